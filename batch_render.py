@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Batch Renderer - Headless table image export
+Renders every layout x property-mapping combination of the unified tables to
+PNG without opening a window.
+
+Each worker process creates its own offscreen QApplication and one instance
+of each table it is asked to render, then paints into a QImage via
+QWidget.render(), so no widget is ever shown.
+
+Usage:
+    python batch_render.py --output posters
+    python batch_render.py -t atoms -t alloys --size 2400x1600 --workers 8
+    python batch_render.py --list
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Headless by default; must be set before any Qt import
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# Add the repository root to the path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+DEFAULT_SIZE = (1920, 1080)
+MANIFEST_FILENAME = 'manifest.json'
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """One image: a table, a layout mode and a property mapping"""
+    table: str
+    layout: str
+    mapping: str
+    width: int
+    height: int
+    output_path: str
+
+
+@dataclass
+class TableSpec:
+    """How to build, lay out and re-map one unified table"""
+    module: str
+    class_name: str
+    layouts: Callable[[], List[str]]
+    mappings: Callable[[], List[str]]
+    apply_mapping: Optional[Callable[[object, str], None]] = None
+
+
+# ==================== Table specifications ====================
+
+def _atom_layouts():
+    from core.pt_enums import PTLayoutMode
+    # LINEAR has no layout builder of its own; SERPENTINE is the linear view
+    return [m.value for m in PTLayoutMode if m != PTLayoutMode.LINEAR]
+
+
+def _atom_mappings():
+    from core.pt_enums import PTPropertyName
+    return [p.value for p in PTPropertyName.get_color_properties()]
+
+
+def _quark_layouts():
+    from core.quark_enums import QuarkLayoutMode
+    return [m.value for m in QuarkLayoutMode]
+
+
+def _quark_mappings():
+    from core.quark_enums import QuarkProperty
+    return [p.value for p in QuarkProperty.get_color_properties()]
+
+
+def _subatomic_layouts():
+    from core.subatomic_enums import SubatomicLayoutMode
+    return [m.value for m in SubatomicLayoutMode]
+
+
+def _molecule_layouts():
+    from core.molecule_enums import MoleculeLayoutMode
+    return [m.value for m in MoleculeLayoutMode]
+
+
+def _alloy_layouts():
+    from core.alloy_enums import AlloyLayoutMode
+    return [m.value for m in AlloyLayoutMode]
+
+
+def _alloy_mappings():
+    from core.alloy_enums import AlloyProperty
+    return [p.value for p in AlloyProperty.get_color_properties()]
+
+
+def _set_alloy_fill(table, mapping):
+    from core.alloy_enums import AlloyProperty
+    table.set_visual_property('fill_color', AlloyProperty.get_display_name(mapping))
+
+
+def _default_mapping():
+    # Card colors in these tables come from particle/molecule categories only
+    return ['default']
+
+
+TABLE_SPECS: Dict[str, TableSpec] = {
+    'atoms': TableSpec('core.unified_table', 'UnifiedTable', _atom_layouts, _atom_mappings,
+                       lambda table, mapping: table.set_property_mapping('fill_color', mapping)),
+    'quarks': TableSpec('core.quark_unified_table', 'QuarkUnifiedTable', _quark_layouts, _quark_mappings,
+                        lambda table, mapping: table.set_fill_property(mapping)),
+    'subatomic': TableSpec('core.subatomic_unified_table', 'SubatomicUnifiedTable',
+                           _subatomic_layouts, _default_mapping),
+    'molecules': TableSpec('core.molecule_unified_table', 'MoleculeUnifiedTable',
+                           _molecule_layouts, _default_mapping),
+    'alloys': TableSpec('core.alloy_unified_table', 'AlloyUnifiedTable', _alloy_layouts, _alloy_mappings,
+                        _set_alloy_fill),
+}
+
+
+def build_jobs(output_dir: str, tables: Optional[List[str]] = None, size: Tuple[int, int] = DEFAULT_SIZE,
+               layouts: Optional[List[str]] = None, mappings: Optional[List[str]] = None) -> List[RenderJob]:
+    """
+    Expand tables into layout x mapping render jobs.
+
+    Args:
+        output_dir: Directory for the PNG files
+        tables: Table names from TABLE_SPECS (default: all)
+        size: (width, height) in pixels
+        layouts: Restrict to these layout values (default: every layout)
+        mappings: Restrict to these mapping values (default: every mapping)
+
+    Returns:
+        Jobs grouped by table, so each worker reuses its table instances
+    """
+    jobs = []
+    for name in tables or list(TABLE_SPECS):
+        if name not in TABLE_SPECS:
+            raise KeyError(f"Unknown table: {name} (expected one of {list(TABLE_SPECS)})")
+        spec = TABLE_SPECS[name]
+        for layout in spec.layouts():
+            if layouts and layout not in layouts:
+                continue
+            for mapping in spec.mappings():
+                if mappings and mapping not in mappings and mapping != 'default':
+                    continue
+                filename = f"{name}_{layout}_{mapping}.png"
+                jobs.append(RenderJob(name, layout, mapping, size[0], size[1],
+                                      os.path.join(output_dir, name, filename)))
+    return jobs
+
+
+# ==================== Worker ====================
+
+_app = None
+_tables: Dict[Tuple[str, int, int], object] = {}
+
+
+def _init_worker():
+    """Create this process's offscreen QApplication"""
+    global _app
+    from PySide6.QtWidgets import QApplication
+    _app = QApplication.instance() or QApplication([])
+
+
+def _get_table(name: str, width: int, height: int):
+    """Create (once per process) a table instance sized for offscreen painting"""
+    key = (name, width, height)
+    table = _tables.get(key)
+    if table is None:
+        import importlib
+        from PySide6.QtCore import QCoreApplication, QSize
+        from PySide6.QtGui import QResizeEvent
+        spec = TABLE_SPECS[name]
+        table = getattr(importlib.import_module(spec.module), spec.class_name)()
+        # Hidden widgets only receive their resize event when shown, so the
+        # tables' relayout-on-resize is triggered explicitly
+        old_size = table.size()
+        table.resize(width, height)
+        QCoreApplication.sendEvent(table, QResizeEvent(QSize(width, height), old_size))
+        _tables[key] = table
+    return table
+
+
+def render_table_image(table, width: int, height: int):
+    """
+    Paint a table into a new QImage without showing it.
+
+    Args:
+        table: Unified table widget (already sized and laid out)
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        QImage with the table's paintEvent output
+    """
+    from PySide6.QtGui import QImage
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(0)
+    table.render(image)
+    return image
+
+
+def render_job(job: RenderJob) -> Dict:
+    """
+    Render one job to PNG (runs in a worker process).
+
+    Returns:
+        Result record with the job fields, 'ok', 'seconds' and 'error'
+    """
+    if _app is None:
+        _init_worker()
+    start = time.perf_counter()
+    result = asdict(job)
+    try:
+        table = _get_table(job.table, job.width, job.height)
+        spec = TABLE_SPECS[job.table]
+        table.set_layout_mode(job.layout)
+        if spec.apply_mapping is not None:
+            spec.apply_mapping(table, job.mapping)
+        image = render_table_image(table, job.width, job.height)
+        os.makedirs(os.path.dirname(job.output_path), exist_ok=True)
+        if not image.save(job.output_path, 'PNG'):
+            raise IOError(f"Could not write {job.output_path}")
+        result.update(ok=True, error=None)
+    except Exception as e:
+        result.update(ok=False, error=f"{type(e).__name__}: {e}")
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def render_all(jobs: List[RenderJob], workers: Optional[int] = None, verbose: bool = True) -> List[Dict]:
+    """
+    Render jobs across a process pool.
+
+    Args:
+        jobs: Jobs from build_jobs()
+        workers: Worker processes (default: CPU count; 1 renders in-process)
+        verbose: Print progress
+
+    Returns:
+        One result record per job
+    """
+    workers = workers or os.cpu_count() or 1
+    results = []
+    if workers == 1:
+        for job in jobs:
+            results.append(render_job(job))
+            if verbose:
+                _print_progress(results[-1], len(results), len(jobs))
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = [executor.submit(render_job, job) for job in jobs]
+        for future in as_completed(futures):
+            results.append(future.result())
+            if verbose:
+                _print_progress(results[-1], len(results), len(jobs))
+    return results
+
+
+def _print_progress(result: Dict, done: int, total: int):
+    status = "ok" if result['ok'] else f"FAILED ({result['error']})"
+    print(f"  [{done}/{total}] {os.path.basename(result['output_path'])}: {status}")
+
+
+def _parse_size(value: str) -> Tuple[int, int]:
+    try:
+        width, height = value.lower().split('x')
+        return int(width), int(height)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Size must be WIDTHxHEIGHT, got {value!r}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Render unified table layouts to PNG without a window")
+    parser.add_argument('-o', '--output', default='renders', help="Output directory (default: %(default)s)")
+    parser.add_argument('-t', '--table', action='append', dest='tables', choices=list(TABLE_SPECS),
+                        help="Table to render (repeatable; default: all)")
+    parser.add_argument('-l', '--layout', action='append', dest='layouts', help="Restrict to a layout value")
+    parser.add_argument('-m', '--mapping', action='append', dest='mappings', help="Restrict to a fill mapping value")
+    parser.add_argument('--size', type=_parse_size, default=DEFAULT_SIZE, help="Image size WIDTHxHEIGHT")
+    parser.add_argument('-j', '--workers', type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument('--list', action='store_true', help="List the jobs without rendering")
+    args = parser.parse_args(argv)
+
+    jobs = build_jobs(args.output, args.tables, args.size, args.layouts, args.mappings)
+    if args.list:
+        for job in jobs:
+            print(f"  {job.table:<10} {job.layout:<20} {job.mapping}")
+        print(f"{len(jobs)} images")
+        return 0
+
+    print(f"Rendering {len(jobs)} images to {args.output}")
+    start = time.perf_counter()
+    results = render_all(jobs, args.workers)
+    elapsed = time.perf_counter() - start
+
+    os.makedirs(args.output, exist_ok=True)
+    with open(os.path.join(args.output, MANIFEST_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump({'elapsed_s': elapsed, 'results': results}, f, indent=2)
+
+    failed = [r for r in results if not r['ok']]
+    print(f"Rendered {len(results) - len(failed)}/{len(results)} images in {elapsed:.1f}s")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,33 @@
+"""
+Benchmarks
+Named performance scenarios for the application's hot paths.
+
+Run with: python -m benchmarks run -o bench_results/current.json
+Compare:  python -m benchmarks compare bench_results/current.json bench_results/baseline.json
+"""
+
+from benchmarks.runner import (
+    Scenario, BenchmarkResult, Comparison, ScenarioSkipped, SCENARIOS,
+    register, scenario, ensure_qt_app, percentile,
+    run_scenario, run_benchmarks, select_scenarios,
+    save_report, load_report, compare_reports, format_comparison
+)
+
+__all__ = [
+    'Scenario',
+    'BenchmarkResult',
+    'Comparison',
+    'ScenarioSkipped',
+    'SCENARIOS',
+    'register',
+    'scenario',
+    'ensure_qt_app',
+    'percentile',
+    'run_scenario',
+    'run_benchmarks',
+    'select_scenarios',
+    'save_report',
+    'load_report',
+    'compare_reports',
+    'format_comparison'
+]
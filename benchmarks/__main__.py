@@ -0,0 +1,92 @@
+"""
+Benchmark command line.
+
+    python -m benchmarks list
+    python -m benchmarks run [-s NAME ...] [--warmup N] [--repeat N] [-o OUT.json] [--baseline BASE.json]
+    python -m benchmarks compare CURRENT.json BASELINE.json [--threshold 0.15]
+
+'run' and 'compare' exit with status 1 when a regression against the
+baseline is found. Qt scenarios use the offscreen platform.
+"""
+
+import argparse
+import os
+import sys
+
+# Headless by default; must be set before any Qt import
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# Add the repository root to the path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import runner
+import benchmarks.scenarios  # noqa: F401  (registers the scenarios)
+
+
+def _report_comparison(current, baseline_path, time_threshold, memory_threshold) -> int:
+    """Print a comparison against a baseline file; return the exit status"""
+    baseline = runner.load_report(baseline_path)
+    comparisons = runner.compare_reports(current, baseline, time_threshold, memory_threshold)
+    print(f"\nComparison against {baseline_path}:")
+    print(runner.format_comparison(comparisons))
+    regressions = [c for c in comparisons if c.regression]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) found")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description="Periodics performance benchmarks")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('list', help="List registered scenarios")
+
+    run_parser = commands.add_parser('run', help="Run scenarios and write a JSON report")
+    run_parser.add_argument('-s', '--scenario', action='append', dest='scenarios',
+                            help="Scenario name or dotted prefix (repeatable; default: all)")
+    run_parser.add_argument('--warmup', type=int, help="Override warm-up iterations")
+    run_parser.add_argument('--repeat', type=int, help="Override timed iterations")
+    run_parser.add_argument('--no-memory', action='store_true', help="Skip tracemalloc peak measurement")
+    run_parser.add_argument('-o', '--output', help="Write the JSON report to this path")
+    run_parser.add_argument('--baseline', help="Compare against this baseline report")
+
+    compare_parser = commands.add_parser('compare', help="Compare a report against a baseline")
+    compare_parser.add_argument('current', help="Current report")
+    compare_parser.add_argument('baseline', help="Baseline report")
+
+    for sub in (run_parser, compare_parser):
+        sub.add_argument('--threshold', type=float, default=runner.DEFAULT_TIME_THRESHOLD,
+                         help="Allowed relative median slowdown (default: %(default)s)")
+        sub.add_argument('--memory-threshold', type=float, default=runner.DEFAULT_MEMORY_THRESHOLD,
+                         help="Allowed relative peak memory growth (default: %(default)s)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        for name, bench in runner.SCENARIOS.items():
+            qt = " [Qt]" if bench.requires_qt else ""
+            print(f"  {name:<36} {bench.description}{qt}")
+        return 0
+
+    if args.command == 'run':
+        try:
+            report = runner.run_benchmarks(args.scenarios, args.warmup, args.repeat,
+                                           measure_memory=not args.no_memory)
+        except KeyError as e:
+            print(f"Error: {e.args[0]}")
+            return 2
+        if args.output:
+            runner.save_report(report, args.output)
+            print(f"\nReport written to {args.output}")
+        if args.baseline:
+            return _report_comparison(report, args.baseline, args.threshold, args.memory_threshold)
+        return 0
+
+    current = runner.load_report(args.current)
+    return _report_comparison(current, args.baseline, args.threshold, args.memory_threshold)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,338 @@
+"""
+Benchmark Runner
+Scenario registry, timing statistics, JSON reports and baseline comparison.
+
+A scenario is a named hot path with an optional setup step. Each run does
+warm-up iterations, then timed repeats (median, p95, mean, min), then one
+extra iteration under tracemalloc to record the peak Python allocation, so
+tracing overhead never pollutes the timings.
+"""
+
+import json
+import os
+import platform
+import time
+import tracemalloc
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+REPORT_VERSION = 1
+
+# Regression thresholds used by compare()
+DEFAULT_TIME_THRESHOLD = 0.15      # 15% slower median
+DEFAULT_MEMORY_THRESHOLD = 0.25    # 25% larger peak
+MIN_TIME_DELTA_S = 0.0005          # ignore differences below 0.5 ms
+
+
+class ScenarioSkipped(Exception):
+    """Raised by a scenario setup when its dependencies are unavailable"""
+
+
+@dataclass
+class Scenario:
+    """A named benchmark: setup() builds a context, run(context) is timed"""
+    name: str
+    run: Callable[[Any], Any]
+    setup: Optional[Callable[[], Any]] = None
+    description: str = ""
+    warmup: int = 1
+    repeat: int = 5
+    requires_qt: bool = False
+
+
+@dataclass
+class BenchmarkResult:
+    """Statistics for one scenario run"""
+    name: str
+    description: str = ""
+    warmup: int = 0
+    repeat: int = 0
+    times_s: List[float] = field(default_factory=list)
+    median_s: float = 0.0
+    p95_s: float = 0.0
+    mean_s: float = 0.0
+    min_s: float = 0.0
+    peak_memory_kb: Optional[float] = None
+    skipped: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+@dataclass
+class Comparison:
+    """Current-vs-baseline comparison for one scenario"""
+    name: str
+    baseline_median_s: float
+    current_median_s: float
+    time_ratio: float
+    baseline_peak_kb: Optional[float]
+    current_peak_kb: Optional[float]
+    memory_ratio: Optional[float]
+    regression: bool
+    reasons: List[str] = field(default_factory=list)
+
+
+# Registered scenarios by name
+SCENARIOS: Dict[str, Scenario] = {}
+
+
+def register(scenario: Scenario) -> Scenario:
+    """Add a scenario to the registry (replacing one with the same name)"""
+    SCENARIOS[scenario.name] = scenario
+    return scenario
+
+
+def scenario(name: str, description: str = "", setup: Optional[Callable[[], Any]] = None,
+             warmup: int = 1, repeat: int = 5, requires_qt: bool = False):
+    """
+    Decorator registering a function as a scenario's timed body.
+
+    Args:
+        name: Scenario name (dotted, e.g. 'atoms.create_all_118')
+        description: One-line description for listings and reports
+        setup: Optional callable returning the context passed to the body
+        warmup: Untimed iterations before measuring
+        repeat: Timed iterations
+        requires_qt: Needs a QApplication (created offscreen)
+    """
+    def decorator(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        register(Scenario(name, func, setup, description, warmup, repeat, requires_qt))
+        return func
+    return decorator
+
+
+# ==================== Qt ====================
+
+_qt_app = None
+
+
+def ensure_qt_app():
+    """
+    Create a QApplication on the offscreen platform if none exists.
+
+    Raises:
+        ScenarioSkipped: If PySide6 is not installed
+    """
+    global _qt_app
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    try:
+        from PySide6.QtWidgets import QApplication
+    except ImportError as e:
+        raise ScenarioSkipped(f"PySide6 not available: {e}")
+    app = QApplication.instance()
+    if app is None:
+        _qt_app = app = QApplication([])
+    return app
+
+
+# ==================== Statistics ====================
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Linear-interpolated percentile of a list (fraction in [0, 1])"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def run_scenario(bench: Scenario, warmup: Optional[int] = None, repeat: Optional[int] = None,
+                 measure_memory: bool = True) -> BenchmarkResult:
+    """
+    Run one scenario and collect statistics.
+
+    Args:
+        bench: Scenario to run
+        warmup: Override the scenario's warm-up count
+        repeat: Override the scenario's repeat count
+        measure_memory: Record peak allocation with tracemalloc
+
+    Returns:
+        BenchmarkResult (with skipped set if the scenario could not run)
+    """
+    warmup = bench.warmup if warmup is None else warmup
+    repeat = max(1, bench.repeat if repeat is None else repeat)
+    result = BenchmarkResult(bench.name, bench.description, warmup, repeat)
+
+    try:
+        if bench.requires_qt:
+            ensure_qt_app()
+        context = bench.setup() if bench.setup else None
+    except ScenarioSkipped as e:
+        result.skipped = str(e)
+        return result
+    except ImportError as e:
+        result.skipped = f"missing dependency: {e}"
+        return result
+
+    for _ in range(warmup):
+        bench.run(context)
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        bench.run(context)
+        times.append(time.perf_counter() - start)
+
+    result.times_s = times
+    result.median_s = percentile(times, 0.5)
+    result.p95_s = percentile(times, 0.95)
+    result.mean_s = sum(times) / len(times)
+    result.min_s = min(times)
+
+    if measure_memory:
+        already_tracing = tracemalloc.is_tracing()
+        if not already_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        bench.run(context)
+        _, peak = tracemalloc.get_traced_memory()
+        if not already_tracing:
+            tracemalloc.stop()
+        result.peak_memory_kb = peak / 1024.0
+
+    return result
+
+
+def run_benchmarks(names: Optional[Iterable[str]] = None, warmup: Optional[int] = None,
+                   repeat: Optional[int] = None, measure_memory: bool = True,
+                   verbose: bool = True) -> Dict:
+    """
+    Run registered scenarios and build a report.
+
+    Args:
+        names: Scenario names or name prefixes to run (default: all)
+        warmup: Override every scenario's warm-up count
+        repeat: Override every scenario's repeat count
+        measure_memory: Record peak allocation per scenario
+        verbose: Print one line per scenario as it finishes
+
+    Returns:
+        Report dictionary ready for save_report()
+    """
+    selected = select_scenarios(names)
+    results = {}
+    for bench in selected:
+        result = run_scenario(bench, warmup, repeat, measure_memory)
+        results[bench.name] = result.to_dict()
+        if verbose:
+            print(format_result(result))
+
+    return {
+        'version': REPORT_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'qt_platform': os.environ.get('QT_QPA_PLATFORM', ''),
+        },
+        'results': results,
+    }
+
+
+def select_scenarios(names: Optional[Iterable[str]] = None) -> List[Scenario]:
+    """
+    Resolve names or dotted prefixes (e.g. 'atoms') to registered scenarios.
+
+    Raises:
+        KeyError: If a name matches no scenario
+    """
+    if not names:
+        return list(SCENARIOS.values())
+    selected = []
+    for name in names:
+        matches = [s for key, s in SCENARIOS.items() if key == name or key.startswith(name + '.')]
+        if not matches:
+            raise KeyError(f"Unknown benchmark scenario: {name}")
+        selected.extend(s for s in matches if s not in selected)
+    return selected
+
+
+def format_result(result: BenchmarkResult) -> str:
+    """One-line summary of a result"""
+    if result.skipped:
+        return f"  {result.name:<36} skipped ({result.skipped})"
+    memory = f"{result.peak_memory_kb:10.1f} KiB" if result.peak_memory_kb is not None else ""
+    return (f"  {result.name:<36} median {result.median_s * 1000:9.2f} ms   "
+            f"p95 {result.p95_s * 1000:9.2f} ms   {memory}")
+
+
+# ==================== Reports ====================
+
+def save_report(report: Dict, path: str):
+    """Write a report as JSON (creating the directory if needed)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+
+def load_report(path: str) -> Dict:
+    """Read a report written by save_report()"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_reports(current: Dict, baseline: Dict,
+                    time_threshold: float = DEFAULT_TIME_THRESHOLD,
+                    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD) -> List[Comparison]:
+    """
+    Compare two reports scenario by scenario.
+
+    A scenario regresses when its median time grows by more than
+    time_threshold (and by at least MIN_TIME_DELTA_S), or its peak memory
+    grows by more than memory_threshold. Scenarios skipped or missing in
+    either report are not compared.
+
+    Args:
+        current: Report from this run
+        baseline: Stored baseline report
+        time_threshold: Allowed relative median slowdown
+        memory_threshold: Allowed relative peak memory growth
+
+    Returns:
+        One Comparison per scenario present in both reports
+    """
+    comparisons = []
+    baseline_results = baseline.get('results', {})
+    for name, cur in current.get('results', {}).items():
+        base = baseline_results.get(name)
+        if not base or cur.get('skipped') or base.get('skipped'):
+            continue
+
+        base_median = base['median_s']
+        cur_median = cur['median_s']
+        time_ratio = cur_median / base_median if base_median > 0 else 1.0
+        reasons = []
+        if time_ratio > 1.0 + time_threshold and cur_median - base_median >= MIN_TIME_DELTA_S:
+            reasons.append(f"median {time_ratio:.2f}x baseline")
+
+        base_peak = base.get('peak_memory_kb')
+        cur_peak = cur.get('peak_memory_kb')
+        memory_ratio = None
+        if base_peak and cur_peak is not None:
+            memory_ratio = cur_peak / base_peak
+            if memory_ratio > 1.0 + memory_threshold:
+                reasons.append(f"peak memory {memory_ratio:.2f}x baseline")
+
+        comparisons.append(Comparison(
+            name, base_median, cur_median, time_ratio,
+            base_peak, cur_peak, memory_ratio, bool(reasons), reasons
+        ))
+    return comparisons
+
+
+def format_comparison(comparisons: List[Comparison]) -> str:
+    """Table of comparisons with regressions marked"""
+    lines = [f"  {'scenario':<36} {'baseline':>11} {'current':>11} {'ratio':>7}  status"]
+    for c in comparisons:
+        status = "REGRESSION: " + "; ".join(c.reasons) if c.regression else "ok"
+        lines.append(f"  {c.name:<36} {c.baseline_median_s * 1000:9.2f}ms {c.current_median_s * 1000:9.2f}ms "
+                     f"{c.time_ratio:6.2f}x  {status}")
+    return "\n".join(lines)
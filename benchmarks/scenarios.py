@@ -0,0 +1,146 @@
+"""
+Benchmark Scenarios
+Named hot paths of the application, registered with the benchmark runner.
+
+Scenario names are dotted ('<area>.<case>') so a whole area can be selected
+by prefix. Qt scenarios run on the offscreen platform and are reported as
+skipped when PySide6 is not installed.
+"""
+
+from benchmarks.runner import scenario
+
+
+# ==================== Helpers ====================
+
+def _data_manager():
+    from data.data_manager import get_data_manager
+    return get_data_manager()
+
+
+def _element_index():
+    """Element dictionaries keyed by symbol"""
+    from data.data_manager import DataCategory
+    elements = _data_manager().get_all_items(DataCategory.ELEMENTS)
+    return {e['symbol']: e for e in elements if e.get('symbol')}
+
+
+# ==================== Data ====================
+
+def _setup_data_load():
+    from data.data_manager import DataManager, DataCategory
+    return DataManager, list(DataCategory)
+
+
+@scenario('data.load_all_categories', "Fresh DataManager reading every category from disk",
+          setup=_setup_data_load, warmup=1, repeat=7)
+def bench_data_load(context):
+    manager_class, categories = context
+    manager = manager_class()
+    for category in categories:
+        manager.get_all_items(category)
+
+
+# ==================== Atoms ====================
+
+def _setup_atoms():
+    from data.data_manager import DataCategory
+    from utils.physics_calculator_v2 import AtomCalculatorV2
+    manager = _data_manager()
+    proton = manager.get_item(DataCategory.SUBATOMIC, 'Proton')
+    neutron = manager.get_item(DataCategory.SUBATOMIC, 'Neutron')
+    electron = manager.get_item(DataCategory.QUARKS, 'Electron')
+    elements = sorted(_element_index().values(), key=lambda e: e['atomic_number'])
+    nuclei = []
+    for element in elements:
+        z = element['atomic_number']
+        n = max(0, round(element.get('atomic_mass', 2 * z)) - z)
+        nuclei.append((z, n, element.get('name', ''), element['symbol']))
+    return AtomCalculatorV2, proton, neutron, electron, nuclei
+
+
+@scenario('atoms.create_all_118', "AtomCalculatorV2.create_atom_from_particles for Z=1..118",
+          setup=_setup_atoms, warmup=1, repeat=5)
+def bench_atoms(context):
+    calculator, proton, neutron, electron, nuclei = context
+    # Bypass the result cache so every repeat times the calculation, not cache hits
+    for z, n, name, symbol in nuclei:
+        calculator.create_atom_from_particles(proton, neutron, electron, z, n, z, name, symbol,
+                                              use_cache=False)
+
+
+# ==================== Alloys ====================
+
+def _setup_alloys():
+    from data.data_manager import DataCategory
+    from utils.alloy_calculator import AlloyCalculator
+    elements = _element_index()
+    batch = []
+    for alloy in _data_manager().get_all_items(DataCategory.ALLOYS):
+        components, fractions = [], []
+        for component in alloy.get('Components', []):
+            element = elements.get(component.get('Element'))
+            if element is None:
+                continue
+            components.append(element)
+            fractions.append((component.get('MinPercent', 0) + component.get('MaxPercent', 0)) / 2.0)
+        total = sum(fractions)
+        if not components or total <= 0:
+            continue
+        lattice = alloy.get('LatticeProperties', {}).get('PrimaryStructure', 'FCC')
+        batch.append((components, [f / total for f in fractions], lattice, alloy.get('Name')))
+    return AlloyCalculator, batch
+
+
+@scenario('alloys.batch_evaluate', "AlloyCalculator.create_alloy_from_components for every stored alloy",
+          setup=_setup_alloys, warmup=1, repeat=7)
+def bench_alloys(context):
+    calculator, batch = context
+    for components, fractions, lattice, name in batch:
+        calculator.create_alloy_from_components(components, fractions, lattice, name)
+
+
+# ==================== Microstructure ====================
+
+def _setup_voronoi():
+    from utils.crystalline_math import create_microstructure, MicrostructureRenderer
+    voronoi = create_microstructure(grain_density=40.0, domain_size=(1.0, 1.0), seed=42)
+    return MicrostructureRenderer(voronoi)
+
+
+@scenario('voronoi.slice_64', "Voronoi microstructure 2D slice at 64x64",
+          setup=_setup_voronoi, warmup=1, repeat=5)
+def bench_voronoi(renderer):
+    renderer.render_2d_slice(64, 64)
+
+
+# ==================== Qt rendering ====================
+
+def _setup_unified_table():
+    from core.unified_table import UnifiedTable
+    return UnifiedTable()
+
+
+@scenario('table.create_element_data', "UnifiedTable.create_element_data (full element rebuild)",
+          setup=_setup_unified_table, warmup=1, repeat=5, requires_qt=True)
+def bench_unified_table(table):
+    table.create_element_data()
+
+
+def _setup_orbital_frame():
+    from PySide6.QtGui import QImage, QPainter
+    from utils.sdf_renderer import SDFRenderer
+    image = QImage(400, 400, QImage.Format_ARGB32_Premultiplied)
+    return image, QPainter, SDFRenderer
+
+
+@scenario('orbital.frame_3d_z1', "SDFRenderer.draw_orbital_cloud frame for a 3d (m=1) orbital",
+          setup=_setup_orbital_frame, warmup=1, repeat=5, requires_qt=True)
+def bench_orbital_frame(context):
+    image, painter_class, renderer = context
+    image.fill(0)
+    painter = painter_class(image)
+    try:
+        renderer.draw_orbital_cloud(painter, 200, 200, 3, 2, 1, 150,
+                                    rotation_x=0.3, rotation_y=0.5, opacity=0.6, Z=1)
+    finally:
+        painter.end()
@@ -12,12 +12,25 @@ from PySide6.QtGui import (QPainter, QColor, QBrush, QPen, QFont, QRadialGradien
                            QLinearGradient, QPainterPath, QImage, QPixmap, QGuiApplication)
 
 from data.alloy_loader import AlloyDataLoader
+from data.data_index import Equals, Matches
 from core.alloy_enums import (AlloyLayoutMode, AlloyCategory, CrystalStructure,
                                AlloyProperty, get_element_color)
 from layouts.alloy_category_layout import AlloyCategoryLayout
 from layouts.alloy_property_layout import AlloyPropertyLayout
 from layouts.alloy_composition_layout import AlloyCompositionLayout
 from layouts.alloy_lattice_layout import AlloyLatticeLayout
+from utils.profiler import get_profiler
+from utils.profiler_overlay import draw_profiler_overlay
+from utils.spatial_index import SpatialIndex, visible_world_rect
+from utils.card_pixmap_cache import get_card_pixmap_cache
+
+# Layout units around each card kept when culling (encoded glow reaches 20)
+CULL_MARGIN = 20
+# Pixmap cache namespace and the layout units cached around each card (glow)
+CARD_CACHE_NAMESPACE = 'alloys'
+CARD_CACHE_PAD = 22
+# Room right of a scatter point for its hover/selection name label
+SCATTER_LABEL_WIDTH = 120
 
 # Import crystalline math for microstructure visualization
 try:
@@ -45,6 +58,7 @@ class AlloyUnifiedTable(QWidget):
         self.loader = AlloyDataLoader()
         self.base_alloys = self.loader.load_all_alloys()
         self.positioned_alloys = []
+        self._card_index = SpatialIndex()
 
         # State
         self.layout_mode = AlloyLayoutMode.CATEGORY
@@ -161,27 +175,34 @@ class AlloyUnifiedTable(QWidget):
 
     def _get_filtered_alloys(self):
         """Get alloys after applying filters"""
-        alloys = self.base_alloys.copy()
+        # Categorical filters are answered from the loader's hash indexes by
+        # intersecting key sets; matching is evaluated once per distinct value.
+        conditions = []
 
         # Apply multi-select category filter
         if self.category_filters:
-            alloys = [a for a in alloys if self._matches_category(a)]
+            conditions.append(Matches('category', lambda v: self._matches_category({'category': v or ''})))
         elif self.category_filter:  # Legacy single-value filter
-            alloys = [a for a in alloys if a.get('category', '').lower() == self.category_filter.lower()]
+            category = self.category_filter.lower()
+            conditions.append(Matches('category', lambda v: (v or '').lower() == category))
 
         # Apply multi-select structure filter
         if self.structure_filters:
-            alloys = [a for a in alloys if self._matches_structure(a)]
+            conditions.append(Matches('crystal_structure',
+                                      lambda v: self._matches_structure({'crystal_structure': v or ''})))
         elif self.structure_filter:  # Legacy single-value filter
-            alloys = [a for a in alloys if a.get('crystal_structure', '').upper() == self.structure_filter.upper()]
-
-        # Apply multi-select corrosion filter
-        if self.corrosion_filters:
-            alloys = [a for a in alloys if self._matches_corrosion(a)]
+            structure = self.structure_filter.upper()
+            conditions.append(Matches('crystal_structure', lambda v: (v or '').upper() == structure))
 
         # Apply element filter (single value only)
         if self.element_filter:
-            alloys = [a for a in alloys if a.get('primary_element') == self.element_filter]
+            conditions.append(Equals('primary_element', self.element_filter))
+
+        alloys = self.loader.query(*conditions) if conditions else self.base_alloys.copy()
+
+        # Apply multi-select corrosion filter (rating may be numeric or text)
+        if self.corrosion_filters:
+            alloys = [a for a in alloys if self._matches_corrosion(a)]
 
         return alloys
 
@@ -229,7 +250,35 @@ class AlloyUnifiedTable(QWidget):
 
         if layout:
             layout.update_dimensions(self.width(), self.height())
-            self.positioned_alloys = layout.calculate_layout(alloys)
+            with get_profiler().scope(f'layout.{type(layout).__name__}', 'layout'):
+                self.positioned_alloys = layout.calculate_layout(alloys)
+                self._build_card_index()
+
+    def _build_card_index(self):
+        """Index the positioned alloy cards (or scatter points) for viewport culling"""
+        scatter = self.layout_mode == AlloyLayoutMode.PROPERTY_SCATTER
+        rects = []
+        for alloy in self.positioned_alloys:
+            x, y = alloy.get('x', 0), alloy.get('y', 0)
+            if scatter:
+                # Points are drawn centred in a size x size box with a glow of 0.8 x size
+                # and a name label to the right
+                size = alloy.get('width', 60)
+                rects.append((x - 0.3 * size, y - 0.3 * size,
+                              1.6 * size + SCATTER_LABEL_WIDTH, 1.6 * size))
+            else:
+                rects.append((x, y, alloy.get('width', 160), alloy.get('height', 180)))
+        largest = max((max(w, h) for _, _, w, h in rects), default=180)
+        self._card_index = SpatialIndex(cell_size=2 * largest)
+        for alloy, rect in zip(self.positioned_alloys, rects):
+            self._card_index.insert(alloy, *rect)
+
+    def get_visible_alloys(self):
+        """Positioned alloys whose cards or points intersect the visible area"""
+        left, top, right, bottom = visible_world_rect(
+            self.width(), self.height(), self.pan_x, self.pan_y, self.zoom_level,
+            scroll_y=self.scroll_offset_y, margin=CULL_MARGIN)
+        return self._card_index.query(left, top, right, bottom)
 
     def resizeEvent(self, event):
         """Handle resize events"""
@@ -240,11 +289,14 @@ class AlloyUnifiedTable(QWidget):
 
     def paintEvent(self, event):
         """Paint the alloy visualization"""
+        profiler = get_profiler()
+        profiler.begin_frame()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw background
-        self._draw_background(painter)
+        with profiler.scope('paint.background', 'paint'):
+            self._draw_background(painter)
 
         # Apply transformations
         painter.translate(self.pan_x, self.pan_y - self.scroll_offset_y)
@@ -252,15 +304,20 @@ class AlloyUnifiedTable(QWidget):
 
         # Draw based on layout mode
         if self.layout_mode == AlloyLayoutMode.PROPERTY_SCATTER:
-            self._draw_scatter_plot(painter)
+            with profiler.scope('paint.elements', 'paint'):
+                self._draw_scatter_plot(painter)
         else:
             # Draw group headers if applicable
-            self._draw_group_headers(painter)
-            # Draw alloy cards
-            for alloy in self.positioned_alloys:
-                self._draw_alloy_card(painter, alloy)
-
+            with profiler.scope('paint.labels', 'paint'):
+                self._draw_group_headers(painter)
+            # Draw alloy cards (off-screen cards are skipped)
+            with profiler.scope('paint.elements', 'paint'):
+                for alloy in self.get_visible_alloys():
+                    self._paint_alloy_card(painter, alloy)
+
+        draw_profiler_overlay(painter, self.width())
         painter.end()
+        profiler.end_frame('AlloyUnifiedTable.paint')
 
     def _draw_background(self, painter):
         """Draw the dark gradient background"""
@@ -373,8 +430,8 @@ class AlloyUnifiedTable(QWidget):
         painter.drawText(-50, 0, f"{y_label} ({y_unit})")
         painter.restore()
 
-        # Draw data points
-        for alloy in self.positioned_alloys:
+        # Draw data points (off-screen points are skipped)
+        for alloy in self.get_visible_alloys():
             self._draw_scatter_point(painter, alloy)
 
     def _draw_scatter_point(self, painter, alloy):
@@ -419,6 +476,30 @@ class AlloyUnifiedTable(QWidget):
             name = alloy.get('name', '')[:15]
             painter.drawText(int(x + size + 5), int(y + size/2 + 5), name)
 
+    def _paint_alloy_card(self, painter, alloy):
+        """Blit an alloy card from the pixmap cache, rendering it on a miss"""
+        if alloy == self.selected_alloy:
+            state = 'selected'
+        elif alloy == self.hovered_alloy:
+            state = 'hovered'
+        else:
+            state = ''
+        get_card_pixmap_cache().draw_card(
+            painter, CARD_CACHE_NAMESPACE, alloy.get('Name'), self._card_encoding_key(), state,
+            alloy.get('x', 0), alloy.get('y', 0), alloy.get('width', 160), alloy.get('height', 180),
+            lambda card_painter: self._draw_alloy_card(card_painter, alloy), pad=CARD_CACHE_PAD)
+
+    def _card_encoding_key(self):
+        """Hashable snapshot of the visual encodings a card is drawn with"""
+        gradients = tuple(sorted((key, start.name(), end.name())
+                                 for key, (start, end) in getattr(self, 'gradient_colors', {}).items()))
+        return (self.fill_property, self.border_color_property, self.glow_property,
+                self.glow_intensity_property, self.border_size_property, gradients)
+
+    def _invalidate_cards(self, names=None):
+        """Drop cached card pixmaps (all cards, or only the named alloys)"""
+        get_card_pixmap_cache().invalidate(CARD_CACHE_NAMESPACE, names)
+
     def _draw_alloy_card(self, painter, alloy):
         """Draw a single alloy card with visual property encoding"""
         x = alloy.get('x', 0)
@@ -664,6 +745,28 @@ class AlloyUnifiedTable(QWidget):
     def reload_data(self):
         """Reload alloy data from files"""
         self.base_alloys = self.loader.load_all_alloys()
+        self._invalidate_cards()
+        self._update_layout()
+        self.update()
+
+    def apply_data_changes(self, event):
+        """
+        Apply an item-level data change, re-reading only the changed files.
+
+        Args:
+            event: DataChangeEvent for the alloys category
+        """
+        if event.full:
+            self.reload_data()
+            return
+        updated, removed = self.loader.reload_items(event.names)
+        if not updated and not removed:
+            return
+        self.base_alloys = self.loader.alloys
+        self._invalidate_cards([a['Name'] for a in updated] + list(removed))
+        if self.selected_alloy is not None and self.selected_alloy.get('Name') in removed:
+            self.selected_alloy = None
+        self.hovered_alloy = None
         self._update_layout()
         self.update()
 
@@ -691,6 +794,7 @@ class AlloyUnifiedTable(QWidget):
         if not hasattr(self, 'gradient_colors'):
             self.gradient_colors = {}
         self.gradient_colors[property_key] = (start_color, end_color)
+        self._invalidate_cards()
         self.update()
 
     def set_property_fade(self, property_key, fade_value):
@@ -724,6 +828,7 @@ class AlloyUnifiedTable(QWidget):
         attr_name = attr_map.get(property_key)
         if attr_name:
             setattr(self, attr_name, property_name)
+            self._invalidate_cards()
             self.update()
 
     def get_normalized_property_value(self, alloy, property_name):
@@ -0,0 +1,140 @@
+"""
+Element Columns
+Columnar (structure-of-arrays) view of the element display records.
+
+UnifiedTable keeps one dict per element, which suits drawing but turns every
+filter check and property lookup into a dict walk per element per paint.
+ElementColumns stores each numeric property as a typed array indexed by row,
+with its min/max precomputed, so a filter change is one pass per active
+filter producing a mask and property reads are indexed reads.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.pt_enums import PTPropertyName
+
+
+# Record field holding the value of each numeric property
+PROPERTY_FIELDS: Dict[str, str] = {
+    PTPropertyName.ATOMIC_NUMBER.value: 'z',
+    PTPropertyName.IONIZATION.value: 'ie',
+    PTPropertyName.ELECTRONEGATIVITY.value: 'electronegativity',
+    PTPropertyName.MELTING.value: 'melting_point',
+    PTPropertyName.BOILING.value: 'boiling_point',
+    PTPropertyName.RADIUS.value: 'atomic_radius',
+    PTPropertyName.DENSITY.value: 'density',
+    PTPropertyName.ELECTRON_AFFINITY.value: 'electron_affinity',
+    PTPropertyName.VALENCE.value: 'valence_electrons',
+}
+
+# Filters on any wavelength property compare against the primary emission wavelength
+FILTER_FIELDS: Dict[str, str] = dict(PROPERTY_FIELDS)
+for _prop in (PTPropertyName.WAVELENGTH, PTPropertyName.EMISSION_WAVELENGTH,
+              PTPropertyName.VISIBLE_EMISSION_WAVELENGTH, PTPropertyName.IONIZATION_WAVELENGTH,
+              PTPropertyName.SPECTRUM):
+    FILTER_FIELDS[_prop.value] = 'wavelength_nm'
+
+COLUMN_FIELDS: Tuple[str, ...] = tuple(sorted(
+    set(FILTER_FIELDS.values()) |
+    {'emission_wavelength', 'visible_emission_wavelength', 'ionization_wavelength'}
+))
+
+
+def _as_float(value) -> float:
+    """Coerce a record value for storage in a typed column (missing -> 0.0)"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return 0.0
+
+
+class ElementColumns:
+    """Typed per-property columns over a list of element records"""
+
+    def __init__(self, records: Iterable[Dict] = ()):
+        """
+        Initialize and build the columns.
+
+        Args:
+            records: Element display records (as built by UnifiedTable), in row order
+        """
+        self.rebuild(records)
+
+    def rebuild(self, records: Iterable[Dict]):
+        """Rebuild every column from the records"""
+        self.records: List[Dict] = list(records)
+        self.size = len(self.records)
+        self.row_of: Dict[int, int] = {record.get('z'): row for row, record in enumerate(self.records)}
+
+        self.columns: Dict[str, array] = {
+            field: array('d', (_as_float(record.get(field)) for record in self.records))
+            for field in COLUMN_FIELDS
+        }
+        self.ranges: Dict[str, Tuple[float, float]] = {
+            field: (min(column), max(column)) if column else (0.0, 0.0)
+            for field, column in self.columns.items()
+        }
+
+        # Neutron offsets (N - Z) available per row; elements without isotope data count as N = Z
+        self.neutron_offsets: List[frozenset] = []
+        for record in self.records:
+            z = record.get('z', 0)
+            offsets = frozenset((mass - z) - z for mass, _ in record.get('isotopes', []))
+            self.neutron_offsets.append(offsets or frozenset((0,)))
+
+    # ==================== Lookups ====================
+
+    def row(self, elem: Dict) -> Optional[int]:
+        """Row index of an element record (matched by atomic number), or None"""
+        return self.row_of.get(elem.get('z'))
+
+    def property_column(self, property_name: str) -> Optional[array]:
+        """Column for a numeric property name (e.g. 'melting'), or None if not numeric"""
+        field = PROPERTY_FIELDS.get(property_name)
+        return self.columns[field] if field else None
+
+    def value(self, property_name: str, row: int) -> float:
+        """Value of a numeric property at a row (0.0 for non-numeric properties)"""
+        column = self.property_column(property_name)
+        return column[row] if column is not None else 0.0
+
+    def property_range(self, property_name: str) -> Optional[Tuple[float, float]]:
+        """(min, max) of a numeric property across all rows"""
+        field = PROPERTY_FIELDS.get(property_name)
+        return self.ranges[field] if field else None
+
+    # ==================== Filtering ====================
+
+    @staticmethod
+    def filter_signature(filters: Dict[str, Dict]) -> Tuple:
+        """Hashable summary of the active filters; equal signatures give equal masks"""
+        return tuple(
+            (prop, data['min'], data['max'])
+            for prop, data in filters.items()
+            if data.get('active') and prop in FILTER_FIELDS
+        )
+
+    def range_mask(self, field: str, low: float, high: float) -> bytearray:
+        """Mask of rows whose field lies within [low, high]"""
+        return bytearray(low <= value <= high for value in self.columns[field])
+
+    def filter_mask(self, filters: Dict[str, Dict], neutron_offset: int = 0) -> bytearray:
+        """
+        Compute which rows pass every active filter.
+
+        Args:
+            filters: UnifiedTable.filters mapping (property -> {'min', 'max', 'active'})
+            neutron_offset: Required isotope neutron offset (N - Z); 0 disables the check
+
+        Returns:
+            bytearray with 1 for rows that pass and 0 for rows that are filtered out
+        """
+        if neutron_offset != 0:
+            mask = bytearray(neutron_offset in offsets for offsets in self.neutron_offsets)
+        else:
+            mask = bytearray(b'\x01') * self.size
+
+        for prop, low, high in self.filter_signature(filters):
+            column = self.columns[FILTER_FIELDS[prop]]
+            mask = bytearray(keep and low <= value <= high for keep, value in zip(mask, column))
+        return mask
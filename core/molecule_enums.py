@@ -17,6 +17,7 @@ class MoleculeLayoutMode(Enum):
     DIPOLE = "dipole"
     DENSITY = "density"
     BOND_COMPLEXITY = "bond_complexity"
+    VIBRATIONAL = "vibrational"
 
     @classmethod
     def from_string(cls, value):
@@ -41,7 +42,8 @@ class MoleculeLayoutMode(Enum):
             cls.PHASE_DIAGRAM: "Phase Diagram",
             cls.DIPOLE: "Dipole-Polarity",
             cls.DENSITY: "Density-Mass",
-            cls.BOND_COMPLEXITY: "Bond Complexity"
+            cls.BOND_COMPLEXITY: "Bond Complexity",
+            cls.VIBRATIONAL: "Vibrational Spectrum"
         }
         return display_names.get(mode, "Unknown")
 
@@ -6,11 +6,12 @@ Main visualization widget for displaying molecules with various layouts.
 import json
 import math
 from PySide6.QtWidgets import QWidget, QScrollArea, QVBoxLayout
-from PySide6.QtCore import Qt, Signal, QPointF, QRectF
+from PySide6.QtCore import Qt, Signal, QPointF, QRectF, QTimer
 from PySide6.QtGui import (QPainter, QColor, QBrush, QPen, QFont, QRadialGradient,
                            QLinearGradient, QPainterPath, QGuiApplication)
 
 from data.molecule_loader import MoleculeDataLoader
+from data.data_index import Equals, Matches
 from core.molecule_enums import (MoleculeLayoutMode, MolecularGeometry, BondType,
                                   MoleculePolarity, MoleculeCategory, MoleculeState,
                                   get_element_color)
@@ -23,6 +24,22 @@ from layouts.molecule_phase_diagram_layout import MoleculePhaseDiagramLayout
 from layouts.molecule_dipole_layout import MoleculeDipoleLayout
 from layouts.molecule_density_layout import MoleculeDensityLayout
 from layouts.molecule_bond_complexity_layout import MoleculeBondComplexityLayout
+from layouts.molecule_vibrational_layout import MoleculeVibrationalLayout
+from utils.profiler import get_profiler
+from utils.profiler_overlay import draw_profiler_overlay
+from utils.spatial_index import SpatialIndex, visible_world_rect
+from utils.card_pixmap_cache import get_card_pixmap_cache
+from utils.layout_transition import LayoutTransition, get_layout_prefetcher, TRANSITION_FRAME_MS
+from utils.molecule_projection import project_structures
+from utils.structure_embedding import molecule_atoms_3d
+
+# Layout units around each card kept when culling (selection border)
+CULL_MARGIN = 10
+# Pixmap cache namespace and the layout units cached around each card (border pen)
+CARD_CACHE_NAMESPACE = 'molecules'
+CARD_CACHE_PAD = 4
+# Layout prefetcher namespace (leading element of the prefetch keys)
+LAYOUT_NAMESPACE = 'molecules'
 
 
 def rotate_point_3d(x, y, z, pitch, yaw, roll):
@@ -76,6 +93,7 @@ class MoleculeUnifiedTable(QWidget):
         self.loader = MoleculeDataLoader()
         self.base_molecules = self.loader.load_all_molecules()
         self.positioned_molecules = []
+        self._card_index = SpatialIndex()
 
         # State
         self.layout_mode = MoleculeLayoutMode.GRID
@@ -93,6 +111,9 @@ class MoleculeUnifiedTable(QWidget):
         self.bond_type_filters = ['Ionic', 'Covalent', 'Polar Covalent']  # Show all by default
         self.category_filters = ['Organic', 'Inorganic']  # Show all by default
 
+        # Search box text (formula pattern, fragment or name; see data.molecule_search)
+        self.search_query = ''
+
         # Visual settings
         self.zoom_level = 1.0
         self.pan_x = 0
@@ -109,6 +130,11 @@ class MoleculeUnifiedTable(QWidget):
         self.yaw = 0.0
         self.roll = 0.0
 
+        # Unrotated structure atoms per (name, radius), and their projections
+        # at the current rotation (rebuilt in one batch per rotation change)
+        self._structure_atoms = {}
+        self._projected_structures = {}
+
         # Layout renderers
         self.layouts = {
             MoleculeLayoutMode.GRID: MoleculeGridLayout(self.width(), self.height()),
@@ -120,19 +146,53 @@ class MoleculeUnifiedTable(QWidget):
             MoleculeLayoutMode.DIPOLE: MoleculeDipoleLayout(self.width(), self.height()),
             MoleculeLayoutMode.DENSITY: MoleculeDensityLayout(self.width(), self.height()),
             MoleculeLayoutMode.BOND_COMPLEXITY: MoleculeBondComplexityLayout(self.width(), self.height()),
+            MoleculeLayoutMode.VIBRATIONAL: MoleculeVibrationalLayout(self.width(), self.height()),
         }
 
+        # Animated layout switch (cards move from the old to the new layout)
+        self._transition = None
+        self._transition_molecules = {}
+        self._transition_timer = QTimer(self)
+        self._transition_timer.setInterval(TRANSITION_FRAME_MS)
+        self._transition_timer.timeout.connect(self._advance_transition)
+
         # Initialize layout
         self._update_layout()
 
     def set_layout_mode(self, mode):
-        """Set the layout mode"""
+        """Set the layout mode, animating cards from their current positions"""
         if isinstance(mode, str):
             mode = MoleculeLayoutMode.from_string(mode)
+        previous = self.positioned_molecules
         self.layout_mode = mode
         self._update_layout()
+        self._start_transition(previous, self.positioned_molecules)
         self.update()
 
+    def prefetch_layout(self, mode):
+        """
+        Compute a layout mode on the background thread, so that switching to it
+        only picks up the result (called while the mode's selector is hovered).
+
+        Args:
+            mode: MoleculeLayoutMode or its string name
+        """
+        if isinstance(mode, str):
+            mode = MoleculeLayoutMode.from_string(mode)
+        layout = self.layouts.get(mode)
+        if layout is None or mode == self.layout_mode:
+            return
+        molecules = self._get_filtered_molecules()
+        # The worker gets its own layout instance; the shared one stays on the GUI thread
+        layout_class, width, height = type(layout), self.width(), self.height()
+        get_layout_prefetcher().prefetch(self._layout_key(mode, molecules),
+                                         lambda: layout_class(width, height).calculate_layout(molecules))
+
+    def _layout_key(self, mode, molecules):
+        """Prefetch key of a layout mode for the given molecules at the current size"""
+        return (LAYOUT_NAMESPACE, mode, self.width(), self.height(),
+                tuple(mol.get('Name') for mol in molecules))
+
     def set_category_filter(self, category):
         """Set category filter (Organic, Inorganic, Ionic, or None for all)"""
         self.category_filter = category
@@ -191,6 +251,16 @@ class MoleculeUnifiedTable(QWidget):
         self._update_layout()
         self.update()
 
+    def set_search_query(self, text):
+        """Set the search box query
+
+        Args:
+            text: Formula pattern (C2H?O?), fragment (C=O, benzene ring) or name; '' shows all
+        """
+        self.search_query = text or ''
+        self._update_layout()
+        self.update()
+
     def set_rotation(self, pitch, yaw, roll):
         """Set 3D rotation angles for molecule structure visualization.
 
@@ -202,36 +272,52 @@ class MoleculeUnifiedTable(QWidget):
         self.pitch = pitch
         self.yaw = yaw
         self.roll = roll
+        # Cached cards hold only the static layer; the structures are re-projected
+        self._projected_structures = {}
         self.update()
 
     def _get_filtered_molecules(self):
         """Get molecules after applying filters"""
-        molecules = self.base_molecules.copy()
+        # Categorical filters are answered from the loader's hash indexes by
+        # intersecting key sets; matching is evaluated once per distinct value.
+        conditions = []
 
         # Apply multi-select category filter
         if self.category_filters:
-            molecules = [m for m in molecules if self._matches_category(m)]
+            conditions.append(Matches('category', lambda v: self._value_in_filters(v, self.category_filters)))
         elif self.category_filter:  # Legacy single-value filter
-            molecules = [m for m in molecules if m.get('category') == self.category_filter]
+            conditions.append(Equals('category', self.category_filter))
 
         # Apply multi-select polarity filter
         if self.polarity_filters:
-            molecules = [m for m in molecules if self._matches_polarity(m)]
+            conditions.append(Matches('polarity', lambda v: self._value_in_filters(v, self.polarity_filters)))
         elif self.polarity_filter:  # Legacy single-value filter
-            molecules = [m for m in molecules if m.get('polarity') == self.polarity_filter]
+            conditions.append(Equals('polarity', self.polarity_filter))
 
         # Apply multi-select state filter
         if self.state_filters:
-            molecules = [m for m in molecules if self._matches_state(m)]
+            conditions.append(Matches('state', lambda v: self._value_in_filters(v, self.state_filters)))
         elif self.state_filter:  # Legacy single-value filter
-            molecules = [m for m in molecules if m.get('state') == self.state_filter]
+            conditions.append(Equals('state', self.state_filter))
 
-        # Apply multi-select bond type filter
+        # Search box: answered by the loader's formula/fingerprint search index
+        if self.search_query:
+            conditions.append(self.loader.search_condition(self.search_query))
+
+        molecules = self.loader.query(*conditions) if conditions else self.base_molecules.copy()
+
+        # Apply multi-select bond type filter (inspects each molecule's bond list)
         if self.bond_type_filters:
             molecules = [m for m in molecules if self._matches_bond_type(m)]
 
         return molecules
 
+    @staticmethod
+    def _value_in_filters(value, filters):
+        """Check a categorical value against a multi-select filter list"""
+        value = value or ''
+        return value.capitalize() in filters or value in filters
+
     def _matches_category(self, molecule):
         """Check if molecule matches category filter"""
         if not self.category_filters:
@@ -302,39 +388,129 @@ class MoleculeUnifiedTable(QWidget):
 
         if layout:
             layout.update_dimensions(self.width(), self.height())
-            self.positioned_molecules = layout.calculate_layout(molecules)
+            positioned = get_layout_prefetcher().take(self._layout_key(self.layout_mode, molecules))
+            with get_profiler().scope(f'layout.{type(layout).__name__}', 'layout'):
+                if positioned is None:
+                    positioned = layout.calculate_layout(molecules)
+                self.positioned_molecules = positioned
+                self._build_card_index()
+
+    def _build_card_index(self):
+        """Index the positioned molecule cards for viewport culling"""
+        rects = [(mol.get('x', 0), mol.get('y', 0), mol.get('width', 150), mol.get('height', 170))
+                 for mol in self.positioned_molecules]
+        largest = max((max(w, h) for _, _, w, h in rects), default=170)
+        self._card_index = SpatialIndex(cell_size=2 * largest)
+        for mol, rect in zip(self.positioned_molecules, rects):
+            self._card_index.insert(mol, *rect)
+
+    def get_visible_molecules(self):
+        """Positioned molecules whose cards intersect the visible area"""
+        left, top, right, bottom = visible_world_rect(
+            self.width(), self.height(), self.pan_x, self.pan_y, self.zoom_level,
+            scroll_y=self.scroll_offset_y, margin=CULL_MARGIN)
+        return self._card_index.query(left, top, right, bottom)
+
+    # ==================== Layout Transitions ====================
+
+    def _start_transition(self, previous, current):
+        """Animate cards from one list of positioned molecules to another"""
+        source = {mol.get('Name'): (mol.get('x', 0), mol.get('y', 0)) for mol in previous}
+        target = {mol.get('Name'): (mol.get('x', 0), mol.get('y', 0)) for mol in current}
+        self._stop_transition()
+        if not source or not self.isVisible():
+            return
+        transition = LayoutTransition(source, target)
+        if not transition.moving:
+            return
+        self._transition_molecules = {mol.get('Name'): mol for mol in previous}
+        self._transition_molecules.update((mol.get('Name'), mol) for mol in current)
+        self._transition = transition.start()
+        self._transition_timer.start()
+
+    def _stop_transition(self):
+        """Cancel a running transition (the target layout is already current)"""
+        self._transition = None
+        self._transition_molecules = {}
+        self._transition_timer.stop()
+
+    def _advance_transition(self):
+        """Timer tick: repaint the moving cards, ending the transition when done"""
+        if self._transition is not None and self._transition.is_finished():
+            self._stop_transition()
+        self.update()
+
+    def _draw_transition(self, painter):
+        """Paint the cards at their interpolated positions (group headers wait for the end)"""
+        left, top, right, bottom = visible_world_rect(
+            self.width(), self.height(), self.pan_x, self.pan_y, self.zoom_level,
+            scroll_y=self.scroll_offset_y, margin=CULL_MARGIN)
+        values, opacities = self._transition.frame()
+        cards = []
+        for i, name in enumerate(self._transition.keys):
+            mol = self._transition_molecules[name]
+            x, y = values[2 * i], values[2 * i + 1]
+            if (x > right or y > bottom or x + mol.get('width', 150) < left
+                    or y + mol.get('height', 170) < top):
+                continue
+            cards.append((mol, x, y, opacities[i]))
+        self._project_structures([mol for mol, _, _, _ in cards])
+        for mol, x, y, opacity in cards:
+            # The record itself is painted, so hover and selection still match it
+            painter.setOpacity(opacity)
+            self._paint_molecule_card(painter, mol, x, y)
+        painter.setOpacity(1.0)
 
     def resizeEvent(self, event):
         """Handle resize events"""
         super().resizeEvent(event)
         for layout in self.layouts.values():
             layout.update_dimensions(self.width(), self.height())
+        self._stop_transition()
         self._update_layout()
 
     def paintEvent(self, event):
         """Paint the molecule visualization"""
+        profiler = get_profiler()
+        profiler.begin_frame()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw background
-        self._draw_background(painter)
+        with profiler.scope('paint.background', 'paint'):
+            self._draw_background(painter)
 
         # Apply transformations
         painter.translate(self.pan_x, self.pan_y - self.scroll_offset_y)
         painter.scale(self.zoom_level, self.zoom_level)
 
+        # While switching layouts only the moving cards are painted
+        if self._transition is not None:
+            with profiler.scope('paint.transition', 'paint'):
+                self._draw_transition(painter)
+            draw_profiler_overlay(painter, self.width())
+            painter.end()
+            profiler.end_frame('MoleculeUnifiedTable.paint')
+            return
+
         # Draw group headers if applicable
         if self.layout_mode in [MoleculeLayoutMode.POLARITY, MoleculeLayoutMode.BOND_TYPE,
                                 MoleculeLayoutMode.GEOMETRY, MoleculeLayoutMode.PHASE_DIAGRAM,
                                 MoleculeLayoutMode.DIPOLE, MoleculeLayoutMode.DENSITY,
-                                MoleculeLayoutMode.BOND_COMPLEXITY]:
-            self._draw_group_headers(painter)
-
-        # Draw molecules
-        for mol in self.positioned_molecules:
-            self._draw_molecule_card(painter, mol)
-
+                                MoleculeLayoutMode.BOND_COMPLEXITY, MoleculeLayoutMode.VIBRATIONAL]:
+            with profiler.scope('paint.labels', 'paint'):
+                self._draw_group_headers(painter)
+
+        # Draw molecules (off-screen cards are skipped)
+        with profiler.scope('paint.elements', 'paint'):
+            visible = self.get_visible_molecules()
+            self._project_structures(visible)
+            for mol in visible:
+                self._paint_molecule_card(painter, mol)
+
+        draw_profiler_overlay(painter, self.width())
         painter.end()
+        profiler.end_frame('MoleculeUnifiedTable.paint')
 
     def _draw_background(self, painter):
         """Draw the dark gradient background"""
@@ -377,10 +553,53 @@ class MoleculeUnifiedTable(QWidget):
             painter.drawLine(int(header_rect.left() + 10), int(header_rect.bottom()),
                            int(header_rect.right() - 10), int(header_rect.bottom()))
 
-    def _draw_molecule_card(self, painter, mol):
-        """Draw a single molecule card"""
-        x = mol.get('x', 0)
-        y = mol.get('y', 0)
+    def _paint_molecule_card(self, painter, mol, x=None, y=None):
+        """
+        Blit a molecule card's static layer from the pixmap cache (rendering it
+        on a miss) and draw its structure on top at the current rotation.
+
+        Args:
+            painter: Table painter
+            mol: Positioned molecule dictionary
+            x, y: Card position overriding the molecule's own (layout transitions)
+        """
+        x = mol.get('x', 0) if x is None else x
+        y = mol.get('y', 0) if y is None else y
+        width = mol.get('width', 150)
+        height = mol.get('height', 170)
+        if mol == self.selected_molecule:
+            state = 'selected'
+        elif mol == self.hovered_molecule:
+            state = 'hovered'
+        else:
+            state = ''
+        get_card_pixmap_cache().draw_card(
+            painter, CARD_CACHE_NAMESPACE, mol.get('Name'), (), state, x, y, width, height,
+            lambda card_painter: self._draw_molecule_card(card_painter, mol, x, y), pad=CARD_CACHE_PAD)
+        self._draw_molecule_structure(painter, mol, x + width/2, y + 50, self._structure_radius(mol))
+
+    def _invalidate_cards(self, names=None):
+        """Drop cached card pixmaps (all cards, or only the named molecules)"""
+        get_card_pixmap_cache().invalidate(CARD_CACHE_NAMESPACE, names)
+
+    def _invalidate_structures(self, names=None):
+        """Drop cached structure atoms and projections (all, or only the named molecules)"""
+        if names is None:
+            self._structure_atoms = {}
+            self._projected_structures = {}
+            return
+        names = set(names)
+        for cache in (self._structure_atoms, self._projected_structures):
+            for key in [k for k in cache if k[0] in names]:
+                del cache[key]
+
+    def _discard_layouts(self):
+        """Drop prefetched layouts and any running transition after a data change"""
+        get_layout_prefetcher().discard(LAYOUT_NAMESPACE)
+        self._stop_transition()
+
+    def _draw_molecule_card(self, painter, mol, x, y):
+        """Draw the static layer of a molecule card (background, border and text)"""
         width = mol.get('width', 150)
         height = mol.get('height', 170)
 
@@ -418,9 +637,6 @@ class MoleculeUnifiedTable(QWidget):
 
         painter.drawRoundedRect(card_rect, 10, 10)
 
-        # Draw molecule structure visualization
-        self._draw_molecule_structure(painter, mol, x + width/2, y + 50, min(width, height) * 0.25)
-
         # Draw text info
         self._draw_molecule_info(painter, mol, x, y, width, height)
 
@@ -432,9 +648,8 @@ class MoleculeUnifiedTable(QWidget):
         if not composition:
             return
 
-        # Calculate atom positions based on geometry
-        geometry = mol.get('geometry', 'Linear')
-        atom_positions = self._calculate_atom_positions(composition, geometry, cx, cy, radius)
+        # Atom positions at the current rotation (projected in the per-frame batch)
+        atom_positions = self._projected_atoms(mol, radius)
 
         # Draw bonds first
         painter.setPen(QPen(QColor(200, 200, 200, 150), 2))
@@ -450,7 +665,7 @@ class MoleculeUnifiedTable(QWidget):
 
         # Draw atoms
         for atom_info in atom_positions:
-            ax, ay = atom_info['x'], atom_info['y']
+            ax, ay = cx + atom_info['x'], cy + atom_info['y']
             element = atom_info['element']
             atom_radius = atom_info['radius']
 
@@ -479,8 +694,88 @@ class MoleculeUnifiedTable(QWidget):
             text_rect = QRectF(ax - atom_radius, ay - atom_radius, atom_radius * 2, atom_radius * 2)
             painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, element)
 
+    @staticmethod
+    def _structure_radius(mol):
+        """Radius of the structure drawing on a molecule's card"""
+        return min(mol.get('width', 150), mol.get('height', 170)) * 0.25
+
+    def _project_structures(self, molecules):
+        """
+        Project the structures of the given molecules at the current rotation in
+        one batch (one rotation matrix, one rotation of all their atoms).
+        Molecules already projected at this rotation are skipped.
+        """
+        keys, structures = [], []
+        for mol in molecules:
+            radius = self._structure_radius(mol)
+            key = (mol.get('Name'), radius)
+            if key in self._projected_structures:
+                continue
+            atoms = self._structure_atoms.get(key)
+            if atoms is None:
+                atoms = self._coordinate_structure_atoms(mol, radius)
+                if not atoms:
+                    atoms = self._generate_structure_atoms(
+                        mol.get('Composition', []), mol.get('geometry', 'Linear'), radius)
+                self._structure_atoms[key] = atoms
+            keys.append(key)
+            structures.append((atoms, radius, 0.0, 0.0))
+        if structures:
+            draw_lists = project_structures(structures, self.pitch, self.yaw, self.roll)
+            self._projected_structures.update(zip(keys, draw_lists))
+
+    def _projected_atoms(self, mol, radius):
+        """Depth-sorted projected atoms of a molecule's structure, relative to its center"""
+        key = (mol.get('Name'), radius)
+        if key not in self._projected_structures:
+            self._project_structures([mol])
+        return self._projected_structures.get(key, [])
+
     def _calculate_atom_positions(self, composition, geometry, cx, cy, radius):
         """Calculate positions for atoms based on molecular geometry with 3D rotation"""
+        atoms = self._generate_structure_atoms(composition, geometry, radius)
+        return project_structures([(atoms, radius, cx, cy)], self.pitch, self.yaw, self.roll)[0]
+
+    @staticmethod
+    def _element_radius(element):
+        """Drawn atom size by element (rough approximation)"""
+        if element in ['C', 'N', 'O', 'S']:
+            return 14
+        if element in ['H']:
+            return 8
+        if element in ['Cl', 'Br', 'I']:
+            return 16
+        return 12
+
+    def _coordinate_structure_atoms(self, mol, radius):
+        """
+        Unrotated atoms from the molecule's stored Atoms3D, or from an embedding
+        of its Bonds3D graph, centered and scaled to fit the structure radius.
+        Returns an empty list when the molecule has neither.
+        """
+        atoms_3d = molecule_atoms_3d(mol)
+        if not atoms_3d:
+            return []
+
+        xs = [a.get('x', 0) for a in atoms_3d]
+        ys = [a.get('y', 0) for a in atoms_3d]
+        zs = [a.get('z', 0) for a in atoms_3d]
+        extent = max(max(xs) - min(xs), max(ys) - min(ys), max(zs) - min(zs), 0.5)
+        scale = radius * 0.7 / extent
+        center_x = (max(xs) + min(xs)) / 2
+        center_y = (max(ys) + min(ys)) / 2
+        center_z = (max(zs) + min(zs)) / 2
+
+        return [{
+            'element': atom.get('element', '?'),
+            'x': (x - center_x) * scale,
+            'y': (y - center_y) * scale,
+            'z': (z - center_z) * scale,
+            'radius': self._element_radius(atom.get('element', '?'))
+        } for atom, x, y, z in zip(atoms_3d, xs, ys, zs)]
+
+    def _generate_structure_atoms(self, composition, geometry, radius):
+        """Unrotated atom positions (relative to the structure center) for a geometry"""
         positions_3d = []
         total_atoms = sum(c.get('Count', 1) for c in composition)
 
@@ -493,14 +788,7 @@ class MoleculeUnifiedTable(QWidget):
             element = comp.get('Element', '?')
             count = comp.get('Count', 1)
 
-            # Size based on element (rough approximation)
-            base_radius = 12
-            if element in ['C', 'N', 'O', 'S']:
-                base_radius = 14
-            elif element in ['H']:
-                base_radius = 8
-            elif element in ['Cl', 'Br', 'I']:
-                base_radius = 16
+            base_radius = self._element_radius(element)
 
             for i in range(count):
                 if total_atoms == 1:
@@ -576,27 +864,7 @@ class MoleculeUnifiedTable(QWidget):
                 })
                 atom_index += 1
 
-        # Apply 3D rotation and project to 2D
-        positions = []
-        for atom in positions_3d:
-            x_rot, y_rot, z_rot = rotate_point_3d(
-                atom['x'], atom['y'], atom['z'],
-                self.pitch, self.yaw, self.roll
-            )
-            # Simple orthographic projection with depth-based scaling
-            depth_scale = 1.0 + z_rot / (radius * 4)  # Subtle perspective
-            positions.append({
-                'element': atom['element'],
-                'x': cx + x_rot,
-                'y': cy + y_rot,
-                'z': z_rot,
-                'radius': atom['radius'] * max(0.7, min(1.3, depth_scale))
-            })
-
-        # Sort by Z depth (draw far atoms first)
-        positions.sort(key=lambda p: p.get('z', 0))
-
-        return positions
+        return positions_3d
 
     def _draw_molecule_info(self, painter, mol, x, y, width, height):
         """Draw molecule text information"""
@@ -907,5 +1175,32 @@ class MoleculeUnifiedTable(QWidget):
     def reload_data(self):
         """Reload molecule data from files and refresh the display"""
         self.base_molecules = self.loader.load_all_molecules()
+        self._invalidate_cards()
+        self._invalidate_structures()
+        self._discard_layouts()
+        self._update_layout()
+        self.update()
+
+    def apply_data_changes(self, event):
+        """
+        Apply an item-level data change, re-reading only the changed files.
+
+        Args:
+            event: DataChangeEvent for the molecules category
+        """
+        if event.full:
+            self.reload_data()
+            return
+        updated, removed = self.loader.reload_items(event.names)
+        if not updated and not removed:
+            return
+        self.base_molecules = self.loader.molecules
+        changed_names = [m['Name'] for m in updated] + list(removed)
+        self._invalidate_cards(changed_names)
+        self._invalidate_structures(changed_names)
+        if self.selected_molecule is not None and self.selected_molecule.get('Name') in removed:
+            self.selected_molecule = None
+        self.hovered_molecule = None
+        self._discard_layouts()
         self._update_layout()
         self.update()
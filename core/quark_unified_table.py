@@ -20,6 +20,9 @@ from layouts.quark_force_network_layout import QuarkForceNetworkLayoutRenderer
 from layouts.quark_mass_spiral_layout import QuarkMassSpiralLayoutRenderer
 from layouts.quark_fermion_boson_layout import QuarkFermionBosonLayoutRenderer
 from layouts.quark_charge_mass_layout import QuarkChargeMassLayoutRenderer
+from utils.profiler import get_profiler
+from utils.profiler_overlay import draw_profiler_overlay
+from utils.filter_masks import FilterMasks
 
 
 class QuarkUnifiedTable(QWidget):
@@ -38,6 +41,11 @@ class QuarkUnifiedTable(QWidget):
         self.loader = QuarkDataLoader()
         self.particles = []
         self.base_particles = []
+        # Per-filter bitsets over base_particles, and the mask and parameters
+        # of the current layout (for diff-based relayout)
+        self._filter_masks = FilterMasks()
+        self._layout_mask = None
+        self._layout_signature = None
 
         # Layout state
         self.layout_mode = QuarkLayoutMode.STANDARD_MODEL
@@ -81,11 +89,17 @@ class QuarkUnifiedTable(QWidget):
         self.load_particle_data()
 
     def load_particle_data(self):
-        """Load particle data from JSON files"""
+        """
+        Load particle data from JSON files. The full catalog (antiparticles
+        and composites included) is loaded once; the display toggles are
+        filter masks over it.
+        """
         self.base_particles = self.loader.load_all_particles(
-            include_antiparticles=self.show_antiparticles,
-            include_composite=self.show_composites
+            include_antiparticles=True,
+            include_composite=True
         )
+        self._filter_masks.set_items(self.base_particles)
+        self._layout_mask = None
         self._update_layout()
 
     def _create_renderers(self):
@@ -108,37 +122,56 @@ class QuarkUnifiedTable(QWidget):
             return
 
         # Filter particles based on settings
-        filtered = self.base_particles.copy()
-        if not self.show_antiparticles:
-            filtered = [p for p in filtered if not p.get('_is_antiparticle', False)]
-        if not self.show_composites:
-            filtered = [p for p in filtered if not p.get('is_composite', False)]
-
-        # Apply classification filter (quarks, leptons, bosons)
-        if hasattr(self, 'classification_filters'):
-            filtered = [p for p in filtered if self._passes_classification_filter(p)]
-
-        # Apply generation filter (1st, 2nd, 3rd generation)
-        if hasattr(self, 'generation_filters'):
-            filtered = [p for p in filtered if self._passes_generation_filter(p)]
+        self._update_filter_masks()
+        mask = self._filter_masks.mask
+        filtered = self._filter_masks.selected()
 
-        # Apply charge type filter (positive, negative, neutral)
-        if hasattr(self, 'charge_type_filters'):
-            filtered = [p for p in filtered if self._passes_charge_type_filter(p)]
-
-        # Create layout
+        # Create layout; with unchanged size and parameters the renderer only
+        # has to account for the particles the filters added or removed
         self.current_renderer = self.renderers.get(self.layout_mode)
         if self.current_renderer:
             self.current_renderer.update_dimensions(self.width(), self.height())
             kwargs = {}
             if self.layout_mode == QuarkLayoutMode.LINEAR:
                 kwargs['sort_property'] = self.order_property
-            self.particles = self.current_renderer.create_layout(filtered, **kwargs)
+            signature = (self.layout_mode, self.width(), self.height(), tuple(sorted(kwargs.items())))
+            with get_profiler().scope(f'layout.{type(self.current_renderer).__name__}', 'layout'):
+                if signature == self._layout_signature and self._layout_mask is not None:
+                    added, removed = self._filter_masks.diff(self._layout_mask, mask)
+                    self.particles = self.current_renderer.update_layout(
+                        self.particles, filtered, added, removed, **kwargs)
+                else:
+                    self.particles = self.current_renderer.create_layout(filtered, **kwargs)
+            self._layout_signature = signature
+            self._layout_mask = mask
         else:
             self.particles = filtered
 
         self.update()
 
+    def _update_filter_masks(self):
+        """
+        Push the display toggles and filter settings into the per-filter
+        bitsets. Only a filter whose setting is new is evaluated.
+        """
+        masks = self._filter_masks
+        masks.set_filter('antiparticles', self.show_antiparticles,
+                         None if self.show_antiparticles else lambda p: not p.get('_is_antiparticle', False))
+        masks.set_filter('composites', self.show_composites,
+                         None if self.show_composites else lambda p: not p.get('is_composite', False))
+
+        # Classification (quarks, leptons, bosons), generation (1st, 2nd, 3rd)
+        # and charge type (positive, negative, neutral) filters
+        if hasattr(self, 'classification_filters'):
+            masks.set_filter('classification', tuple(sorted(self.classification_filters.items())),
+                             self._passes_classification_filter)
+        if hasattr(self, 'generation_filters'):
+            masks.set_filter('generation', tuple(sorted(self.generation_filters.items())),
+                             self._passes_generation_filter)
+        if hasattr(self, 'charge_type_filters'):
+            masks.set_filter('charge_type', tuple(sorted(self.charge_type_filters.items())),
+                             self._passes_charge_type_filter)
+
     def _passes_classification_filter(self, particle):
         """Check if particle passes the classification filter"""
         if not hasattr(self, 'classification_filters'):
@@ -229,13 +262,13 @@ class QuarkUnifiedTable(QWidget):
         """Toggle antiparticle display"""
         if self.show_antiparticles != show:
             self.show_antiparticles = show
-            self.load_particle_data()
+            self._update_layout()
 
     def set_show_composites(self, show):
         """Toggle composite particle display"""
         if self.show_composites != show:
             self.show_composites = show
-            self.load_particle_data()
+            self._update_layout()
 
     def passes_filter(self, particle):
         """Check if a particle passes the current filters"""
@@ -270,28 +303,35 @@ class QuarkUnifiedTable(QWidget):
 
     def paintEvent(self, event):
         """Paint the particle visualization"""
+        profiler = get_profiler()
+        profiler.begin_frame()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Background
-        painter.fillRect(self.rect(), QColor(15, 15, 30))
+        with profiler.scope('paint.background', 'paint'):
+            painter.fillRect(self.rect(), QColor(15, 15, 30))
 
         # Apply zoom and pan
         painter.translate(self.pan_x, self.pan_y)
         painter.scale(self.zoom_level, self.zoom_level)
 
         # Draw title
-        self._draw_title(painter)
+        with profiler.scope('paint.labels', 'paint'):
+            self._draw_title(painter)
 
         # Draw particles using current renderer
         if self.current_renderer and self.particles:
             table_state = self.get_table_state()
-            self.current_renderer.paint(
-                painter, self.particles, table_state,
-                passes_filter_func=self.passes_filter
-            )
+            with profiler.scope('paint.elements', 'paint'):
+                self.current_renderer.paint(
+                    painter, self.particles, table_state,
+                    passes_filter_func=self.passes_filter
+                )
 
+        draw_profiler_overlay(painter, self.width())
         painter.end()
+        profiler.end_frame('QuarkUnifiedTable.paint')
 
     def _draw_title(self, painter):
         """Draw layout mode title"""
@@ -456,3 +496,13 @@ class QuarkUnifiedTable(QWidget):
         """Reload particle data from files and refresh the display"""
         self.load_particle_data()
         self.update()
+
+    def apply_data_changes(self, event):
+        """
+        Apply a data change. The quark catalog is small and is merged from
+        several directories, so any change simply reloads it.
+
+        Args:
+            event: DataChangeEvent for the quarks, antiquarks or subatomic category
+        """
+        self.reload_data()
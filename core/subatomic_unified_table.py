@@ -5,8 +5,9 @@ Handles all layout modes and user interactions for the Subatomic tab
 
 import json
 import math
+from collections import OrderedDict
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, QPointF, QRectF, Signal
+from PySide6.QtCore import Qt, QPointF, QRectF, QTimer, Signal
 from PySide6.QtGui import (QPainter, QColor, QPen, QBrush, QFont, QPainterPath,
                            QLinearGradient, QRadialGradient, QPolygonF, QGuiApplication)
 
@@ -14,6 +15,25 @@ from data.subatomic_loader import get_subatomic_loader, SubatomicDataLoader
 from data.layout_config_loader import get_subatomic_config
 from core.subatomic_enums import (SubatomicLayoutMode, ParticleCategory, SubatomicProperty,
                                    QuarkType, PARTICLE_COLORS, get_particle_family_color)
+from utils.profiler import get_profiler
+from utils.profiler_overlay import draw_profiler_overlay
+from utils.spatial_index import SpatialIndex, visible_world_rect
+from utils.card_pixmap_cache import get_card_pixmap_cache
+from utils.filter_masks import FilterMasks
+from utils.layout_transition import LayoutTransition, get_layout_prefetcher, TRANSITION_FRAME_MS
+from utils.physics_calculator_v2 import SubatomicCalculatorV2
+from layouts.subatomic_eightfold_layout import eightfold_coordinates
+from layouts.subatomic_quark_tree_layout import quark_tree_level
+
+# Layout units around each card kept when culling (hover/selection glow)
+CULL_MARGIN = 10
+# Pixmap cache namespace and the layout units cached around each card (glow)
+CARD_CACHE_NAMESPACE = 'subatomic'
+CARD_CACHE_PAD = 6
+# Laid-out views kept per (layout mode, width, filter mask)
+LAYOUT_MEMO_SIZE = 16
+# Layout prefetcher namespace (leading element of the memo keys)
+LAYOUT_NAMESPACE = 'subatomic'
 
 
 class SubatomicUnifiedTable(QWidget):
@@ -53,6 +73,10 @@ class SubatomicUnifiedTable(QWidget):
         self.show_unstable = True
         self.charge_filter = None  # None = show all, or specific charge
 
+        # Per-filter bitsets over self.particles
+        self._filter_masks = FilterMasks(self.particles)
+        self._update_filter_masks()
+
         # Zoom and pan
         self.zoom_level = 1.0
         self.pan_x = 0
@@ -68,16 +92,44 @@ class SubatomicUnifiedTable(QWidget):
 
         # Layout cache
         self._layout_cache = {}
+        self._card_index = SpatialIndex()
+        self._decay_arrow_segments = []
+        self._layout_memo = OrderedDict()
         self._needs_layout_update = True
 
+        # Animated layout switch (cards move from the old to the new layout)
+        self._transition = None
+        self._transition_particles = {}
+        self._transition_timer = QTimer(self)
+        self._transition_timer.setInterval(TRANSITION_FRAME_MS)
+        self._transition_timer.timeout.connect(self._advance_transition)
+
     def set_layout_mode(self, mode):
-        """Set the layout mode"""
+        """Set the layout mode, animating cards from their current positions"""
         if isinstance(mode, str):
             mode = SubatomicLayoutMode.from_string(mode)
+        previous = {} if self._needs_layout_update else dict(self._layout_cache)
         self.layout_mode = mode
-        self._needs_layout_update = True
+        self._calculate_layout()
+        self._start_transition(previous, self._layout_cache)
         self.update()
 
+    def prefetch_layout(self, mode):
+        """
+        Compute a layout mode on the background thread, so that switching to it
+        only picks up the result (called while the mode's selector is hovered).
+
+        Args:
+            mode: SubatomicLayoutMode or its string name
+        """
+        if isinstance(mode, str):
+            mode = SubatomicLayoutMode.from_string(mode)
+        key = self._layout_key(mode)
+        if key in self._layout_memo:
+            return
+        particles, width = self.get_filtered_particles(), self.width()
+        get_layout_prefetcher().prefetch(key, lambda: self._compute_layout(mode, particles, width))
+
     def set_filter(self, show_baryons=True, show_mesons=True, show_stable=True, show_unstable=True, charge=None):
         """Set particle filters"""
         self.show_baryons = show_baryons
@@ -85,63 +137,159 @@ class SubatomicUnifiedTable(QWidget):
         self.show_stable = show_stable
         self.show_unstable = show_unstable
         self.charge_filter = charge
-        self._needs_layout_update = True
+        if self._update_filter_masks():
+            self._needs_layout_update = True
         self.update()
 
+    def _update_filter_masks(self):
+        """
+        Push the filter settings into the per-filter bitsets. Only a filter
+        whose setting is new is evaluated; the others keep their bitsets.
+
+        Returns:
+            True if any filter setting changed
+        """
+        masks = self._filter_masks
+        show_baryons, show_mesons = self.show_baryons, self.show_mesons
+        show_stable, show_unstable = self.show_stable, self.show_unstable
+        charge = self.charge_filter
+
+        changed = masks.set_filter(
+            'category', (show_baryons, show_mesons),
+            lambda p: (show_baryons or not p.get('_is_baryon')) and (show_mesons or not p.get('_is_meson')))
+        changed |= masks.set_filter(
+            'stability', (show_stable, show_unstable),
+            lambda p: show_stable if p.get('Stability', 'Unstable') == 'Stable' else show_unstable)
+        changed |= masks.set_filter(
+            'charge', charge, None if charge is None else (lambda p: p.get('Charge_e', 0) == charge))
+        return changed
+
     def get_filtered_particles(self):
         """Get particles after applying filters"""
-        filtered = []
-        for p in self.particles:
-            # Category filter
-            if p.get('_is_baryon') and not self.show_baryons:
-                continue
-            if p.get('_is_meson') and not self.show_mesons:
-                continue
+        return self._filter_masks.selected()
 
-            # Stability filter
-            stability = p.get('Stability', 'Unstable')
-            is_stable = stability == 'Stable'
-            if is_stable and not self.show_stable:
-                continue
-            if not is_stable and not self.show_unstable:
-                continue
+    def _set_particles(self, particles):
+        """Replace the particle list, dropping its filter bitsets and memoized layouts"""
+        self.particles = particles
+        self._filter_masks.set_items(particles)
+        self._layout_memo.clear()
+        self._needs_layout_update = True
+        self._stop_transition()
+        get_layout_prefetcher().discard(LAYOUT_NAMESPACE)
 
-            # Charge filter
-            if self.charge_filter is not None:
-                if p.get('Charge_e', 0) != self.charge_filter:
-                    continue
+    def _layout_key(self, mode):
+        """Memo and prefetch key of a layout mode at the current width and filters"""
+        return (LAYOUT_NAMESPACE, mode, self.width(), self._filter_masks.mask)
 
-            filtered.append(p)
+    def _calculate_layout(self):
+        """
+        Calculate positions for all particles based on layout mode. Layouts are
+        memoized by (mode, width, filter mask), so toggling a filter back
+        restores the earlier positions without recomputing them; a layout
+        prefetched on the background thread is picked up instead of computed.
+        """
+        key = self._layout_key(self.layout_mode)
+        memo = self._layout_memo.get(key)
+        if memo is not None:
+            self._layout_memo.move_to_end(key)
+        else:
+            memo = get_layout_prefetcher().take(key)
+            if memo is None:
+                with get_profiler().scope(f'layout.{self.layout_mode.name.lower()}', 'layout'):
+                    memo = self._compute_layout(self.layout_mode, self.get_filtered_particles(), self.width())
+            self._layout_memo[key] = memo
+            if len(self._layout_memo) > LAYOUT_MEMO_SIZE:
+                self._layout_memo.popitem(last=False)
+        self._layout_cache, self._decay_arrow_segments, self._card_index = memo
+        self._needs_layout_update = False
 
-        return filtered
+    def _build_card_index(self, cache):
+        """Index the laid-out particle cards for viewport culling and hit testing"""
+        cards = [data for data in cache.values() if 'particle' in data]
+        return SpatialIndex.build(
+            cards, lambda data: (data['x'], data['y'], self.card_width, self.card_height),
+            cell_size=2 * max(self.card_width, self.card_height))
 
-    def _calculate_layout(self):
-        """Calculate positions for all particles based on layout mode"""
-        particles = self.get_filtered_particles()
-        self._layout_cache = {}
+    def get_visible_cards(self):
+        """Layout entries of the particle cards that intersect the visible area"""
+        left, top, right, bottom = visible_world_rect(
+            self.width(), self.height(), self.pan_x, self.pan_y, self.zoom_level, margin=CULL_MARGIN)
+        return self._card_index.query(left, top, right, bottom)
 
-        if self.layout_mode == SubatomicLayoutMode.BARYON_MESON:
-            self._calculate_baryon_meson_layout(particles)
-        elif self.layout_mode == SubatomicLayoutMode.MASS_ORDER:
-            self._calculate_mass_layout(particles)
-        elif self.layout_mode == SubatomicLayoutMode.CHARGE_ORDER:
-            self._calculate_charge_layout(particles)
-        elif self.layout_mode == SubatomicLayoutMode.DECAY_CHAIN:
-            self._calculate_decay_layout(particles)
-        elif self.layout_mode == SubatomicLayoutMode.QUARK_CONTENT:
-            self._calculate_quark_content_layout(particles)
-        elif self.layout_mode == SubatomicLayoutMode.EIGHTFOLD_WAY:
-            self._calculate_eightfold_layout(particles)
-        elif self.layout_mode == SubatomicLayoutMode.LIFETIME_SPECTRUM:
-            self._calculate_lifetime_layout(particles)
-        elif self.layout_mode == SubatomicLayoutMode.QUARK_TREE:
-            self._calculate_quark_tree_layout(particles)
-        elif self.layout_mode == SubatomicLayoutMode.DISCOVERY_TIMELINE:
-            self._calculate_discovery_layout(particles)
+    def _compute_layout(self, mode, particles, width):
+        """
+        Run the layout calculation for a mode. Only reads its arguments and the
+        fixed card metrics, so it can run on the prefetch thread.
 
-        self._needs_layout_update = False
+        Returns:
+            (layout cache, decay arrow segments, card index)
+        """
+        cache = {}
+        if mode == SubatomicLayoutMode.BARYON_MESON:
+            self._calculate_baryon_meson_layout(particles, cache, width)
+        elif mode == SubatomicLayoutMode.MASS_ORDER:
+            self._calculate_mass_layout(particles, cache, width)
+        elif mode == SubatomicLayoutMode.CHARGE_ORDER:
+            self._calculate_charge_layout(particles, cache, width)
+        elif mode == SubatomicLayoutMode.DECAY_CHAIN:
+            self._calculate_decay_layout(particles, cache, width)
+        elif mode == SubatomicLayoutMode.QUARK_CONTENT:
+            self._calculate_quark_content_layout(particles, cache, width)
+        elif mode == SubatomicLayoutMode.EIGHTFOLD_WAY:
+            self._calculate_eightfold_layout(particles, cache, width)
+        elif mode == SubatomicLayoutMode.LIFETIME_SPECTRUM:
+            self._calculate_lifetime_layout(particles, cache, width)
+        elif mode == SubatomicLayoutMode.QUARK_TREE:
+            self._calculate_quark_tree_layout(particles, cache, width)
+        elif mode == SubatomicLayoutMode.DISCOVERY_TIMELINE:
+            self._calculate_discovery_layout(particles, cache, width)
+
+        segments = self._calculate_decay_arrow_segments(cache) if mode == SubatomicLayoutMode.DECAY_CHAIN else []
+        return cache, segments, self._build_card_index(cache)
+
+    # ==================== Layout Transitions ====================
+
+    def _start_transition(self, previous, current):
+        """Animate cards from one layout cache to another"""
+        source = {name: (data['x'], data['y']) for name, data in previous.items() if 'particle' in data}
+        target = {name: (data['x'], data['y']) for name, data in current.items() if 'particle' in data}
+        self._stop_transition()
+        if not source or not self.isVisible():
+            return
+        transition = LayoutTransition(source, target)
+        if not transition.moving:
+            return
+        self._transition_particles = {name: data['particle'] for layout in (previous, current)
+                                      for name, data in layout.items() if 'particle' in data}
+        self._transition = transition.start()
+        self._transition_timer.start()
+
+    def _stop_transition(self):
+        """Cancel a running transition (the target layout is already current)"""
+        self._transition = None
+        self._transition_particles = {}
+        self._transition_timer.stop()
+
+    def _advance_transition(self):
+        """Timer tick: repaint the moving cards, ending the transition when done"""
+        if self._transition is not None and self._transition.is_finished():
+            self._stop_transition()
+        self.update()
+
+    def _draw_transition(self, painter):
+        """Paint the cards at their interpolated positions (headers and arrows wait for the end)"""
+        left, top, right, bottom = visible_world_rect(
+            self.width(), self.height(), self.pan_x, self.pan_y, self.zoom_level, margin=CULL_MARGIN)
+        values, opacities = self._transition.frame()
+        for i, name in enumerate(self._transition.keys):
+            x, y = values[2 * i], values[2 * i + 1]
+            if x > right or y > bottom or x + self.card_width < left or y + self.card_height < top:
+                continue
+            painter.setOpacity(opacities[i])
+            self._paint_particle_card(painter, x, y, self._transition_particles[name])
+        painter.setOpacity(1.0)
 
-    def _calculate_baryon_meson_layout(self, particles):
+    def _calculate_baryon_meson_layout(self, particles, cache, width):
         """Layout with baryons and mesons in separate groups"""
         baryons = [p for p in particles if p.get('_is_baryon')]
         mesons = [p for p in particles if p.get('_is_meson')]
@@ -151,14 +299,14 @@ class SubatomicUnifiedTable(QWidget):
 
         # Baryon section
         if baryons:
-            self._layout_cache['baryon_header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'BARYONS (3 quarks)'}
-            cols = max(1, (self.width() - 100) // (self.card_width + self.card_spacing))
+            cache['baryon_header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'BARYONS (3 quarks)'}
+            cols = max(1, (width - 100) // (self.card_width + self.card_spacing))
             for i, p in enumerate(baryons):
                 row = i // cols
                 col = i % cols
                 x = x_start + col * (self.card_width + self.card_spacing)
                 y = y_offset + row * (self.card_height + self.card_spacing)
-                self._layout_cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
+                cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
 
             # Calculate end of baryon section
             baryon_rows = (len(baryons) + cols - 1) // cols
@@ -166,33 +314,33 @@ class SubatomicUnifiedTable(QWidget):
 
         # Meson section
         if mesons:
-            self._layout_cache['meson_header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'MESONS (quark + antiquark)'}
-            cols = max(1, (self.width() - 100) // (self.card_width + self.card_spacing))
+            cache['meson_header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'MESONS (quark + antiquark)'}
+            cols = max(1, (width - 100) // (self.card_width + self.card_spacing))
             for i, p in enumerate(mesons):
                 row = i // cols
                 col = i % cols
                 x = x_start + col * (self.card_width + self.card_spacing)
                 y = y_offset + row * (self.card_height + self.card_spacing)
-                self._layout_cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
+                cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
 
-    def _calculate_mass_layout(self, particles):
+    def _calculate_mass_layout(self, particles, cache, width):
         """Layout ordered by mass"""
         sorted_particles = sorted(particles, key=lambda p: p.get('Mass_MeVc2', 0))
 
         y_offset = 80
         x_start = 50
-        cols = max(1, (self.width() - 100) // (self.card_width + self.card_spacing))
+        cols = max(1, (width - 100) // (self.card_width + self.card_spacing))
 
-        self._layout_cache['header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'Particles by Mass (MeV/c^2)'}
+        cache['header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'Particles by Mass (MeV/c^2)'}
 
         for i, p in enumerate(sorted_particles):
             row = i // cols
             col = i % cols
             x = x_start + col * (self.card_width + self.card_spacing)
             y = y_offset + row * (self.card_height + self.card_spacing)
-            self._layout_cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
+            cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
 
-    def _calculate_charge_layout(self, particles):
+    def _calculate_charge_layout(self, particles, cache, width):
         """Layout grouped by charge"""
         charge_groups = {}
         for p in particles:
@@ -207,23 +355,23 @@ class SubatomicUnifiedTable(QWidget):
         for charge in sorted(charge_groups.keys(), reverse=True):
             group = charge_groups[charge]
             charge_str = f"+{charge}" if charge > 0 else str(charge)
-            self._layout_cache[f'charge_header_{charge}'] = {
+            cache[f'charge_header_{charge}'] = {
                 'x': x_start, 'y': y_offset - 40,
                 'text': f'Charge: {charge_str} e'
             }
 
-            cols = max(1, (self.width() - 100) // (self.card_width + self.card_spacing))
+            cols = max(1, (width - 100) // (self.card_width + self.card_spacing))
             for i, p in enumerate(group):
                 row = i // cols
                 col = i % cols
                 x = x_start + col * (self.card_width + self.card_spacing)
                 y = y_offset + row * (self.card_height + self.card_spacing)
-                self._layout_cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
+                cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
 
             rows = (len(group) + cols - 1) // cols
             y_offset += rows * (self.card_height + self.card_spacing) + 60
 
-    def _calculate_decay_layout(self, particles):
+    def _calculate_decay_layout(self, particles, cache, width):
         """Layout showing decay relationships"""
         # Sort by stability (most stable first)
         sorted_particles = sorted(particles, key=lambda p: -p.get('_stability_factor', 0))
@@ -231,17 +379,17 @@ class SubatomicUnifiedTable(QWidget):
         y_offset = 80
         x_start = 50
 
-        self._layout_cache['header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'Particles by Stability (Decay Chains)'}
+        cache['header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'Particles by Stability (Decay Chains)'}
 
-        cols = max(1, (self.width() - 100) // (self.card_width + self.card_spacing))
+        cols = max(1, (width - 100) // (self.card_width + self.card_spacing))
         for i, p in enumerate(sorted_particles):
             row = i // cols
             col = i % cols
             x = x_start + col * (self.card_width + self.card_spacing)
             y = y_offset + row * (self.card_height + self.card_spacing)
-            self._layout_cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
+            cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
 
-    def _calculate_quark_content_layout(self, particles):
+    def _calculate_quark_content_layout(self, particles, cache, width):
         """Layout grouped by quark content"""
         quark_groups = {
             'uuu/uud/udd/ddd': [],  # Delta baryons
@@ -291,43 +439,45 @@ class SubatomicUnifiedTable(QWidget):
             if not particles_list:
                 continue
 
-            self._layout_cache[f'quark_header_{group_key}'] = {
+            cache[f'quark_header_{group_key}'] = {
                 'x': x_start, 'y': y_offset - 40,
                 'text': group_names.get(group_key, group_key)
             }
 
-            cols = max(1, (self.width() - 100) // (self.card_width + self.card_spacing))
+            cols = max(1, (width - 100) // (self.card_width + self.card_spacing))
             for i, p in enumerate(particles_list):
                 row = i // cols
                 col = i % cols
                 x = x_start + col * (self.card_width + self.card_spacing)
                 y = y_offset + row * (self.card_height + self.card_spacing)
-                self._layout_cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
+                cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
 
             rows = (len(particles_list) + cols - 1) // cols
             y_offset += rows * (self.card_height + self.card_spacing) + 60
 
-    def _calculate_eightfold_layout(self, particles):
+    def _calculate_eightfold_layout(self, particles, cache, width):
         """Layout in Eightfold Way diagram (I3 vs Hypercharge Y)"""
         y_offset = 80
         x_start = 50
 
-        self._layout_cache['header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'Eightfold Way (I3 vs Hypercharge)'}
+        cache['header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'Eightfold Way (I3 vs Hypercharge)'}
 
         if not particles:
             return
 
         # Calculate I3 and Y for positioning
         plot_left = 100
-        plot_right = self.width() - 100
+        plot_right = width - 100
         plot_top = y_offset + 20
         plot_bottom = plot_top + 500
         plot_width = plot_right - plot_left
         plot_height = plot_bottom - plot_top
 
-        # Get ranges
-        i3_values = [p.get('Isospin_I3', 0) for p in particles]
-        y_values = [p.get('Strangeness', 0) + p.get('BaryonNumber_B', 0) for p in particles]
+        # Get ranges (missing quantum numbers come from the enumerated hadrons)
+        hadrons = SubatomicCalculatorV2.enumerated_hadrons_for(particles)
+        coords = [eightfold_coordinates(p, hadron) for p, hadron in zip(particles, hadrons)]
+        i3_values = [i3 for i3, _ in coords]
+        y_values = [hypercharge for _, hypercharge in coords]
 
         i3_min, i3_max = min(i3_values) - 0.5, max(i3_values) + 0.5
         y_min, y_max = min(y_values) - 0.5, max(y_values) + 0.5
@@ -335,10 +485,7 @@ class SubatomicUnifiedTable(QWidget):
         y_range = y_max - y_min if y_max != y_min else 4
 
         position_map = {}
-        for p in particles:
-            i3 = p.get('Isospin_I3', 0)
-            hypercharge = p.get('Strangeness', 0) + p.get('BaryonNumber_B', 0)
-
+        for p, (i3, hypercharge) in zip(particles, coords):
             # Map to pixel coordinates
             x_norm = (i3 - i3_min) / i3_range
             y_norm = (hypercharge - y_min) / y_range
@@ -354,14 +501,14 @@ class SubatomicUnifiedTable(QWidget):
             else:
                 position_map[key] = 1
 
-            self._layout_cache[p['Name']] = {'x': px, 'y': py, 'particle': p}
+            cache[p['Name']] = {'x': px, 'y': py, 'particle': p}
 
-    def _calculate_lifetime_layout(self, particles):
+    def _calculate_lifetime_layout(self, particles, cache, width):
         """Layout on logarithmic lifetime spectrum"""
         y_offset = 80
         x_start = 50
 
-        self._layout_cache['header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'Lifetime Spectrum (Log Scale)'}
+        cache['header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'Lifetime Spectrum (Log Scale)'}
 
         # Separate by stability
         stable = [p for p in particles if p.get('Stability') == 'Stable']
@@ -369,7 +516,7 @@ class SubatomicUnifiedTable(QWidget):
         unstable_mesons = [p for p in particles if p.get('_is_meson') and p.get('Stability') != 'Stable']
 
         timeline_left = 100
-        timeline_right = self.width() - 200
+        timeline_right = width - 200
         timeline_width = timeline_right - timeline_left
         log_min, log_max = -24, 4
 
@@ -381,9 +528,9 @@ class SubatomicUnifiedTable(QWidget):
 
         # Stable particles on far right
         if stable:
-            self._layout_cache['stable_header'] = {'x': x_start, 'y': y_offset, 'text': 'Stable'}
+            cache['stable_header'] = {'x': x_start, 'y': y_offset, 'text': 'Stable'}
             for i, p in enumerate(stable):
-                self._layout_cache[p['Name']] = {
+                cache[p['Name']] = {
                     'x': timeline_right + 50,
                     'y': y_offset + 40 + i * (self.card_height + 10),
                     'particle': p
@@ -392,7 +539,7 @@ class SubatomicUnifiedTable(QWidget):
 
         # Unstable baryons
         if unstable_baryons:
-            self._layout_cache['baryon_lifetime_header'] = {'x': x_start, 'y': y_offset, 'text': 'Baryons (by half-life)'}
+            cache['baryon_lifetime_header'] = {'x': x_start, 'y': y_offset, 'text': 'Baryons (by half-life)'}
             y_offset += 40
             x_positions = {}
             for p in sorted(unstable_baryons, key=lambda p: p.get('HalfLife_s') or 0):
@@ -404,13 +551,13 @@ class SubatomicUnifiedTable(QWidget):
                 else:
                     y = y_offset
                     x_positions[x_key] = 1
-                self._layout_cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
+                cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
             max_rows = max(x_positions.values()) if x_positions else 1
             y_offset += max_rows * (self.card_height + 10) + 60
 
         # Unstable mesons
         if unstable_mesons:
-            self._layout_cache['meson_lifetime_header'] = {'x': x_start, 'y': y_offset, 'text': 'Mesons (by half-life)'}
+            cache['meson_lifetime_header'] = {'x': x_start, 'y': y_offset, 'text': 'Mesons (by half-life)'}
             y_offset += 40
             x_positions = {}
             for p in sorted(unstable_mesons, key=lambda p: p.get('HalfLife_s') or 0):
@@ -422,14 +569,14 @@ class SubatomicUnifiedTable(QWidget):
                 else:
                     y = y_offset
                     x_positions[x_key] = 1
-                self._layout_cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
+                cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
 
-    def _calculate_quark_tree_layout(self, particles):
+    def _calculate_quark_tree_layout(self, particles, cache, width):
         """Layout as hierarchical quark composition tree"""
         y_offset = 80
         x_start = 50
 
-        self._layout_cache['header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'Quark Composition Tree'}
+        cache['header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'Quark Composition Tree'}
 
         # Categorize by quark content
         light_hadrons = []
@@ -437,32 +584,27 @@ class SubatomicUnifiedTable(QWidget):
         charm_hadrons = []
         bottom_hadrons = []
 
-        for p in particles:
-            quark_content = p.get('QuarkContent', '').lower()
-            composition = p.get('Composition', [])
-            has_bottom = 'b' in quark_content or any('bottom' in c.get('Constituent', '').lower() for c in composition)
-            has_charm = 'c' in quark_content or any('charm' in c.get('Constituent', '').lower() for c in composition)
-            has_strange = 's' in quark_content or any('strange' in c.get('Constituent', '').lower() for c in composition)
-
-            if has_bottom:
+        for p, hadron in zip(particles, SubatomicCalculatorV2.enumerated_hadrons_for(particles)):
+            level = quark_tree_level(p, hadron)
+            if level == 'bottom':
                 bottom_hadrons.append(p)
-            elif has_charm:
+            elif level == 'charm':
                 charm_hadrons.append(p)
-            elif has_strange:
+            elif level == 'strange':
                 strange_hadrons.append(p)
             else:
                 light_hadrons.append(p)
 
-        cols = max(1, (self.width() - 100) // (self.card_width + self.card_spacing))
+        cols = max(1, (width - 100) // (self.card_width + self.card_spacing))
         level_spacing = 220
 
         # Level 1: Light hadrons
         if light_hadrons:
-            self._layout_cache['light_header'] = {'x': x_start, 'y': y_offset, 'text': 'Light Hadrons (u, d)'}
+            cache['light_header'] = {'x': x_start, 'y': y_offset, 'text': 'Light Hadrons (u, d)'}
             y_offset += 40
             for i, p in enumerate(light_hadrons):
                 row, col = i // cols, i % cols
-                self._layout_cache[p['Name']] = {
+                cache[p['Name']] = {
                     'x': x_start + col * (self.card_width + self.card_spacing),
                     'y': y_offset + row * (self.card_height + self.card_spacing),
                     'particle': p
@@ -472,11 +614,11 @@ class SubatomicUnifiedTable(QWidget):
 
         # Level 2: Strange hadrons
         if strange_hadrons:
-            self._layout_cache['strange_header'] = {'x': x_start, 'y': y_offset, 'text': 'Strange Hadrons (+s)'}
+            cache['strange_header'] = {'x': x_start, 'y': y_offset, 'text': 'Strange Hadrons (+s)'}
             y_offset += 40
             for i, p in enumerate(strange_hadrons):
                 row, col = i // cols, i % cols
-                self._layout_cache[p['Name']] = {
+                cache[p['Name']] = {
                     'x': x_start + col * (self.card_width + self.card_spacing),
                     'y': y_offset + row * (self.card_height + self.card_spacing),
                     'particle': p
@@ -486,11 +628,11 @@ class SubatomicUnifiedTable(QWidget):
 
         # Level 3: Charm hadrons
         if charm_hadrons:
-            self._layout_cache['charm_header'] = {'x': x_start, 'y': y_offset, 'text': 'Charm Hadrons (+c)'}
+            cache['charm_header'] = {'x': x_start, 'y': y_offset, 'text': 'Charm Hadrons (+c)'}
             y_offset += 40
             for i, p in enumerate(charm_hadrons):
                 row, col = i // cols, i % cols
-                self._layout_cache[p['Name']] = {
+                cache[p['Name']] = {
                     'x': x_start + col * (self.card_width + self.card_spacing),
                     'y': y_offset + row * (self.card_height + self.card_spacing),
                     'particle': p
@@ -500,22 +642,22 @@ class SubatomicUnifiedTable(QWidget):
 
         # Level 4: Bottom hadrons
         if bottom_hadrons:
-            self._layout_cache['bottom_header'] = {'x': x_start, 'y': y_offset, 'text': 'Bottom Hadrons (+b)'}
+            cache['bottom_header'] = {'x': x_start, 'y': y_offset, 'text': 'Bottom Hadrons (+b)'}
             y_offset += 40
             for i, p in enumerate(bottom_hadrons):
                 row, col = i // cols, i % cols
-                self._layout_cache[p['Name']] = {
+                cache[p['Name']] = {
                     'x': x_start + col * (self.card_width + self.card_spacing),
                     'y': y_offset + row * (self.card_height + self.card_spacing),
                     'particle': p
                 }
 
-    def _calculate_discovery_layout(self, particles):
+    def _calculate_discovery_layout(self, particles, cache, width):
         """Layout on discovery timeline with mass distribution"""
         y_offset = 80
         x_start = 50
 
-        self._layout_cache['header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'Discovery Timeline'}
+        cache['header'] = {'x': x_start, 'y': y_offset - 40, 'text': 'Discovery Timeline'}
 
         # Separate particles with and without discovery dates
         with_date = []
@@ -532,7 +674,7 @@ class SubatomicUnifiedTable(QWidget):
 
         # Timeline area
         timeline_left = 100
-        timeline_right = self.width() - 100
+        timeline_right = width - 100
         timeline_width = timeline_right - timeline_left
 
         year_min = min(p[1] for p in with_date) - 5 if with_date else 1895
@@ -572,17 +714,17 @@ class SubatomicUnifiedTable(QWidget):
             else:
                 position_grid[grid_key] = 1
 
-            self._layout_cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
+            cache[p['Name']] = {'x': x, 'y': y, 'particle': p}
 
         # Particles without dates
         if without_date:
             unknown_y = plot_top + plot_height + 80
-            self._layout_cache['unknown_header'] = {'x': x_start, 'y': unknown_y, 'text': 'Discovery Date Unknown'}
+            cache['unknown_header'] = {'x': x_start, 'y': unknown_y, 'text': 'Discovery Date Unknown'}
             unknown_y += 40
-            cols = max(1, (self.width() - 100) // (self.card_width + self.card_spacing))
+            cols = max(1, (width - 100) // (self.card_width + self.card_spacing))
             for i, p in enumerate(without_date):
                 row, col = i // cols, i % cols
-                self._layout_cache[p['Name']] = {
+                cache[p['Name']] = {
                     'x': x_start + col * (self.card_width + self.card_spacing),
                     'y': unknown_y + row * (self.card_height + self.card_spacing),
                     'particle': p
@@ -590,6 +732,8 @@ class SubatomicUnifiedTable(QWidget):
 
     def paintEvent(self, event):
         """Paint the widget"""
+        profiler = get_profiler()
+        profiler.begin_frame()
         if self._needs_layout_update:
             self._calculate_layout()
 
@@ -601,26 +745,37 @@ class SubatomicUnifiedTable(QWidget):
         painter.scale(self.zoom_level, self.zoom_level)
 
         # Draw background
-        painter.fillRect(self.rect(), QColor(20, 20, 35))
+        with profiler.scope('paint.background', 'paint'):
+            painter.fillRect(self.rect(), QColor(20, 20, 35))
+
+        # While switching layouts only the moving cards are painted
+        if self._transition is not None:
+            with profiler.scope('paint.transition', 'paint'):
+                self._draw_transition(painter)
+            draw_profiler_overlay(painter, self.width())
+            painter.end()
+            profiler.end_frame('SubatomicUnifiedTable.paint')
+            return
 
         # Draw section headers
-        for key, data in self._layout_cache.items():
-            if 'text' in data:
-                self._draw_section_header(painter, data['x'], data['y'], data['text'])
-
-        # Draw particle cards
-        for key, data in self._layout_cache.items():
-            if 'particle' in data:
-                is_hovered = self.hovered_particle == data['particle']
-                is_selected = self.selected_particle == data['particle']
-                self._draw_particle_card(painter, data['x'], data['y'],
-                                        data['particle'], is_hovered, is_selected)
+        with profiler.scope('paint.labels', 'paint'):
+            for key, data in self._layout_cache.items():
+                if 'text' in data:
+                    self._draw_section_header(painter, data['x'], data['y'], data['text'])
+
+        # Draw particle cards (off-screen cards are skipped)
+        with profiler.scope('paint.elements', 'paint'):
+            for data in self.get_visible_cards():
+                self._paint_particle_card(painter, data['x'], data['y'], data['particle'])
 
         # Draw decay arrows if in decay mode
         if self.layout_mode == SubatomicLayoutMode.DECAY_CHAIN:
-            self._draw_decay_arrows(painter)
+            with profiler.scope('paint.decay_arrows', 'paint'):
+                self._draw_decay_arrows(painter)
 
+        draw_profiler_overlay(painter, self.width())
         painter.end()
+        profiler.end_frame('SubatomicUnifiedTable.paint')
 
     def _draw_section_header(self, painter, x, y, text):
         """Draw a section header"""
@@ -634,6 +789,22 @@ class SubatomicUnifiedTable(QWidget):
         text_width = metrics.horizontalAdvance(text)
         painter.drawLine(int(x), int(y + 5), int(x + text_width), int(y + 5))
 
+    def _paint_particle_card(self, painter, x, y, particle):
+        """Blit a particle card from the pixmap cache, rendering it on a miss"""
+        is_hovered = self.hovered_particle == particle
+        is_selected = self.selected_particle == particle
+        state = 'selected' if is_selected else 'hovered' if is_hovered else ''
+        get_card_pixmap_cache().draw_card(
+            painter, CARD_CACHE_NAMESPACE, particle.get('Name'), (), state,
+            x, y, self.card_width, self.card_height,
+            lambda card_painter: self._draw_particle_card(card_painter, x, y, particle,
+                                                          is_hovered, is_selected),
+            pad=CARD_CACHE_PAD)
+
+    def _invalidate_cards(self, names=None):
+        """Drop cached card pixmaps (all cards, or only the named particles)"""
+        get_card_pixmap_cache().invalidate(CARD_CACHE_NAMESPACE, names)
+
     def _draw_particle_card(self, painter, x, y, particle, is_hovered, is_selected):
         """Draw a single particle card"""
         # Get category color
@@ -827,24 +998,29 @@ class SubatomicUnifiedTable(QWidget):
         """Draw arrows showing decay relationships"""
         painter.setPen(QPen(QColor(150, 150, 150, 100), 1, Qt.PenStyle.DashLine))
 
-        for key, data in self._layout_cache.items():
+        for x1, y1, x2, y2 in self._decay_arrow_segments:
+            painter.drawLine(x1, y1, x2, y2)
+
+    def _calculate_decay_arrow_segments(self, cache):
+        """Precompute arrow endpoints from the loader's decay graph for laid-out particles"""
+        segments = []
+        decay_graph = self.loader.decay_graph
+
+        for name, data in cache.items():
             if 'particle' not in data:
                 continue
 
-            particle = data['particle']
-            decay_products = particle.get('DecayProducts', [])
+            for product in decay_graph.get_products(name):
+                target_data = cache.get(product)
+                if target_data and 'particle' in target_data:
+                    # Arrow from the bottom of this card to the top of the product card
+                    x1 = data['x'] + self.card_width / 2
+                    y1 = data['y'] + self.card_height
+                    x2 = target_data['x'] + self.card_width / 2
+                    y2 = target_data['y']
+                    segments.append((int(x1), int(y1), int(x2), int(y2)))
 
-            for product in decay_products:
-                if product in self._layout_cache:
-                    target_data = self._layout_cache[product]
-                    if 'particle' in target_data:
-                        # Draw arrow from this particle to decay product
-                        x1 = data['x'] + self.card_width / 2
-                        y1 = data['y'] + self.card_height
-                        x2 = target_data['x'] + self.card_width / 2
-                        y2 = target_data['y']
-
-                        painter.drawLine(int(x1), int(y1), int(x2), int(y2))
+        return segments
 
     def mousePressEvent(self, event):
         """Handle mouse press"""
@@ -910,23 +1086,14 @@ class SubatomicUnifiedTable(QWidget):
         x = (screen_x - self.pan_x) / self.zoom_level
         y = (screen_y - self.pan_y) / self.zoom_level
 
-        for key, data in self._layout_cache.items():
-            if 'particle' not in data:
-                continue
-
-            card_x = data['x']
-            card_y = data['y']
-
-            if (card_x <= x <= card_x + self.card_width and
-                card_y <= y <= card_y + self.card_height):
-                return data['particle']
-
-        return None
+        data = self._card_index.item_at(x, y)
+        return data['particle'] if data else None
 
     def resizeEvent(self, event):
         """Handle resize"""
         super().resizeEvent(event)
         self._needs_layout_update = True
+        self._stop_transition()
         self.update()
 
     def reset_view(self):
@@ -977,6 +1144,27 @@ class SubatomicUnifiedTable(QWidget):
 
     def reload_data(self):
         """Reload particle data from files and refresh the display"""
-        self.particles = self.loader.get_all_particles()
-        self._needs_layout_update = True
+        self._set_particles(self.loader.get_all_particles())
+        self._invalidate_cards()
+        self.update()
+
+    def apply_data_changes(self, event):
+        """
+        Apply an item-level data change, re-reading only the changed files.
+
+        Args:
+            event: DataChangeEvent for the subatomic category
+        """
+        if event.full:
+            self.loader.load_all_particles()
+            self.reload_data()
+            return
+        updated, removed = self.loader.reload_items(event.names)
+        if not updated and not removed:
+            return
+        if self.selected_particle is not None and self.selected_particle.get('Name') in removed:
+            self.selected_particle = None
+        self.hovered_particle = None
+        self._invalidate_cards([p['Name'] for p in updated] + list(removed))
+        self._set_particles(self.loader.get_all_particles())
         self.update()
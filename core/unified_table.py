@@ -21,6 +21,7 @@ from PySide6.QtGui import (QPainter, QColor, QPen, QBrush, QFont, QPainterPath,
 
 # Import element data loader (JSON-based)
 from data.element_loader import get_loader, ElementDataLoader
+from core.element_columns import ElementColumns, PROPERTY_FIELDS
 
 # Import helper functions that are still needed from element_data
 from data.element_data import (get_electron_config, get_valence_electrons,
@@ -35,7 +36,9 @@ from utils.calculations import (get_block_color, ev_to_frequency, ev_to_waveleng
                                  wavelength_to_rgb, get_ie_color, get_electroneg_color,
                                  calculate_emission_spectrum, draw_spectrum_bar,
                                  get_melting_color, get_radius_color, get_density_color,
-                                 get_electron_affinity_color, get_boiling_color, C)
+                                 get_electron_affinity_color, get_boiling_color, C,
+                                 wavelength_to_rgb_tuple)
+from utils.color_lut import gradient_lut, spectrum_lut
 
 # Import position calculator
 from utils.position_calculator import PositionCalculator
@@ -47,10 +50,22 @@ from utils.orbital_clouds import (get_orbital_probability, get_available_orbital
 # Import SDF renderer for smooth particle visualization
 from utils.sdf_renderer import SDFRenderer
 
+# Import profiling scopes and overlay
+from utils.profiler import get_profiler, profiled
+from utils.profiler_overlay import draw_profiler_overlay
+
 # Import layout renderers
 from layouts import (CircularLayoutRenderer, SpiralLayoutRenderer,
                     LinearLayoutRenderer, TableLayoutRenderer)
 
+# Import layout transitions and background layout prefetching
+from utils.layout_transition import LayoutTransition, get_layout_prefetcher, TRANSITION_FRAME_MS
+
+# Layout prefetcher namespace (leading element of the prefetch keys)
+LAYOUT_NAMESPACE = 'elements'
+# Marker diameter of spiral elements while a layout transition runs
+SPIRAL_MARKER_SIZE = 16
+
 
 def normalize_angle(angle):
     """Normalize angle to [-π, π] range"""
@@ -76,6 +91,12 @@ class UnifiedTable(QWidget):
         # Spectrum calculation settings (must be set before create_element_data)
         self.spectrum_max_n = 30  # Maximum quantum number for spectrum calculation (10=fast, 20=default, 50=detailed)
 
+        # Columnar view of base_elements; filter masks are revalidated once per
+        # paint (see _paint_generation), color columns when their settings change
+        self.element_columns = ElementColumns()
+        self._paint_generation = 0
+        self._channel_attribute_names = {}
+
         self.create_element_data()
 
         self.hovered_element = None
@@ -255,6 +276,13 @@ class UnifiedTable(QWidget):
         self.animation_timer.timeout.connect(self.animate_cloud)
         self.animation_timer.start(50)  # Update every 50ms (20fps)
 
+        # Animated layout switch (element markers move between layouts)
+        self._transition = None
+        self._transition_elements = {}
+        self._transition_timer = QTimer(self)
+        self._transition_timer.setInterval(TRANSITION_FRAME_MS)
+        self._transition_timer.timeout.connect(self._advance_transition)
+
     def animate_cloud(self):
         """Update cloud animation phase for fuzzy effect"""
         self.cloud_animation_phase += 0.1
@@ -274,34 +302,148 @@ class UnifiedTable(QWidget):
         if isinstance(mode, str):
             mode = PTLayoutMode.from_string(mode)
 
+        previous = self._element_anchors()
         self.layout_mode = mode
 
         # Auto-set glow type based on layout mode
         if mode == PTLayoutMode.CIRCULAR:
             self.glow_type = "internal"
-            self.create_circular_layout()
         elif mode == PTLayoutMode.SPIRAL:
             self.glow_type = "external"
             # Reset zoom and pan when switching to spiral
             self.zoom_level = 1.0
             self.pan_x = 0
             self.pan_y = 0
-            self.create_spiral_layout()
         elif mode == PTLayoutMode.SERPENTINE:
             self.glow_type = "external"
             # Reset zoom and pan when switching to serpentine
             self.zoom_level = 1.0
             self.pan_x = 0
             self.pan_y = 0
-            self.create_serpentine_layout()
         elif mode == PTLayoutMode.TABLE:
             self.glow_type = "internal"
+
+        # A layout prefetched while the selector was hovered is applied as is
+        prefetched = get_layout_prefetcher().take(self._layout_key(mode))
+        if prefetched is not None:
+            self._apply_layout(prefetched)
+        elif mode == PTLayoutMode.CIRCULAR:
+            self.create_circular_layout()
+        elif mode == PTLayoutMode.SPIRAL:
+            self.create_spiral_layout()
+        elif mode == PTLayoutMode.SERPENTINE:
+            self.create_serpentine_layout()
+        elif mode == PTLayoutMode.TABLE:
             self.create_table_layout()
+        self._start_transition(previous, self._element_anchors())
 
         # Update mode description in UI
         self.update_mode_description()
         self.update()
 
+    def prefetch_layout(self, mode):
+        """
+        Compute a layout mode on the background thread, so that switching to it
+        only applies the result (called while the mode's selector is hovered).
+
+        Args:
+            mode: PTLayoutMode enum or string layout mode
+        """
+        if isinstance(mode, str):
+            mode = PTLayoutMode.from_string(mode)
+        if mode == self.layout_mode:
+            return
+        base_elements, width, height = self.base_elements, self.width(), self.height()
+        order_property = self.order_property
+        if mode == PTLayoutMode.CIRCULAR:
+            compute = lambda: self._compute_circular_layout(base_elements, width, height)
+        elif mode == PTLayoutMode.SPIRAL:
+            compute = lambda: self._compute_spiral_layout(base_elements, width, height)
+        elif mode == PTLayoutMode.SERPENTINE:
+            compute = lambda: self._compute_serpentine_layout(base_elements, width, height, order_property)
+        elif mode == PTLayoutMode.TABLE:
+            compute = lambda: self._compute_table_layout(base_elements)
+        else:
+            return
+        get_layout_prefetcher().prefetch(self._layout_key(mode), compute)
+
+    def _layout_key(self, mode):
+        """Prefetch key of a layout mode at the current size and ordering"""
+        order_property = self.order_property if mode == PTLayoutMode.SERPENTINE else None
+        return (LAYOUT_NAMESPACE, mode, self.width(), self.height(), order_property)
+
+    def _apply_layout(self, attributes):
+        """Install computed layout attributes (elements and mode-specific geometry)"""
+        for name, value in attributes.items():
+            setattr(self, name, value)
+
+    # ==================== Layout Transitions ====================
+
+    def _element_anchors(self):
+        """Screen-space (x, y, size) of each laid-out element, keyed by atomic number"""
+        anchors = {}
+        center_x, center_y = self.width() / 2, self.height() / 2
+        for elem in self.elements:
+            layout = elem.get('layout')
+            if layout == 'circular':
+                radius = (elem['r_inner'] + elem['r_outer']) / 2
+                x = center_x + radius * math.cos(elem['angle_mid'])
+                y = center_y + radius * math.sin(elem['angle_mid'])
+                size = elem['r_outer'] - elem['r_inner']
+            elif layout == 'table':
+                size = elem['cell_size']
+                x, y = elem['x'] + size / 2, elem['y'] + size / 2
+            elif layout == 'linear':
+                x, y, size = elem['x'], elem['y'], elem['box_width']
+            else:
+                x, y, size = elem['x'], elem['y'], SPIRAL_MARKER_SIZE
+            anchors[elem['z']] = (x * self.zoom_level + self.pan_x,
+                                  y * self.zoom_level + self.pan_y,
+                                  size * self.zoom_level)
+        return anchors
+
+    def _start_transition(self, previous, current):
+        """Animate element markers between two sets of screen-space anchors"""
+        self._stop_transition()
+        if not previous or not self.isVisible():
+            return
+        transition = LayoutTransition(previous, current)
+        if not transition.moving:
+            return
+        self._transition_elements = {elem['z']: elem for elem in self.elements}
+        self._transition = transition.start()
+        self._transition_timer.start()
+
+    def _stop_transition(self):
+        """Cancel a running transition (the target layout is already current)"""
+        self._transition = None
+        self._transition_elements = {}
+        self._transition_timer.stop()
+
+    def _advance_transition(self):
+        """Timer tick: repaint the moving markers, ending the transition when done"""
+        if self._transition is not None and self._transition.is_finished():
+            self._stop_transition()
+        self.update()
+
+    def _draw_transition(self, painter):
+        """Draw each element as a fill-colored marker at its interpolated position"""
+        values, opacities = self._transition.frame()
+        painter.setPen(Qt.PenStyle.NoPen)
+        for i, z in enumerate(self._transition.keys):
+            elem = self._transition_elements.get(z)
+            if elem is None:
+                continue
+            x, y, size = values[3 * i], values[3 * i + 1], values[3 * i + 2]
+            if self.passes_filters(elem):
+                color = self.get_property_color(elem, self.fill_property, "fill")
+            else:
+                color = QColor(100, 100, 100, 60)
+            painter.setOpacity(opacities[i])
+            painter.setBrush(QBrush(color))
+            painter.drawEllipse(QPointF(x, y), size / 2, size / 2)
+        painter.setOpacity(1.0)
+
     def update_mode_description(self):
         """Update the mode description - now handled by control panel mode-specific UI"""
         # Mode descriptions are now shown in mode-specific control panel widgets
@@ -385,6 +527,7 @@ class UnifiedTable(QWidget):
                     'max': max_val,
                     'active': True
                 }
+            self.invalidate_filters()
             self.update()
 
     def set_gradient_colors(self, property_key, start_color, end_color):
@@ -463,92 +606,8 @@ class UnifiedTable(QWidget):
         # Get the element data loader (loads from JSON files)
         loader = get_loader()
 
-        self.base_elements = []
-        for element in loader.get_all_elements():
-            symbol = element['symbol']
-            z = element['atomic_number']
-            ie = element.get('ionization_energy', 10.0)
-            block = element.get('block', 's')
-            electroneg = element.get('electronegativity', 0.0) or 0.0
-            radius = element.get('atomic_radius', 100)
-            melting = element.get('melting_point', 300) or 300
-            # Convert isotopes from JSON dict format to tuple format (mass, abundance)
-            raw_isotopes = element.get('isotopes', [])
-            isotopes = []
-            for iso in raw_isotopes:
-                if isinstance(iso, dict):
-                    mass = iso.get('mass_number', 0)
-                    abundance = iso.get('abundance', 0)
-                    isotopes.append((mass, abundance))
-                elif isinstance(iso, (list, tuple)) and len(iso) >= 2:
-                    isotopes.append((iso[0], iso[1]))
-            density = element.get('density', 1.0) or 1.0
-            boiling = element.get('boiling_point', 300) or 300
-            electron_affinity = element.get('electron_affinity', 0) or 0
-            valence = element.get('valence_electrons') or get_valence_electrons(z, block)
-            name = element.get('name', symbol)
-            group = element.get('group')
-            period = element.get('period', 1)
-
-            # Calculate emission spectrum lines for this element
-            # Use configurable max_n for spectrum detail level
-            spectrum_lines = calculate_emission_spectrum(z, ie, max_n=self.spectrum_max_n)
-
-            # Extract wavelengths from calculated spectrum_lines
-            # Primary emission: from JSON or calculated
-            primary_wavelength = element.get('primary_emission_wavelength')
-            if primary_wavelength is None:
-                if spectrum_lines:
-                    # Use strongest calculated line
-                    primary_wavelength = max(spectrum_lines, key=lambda x: x[1])[0]
-                else:
-                    primary_wavelength = ev_to_wavelength(ie)
-
-            # Visible emission: from JSON or calculated
-            visible_wavelength = element.get('visible_emission_wavelength')
-            if visible_wavelength is None:
-                if spectrum_lines:
-                    # Find strongest line in visible range from calculated spectrum
-                    visible_lines = [(wl, intensity) for wl, intensity in spectrum_lines if 380 <= wl <= 780]
-                    if visible_lines:
-                        visible_wavelength = max(visible_lines, key=lambda x: x[1])[0]
-                    else:
-                        visible_wavelength = primary_wavelength
-                else:
-                    visible_wavelength = primary_wavelength
-
-            # Ionization wavelength: wavelength corresponding to ionization energy
-            ionization_wavelength = ev_to_wavelength(ie)
-
-            self.base_elements.append({
-                'symbol': symbol,
-                'name': name,
-                'z': z,
-                'ie': ie,
-                'ionization_energy': ie,  # Alias for tests
-                'block': block,
-                'block_color': get_block_color(block),
-                'period': period,
-                'group': group,
-                'freq_phz': ev_to_frequency(ie),
-                'wavelength_nm': primary_wavelength,  # Primary emission wavelength
-                'emission_wavelength': primary_wavelength,  # Strongest emission line (may be UV/IR)
-                'visible_emission_wavelength': visible_wavelength,  # Most prominent visible line
-                'ionization_wavelength': ionization_wavelength,  # Wavelength from IE
-                'electronegativity': electroneg,
-                'atomic_radius': radius,
-                'melting_point': melting,
-                'melting': melting,  # Alias for tests
-                'boiling_point': boiling,
-                'boiling': boiling,  # Alias for tests
-                'density': density,
-                'electron_affinity': electron_affinity,
-                'valence_electrons': valence,
-                'valence': valence,  # Alias for tests
-                'electron_config': element.get('electron_configuration') or get_electron_config(z),
-                'isotopes': isotopes,
-                'spectrum_lines': spectrum_lines
-            })
+        self.base_elements = [self._build_element_record(element) for element in loader.get_all_elements()]
+        self._rebuild_element_columns()
 
         # Select hydrogen (Z=1) by default on launch
         if self.base_elements:
@@ -558,52 +617,128 @@ class UnifiedTable(QWidget):
 
         self.create_circular_layout()
 
-    def passes_filters(self, elem):
-        """Check if element passes all active filters and isotope selection"""
-        # First check isotope availability (for non-spiral layouts)
-        if self.layout_mode != "spiral" and self.selected_neutron_offset != 0:
-            # Check if this element has an isotope with the selected neutron offset
-            if not self._has_isotope_with_offset(elem, self.selected_neutron_offset):
-                return False
-
-        # Then check property filters
-        for prop, filter_data in self.filters.items():
-            if not filter_data['active']:
-                continue
-
-            # Get the element's value for this property
-            # Convert string property name to enum for comparison
-            prop_enum = PTPropertyName.from_string(prop) if isinstance(prop, str) else prop
-
-            if prop_enum == PTPropertyName.IONIZATION:
-                value = elem.get('ie', 0)
-            elif prop_enum == PTPropertyName.ELECTRONEGATIVITY:
-                value = elem.get('electronegativity', 0)
-            elif prop_enum == PTPropertyName.MELTING:
-                value = elem.get('melting_point', 0)
-            elif prop_enum == PTPropertyName.BOILING:
-                value = elem.get('boiling_point', 0)
-            elif prop_enum == PTPropertyName.RADIUS:
-                value = elem.get('atomic_radius', 0)
-            elif prop_enum == PTPropertyName.DENSITY:
-                value = elem.get('density', 0)
-            elif prop_enum == PTPropertyName.ELECTRON_AFFINITY:
-                value = elem.get('electron_affinity', 0)
-            elif prop_enum == PTPropertyName.VALENCE:
-                value = elem.get('valence_electrons', 0)
-            elif prop_enum == PTPropertyName.ATOMIC_NUMBER:
-                value = elem.get('z', 0)
-            elif PTPropertyName.is_wavelength_property(prop_enum):
-                # All wavelength properties use the same underlying wavelength_nm data
-                value = elem.get('wavelength_nm', 0)
+    def _build_element_record(self, element):
+        """Build the display record (including the emission spectrum) for one loaded element"""
+        symbol = element['symbol']
+        z = element['atomic_number']
+        ie = element.get('ionization_energy', 10.0)
+        block = element.get('block', 's')
+        electroneg = element.get('electronegativity', 0.0) or 0.0
+        radius = element.get('atomic_radius', 100)
+        melting = element.get('melting_point', 300) or 300
+        # Convert isotopes from JSON dict format to tuple format (mass, abundance)
+        raw_isotopes = element.get('isotopes', [])
+        isotopes = []
+        for iso in raw_isotopes:
+            if isinstance(iso, dict):
+                mass = iso.get('mass_number', 0)
+                abundance = iso.get('abundance', 0)
+                isotopes.append((mass, abundance))
+            elif isinstance(iso, (list, tuple)) and len(iso) >= 2:
+                isotopes.append((iso[0], iso[1]))
+        density = element.get('density', 1.0) or 1.0
+        boiling = element.get('boiling_point', 300) or 300
+        electron_affinity = element.get('electron_affinity', 0) or 0
+        valence = element.get('valence_electrons') or get_valence_electrons(z, block)
+        name = element.get('name', symbol)
+        group = element.get('group')
+        period = element.get('period', 1)
+
+        # Calculate emission spectrum lines for this element
+        # Use configurable max_n for spectrum detail level
+        spectrum_lines = calculate_emission_spectrum(z, ie, max_n=self.spectrum_max_n)
+
+        # Extract wavelengths from calculated spectrum_lines
+        # Primary emission: from JSON or calculated
+        primary_wavelength = element.get('primary_emission_wavelength')
+        if primary_wavelength is None:
+            if spectrum_lines:
+                # Use strongest calculated line
+                primary_wavelength = max(spectrum_lines, key=lambda x: x[1])[0]
             else:
-                continue
+                primary_wavelength = ev_to_wavelength(ie)
+
+        # Visible emission: from JSON or calculated
+        visible_wavelength = element.get('visible_emission_wavelength')
+        if visible_wavelength is None:
+            if spectrum_lines:
+                # Find strongest line in visible range from calculated spectrum
+                visible_lines = [(wl, intensity) for wl, intensity in spectrum_lines if 380 <= wl <= 780]
+                if visible_lines:
+                    visible_wavelength = max(visible_lines, key=lambda x: x[1])[0]
+                else:
+                    visible_wavelength = primary_wavelength
+            else:
+                visible_wavelength = primary_wavelength
+
+        # Ionization wavelength: wavelength corresponding to ionization energy
+        ionization_wavelength = ev_to_wavelength(ie)
+
+        return {
+            'symbol': symbol,
+            'name': name,
+            'z': z,
+            'ie': ie,
+            'ionization_energy': ie,  # Alias for tests
+            'block': block,
+            'block_color': get_block_color(block),
+            'period': period,
+            'group': group,
+            'freq_phz': ev_to_frequency(ie),
+            'wavelength_nm': primary_wavelength,  # Primary emission wavelength
+            'emission_wavelength': primary_wavelength,  # Strongest emission line (may be UV/IR)
+            'visible_emission_wavelength': visible_wavelength,  # Most prominent visible line
+            'ionization_wavelength': ionization_wavelength,  # Wavelength from IE
+            'electronegativity': electroneg,
+            'atomic_radius': radius,
+            'melting_point': melting,
+            'melting': melting,  # Alias for tests
+            'boiling_point': boiling,
+            'boiling': boiling,  # Alias for tests
+            'density': density,
+            'electron_affinity': electron_affinity,
+            'valence_electrons': valence,
+            'valence': valence,  # Alias for tests
+            'electron_config': element.get('electron_configuration') or get_electron_config(z),
+            'isotopes': isotopes,
+            'spectrum_lines': spectrum_lines
+        }
 
-            # Check if value is within range
-            if value < filter_data['min'] or value > filter_data['max']:
-                return False
+    def _rebuild_element_columns(self):
+        """Rebuild the columnar element store and drop masks and colors derived from it"""
+        self.element_columns.rebuild(self.base_elements)
+        self._filter_mask = None
+        self._filter_mask_key = None
+        self._filter_mask_checked = None
+        self._color_columns = {}
+
+    def _filter_mask_state(self):
+        """Filter settings that determine the filter mask"""
+        # Isotope availability applies to non-spiral layouts
+        neutron_offset = self.selected_neutron_offset if self.layout_mode != "spiral" else 0
+        return ElementColumns.filter_signature(self.filters), neutron_offset
+
+    def invalidate_filters(self):
+        """Force the filter mask to be recomputed (call after editing self.filters directly)"""
+        self._filter_mask_checked = None
+
+    def _current_filter_mask(self):
+        """Filter mask for base_elements, recomputed only when the filter settings change"""
+        if self._filter_mask_checked != self._paint_generation or self._filter_mask is None:
+            key = self._filter_mask_state()
+            if key != self._filter_mask_key or self._filter_mask is None:
+                self._filter_mask = self.element_columns.filter_mask(self.filters, key[1])
+                self._filter_mask_key = key
+            self._filter_mask_checked = self._paint_generation
+        return self._filter_mask
 
-        return True
+    def passes_filters(self, elem):
+        """Check if element passes all active filters and isotope selection"""
+        row = self.element_columns.row(elem)
+        if row is None:
+            # Not part of the current catalog: evaluate it on its own
+            return bool(ElementColumns([elem]).filter_mask(self.filters, self._filter_mask_state()[1])[0])
+        return bool(self._current_filter_mask()[row])
 
     def _has_isotope_with_offset(self, elem, neutron_offset):
         """Check if element has an isotope with the specified neutron offset (N - Z)"""
@@ -623,10 +758,15 @@ class UnifiedTable(QWidget):
 
         return False
 
+    @profiled('layout.circular', 'layout')
     def create_circular_layout(self):
         """Create circular wedge layout with dynamic radii based on widget size"""
+        self._apply_layout(self._compute_circular_layout(self.base_elements, self.width(), self.height()))
+
+    def _compute_circular_layout(self, base_elements, widget_width, widget_height):
+        """Circular wedge layout attributes for the given elements and widget size"""
         # Calculate dynamic radii based on widget dimensions
-        min_dimension = min(self.width(), self.height())
+        min_dimension = min(widget_width, widget_height)
         max_radius = min_dimension / 2 * 0.85  # Use 85% of available radius
 
         # Calculate period radii dynamically
@@ -640,18 +780,18 @@ class UnifiedTable(QWidget):
             period_radii.append((r_inner, r_outer))
 
         # Store the outermost radius for electron shell rendering
-        self.outermost_radius = period_radii[-1][1]  # r_outer of period 7
+        outermost_radius = period_radii[-1][1]  # r_outer of period 7
 
         start_angle = -math.pi / 2
 
-        self.elements = []
+        elements = []
         current_z = 0
-        for elem in self.base_elements:
+        for elem in base_elements:
             period_idx = elem['period'] - 1
             r_inner, r_outer = period_radii[period_idx]
 
             # Count elements in this period
-            period_elements = [e for e in self.base_elements if e['period'] == elem['period']]
+            period_elements = [e for e in base_elements if e['period'] == elem['period']]
             num_elements = len(period_elements)
             elem_idx_in_period = period_elements.index(elem)
 
@@ -660,7 +800,7 @@ class UnifiedTable(QWidget):
             angle_end = angle_start + angle_per_elem
             angle_mid = (angle_start + angle_end) / 2
 
-            self.elements.append({
+            elements.append({
                 **elem,
                 'layout': 'circular',
                 'r_inner': r_inner,
@@ -670,20 +810,27 @@ class UnifiedTable(QWidget):
                 'angle_mid': angle_mid
             })
 
+        return {'elements': elements, 'outermost_radius': outermost_radius}
+
+    @profiled('layout.spiral', 'layout')
     def create_spiral_layout(self):
         """
         Create spiral layout with main element positions on period circles.
         Isotopes are stored as radial offsets for rendering.
         """
-        self.elements = []
+        self._apply_layout(self._compute_spiral_layout(self.base_elements, self.width(), self.height()))
+
+    def _compute_spiral_layout(self, base_elements, widget_width, widget_height):
+        """Spiral layout attributes for the given elements and widget size"""
+        elements = []
 
         # Spiral parameters
         margin = 50
-        width = self.width() - 2 * margin
-        height = self.height() - 2 * margin
+        width = widget_width - 2 * margin
+        height = widget_height - 2 * margin
 
         # Calculate dynamic period radii
-        num_periods = max(elem['period'] for elem in self.base_elements)
+        num_periods = max(elem['period'] for elem in base_elements)
         available_radius = min(width, height) / 2 - 50
         base_radius = available_radius * 0.18
         ring_spacing = (available_radius - base_radius) / (num_periods - 1) if num_periods > 1 else 0
@@ -697,13 +844,13 @@ class UnifiedTable(QWidget):
         spiral_center_y = height / 2
 
         # Angular spacing - 4 full rotations over all ELEMENTS (not isotopes)
-        total_elements = len(self.base_elements)
+        total_elements = len(base_elements)
         angular_spacing_per_element = (8 * math.pi) / max(total_elements, 1)
 
         element_positions = []
         current_angle = 0
 
-        for elem_idx, elem in enumerate(self.base_elements):
+        for elem_idx, elem in enumerate(base_elements):
             period = elem['period']
             base_radius_elem = period_radii[period]
 
@@ -760,16 +907,10 @@ class UnifiedTable(QWidget):
                 'ring_spacing': ring_spacing
             })
 
-        # Store for rendering
-        self.element_spiral_positions = element_positions
-        self.period_radii = period_radii
-        self.spiral_center = (spiral_center_x, spiral_center_y)
-        self.ring_spacing = ring_spacing
-
         # Now create element entries for drawing
         for pos_data in element_positions:
             elem = pos_data['elem']
-            self.elements.append({
+            elements.append({
                 **elem,
                 'layout': 'spiral',
                 'x': pos_data['x'],
@@ -784,22 +925,38 @@ class UnifiedTable(QWidget):
                 'ring_spacing': pos_data['ring_spacing']
             })
 
-        # Store the outermost radius for electron shell rendering
-        self.outermost_radius = period_radii[max(period_radii.keys())]
+        # Store for rendering (the outermost radius is used for electron shells)
+        return {
+            'elements': elements,
+            'element_spiral_positions': element_positions,
+            'period_radii': period_radii,
+            'spiral_center': (spiral_center_x, spiral_center_y),
+            'ring_spacing': ring_spacing,
+            'outermost_radius': period_radii[max(period_radii.keys())]
+        }
 
+    @profiled('layout.serpentine', 'layout')
     def create_serpentine_layout(self):
         """Create linear graph layout with configurable ordering and property lines"""
+        self._apply_layout(self._compute_serpentine_layout(
+            self.base_elements, self.width(), self.height(), self.order_property))
+
+    def _compute_serpentine_layout(self, base_elements, widget_width, widget_height, order_property):
+        """Linear graph layout attributes for the given elements, widget size and ordering"""
         # Use the LinearLayoutRenderer to create layout
-        renderer = LinearLayoutRenderer(self.width(), self.height())
-        self.elements = renderer.create_layout(
-            self.base_elements,
+        renderer = LinearLayoutRenderer(widget_width, widget_height)
+        elements = renderer.create_layout(
+            base_elements,
             position_calculator=None,
-            order_property=self.order_property
+            order_property=order_property
         )
 
         # Store renderer for painting
-        self.linear_renderer = renderer
-        self.period_boundaries = renderer.period_boundaries
+        return {
+            'elements': elements,
+            'linear_renderer': renderer,
+            'period_boundaries': renderer.period_boundaries
+        }
 
     def get_order_value(self, elem):
         """Get the value to order elements by in linear mode"""
@@ -826,9 +983,14 @@ class UnifiedTable(QWidget):
         else:
             return elem.get('z', 0)
 
+    @profiled('layout.table', 'layout')
     def create_table_layout(self):
         """Create traditional periodic table layout - positions calculated dynamically from atomic properties"""
-        self.elements = []
+        self._apply_layout(self._compute_table_layout(self.base_elements))
+
+    def _compute_table_layout(self, base_elements):
+        """Table layout attributes for the given elements (cells have a fixed size)"""
+        elements = []
 
         # Dynamic calculation - NO hardcoded positions!
         calc = PositionCalculator()
@@ -836,7 +998,7 @@ class UnifiedTable(QWidget):
         margin_left = 50
         margin_top = 50
 
-        for elem in self.base_elements:
+        for elem in base_elements:
             symbol = elem['symbol']
             z = elem['z']
 
@@ -847,7 +1009,7 @@ class UnifiedTable(QWidget):
             x = margin_left + (col - 1) * cell_size
             y = margin_top + (row - 1) * cell_size
 
-            self.elements.append({
+            elements.append({
                 **elem,
                 'layout': 'table',
                 'x': x,
@@ -857,6 +1019,8 @@ class UnifiedTable(QWidget):
                 'grid_col': col
             })
 
+        return {'elements': elements}
+
     def _get_wavelength_mode(self, property_type):
         """Get wavelength display mode for a property type
 
@@ -963,28 +1127,90 @@ class UnifiedTable(QWidget):
             b = int(color_end.blue() * (1 - fade_amount))
             color = QColor(r, g, b)
         else:
-            # Within range: simple A to B lerp
+            # Within range: simple A to B lerp, read from the channel's gradient LUT
             if max_value > min_value:
                 t = (value - min_value) / (max_value - min_value)
             else:
                 t = 0.5
-            # Lerp from color_start to color_end
-            r = int(color_start.red() * (1 - t) + color_end.red() * t)
-            g = int(color_start.green() * (1 - t) + color_end.green() * t)
-            b = int(color_start.blue() * (1 - t) + color_end.blue() * t)
-            color = QColor(r, g, b)
+            lut = gradient_lut(color_start.getRgb()[:3], color_end.getRgb()[:3], int(255 * (1.0 - fade)))
+            return lut.color_at(t)
 
         color.setAlpha(int(255 * (1.0 - fade)))
         return color
 
+    def _spectrum_color(self, wavelength, range_min, range_max, fade):
+        """Rainbow color for a wavelength, read from the spectrum LUT when in range"""
+        if range_min >= range_max:
+            range_max = range_min + 1
+        t = (wavelength - range_min) / (range_max - range_min)
+        if 0.0 <= t <= 1.0:
+            return spectrum_lut(int(255 * (1.0 - fade))).color_at(t)
+        return wavelength_to_rgb(wavelength, range_min, range_max, fade)
+
     def get_property_color(self, elem, property_name, property_type="fill"):
         """Get color based on property name and type (for per-property fade)
 
+        Colors for catalog elements are read from a per-(property, encoding)
+        color column that is only recomputed when its settings change.
+
         Args:
             elem: Element dictionary
             property_name: Name of the property ("atomic_number", "wavelength", etc.)
             property_type: PTEncodingType enum or string encoding type
         """
+        row = self.element_columns.row(elem)
+        # The color is shared with the color column and LUTs: callers copy it before changing alpha
+        if row is None:
+            return self._compute_property_color(elem, property_name, property_type)
+        return self._color_column(property_name, property_type)[row]
+
+    def _channel_attributes(self, property_type):
+        """Attribute names holding one encoding channel's color settings (cached per channel)"""
+        attrs = self._channel_attribute_names.get(property_type)
+        if attrs is None:
+            encoding = PTEncodingType.from_string(property_type) if isinstance(property_type, str) else property_type
+            prefix = encoding.value
+            attrs = (
+                encoding,
+                f"{prefix}_{'fade' if encoding == PTEncodingType.FILL else 'color_fade'}",
+                f"{prefix}_color_range_min",
+                f"{prefix}_color_range_max",
+                encoding.get_wavelength_mode_attr(),
+                f"custom_{prefix}_gradient_start",
+                f"custom_{prefix}_gradient_end",
+            )
+            self._channel_attribute_names[property_type] = attrs
+        return attrs
+
+    def _channel_state(self, attrs):
+        """Current values of a channel's color settings; a change invalidates its colors"""
+        _, fade_attr, min_attr, max_attr, mode_attr, start_attr, end_attr = attrs
+        start = getattr(self, start_attr, None)
+        end = getattr(self, end_attr, None)
+        return (
+            getattr(self, fade_attr, 0.0),
+            getattr(self, min_attr, self.color_range_min),
+            getattr(self, max_attr, self.color_range_max),
+            getattr(self, mode_attr, PTWavelengthMode.SPECTRUM),
+            start.rgba() if start is not None else None,
+            end.rgba() if end is not None else None,
+        )
+
+    def _color_column(self, property_name, property_type):
+        """Colors for every row of element_columns, rebuilt when the mapping or its LUT settings change"""
+        attrs = self._channel_attributes(property_type)
+        state = self._channel_state(attrs)
+        key = (property_name, attrs[0])
+        entry = self._color_columns.get(key)
+        if entry is None or entry[0] != state:
+            colors = [self._compute_property_color(record, property_name, attrs[0])
+                      for record in self.element_columns.records]
+            entry = (state, colors)
+            self._color_columns[key] = entry
+        return entry[1]
+
+    def _compute_property_color(self, elem, property_name, property_type="fill"):
+        """Compute the color for one element (uncached)"""
         # Convert string to enum if needed
         if isinstance(property_type, str):
             property_type = PTEncodingType.from_string(property_type)
@@ -1031,28 +1257,28 @@ class UnifiedTable(QWidget):
             if mode == PTWavelengthMode.GRADIENT:
                 return self._generate_gradient_color(elem[PTElementDataKey.WAVELENGTH_NM.value], color_range_min, color_range_max, property_name, fade, property_type)
             else:
-                return wavelength_to_rgb(elem[PTElementDataKey.WAVELENGTH_NM.value], color_range_min, color_range_max, fade)
+                return self._spectrum_color(elem[PTElementDataKey.WAVELENGTH_NM.value], color_range_min, color_range_max, fade)
         elif prop_enum == PTPropertyName.EMISSION_WAVELENGTH:
             # Most prominent emission line (may be UV/IR)
             mode = self._get_wavelength_mode(property_type)
             if mode == PTWavelengthMode.GRADIENT:
                 return self._generate_gradient_color(elem[PTElementDataKey.EMISSION_WAVELENGTH.value], color_range_min, color_range_max, property_name, fade, property_type)
             else:
-                return wavelength_to_rgb(elem[PTElementDataKey.EMISSION_WAVELENGTH.value], color_range_min, color_range_max, fade)
+                return self._spectrum_color(elem[PTElementDataKey.EMISSION_WAVELENGTH.value], color_range_min, color_range_max, fade)
         elif prop_enum == PTPropertyName.VISIBLE_EMISSION_WAVELENGTH:
             # Most prominent visible emission line (flame test colors)
             mode = self._get_wavelength_mode(property_type)
             if mode == PTWavelengthMode.GRADIENT:
                 return self._generate_gradient_color(elem[PTElementDataKey.VISIBLE_EMISSION_WAVELENGTH.value], color_range_min, color_range_max, property_name, fade, property_type)
             else:
-                return wavelength_to_rgb(elem[PTElementDataKey.VISIBLE_EMISSION_WAVELENGTH.value], color_range_min, color_range_max, fade)
+                return self._spectrum_color(elem[PTElementDataKey.VISIBLE_EMISSION_WAVELENGTH.value], color_range_min, color_range_max, fade)
         elif prop_enum == PTPropertyName.IONIZATION_WAVELENGTH:
             # Wavelength corresponding to ionization energy
             mode = self._get_wavelength_mode(property_type)
             if mode == PTWavelengthMode.GRADIENT:
                 return self._generate_gradient_color(elem[PTElementDataKey.IONIZATION_WAVELENGTH.value], color_range_min, color_range_max, property_name, fade, property_type)
             else:
-                return wavelength_to_rgb(elem[PTElementDataKey.IONIZATION_WAVELENGTH.value], color_range_min, color_range_max, fade)
+                return self._spectrum_color(elem[PTElementDataKey.IONIZATION_WAVELENGTH.value], color_range_min, color_range_max, fade)
         elif prop_enum == PTPropertyName.SPECTRUM:
             # Use spectrum background - blend colors from all emission lines
             # This creates a mixed color representing the element's spectrum
@@ -1062,7 +1288,7 @@ class UnifiedTable(QWidget):
                 if mode == PTWavelengthMode.GRADIENT:
                     return self._generate_gradient_color(elem[PTElementDataKey.WAVELENGTH_NM.value], color_range_min, color_range_max, property_name, fade, property_type)
                 else:
-                    return wavelength_to_rgb(elem[PTElementDataKey.WAVELENGTH_NM.value], color_range_min, color_range_max, fade)
+                    return self._spectrum_color(elem[PTElementDataKey.WAVELENGTH_NM.value], color_range_min, color_range_max, fade)
 
             # Check wavelength mode
             mode = self._get_wavelength_mode(property_type)
@@ -1097,12 +1323,12 @@ class UnifiedTable(QWidget):
                         continue
 
                     # Get color for this wavelength (with remapping, but NO fade yet - we'll apply it to final color)
-                    color = wavelength_to_rgb(wavelength, color_range_min, color_range_max, 0.0)
+                    r, g, b = wavelength_to_rgb_tuple(wavelength, color_range_min, color_range_max)
                     weight = intensity
 
-                    total_r += color.red() * weight
-                    total_g += color.green() * weight
-                    total_b += color.blue() * weight
+                    total_r += r * weight
+                    total_g += g * weight
+                    total_b += b * weight
                     total_weight += weight
 
                 if total_weight > 0:
@@ -1179,27 +1405,11 @@ class UnifiedTable(QWidget):
 
     def _get_property_value(self, elem, property_name):
         """Get raw property value from element"""
-        prop_enum = PTPropertyName.from_string(property_name)
-
-        if prop_enum == PTPropertyName.ATOMIC_NUMBER:
-            return elem.get('z', 0)
-        elif prop_enum == PTPropertyName.RADIUS:
-            return elem.get('atomic_radius', 0)
-        elif prop_enum == PTPropertyName.IONIZATION:
-            return elem.get('ie', 0)
-        elif prop_enum == PTPropertyName.ELECTRONEGATIVITY:
-            return elem.get('electronegativity', 0)
-        elif prop_enum == PTPropertyName.MELTING:
-            return elem.get('melting_point', 0)
-        elif prop_enum == PTPropertyName.BOILING:
-            return elem.get('boiling_point', 0)
-        elif prop_enum == PTPropertyName.DENSITY:
-            return elem.get('density', 0)
-        elif prop_enum == PTPropertyName.ELECTRON_AFFINITY:
-            return elem.get('electron_affinity', 0)
-        elif prop_enum == PTPropertyName.VALENCE:
-            return elem.get('valence_electrons', 0)
-        return 0
+        row = self.element_columns.row(elem)
+        if row is not None:
+            return self.element_columns.value(property_name, row)
+        field = PROPERTY_FIELDS.get(property_name)
+        return elem.get(field, 0) if field else 0
 
     def _map_property_to_range(self, elem, property_name, input_min, input_max, output_min, output_max):
         """Map property value to output range using configurable input range"""
@@ -1354,17 +1564,27 @@ class UnifiedTable(QWidget):
         return 0, 0
 
     def paintEvent(self, event):
+        # New frame: the filter mask revalidates against the current filters
+        self._paint_generation += 1
+        profiler = get_profiler()
+        profiler.begin_frame()
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Cosmic background
-        gradient = QRadialGradient(self.width()/2, self.height()/2,
-                                  max(self.width(), self.height())/2)
-        gradient.setColorAt(0, QColor(20, 20, 40))
-        gradient.setColorAt(1, QColor(5, 5, 15))
-        painter.fillRect(self.rect(), QBrush(gradient))
-
-        if self.layout_mode == PTLayoutMode.CIRCULAR:
+        with profiler.scope('paint.background', 'paint'):
+            gradient = QRadialGradient(self.width()/2, self.height()/2,
+                                      max(self.width(), self.height())/2)
+            gradient.setColorAt(0, QColor(20, 20, 40))
+            gradient.setColorAt(1, QColor(5, 5, 15))
+            painter.fillRect(self.rect(), QBrush(gradient))
+
+        # While switching layouts only the moving element markers are painted
+        if self._transition is not None:
+            with profiler.scope('paint.transition', 'paint'):
+                self._draw_transition(painter)
+        elif self.layout_mode == PTLayoutMode.CIRCULAR:
             self.paint_circular(painter)
         elif self.layout_mode == PTLayoutMode.SPIRAL:
             self.paint_spiral(painter)
@@ -1373,6 +1593,9 @@ class UnifiedTable(QWidget):
         elif self.layout_mode == PTLayoutMode.TABLE:
             self.paint_table(painter)
 
+        draw_profiler_overlay(painter, self.width())
+        profiler.end_frame('UnifiedTable.paint')
+
     def paint_circular(self, painter):
         """Paint circular wedge layout"""
         # Apply zoom and pan transformations
@@ -1396,15 +1619,16 @@ class UnifiedTable(QWidget):
 
         # Draw element table if enabled
         if self.show_element_table:
-            # If showing subatomic particles, only draw selected element
-            if self.show_subatomic_particles and self.selected_element:
-                passes_filter = self.passes_filters(self.selected_element)
-                self.draw_circular_element(painter, self.selected_element, center_x, center_y, passes_filter)
-            else:
-                # Draw all elements normally
-                for elem in self.elements:
-                    passes_filter = self.passes_filters(elem)
-                    self.draw_circular_element(painter, elem, center_x, center_y, passes_filter)
+            with get_profiler().scope('paint.elements', 'paint'):
+                # If showing subatomic particles, only draw selected element
+                if self.show_subatomic_particles and self.selected_element:
+                    passes_filter = self.passes_filters(self.selected_element)
+                    self.draw_circular_element(painter, self.selected_element, center_x, center_y, passes_filter)
+                else:
+                    # Draw all elements normally
+                    for elem in self.elements:
+                        passes_filter = self.passes_filters(elem)
+                        self.draw_circular_element(painter, elem, center_x, center_y, passes_filter)
 
         # Draw subatomic particles overlay (before shells)
         if self.selected_element:
@@ -1521,7 +1745,7 @@ class UnifiedTable(QWidget):
             painter.restore()
 
         # Get fill color (already has fade alpha applied)
-        fill_color = self.get_property_color(elem, self.fill_property, "fill")
+        fill_color = QColor(self.get_property_color(elem, self.fill_property, "fill"))
         # Combine fade alpha with scene alpha
         fade_alpha = fill_color.alpha()
         combined_alpha = int((fade_alpha / 255.0) * alpha)
@@ -1587,7 +1811,7 @@ class UnifiedTable(QWidget):
             ring_path.closeSubpath()
 
             # Fill inner ring
-            ring_color = self.get_property_color(elem, self.ring_property, "ring")
+            ring_color = QColor(self.get_property_color(elem, self.ring_property, "ring"))
             # Combine fade alpha with scene alpha
             fade_alpha_ring = ring_color.alpha()
             combined_alpha_ring = int((fade_alpha_ring / 255.0) * alpha)
@@ -1712,6 +1936,7 @@ class UnifiedTable(QWidget):
         border_color = self.get_property_color(elem, self.border_color_property, "border")
         # Increase alpha for selected/hovered elements
         if (elem == self.hovered_element or elem == self.selected_element) and not self.show_subatomic_particles:
+            border_color = QColor(border_color)
             current_alpha = border_color.alpha()
             border_color.setAlpha(min(255, int(current_alpha * 1.5)))
         painter.setPen(QPen(border_color, border_width))
@@ -1923,6 +2148,7 @@ class UnifiedTable(QWidget):
         color.setAlpha(alpha)
         return color
 
+    @profiled('paint.spectrum', 'paint')
     def draw_spectrum_lines_overlay(self, painter, elem, clip_path, center_x, center_y):
         """Draw spectrum emission lines as colored vertical bars overlaid on the element"""
         painter.save()
@@ -2088,15 +2314,16 @@ class UnifiedTable(QWidget):
         }
 
         # Use the LinearLayoutRenderer to paint
-        self.linear_renderer.paint(
-            painter,
-            self.elements,
-            table_state,
-            self.passes_filters,
-            zoom_level=self.zoom_level,
-            pan_x=self.pan_x,
-            pan_y=self.pan_y
-        )
+        with get_profiler().scope('paint.elements', 'paint'):
+            self.linear_renderer.paint(
+                painter,
+                self.elements,
+                table_state,
+                self.passes_filters,
+                zoom_level=self.zoom_level,
+                pan_x=self.pan_x,
+                pan_y=self.pan_y
+            )
 
         # Draw orbital/cloud visualization for selected element (if in subatomic mode)
         if self.selected_element and self.show_subatomic_particles:
@@ -2206,7 +2433,7 @@ class UnifiedTable(QWidget):
         alpha = 255
 
         # Get fill color (already has fade alpha applied)
-        fill_color = self.get_property_color(elem, self.fill_property, "fill")
+        fill_color = QColor(self.get_property_color(elem, self.fill_property, "fill"))
         # Combine fade alpha with scene alpha
         fade_alpha = fill_color.alpha()
         combined_alpha = int((fade_alpha / 255.0) * alpha)
@@ -2247,7 +2474,7 @@ class UnifiedTable(QWidget):
         inner_ring_fraction = self.get_inner_ring_size(elem)
         if self.ring_property != "none" and inner_ring_fraction > 0:
             ring_radius = marker_size * inner_ring_fraction
-            ring_color = self.get_property_color(elem, self.ring_property, "ring")
+            ring_color = QColor(self.get_property_color(elem, self.ring_property, "ring"))
             # Combine fade alpha with scene alpha
             fade_alpha_ring = ring_color.alpha()
             combined_alpha_ring = int((fade_alpha_ring / 255.0) * alpha)
@@ -2303,7 +2530,7 @@ class UnifiedTable(QWidget):
 
         # Border
         border_width = self.get_border_width(elem)
-        border_color = self.get_property_color(elem, self.border_color_property, "border")
+        border_color = QColor(self.get_property_color(elem, self.border_color_property, "border"))
         # Combine fade alpha with scene alpha
         fade_alpha_border = border_color.alpha()
         combined_alpha_border = int((fade_alpha_border / 255.0) * alpha)
@@ -2315,7 +2542,7 @@ class UnifiedTable(QWidget):
         # Draw element label
         if elem == self.hovered_element or elem == self.selected_element or passes_filter:
             text_alpha = alpha
-            symbol_text_color = self.get_property_color(elem, self.symbol_text_color_property, "symbol_text")
+            symbol_text_color = QColor(self.get_property_color(elem, self.symbol_text_color_property, "symbol_text"))
             symbol_text_color.setAlpha(text_alpha)
             font = QFont('Arial', 9 if passes_filter else 7, QFont.Weight.Bold)
 
@@ -2366,14 +2593,15 @@ class UnifiedTable(QWidget):
             self.draw_electron_probability_cloud(painter, center_x, center_y)
 
         # If showing subatomic particles, only draw selected element
-        if self.show_subatomic_particles and self.selected_element:
-            passes_filter = self.passes_filters(self.selected_element)
-            self.draw_table_element(painter, self.selected_element, passes_filter)
-        else:
-            # Draw all elements normally
-            for elem in self.elements:
-                passes_filter = self.passes_filters(elem)
-                self.draw_table_element(painter, elem, passes_filter)
+        with get_profiler().scope('paint.elements', 'paint'):
+            if self.show_subatomic_particles and self.selected_element:
+                passes_filter = self.passes_filters(self.selected_element)
+                self.draw_table_element(painter, self.selected_element, passes_filter)
+            else:
+                # Draw all elements normally
+                for elem in self.elements:
+                    passes_filter = self.passes_filters(elem)
+                    self.draw_table_element(painter, elem, passes_filter)
 
         # Draw subatomic particles and shells for selected element (on top)
         if self.selected_element and self.show_subatomic_particles and 'cell_size' in self.selected_element:
@@ -2403,7 +2631,7 @@ class UnifiedTable(QWidget):
         alpha = 255
 
         # Get fill color (already has fade alpha applied)
-        fill_color = self.get_property_color(elem, self.fill_property, "fill")
+        fill_color = QColor(self.get_property_color(elem, self.fill_property, "fill"))
         # Combine fade alpha with scene alpha
         fade_alpha = fill_color.alpha()
         combined_alpha = int((fade_alpha / 255.0) * alpha)
@@ -2444,7 +2672,7 @@ class UnifiedTable(QWidget):
         inner_ring_fraction = self.get_inner_ring_size(elem)
         if self.ring_property != "none" and inner_ring_fraction > 0:
             ring_height = cell_size * inner_ring_fraction
-            ring_color = self.get_property_color(elem, self.ring_property, "ring")
+            ring_color = QColor(self.get_property_color(elem, self.ring_property, "ring"))
             # Combine fade alpha with scene alpha
             fade_alpha_ring = ring_color.alpha()
             combined_alpha_ring = int((fade_alpha_ring / 255.0) * alpha)
@@ -2514,7 +2742,7 @@ class UnifiedTable(QWidget):
 
         # Border
         border_width = self.get_border_width(elem)
-        border_color = self.get_property_color(elem, self.border_color_property, "border")
+        border_color = QColor(self.get_property_color(elem, self.border_color_property, "border"))
         # Combine fade alpha with scene alpha
         fade_alpha_border = border_color.alpha()
         combined_alpha_border = int((fade_alpha_border / 255.0) * alpha)
@@ -2528,7 +2756,7 @@ class UnifiedTable(QWidget):
             text_alpha = alpha
 
             # Atomic number (top left) with colored text and white border
-            atomic_num_text_color = self.get_property_color(elem, self.atomic_number_text_color_property, "atomic_number_text")
+            atomic_num_text_color = QColor(self.get_property_color(elem, self.atomic_number_text_color_property, "atomic_number_text"))
             atomic_num_text_color.setAlpha(text_alpha)
             font = QFont('Arial', 8)
             painter.setFont(font)
@@ -2546,7 +2774,7 @@ class UnifiedTable(QWidget):
             painter.drawPath(num_path)
 
             # Symbol (center, large) with colored text and white border
-            symbol_text_color = self.get_property_color(elem, self.symbol_text_color_property, "symbol_text")
+            symbol_text_color = QColor(self.get_property_color(elem, self.symbol_text_color_property, "symbol_text"))
             symbol_text_color.setAlpha(text_alpha)
             font = QFont('Arial', 18 if passes_filter else 14, QFont.Weight.Bold)
             painter.setFont(font)
@@ -2831,6 +3059,7 @@ class UnifiedTable(QWidget):
             painter.setFont(font)
             painter.drawText(QPointF(label_x + 5, label_y - 5), f"P{period}")
 
+    @profiled('paint.elements', 'paint')
     def draw_isotope_spirals(self, painter):
         """Draw main spiral line and isotope lines with property-based colors and borders"""
         if not hasattr(self, 'element_spiral_positions') or not self.element_spiral_positions:
@@ -3057,6 +3286,7 @@ class UnifiedTable(QWidget):
             painter.setBrush(QBrush(ring_color))
             painter.drawEllipse(QPointF(x, y), dot_size, dot_size)
 
+    @profiled('paint.elements', 'paint')
     def draw_isotope_wedges(self, painter):
         """Draw wedges between isotopes showing property variations"""
         if not hasattr(self, 'isotope_spiral_lines'):
@@ -3101,7 +3331,7 @@ class UnifiedTable(QWidget):
             path.closeSubpath()
 
             # Fill color based on border property
-            fill_color = self.get_property_color(iso1['elem'], self.border_property)
+            fill_color = QColor(self.get_property_color(iso1['elem'], self.border_property))
             fill_color.setAlpha(40)
 
             # Border color based on glow property
@@ -3112,6 +3342,7 @@ class UnifiedTable(QWidget):
             painter.setBrush(QBrush(fill_color))
             painter.drawPath(path)
 
+    @profiled('paint.labels', 'paint')
     def draw_element_labels(self, painter):
         """Draw element symbols at their positions with colored text and white borders"""
         center_x, center_y = self.spiral_center
@@ -3545,7 +3776,7 @@ class UnifiedTable(QWidget):
 
         if show_text:
             # Draw symbol with colored text and white border
-            symbol_text_color = self.get_property_color(elem, self.symbol_text_color_property, "symbol_text")
+            symbol_text_color = QColor(self.get_property_color(elem, self.symbol_text_color_property, "symbol_text"))
             symbol_text_color.setAlpha(220)
             font = QFont('Arial', 9, QFont.Weight.Bold)
             painter.setFont(font)
@@ -3896,6 +4127,7 @@ class UnifiedTable(QWidget):
 
         return orbitals
 
+    @profiled('paint.clouds', 'paint')
     def draw_electron_probability_cloud(self, painter, center_x, center_y):
         """
         Draw electron probability cloud for selected element as background glow.
@@ -3972,6 +4204,7 @@ class UnifiedTable(QWidget):
             animation_phase=self.cloud_animation_phase
         )
 
+    @profiled('paint.shells', 'paint')
     def draw_electron_shells(self, painter, center_x, center_y):
         """
         Draw concentric electron shells with electron dots for selected element.
@@ -4123,7 +4356,7 @@ class UnifiedTable(QWidget):
         z = self.selected_element['z']
 
         # Get element color
-        elem_color = self.get_property_color(self.selected_element, self.fill_property)
+        elem_color = QColor(self.get_property_color(self.selected_element, self.fill_property))
 
         # Circle size - should fit inside innermost radius
         circle_radius = 35
@@ -4179,6 +4412,7 @@ class UnifiedTable(QWidget):
         painter.setPen(QPen(QColor(255, 255, 255, 200), 1))
         painter.drawText(int(number_x), int(number_y), number_text)
 
+    @profiled('paint.particles', 'paint')
     def draw_subatomic_particles(self, painter, center_x, center_y):
         """
         Draw subatomic particles using realistic nuclear physics positioning.
@@ -4657,6 +4891,7 @@ class UnifiedTable(QWidget):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        self._stop_transition()
         # Recreate layout on resize for proper scaling
         if self.layout_mode == PTLayoutMode.CIRCULAR:
             self.create_circular_layout()
@@ -4670,7 +4905,17 @@ class UnifiedTable(QWidget):
     def reload_data(self):
         """Reload element data from files and refresh the display"""
         self.create_element_data()
-        # Recreate layout based on current mode
+        self._discard_layouts()
+        self._recreate_layout()
+        self.update()
+
+    def _discard_layouts(self):
+        """Drop prefetched layouts and any running transition after a data change"""
+        get_layout_prefetcher().discard(LAYOUT_NAMESPACE)
+        self._stop_transition()
+
+    def _recreate_layout(self):
+        """Recreate layout based on current mode"""
         if self.layout_mode == PTLayoutMode.CIRCULAR:
             self.create_circular_layout()
         elif self.layout_mode == PTLayoutMode.SPIRAL or self.layout_mode == PTLayoutMode.SERPENTINE:
@@ -4679,6 +4924,65 @@ class UnifiedTable(QWidget):
             self.create_table_layout()
         elif self.layout_mode == PTLayoutMode.LINEAR:
             self.create_linear_layout()
+
+    def apply_data_changes(self, event):
+        """
+        Apply an item-level data change without rebuilding every element.
+
+        Only the changed element files are re-read and only their records (and
+        emission spectra) are rebuilt. When no element was added or removed and
+        no period changed, circular and table layouts are patched in place;
+        otherwise the layout for the current mode is recomputed.
+
+        Args:
+            event: DataChangeEvent for the elements category
+        """
+        loader = get_loader()
+        if event.full:
+            loader.load_all_elements()
+            self.reload_data()
+            return
+
+        updated, removed = loader.reload_items(event.names)
+        if not updated and not removed:
+            return
+
+        records = {elem['z']: elem for elem in self.base_elements}
+        changed = {}
+        for element in updated:
+            record = self._build_element_record(element)
+            changed[record['z']] = record
+
+        same_shape = not removed and all(
+            z in records and records[z]['period'] == record['period'] and records[z]['symbol'] == record['symbol']
+            for z, record in changed.items()
+        )
+
+        for z in removed:
+            records.pop(z, None)
+        records.update(changed)
+        self.base_elements = [records[z] for z in sorted(records)]
+        self._rebuild_element_columns()
+        self._discard_layouts()
+
+        if self.selected_element is not None:
+            z = self.selected_element.get('z')
+            if z in changed:
+                self.selected_element.update(changed[z])
+            elif z not in records:
+                self.selected_element = None
+        if self.hovered_element is not None and self.hovered_element.get('z') not in records:
+            self.hovered_element = None
+
+        if same_shape and self.layout_mode in (PTLayoutMode.CIRCULAR, PTLayoutMode.TABLE):
+            # Layout keys (angles, radii, grid cells) do not overlap record keys,
+            # so the existing entries can take the new values directly
+            for entry in self.elements:
+                record = changed.get(entry['z'])
+                if record is not None:
+                    entry.update(record)
+        else:
+            self._recreate_layout()
         self.update()
 
 
@@ -4,8 +4,25 @@ Loads alloy data from JSON files in the alloys folder.
 """
 
 import json
+from bisect import bisect_right
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from data.data_index import Condition, DataIndex, Matches
+from utils.profiler import profiled
+
+
+# Fields indexed for fast filtering
+ALLOY_CATEGORICAL_FIELDS = ('category', 'crystal_structure', 'primary_element', 'subcategory')
+ALLOY_NUMERIC_FIELDS = (
+    'density', 'melting_point', 'thermal_conductivity', 'thermal_expansion',
+    'electrical_resistivity', 'specific_heat', 'youngs_modulus', 'shear_modulus',
+    'poissons_ratio', 'hardness', 'hardness_brinell', 'hardness_vickers',
+    'hardness_rockwell', 'tensile_strength', 'yield_strength', 'elongation',
+    'reduction_of_area', 'impact_strength', 'fatigue_strength', 'fracture_toughness',
+    'pren', 'pitting_potential', 'corrosion_resistance', 'cost_per_kg',
+    'lattice_parameter_a', 'packing_factor', 'grain_size',
+)
 
 
 class AlloyDataLoader:
@@ -27,7 +44,10 @@ class AlloyDataLoader:
         self.alloys_dir = Path(alloys_dir)
         self.alloys: List[Dict] = []
         self.alloys_by_name: Dict[str, Dict] = {}
+        self.index = DataIndex(key_field='Name', categorical=ALLOY_CATEGORICAL_FIELDS,
+                               numeric=ALLOY_NUMERIC_FIELDS)
 
+    @profiled('data.load_alloys', 'data')
     def load_all_alloys(self) -> List[Dict]:
         """
         Load all alloy data from JSON files.
@@ -63,6 +83,7 @@ class AlloyDataLoader:
         # Store in instance variables
         self.alloys = loaded_alloys
         self.alloys_by_name = {a['Name']: a for a in loaded_alloys}
+        self.index.rebuild(loaded_alloys)
 
         return loaded_alloys
 
@@ -94,6 +115,11 @@ class AlloyDataLoader:
                 print(f"Warning: Missing required field '{field}' in {filepath.name}")
                 return None
 
+        data['_filename'] = filepath.stem
+        return self._add_derived_fields(data)
+
+    def _add_derived_fields(self, data: Dict) -> Dict:
+        """Add flattened derived fields used by layouts and filters"""
         # Add derived fields for easier access
         data['name'] = data['Name']
         data['formula'] = data.get('Formula', '')
@@ -189,35 +215,115 @@ class AlloyDataLoader:
 
     def get_alloys_by_category(self, category: str) -> List[Dict]:
         """Get alloys filtered by category"""
-        return [a for a in self.alloys if a.get('category', '').lower() == category.lower()]
+        category = category.lower()
+        return self.query(Matches('category', lambda c: (c or '').lower() == category))
 
     def get_alloys_by_structure(self, structure: str) -> List[Dict]:
         """Get alloys filtered by crystal structure"""
-        return [a for a in self.alloys if a.get('crystal_structure', '').upper() == structure.upper()]
+        structure = structure.upper()
+        return self.query(Matches('crystal_structure', lambda s: (s or '').upper() == structure))
 
     def get_alloys_by_primary_element(self, element: str) -> List[Dict]:
         """Get alloys filtered by primary element"""
-        return [a for a in self.alloys if a.get('primary_element') == element]
+        return self.index.items_for(self.index.keys_for('primary_element', element))
 
     def get_unique_categories(self) -> List[str]:
         """Get list of unique categories"""
-        return sorted(list(set(a.get('category', 'Other') for a in self.alloys)))
+        return sorted(self.index.unique_values('category'))
 
     def get_unique_structures(self) -> List[str]:
         """Get list of unique crystal structures"""
-        return sorted(list(set(a.get('crystal_structure', 'Unknown') for a in self.alloys)))
+        return sorted(self.index.unique_values('crystal_structure'))
 
     def get_unique_primary_elements(self) -> List[str]:
         """Get list of unique primary elements"""
-        return sorted(list(set(a.get('primary_element', 'Unknown') for a in self.alloys)))
+        return sorted(self.index.unique_values('primary_element'))
 
     def get_property_range(self, property_name: str) -> tuple:
         """Get min/max range for a property"""
+        if property_name in self.index.sorted_columns:
+            return self.index.value_range(property_name, exclusive_min=0) or (0, 1)
         values = [a.get(property_name, 0) for a in self.alloys if a.get(property_name, 0) > 0]
         if not values:
             return (0, 1)
         return (min(values), max(values))
 
+    def query(self, *conditions: Condition) -> List[Dict]:
+        """
+        Query alloys with indexed conditions (see data.data_index).
+
+        Example:
+            loader.query(In('category', {'Steel'}), Between('density', 7.0, 8.5))
+        """
+        return self.index.query(*conditions)
+
+    # ==================== Incremental Edits ====================
+
+    def upsert_alloy(self, data: Dict, old_name: Optional[str] = None) -> Dict:
+        """
+        Add or replace a single alloy and update the indexes in place.
+
+        Args:
+            data: Raw alloy JSON data (derived fields are added here)
+            old_name: Previous name if the alloy was renamed
+
+        Returns:
+            The stored alloy dictionary
+        """
+        alloy = self._add_derived_fields(data)
+        old = self.alloys_by_name.pop(old_name if old_name else alloy['Name'], None)
+        if old is not None:
+            self.alloys.remove(old)
+            self.index.remove(old['Name'])
+
+        names = [a.get('Name', '') for a in self.alloys]
+        self.alloys.insert(bisect_right(names, alloy['Name']), alloy)
+        self.alloys_by_name[alloy['Name']] = alloy
+        self.index.add(alloy)
+        self.index.set_order(self.alloys)
+        return alloy
+
+    def reload_items(self, filenames: Iterable[str]) -> Tuple[List[Dict], List[str]]:
+        """
+        Re-read only the given alloy files and patch the catalog in place.
+
+        Args:
+            filenames: Filename stems that were added, edited or deleted
+
+        Returns:
+            (alloys that were loaded or replaced, names of alloys removed)
+        """
+        updated, removed = [], []
+        by_filename = {a.get('_filename'): a for a in self.alloys}
+
+        for filename in filenames:
+            previous = by_filename.get(filename)
+            filepath = self.alloys_dir / f"{filename}.json"
+            alloy = self._load_alloy_file(filepath) if filepath.exists() else None
+
+            if alloy is None:
+                if previous is not None:
+                    self.remove_alloy(previous['Name'])
+                    removed.append(previous['Name'])
+                continue
+
+            old_name = previous['Name'] if previous is not None else None
+            if old_name is not None and old_name != alloy['Name']:
+                removed.append(old_name)
+            updated.append(self.upsert_alloy(alloy, old_name=old_name))
+
+        return updated, removed
+
+    def remove_alloy(self, name: str) -> Optional[Dict]:
+        """Remove a single alloy and update the indexes in place"""
+        alloy = self.alloys_by_name.pop(name, None)
+        if alloy is None:
+            return None
+        self.alloys.remove(alloy)
+        self.index.remove(name)
+        self.index.set_order(self.alloys)
+        return alloy
+
 
 # Global loader instance for convenient access
 _alloy_loader = None
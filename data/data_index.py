@@ -0,0 +1,281 @@
+"""
+Data Index
+Secondary indexes and a small composable query API over loaded records.
+
+Loaders build a DataIndex once at load time: a hash index (value -> set of
+record keys) for each categorical field and a sorted column for each numeric
+field.  Filters are then answered by set intersection and bisect instead of
+a full list scan per call, and the indexes are patched in place when a
+single record is added, edited or removed.
+
+Example:
+    loader.query(In('category', {'Organic'}), Between('density', 0.5, 1.2))
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class Condition:
+    """Base class for query conditions. Combine with & (AND) and | (OR)."""
+
+    def resolve(self, index: 'DataIndex') -> Set[str]:
+        """Return the set of record keys matching this condition"""
+        raise NotImplementedError
+
+    def __and__(self, other: 'Condition') -> 'Condition':
+        return _Combined(self, other, intersect=True)
+
+    def __or__(self, other: 'Condition') -> 'Condition':
+        return _Combined(self, other, intersect=False)
+
+
+class _Combined(Condition):
+    """AND/OR of two conditions"""
+
+    def __init__(self, left: Condition, right: Condition, intersect: bool):
+        self.left = left
+        self.right = right
+        self.intersect = intersect
+
+    def resolve(self, index: 'DataIndex') -> Set[str]:
+        left = self.left.resolve(index)
+        if self.intersect and not left:
+            return left
+        right = self.right.resolve(index)
+        return left & right if self.intersect else left | right
+
+
+class Equals(Condition):
+    """Categorical field equals a value"""
+
+    def __init__(self, field: str, value: Any):
+        self.field = field
+        self.value = value
+
+    def resolve(self, index: 'DataIndex') -> Set[str]:
+        return set(index.keys_for(self.field, self.value))
+
+
+class In(Condition):
+    """Categorical field is one of a set of values"""
+
+    def __init__(self, field: str, values: Iterable[Any]):
+        self.field = field
+        self.values = set(values)
+
+    def resolve(self, index: 'DataIndex') -> Set[str]:
+        result: Set[str] = set()
+        for value in self.values:
+            result |= index.keys_for(self.field, value)
+        return result
+
+
+class Matches(Condition):
+    """
+    Categorical field satisfies a predicate.
+
+    The predicate is evaluated once per distinct value rather than once per
+    record, which keeps case-insensitive or normalized matches cheap.
+    """
+
+    def __init__(self, field: str, predicate: Callable[[Any], bool]):
+        self.field = field
+        self.predicate = predicate
+
+    def resolve(self, index: 'DataIndex') -> Set[str]:
+        result: Set[str] = set()
+        for value, keys in index.hash_indexes.get(self.field, {}).items():
+            if self.predicate(value):
+                result |= keys
+        return result
+
+
+class Between(Condition):
+    """Numeric field within [low, high] (either bound may be None)"""
+
+    def __init__(self, field: str, low: Optional[float] = None, high: Optional[float] = None,
+                 include_low: bool = True, include_high: bool = True):
+        self.field = field
+        self.low = low
+        self.high = high
+        self.include_low = include_low
+        self.include_high = include_high
+
+    def resolve(self, index: 'DataIndex') -> Set[str]:
+        return set(index.keys_between(self.field, self.low, self.high,
+                                      self.include_low, self.include_high))
+
+
+class DataIndex:
+    """Hash indexes on categorical fields and sorted columns on numeric fields"""
+
+    def __init__(self, items: Iterable[Dict] = (), key_field: str = 'Name',
+                 categorical: Iterable[str] = (), numeric: Iterable[str] = ()):
+        """
+        Initialize and build the index.
+
+        Args:
+            items: Records to index, in catalog order
+            key_field: Field holding each record's unique key
+            categorical: Fields to hash-index
+            numeric: Fields to keep as sorted columns
+        """
+        self.key_field = key_field
+        self.categorical_fields: Tuple[str, ...] = tuple(categorical)
+        self.numeric_fields: Tuple[str, ...] = tuple(numeric)
+        self.rebuild(items)
+
+    # ==================== Build / Maintain ====================
+
+    def rebuild(self, items: Iterable[Dict]):
+        """Rebuild every index from scratch"""
+        self.records: Dict[str, Dict] = {}
+        self.order: Dict[str, int] = {}
+        self.hash_indexes: Dict[str, Dict[Any, Set[str]]] = {f: {} for f in self.categorical_fields}
+        self.sorted_columns: Dict[str, Tuple[List[float], List[str]]] = {}
+
+        pairs: Dict[str, List[Tuple[float, str]]] = {f: [] for f in self.numeric_fields}
+        for position, item in enumerate(items):
+            key = item[self.key_field]
+            self.records[key] = item
+            self.order[key] = position
+            for field in self.categorical_fields:
+                self.hash_indexes[field].setdefault(item.get(field), set()).add(key)
+            for field in self.numeric_fields:
+                value = self._numeric(item.get(field))
+                if value is not None:
+                    pairs[field].append((value, key))
+
+        for field, column in pairs.items():
+            column.sort()
+            self.sorted_columns[field] = ([v for v, _ in column], [k for _, k in column])
+
+    def set_order(self, items: Iterable[Dict]):
+        """Record the catalog order used when returning query results"""
+        self.order = {item[self.key_field]: i for i, item in enumerate(items)}
+
+    def add(self, item: Dict):
+        """Index a new record (replaces any record with the same key)"""
+        key = item[self.key_field]
+        if key in self.records:
+            self.remove(key)
+
+        self.records[key] = item
+        if key not in self.order:
+            self.order[key] = len(self.order)
+        for field in self.categorical_fields:
+            self.hash_indexes[field].setdefault(item.get(field), set()).add(key)
+        for field in self.numeric_fields:
+            value = self._numeric(item.get(field))
+            if value is not None:
+                values, keys = self.sorted_columns[field]
+                position = bisect_right(values, value)
+                values.insert(position, value)
+                keys.insert(position, key)
+
+    def remove(self, key: str) -> Optional[Dict]:
+        """Drop a record from every index and return it"""
+        item = self.records.pop(key, None)
+        if item is None:
+            return None
+
+        for field in self.categorical_fields:
+            bucket = self.hash_indexes[field].get(item.get(field))
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self.hash_indexes[field][item.get(field)]
+        for field in self.numeric_fields:
+            value = self._numeric(item.get(field))
+            if value is None:
+                continue
+            values, keys = self.sorted_columns[field]
+            position = bisect_left(values, value)
+            while position < len(values) and values[position] == value:
+                if keys[position] == key:
+                    del values[position]
+                    del keys[position]
+                    break
+                position += 1
+        return item
+
+    def update(self, item: Dict, old_key: Optional[str] = None):
+        """Re-index an edited record (optionally renamed from old_key)"""
+        position = self.order.get(old_key if old_key is not None else item[self.key_field])
+        if old_key is not None and old_key != item[self.key_field]:
+            self.remove(old_key)
+            self.order.pop(old_key, None)
+        self.add(item)
+        if position is not None:
+            self.order[item[self.key_field]] = position
+
+    @staticmethod
+    def _numeric(value) -> Optional[float]:
+        """Coerce a value to float for the sorted columns, or None to skip it"""
+        if isinstance(value, bool) or value is None:
+            return None
+        if isinstance(value, (int, float)):
+            return float(value)
+        return None
+
+    # ==================== Lookups ====================
+
+    def keys_for(self, field: str, value: Any) -> Set[str]:
+        """Keys of records whose categorical field equals value"""
+        return self.hash_indexes.get(field, {}).get(value, set())
+
+    def keys_between(self, field: str, low: Optional[float] = None, high: Optional[float] = None,
+                     include_low: bool = True, include_high: bool = True) -> List[str]:
+        """Keys of records whose numeric field lies in the given range"""
+        values, keys = self.sorted_columns.get(field, ([], []))
+        start = 0
+        end = len(values)
+        if low is not None:
+            start = bisect_left(values, low) if include_low else bisect_right(values, low)
+        if high is not None:
+            end = bisect_right(values, high) if include_high else bisect_left(values, high)
+        return keys[start:end]
+
+    def unique_values(self, field: str) -> List[Any]:
+        """Distinct values of a categorical field"""
+        return list(self.hash_indexes.get(field, {}).keys())
+
+    def value_range(self, field: str, exclusive_min: Optional[float] = None) -> Optional[Tuple[float, float]]:
+        """
+        Get (min, max) of a numeric column.
+
+        Args:
+            field: Numeric field name
+            exclusive_min: If given, only values strictly above it are considered
+
+        Returns:
+            (min, max) tuple, or None if no values qualify
+        """
+        values, _ = self.sorted_columns.get(field, ([], []))
+        start = 0 if exclusive_min is None else bisect_right(values, exclusive_min)
+        if start >= len(values):
+            return None
+        return values[start], values[-1]
+
+    def items_for(self, keys: Iterable[str]) -> List[Dict]:
+        """Records for a set of keys, in catalog order"""
+        order = self.order
+        return [self.records[k] for k in sorted(keys, key=lambda k: order.get(k, len(order)))]
+
+    def query(self, *conditions: Condition) -> List[Dict]:
+        """
+        Return records matching all conditions, in catalog order.
+
+        With no conditions every record is returned.
+        """
+        if not conditions:
+            return self.items_for(self.records.keys())
+
+        result: Optional[Set[str]] = None
+        for condition in conditions:
+            matched = condition.resolve(self)
+            result = matched if result is None else result & matched
+            if not result:
+                return []
+        return self.items_for(result)
@@ -8,10 +8,13 @@ import json
 import os
 import re
 import shutil
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Set
 from enum import Enum
 
+from utils.profiler import profiled
+
 
 class DataCategory(Enum):
     """Categories of data that can be managed"""
@@ -23,6 +26,52 @@ class DataCategory(Enum):
     ALLOYS = "alloys"
 
 
+@dataclass
+class DataChangeEvent:
+    """
+    Item-level description of a data change.
+
+    Names are filename stems (e.g. "026_Fe", "Water").  When ``full`` is
+    True the whole category changed (e.g. reset to defaults) and listeners
+    should fall back to a complete reload.
+    """
+    category: DataCategory
+    added: Set[str] = field(default_factory=set)
+    modified: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+    full: bool = False
+
+    @property
+    def changed(self) -> Set[str]:
+        """Names whose files exist and need to be (re)loaded"""
+        return self.added | self.modified
+
+    @property
+    def names(self) -> Set[str]:
+        """All affected names"""
+        return self.added | self.modified | self.removed
+
+    def is_empty(self) -> bool:
+        """True if the event carries no changes"""
+        return not self.full and not self.names
+
+    def merge(self, other: 'DataChangeEvent'):
+        """Fold a later event for the same category into this one"""
+        self.full = self.full or other.full
+        for name in other.added:
+            self.removed.discard(name)
+            self.added.add(name)
+        for name in other.modified:
+            if name not in self.added:
+                self.modified.add(name)
+        for name in other.removed:
+            if name in self.added:
+                self.added.discard(name)
+            else:
+                self.modified.discard(name)
+                self.removed.add(name)
+
+
 class DataManager:
     """
     Manages JSON data files with add, edit, remove, and reset functionality.
@@ -50,6 +99,10 @@ class DataManager:
         self._change_callbacks: Dict[DataCategory, List[Callable]] = {
             cat: [] for cat in DataCategory
         }
+        # Callbacks receiving a DataChangeEvent with the affected item names
+        self._item_change_callbacks: Dict[DataCategory, List[Callable]] = {
+            cat: [] for cat in DataCategory
+        }
 
     def _ensure_directories(self):
         """Ensure all required directories exist"""
@@ -88,6 +141,7 @@ class DataManager:
             return self._load_json(filepath)
         return None
 
+    @profiled('data.get_all_items', 'data')
     def get_all_items(self, category: DataCategory) -> List[Dict]:
         """Get all items in a category"""
         items = []
@@ -148,7 +202,8 @@ class DataManager:
             print(f"Item '{name}' already exists in {category.value}")
             return False
 
-        return self._save_json(filepath, data, category)
+        return self._save_json(filepath, data, category,
+                               DataChangeEvent(category, added={filepath.stem}))
 
     def edit_item(self, category: DataCategory, name: str, data: Dict) -> bool:
         """
@@ -167,7 +222,8 @@ class DataManager:
             print(f"Item '{name}' not found in {category.value}")
             return False
 
-        return self._save_json(filepath, data, category)
+        return self._save_json(filepath, data, category,
+                               DataChangeEvent(category, modified={filepath.stem}))
 
     def remove_item(self, category: DataCategory, name: str) -> bool:
         """
@@ -187,18 +243,19 @@ class DataManager:
 
         try:
             filepath.unlink()
-            self._notify_change(category)
+            self._notify_change(category, DataChangeEvent(category, removed={filepath.stem}))
             return True
         except Exception as e:
             print(f"Error removing {filepath}: {e}")
             return False
 
-    def _save_json(self, filepath: Path, data: Dict, category: DataCategory) -> bool:
+    def _save_json(self, filepath: Path, data: Dict, category: DataCategory,
+                   event: Optional[DataChangeEvent] = None) -> bool:
         """Save data to JSON file"""
         try:
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
-            self._notify_change(category)
+            self._notify_change(category, event)
             return True
         except Exception as e:
             print(f"Error saving {filepath}: {e}")
@@ -261,7 +318,7 @@ class DataManager:
 
         try:
             shutil.copy2(default_file, active_path / default_file.name)
-            self._notify_change(category)
+            self._notify_change(category, DataChangeEvent(category, modified={default_file.stem}))
             return True
         except Exception as e:
             print(f"Error resetting {name}: {e}")
@@ -286,14 +343,38 @@ class DataManager:
         if callback in self._change_callbacks[category]:
             self._change_callbacks[category].remove(callback)
 
-    def _notify_change(self, category: DataCategory):
+    def register_item_change_callback(self, category: DataCategory,
+                                      callback: Callable[[DataChangeEvent], None]):
+        """Register a callback receiving a DataChangeEvent with the changed item names"""
+        self._item_change_callbacks[category].append(callback)
+
+    def unregister_item_change_callback(self, category: DataCategory, callback: Callable):
+        """Unregister an item change callback"""
+        if callback in self._item_change_callbacks[category]:
+            self._item_change_callbacks[category].remove(callback)
+
+    def notify_items_changed(self, event: DataChangeEvent):
+        """Broadcast changes detected outside this manager (e.g. by DataWatcher)"""
+        if not event.is_empty():
+            self._notify_change(event.category, event)
+
+    def _notify_change(self, category: DataCategory, event: Optional[DataChangeEvent] = None):
         """Notify all registered callbacks of a change"""
+        if event is None:
+            event = DataChangeEvent(category, full=True)
+
         for callback in self._change_callbacks[category]:
             try:
                 callback()
             except Exception as e:
                 print(f"Error in change callback: {e}")
 
+        for callback in self._item_change_callbacks[category]:
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Error in item change callback: {e}")
+
     # ==================== Utility Methods ====================
 
     def get_item_count(self, category: DataCategory) -> int:
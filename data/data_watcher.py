@@ -0,0 +1,199 @@
+"""
+Data Watcher
+Watches the active data directories and reports item-level changes.
+
+The watcher keeps a snapshot of (mtime, size) per JSON file and diffs it on
+each poll, producing a DataChangeEvent per category with the added, modified
+and removed filename stems.  Events are broadcast through the DataManager so
+the same listeners receive edits made in the app and edits made on disk.
+
+When PySide6 is available, start() drives polling from a QFileSystemWatcher
+(debounced with a single-shot QTimer); otherwise poll() can be called on any
+schedule as a polling stand-in.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from data.data_manager import DataCategory, DataChangeEvent, DataManager, get_data_manager
+
+
+FileSignature = Tuple[int, int]
+
+
+class DataWatcher:
+    """Detects on-disk changes to active data files and emits item-level events"""
+
+    def __init__(self, manager: Optional[DataManager] = None,
+                 categories: Optional[Iterable[DataCategory]] = None,
+                 debounce_ms: int = 250):
+        """
+        Initialize the watcher.
+
+        Args:
+            manager: DataManager whose active directories are watched (global if None)
+            categories: Categories to watch (all if None)
+            debounce_ms: Delay used to coalesce bursts of file system notifications
+        """
+        self.manager = manager or get_data_manager()
+        self.categories: List[DataCategory] = list(categories) if categories else list(DataCategory)
+        self.debounce_ms = debounce_ms
+        self._snapshots: Dict[DataCategory, Dict[str, FileSignature]] = {
+            category: self._scan(category) for category in self.categories
+        }
+        self._qt_watcher = None
+        self._qt_timer = None
+        self._poll_timer = None
+
+        # Writes made through the manager are already announced; refresh the
+        # snapshot for those files so the next poll does not report them again.
+        for category in self.categories:
+            self.manager.register_item_change_callback(category, self._on_manager_change)
+
+    def _scan(self, category: DataCategory) -> Dict[str, FileSignature]:
+        """Read (mtime_ns, size) for every JSON file in a category"""
+        snapshot = {}
+        for filepath in self.manager.get_active_path(category).glob("*.json"):
+            try:
+                stat = filepath.stat()
+            except OSError:
+                continue
+            snapshot[filepath.stem] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _signature(self, category: DataCategory, name: str) -> Optional[FileSignature]:
+        """Current signature for one file, or None if it no longer exists"""
+        try:
+            stat = (self.manager.get_active_path(category) / f"{name}.json").stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _on_manager_change(self, event: DataChangeEvent):
+        """Keep the snapshot in sync with changes the manager already reported"""
+        snapshot = self._snapshots.get(event.category)
+        if snapshot is None:
+            return
+        if event.full:
+            self._snapshots[event.category] = self._scan(event.category)
+            return
+        for name in event.names:
+            signature = self._signature(event.category, name)
+            if signature is None:
+                snapshot.pop(name, None)
+            else:
+                snapshot[name] = signature
+
+    def diff(self, category: DataCategory) -> DataChangeEvent:
+        """Compare the directory against the snapshot and update the snapshot"""
+        old = self._snapshots.get(category, {})
+        new = self._scan(category)
+        self._snapshots[category] = new
+
+        event = DataChangeEvent(category)
+        for name, signature in new.items():
+            if name not in old:
+                event.added.add(name)
+            elif old[name] != signature:
+                event.modified.add(name)
+        event.removed = set(old) - set(new)
+        return event
+
+    def poll(self) -> List[DataChangeEvent]:
+        """
+        Check every watched category and broadcast any changes.
+
+        Returns:
+            The non-empty events that were emitted
+        """
+        events = []
+        for category in self.categories:
+            event = self.diff(category)
+            if not event.is_empty():
+                events.append(event)
+                self.manager.notify_items_changed(event)
+        return events
+
+    # ==================== Qt Integration ====================
+
+    def start(self, poll_interval_ms: int = 0) -> bool:
+        """
+        Start watching with QFileSystemWatcher.
+
+        Args:
+            poll_interval_ms: If > 0, also poll on a timer (for file systems
+                              where native notifications are unreliable)
+
+        Returns:
+            True if Qt watching started, False if PySide6 is unavailable
+        """
+        try:
+            from PySide6.QtCore import QFileSystemWatcher, QTimer
+        except ImportError:
+            return False
+
+        if self._qt_watcher is not None:
+            return True
+
+        self._qt_timer = QTimer()
+        self._qt_timer.setSingleShot(True)
+        self._qt_timer.setInterval(self.debounce_ms)
+        self._qt_timer.timeout.connect(self._on_qt_timeout)
+
+        directories = [str(self.manager.get_active_path(c)) for c in self.categories]
+        self._qt_watcher = QFileSystemWatcher(directories)
+        self._watch_files()
+        self._qt_watcher.directoryChanged.connect(self._schedule_poll)
+        self._qt_watcher.fileChanged.connect(self._schedule_poll)
+
+        if poll_interval_ms > 0:
+            self._poll_timer = QTimer()
+            self._poll_timer.setInterval(poll_interval_ms)
+            self._poll_timer.timeout.connect(self.poll)
+            self._poll_timer.start()
+        return True
+
+    def stop(self):
+        """Stop Qt watching and unregister from the manager"""
+        if self._qt_watcher is not None:
+            self._qt_watcher.deleteLater()
+            self._qt_watcher = None
+        if self._poll_timer is not None:
+            self._poll_timer.stop()
+            self._poll_timer = None
+        for category in self.categories:
+            self.manager.unregister_item_change_callback(category, self._on_manager_change)
+
+    def _watch_files(self):
+        """Watch individual files so in-place content edits are noticed"""
+        watched = set(self._qt_watcher.files())
+        paths = []
+        for category in self.categories:
+            for name in self._snapshots[category]:
+                path = str(self.manager.get_active_path(category) / f"{name}.json")
+                if path not in watched:
+                    paths.append(path)
+        if paths:
+            self._qt_watcher.addPaths(paths)
+
+    def _schedule_poll(self, _path: str = ""):
+        """Debounce bursts of notifications (editors often write several times)"""
+        if self._qt_timer is not None:
+            self._qt_timer.start()
+
+    def _on_qt_timeout(self):
+        """Poll after the debounce interval and pick up newly created files"""
+        self.poll()
+        if self._qt_watcher is not None:
+            self._watch_files()
+
+
+# Global watcher instance
+_global_watcher: Optional[DataWatcher] = None
+
+
+def get_data_watcher() -> DataWatcher:
+    """Get the global data watcher instance"""
+    global _global_watcher
+    if _global_watcher is None:
+        _global_watcher = DataWatcher()
+    return _global_watcher
@@ -7,7 +7,9 @@ This replaces hardcoded Python data with data-driven JSON configuration.
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
+
+from utils.profiler import profiled
 
 
 class ElementDataLoader:
@@ -35,6 +37,7 @@ class ElementDataLoader:
         self._groups: Dict[int, List[str]] = {i: [] for i in range(1, 19)}
         self._loaded = False
 
+    @profiled('data.load_elements', 'data')
     def load_all_elements(self) -> List[Dict]:
         """
         Load all element data from JSON files.
@@ -95,8 +98,55 @@ class ElementDataLoader:
             if field not in data:
                 raise ValueError(f"Missing required field '{field}' in {filepath.name}")
 
+        data['_filename'] = filepath.stem
         return data
 
+    def reload_items(self, filenames: Iterable[str]) -> Tuple[List[Dict], List[int]]:
+        """
+        Re-read only the given element files and patch the catalog in place.
+
+        Args:
+            filenames: Filename stems (e.g. "026_Fe") that were added, edited or deleted
+
+        Returns:
+            (elements that were loaded or replaced, atomic numbers removed)
+        """
+        self.ensure_loaded()
+        updated, removed = [], []
+        by_filename = {e.get('_filename'): e for e in self.elements}
+
+        for filename in filenames:
+            previous = by_filename.get(filename)
+            filepath = self.elements_dir / f"{filename}.json"
+            element = None
+            if filepath.exists():
+                try:
+                    element = self._load_element_file(filepath)
+                except Exception as e:
+                    print(f"Warning: Failed to load {filepath.name}: {e}")
+
+            if previous is not None:
+                self.elements.remove(previous)
+                self.elements_by_z.pop(previous['atomic_number'], None)
+                if self.elements_by_symbol.get(previous['symbol']) is previous:
+                    del self.elements_by_symbol[previous['symbol']]
+                if element is None or element['atomic_number'] != previous['atomic_number']:
+                    removed.append(previous['atomic_number'])
+
+            if element is not None:
+                replaced = self.elements_by_z.get(element['atomic_number'])
+                if replaced is not None:
+                    self.elements.remove(replaced)
+                self.elements.append(element)
+                self.elements_by_z[element['atomic_number']] = element
+                self.elements_by_symbol[element['symbol']] = element
+                updated.append(element)
+
+        if updated or removed:
+            self.elements.sort(key=lambda e: e['atomic_number'])
+            self._build_indices()
+        return updated, removed
+
     def _build_indices(self):
         """Build indices for fast lookup by block, period, and group"""
         self._blocks = {'s': [], 'p': [], 'd': [], 'f': []}
@@ -4,8 +4,19 @@ Loads molecule data from JSON files in the Molecules folder.
 """
 
 import json
+from bisect import bisect_right
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from data.data_index import Condition, DataIndex
+from data.molecule_search import MoleculeSearch, MoleculeSearchIndex
+from utils.profiler import profiled
+
+
+# Fields indexed for fast filtering
+MOLECULE_CATEGORICAL_FIELDS = ('category', 'bond_type', 'polarity', 'geometry', 'state')
+MOLECULE_NUMERIC_FIELDS = ('mass', 'melting_point', 'boiling_point', 'density',
+                           'dipole_moment', 'bond_angle')
 
 
 class MoleculeDataLoader:
@@ -28,7 +39,11 @@ class MoleculeDataLoader:
         self.molecules: List[Dict] = []
         self.molecules_by_name: Dict[str, Dict] = {}
         self.molecules_by_formula: Dict[str, Dict] = {}
+        self.index = DataIndex(key_field='Name', categorical=MOLECULE_CATEGORICAL_FIELDS,
+                               numeric=MOLECULE_NUMERIC_FIELDS)
+        self.search_index = MoleculeSearchIndex(key_field='Name')
 
+    @profiled('data.load_molecules', 'data')
     def load_all_molecules(self) -> List[Dict]:
         """
         Load all molecule data from JSON files.
@@ -65,6 +80,8 @@ class MoleculeDataLoader:
         self.molecules = loaded_molecules
         self.molecules_by_name = {m['Name']: m for m in loaded_molecules}
         self.molecules_by_formula = {m['Formula']: m for m in loaded_molecules}
+        self.index.rebuild(loaded_molecules)
+        self.search_index.rebuild(loaded_molecules)
 
         return loaded_molecules
 
@@ -96,7 +113,11 @@ class MoleculeDataLoader:
                 print(f"Warning: Missing required field '{field}' in {filepath.name}")
                 return None
 
-        # Add derived fields for easier access
+        data['_filename'] = filepath.stem
+        return self._add_derived_fields(data)
+
+    def _add_derived_fields(self, data: Dict) -> Dict:
+        """Add derived lowercase fields used by layouts and filters"""
         data['name'] = data['Name']
         data['formula'] = data['Formula']
         data['mass'] = data['MolecularMass_amu']
@@ -119,8 +140,13 @@ class MoleculeDataLoader:
         return self.molecules_by_name.get(name)
 
     def get_molecule_by_formula(self, formula: str) -> Optional[Dict]:
-        """Get molecule data by formula"""
-        return self.molecules_by_formula.get(formula)
+        """Get molecule data by formula (exact string, else the same formula in any element order)"""
+        molecule = self.molecules_by_formula.get(formula)
+        if molecule is None:
+            keys = self.search_index.keys_for_formula(formula)
+            if keys:
+                molecule = self.index.items_for(keys)[0]
+        return molecule
 
     def get_all_molecules(self) -> List[Dict]:
         """Get all loaded molecules"""
@@ -132,43 +158,144 @@ class MoleculeDataLoader:
 
     def get_molecules_by_category(self, category: str) -> List[Dict]:
         """Get molecules filtered by category"""
-        return [m for m in self.molecules if m.get('category') == category]
+        return self.index.items_for(self.index.keys_for('category', category))
 
     def get_molecules_by_bond_type(self, bond_type: str) -> List[Dict]:
         """Get molecules filtered by bond type"""
-        return [m for m in self.molecules if m.get('bond_type') == bond_type]
+        return self.index.items_for(self.index.keys_for('bond_type', bond_type))
 
     def get_molecules_by_polarity(self, polarity: str) -> List[Dict]:
         """Get molecules filtered by polarity"""
-        return [m for m in self.molecules if m.get('polarity') == polarity]
+        return self.index.items_for(self.index.keys_for('polarity', polarity))
 
     def get_molecules_by_geometry(self, geometry: str) -> List[Dict]:
         """Get molecules filtered by geometry"""
-        return [m for m in self.molecules if m.get('geometry') == geometry]
+        return self.index.items_for(self.index.keys_for('geometry', geometry))
 
     def get_molecules_by_state(self, state: str) -> List[Dict]:
         """Get molecules filtered by state at STP"""
-        return [m for m in self.molecules if m.get('state') == state]
+        return self.index.items_for(self.index.keys_for('state', state))
 
     def get_unique_categories(self) -> List[str]:
         """Get list of unique categories"""
-        return sorted(list(set(m.get('category', 'Unknown') for m in self.molecules)))
+        return sorted(self.index.unique_values('category'))
 
     def get_unique_geometries(self) -> List[str]:
         """Get list of unique geometries"""
-        return sorted(list(set(m.get('geometry', 'Unknown') for m in self.molecules)))
+        return sorted(self.index.unique_values('geometry'))
 
     def get_unique_bond_types(self) -> List[str]:
         """Get list of unique bond types"""
-        return sorted(list(set(m.get('bond_type', 'Unknown') for m in self.molecules)))
+        return sorted(self.index.unique_values('bond_type'))
 
     def get_unique_polarities(self) -> List[str]:
         """Get list of unique polarities"""
-        return sorted(list(set(m.get('polarity', 'Unknown') for m in self.molecules)))
+        return sorted(self.index.unique_values('polarity'))
 
     def get_unique_states(self) -> List[str]:
         """Get list of unique states"""
-        return sorted(list(set(m.get('state', 'Unknown') for m in self.molecules)))
+        return sorted(self.index.unique_values('state'))
+
+    def get_property_range(self, property_name: str) -> Tuple[float, float]:
+        """Get min/max range for a numeric property (positive values only)"""
+        return self.index.value_range(property_name, exclusive_min=0) or (0, 1)
+
+    def query(self, *conditions: Condition) -> List[Dict]:
+        """
+        Query molecules with indexed conditions (see data.data_index).
+
+        Example:
+            loader.query(In('category', {'Organic'}), Between('density', 0.5, 1.2))
+        """
+        return self.index.query(*conditions)
+
+    def search(self, text: str) -> List[Dict]:
+        """
+        Molecules matching search-box text, in catalog order.
+
+        Example:
+            loader.search('C2H?O?'), loader.search('C=O'), loader.search('benzene ring')
+        """
+        return self.index.items_for(self.search_index.search(text))
+
+    def search_condition(self, text: str) -> Condition:
+        """Search-box text as a condition for query()"""
+        return MoleculeSearch(self.search_index, text)
+
+    # ==================== Incremental Edits ====================
+
+    def upsert_molecule(self, data: Dict, old_name: Optional[str] = None) -> Dict:
+        """
+        Add or replace a single molecule and update the indexes in place.
+
+        Args:
+            data: Raw molecule JSON data (derived fields are added here)
+            old_name: Previous name if the molecule was renamed
+
+        Returns:
+            The stored molecule dictionary
+        """
+        molecule = self._add_derived_fields(data)
+        old = self.molecules_by_name.pop(old_name if old_name else molecule['Name'], None)
+        if old is not None:
+            self.molecules.remove(old)
+            if self.molecules_by_formula.get(old['Formula']) is old:
+                del self.molecules_by_formula[old['Formula']]
+            self.index.remove(old['Name'])
+            self.search_index.remove(old['Name'])
+
+        names = [m.get('Name', '') for m in self.molecules]
+        self.molecules.insert(bisect_right(names, molecule['Name']), molecule)
+        self.molecules_by_name[molecule['Name']] = molecule
+        self.molecules_by_formula[molecule['Formula']] = molecule
+        self.index.add(molecule)
+        self.search_index.add(molecule)
+        self.index.set_order(self.molecules)
+        return molecule
+
+    def reload_items(self, filenames: Iterable[str]) -> Tuple[List[Dict], List[str]]:
+        """
+        Re-read only the given molecule files and patch the catalog in place.
+
+        Args:
+            filenames: Filename stems that were added, edited or deleted
+
+        Returns:
+            (molecules that were loaded or replaced, names of molecules removed)
+        """
+        updated, removed = [], []
+        by_filename = {m.get('_filename'): m for m in self.molecules}
+
+        for filename in filenames:
+            previous = by_filename.get(filename)
+            filepath = self.molecules_dir / f"{filename}.json"
+            molecule = self._load_molecule_file(filepath) if filepath.exists() else None
+
+            if molecule is None:
+                if previous is not None:
+                    self.remove_molecule(previous['Name'])
+                    removed.append(previous['Name'])
+                continue
+
+            old_name = previous['Name'] if previous is not None else None
+            if old_name is not None and old_name != molecule['Name']:
+                removed.append(old_name)
+            updated.append(self.upsert_molecule(molecule, old_name=old_name))
+
+        return updated, removed
+
+    def remove_molecule(self, name: str) -> Optional[Dict]:
+        """Remove a single molecule and update the indexes in place"""
+        molecule = self.molecules_by_name.pop(name, None)
+        if molecule is None:
+            return None
+        self.molecules.remove(molecule)
+        if self.molecules_by_formula.get(molecule['Formula']) is molecule:
+            del self.molecules_by_formula[molecule['Formula']]
+        self.index.remove(name)
+        self.search_index.remove(name)
+        self.index.set_order(self.molecules)
+        return molecule
 
 
 # Global loader instance for convenient access
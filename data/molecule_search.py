@@ -0,0 +1,607 @@
+"""
+Molecule Search
+Formula and substructure search index for the molecule catalog.
+
+Built in bulk at load time and patched in place on single-record edits:
+
+- Canonical Hill formulas (formula -> keys), so "OH2" finds water.
+- Element-count postings (element -> sorted counts) for range queries such as
+  "C2H?O?" (exactly two carbons, any hydrogens and oxygens, nothing else).
+- Bond-graph fingerprints: one bitset per feature (element counts, bonded
+  atom pairs and two-bond paths) over molecule slots. A fragment query ANDs
+  the bitsets of its own features to get candidates, and exact subgraph
+  matching only runs on those.
+
+Search text understood by MoleculeSearchIndex.search():
+    C2H?O?          formula pattern: n exact, ? any (>= 1), n-m range, n+ at least n;
+                    a trailing * allows other elements
+    H2O, Ca(OH)2    exact formula (any element order)
+    C=O, c1ccccc1   fragment in a small SMILES subset (explicit H only)
+    benzene ring    named fragment (see FRAGMENTS)
+    has:C#N         force a fragment search
+    anything else   case-insensitive name match (also tried when a fragment
+                    query matches nothing, e.g. 'co')
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from data.data_index import Condition, DataIndex
+
+
+# Named fragments accepted by the search box
+FRAGMENTS = {
+    'benzene ring': 'c1ccccc1',
+    'benzene': 'c1ccccc1',
+    'carbonyl': 'C=O',
+    'hydroxyl': 'OH',
+    'carboxyl': 'C(=O)O',
+    'nitrile': 'C#N',
+    'alkene': 'C=C',
+    'alkyne': 'C#C',
+}
+
+# Element-count fingerprint features are capped at this count
+MAX_COUNT_FEATURE = 16
+
+# Bond type (as stored in Bonds3D) -> bond symbol used by fragments and features
+BOND_SYMBOLS = {'single': '-', 'double': '=', 'triple': '#', 'aromatic': ':', 'resonance': ':'}
+ANY_BOND = '~'
+
+_SUBSCRIPTS = str.maketrans('₀₁₂₃₄₅₆₇₈₉', '0123456789')
+_FORMULA_TOKEN = re.compile(r'([A-Z][a-z]?)(\d*)|(\()|(\))(\d*)')
+_PATTERN_TOKEN = re.compile(r'([A-Z][a-z]?)(\?|\d+-\d+|\d+\+|\d*)')
+_PATTERN = re.compile(r'(?:[A-Z][a-z]?(?:\?|\d+-\d+|\d+\+|\d*))+\*?')
+_SMILES_ATOM = re.compile(r'\[([A-Z][a-z]?|[a-z])\]|(Cl|Br|[BCNOPSFIH])|([bcnops])')
+
+
+# ==================== Formulas ====================
+
+def parse_formula(formula: str) -> Optional[Dict[str, int]]:
+    """
+    Element counts of a formula such as 'C6H12O6', 'Ca(OH)2' or 'H₂O'.
+
+    Returns:
+        Element -> count, or None if the formula does not parse
+    """
+    text = formula.translate(_SUBSCRIPTS).replace(' ', '')
+    stack: List[Dict[str, int]] = [{}]
+    position = 0
+    while position < len(text):
+        match = _FORMULA_TOKEN.match(text, position)
+        if match is None:
+            return None
+        element, count, opening, closing, group_count = match.groups()
+        if element:
+            stack[-1][element] = stack[-1].get(element, 0) + (int(count) if count else 1)
+        elif opening:
+            stack.append({})
+        elif closing:
+            if len(stack) < 2:
+                return None
+            group = stack.pop()
+            factor = int(group_count) if group_count else 1
+            for symbol, n in group.items():
+                stack[-1][symbol] = stack[-1].get(symbol, 0) + n * factor
+        position = match.end()
+    if len(stack) != 1 or not stack[0]:
+        return None
+    return stack[0]
+
+
+def hill_formula(counts: Dict[str, int]) -> str:
+    """
+    Canonical Hill-system formula: C, then H, then the rest alphabetically
+    (all alphabetically when there is no carbon).
+    """
+    if 'C' in counts:
+        order = ['C'] + (['H'] if 'H' in counts else []) + sorted(e for e in counts if e not in ('C', 'H'))
+    else:
+        order = sorted(counts)
+    return ''.join(e + (str(counts[e]) if counts[e] != 1 else '') for e in order if counts[e] > 0)
+
+
+def parse_formula_pattern(pattern: str) -> Optional[Tuple[Dict[str, Tuple[int, Optional[int]]], bool]]:
+    """
+    Parse a formula pattern such as 'C2H?O?' or 'C1-4H*'.
+
+    Returns:
+        (element -> (min count, max count or None), other elements allowed),
+        or None if the text is not a formula pattern
+    """
+    text = pattern.translate(_SUBSCRIPTS).replace(' ', '')
+    if not _PATTERN.fullmatch(text):
+        return None
+    open_ended = text.endswith('*')
+    ranges: Dict[str, Tuple[int, Optional[int]]] = {}
+    for element, spec in _PATTERN_TOKEN.findall(text.rstrip('*')):
+        if spec == '?':
+            ranges[element] = (1, None)
+        elif spec.endswith('+'):
+            ranges[element] = (int(spec[:-1]), None)
+        elif '-' in spec:
+            low, high = spec.split('-')
+            ranges[element] = (int(low), int(high))
+        else:
+            n = int(spec) if spec else 1
+            low, high = ranges.get(element, (0, 0))
+            ranges[element] = (low + n, high + n if high is not None else None)
+    return ranges, open_ended
+
+
+# ==================== Bond Graphs ====================
+
+class MoleculeGraph:
+    """Atoms (element, aromatic flag) and bonds (neighbor, bond symbol) of a molecule or fragment"""
+
+    __slots__ = ('elements', 'aromatic', 'neighbors')
+
+    def __init__(self, elements: List[str], bonds: Iterable[Tuple[int, int, str]],
+                 aromatic: Optional[List[bool]] = None):
+        self.elements = elements
+        self.neighbors: List[List[Tuple[int, str]]] = [[] for _ in elements]
+        flags = list(aromatic) if aromatic is not None else [False] * len(elements)
+        size = len(elements)
+        for i, j, symbol in bonds:
+            if i == j or i >= size or j >= size:
+                continue
+            self.neighbors[i].append((j, symbol))
+            self.neighbors[j].append((i, symbol))
+            if symbol == ':':
+                flags[i] = flags[j] = True
+        self.aromatic = flags
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    @classmethod
+    def from_record(cls, molecule: Dict) -> 'MoleculeGraph':
+        """Graph of a molecule record (Atoms3D elements, or the expanded Composition, and Bonds3D)"""
+        atoms = molecule.get('Atoms3D')
+        if atoms:
+            elements = [a.get('element', '?') for a in atoms]
+        else:
+            elements = [c.get('Element', '?') for c in molecule.get('Composition', [])
+                        for _ in range(c.get('Count', 1))]
+        bonds = [(b['from'], b['to'], BOND_SYMBOLS.get(str(b.get('type', 'single')).lower(), ANY_BOND))
+                 for b in molecule.get('Bonds3D', [])]
+        return cls(elements, bonds)
+
+    def features(self) -> Set[str]:
+        """Fingerprint features: element counts, bonded pairs and two-bond paths"""
+        elements = self.elements
+        counts: Dict[str, int] = {}
+        for element in elements:
+            counts[element] = counts.get(element, 0) + 1
+        features = {f'{element}*{n}' for element, count in counts.items()
+                    for n in range(1, min(count, MAX_COUNT_FEATURE) + 1)}
+
+        for center, bonded in enumerate(self.neighbors):
+            middle = elements[center]
+            # (bond + neighbor, neighbor + bond) for the bonds leaving this atom
+            halves = [(bond + elements[i], elements[i] + bond) for i, bond in bonded if bond != ANY_BOND]
+            for a, (outward_i, inward_i) in enumerate(halves):
+                pair, reverse = middle + outward_i, inward_i + middle
+                features.add(pair if pair < reverse else reverse)
+                for outward_j, inward_j in halves[a + 1:]:
+                    forward = inward_i + middle + outward_j
+                    backward = inward_j + middle + outward_i
+                    features.add(forward if forward < backward else backward)
+        return features
+
+
+def parse_fragment(smiles: str) -> Optional[MoleculeGraph]:
+    """
+    Parse a fragment in a small SMILES subset: atoms (C, Cl, [Na], aromatic
+    c/n/o/...), explicit H, bonds - = # : ~, branches and ring-closure digits.
+    Unwritten bonds are single, or aromatic between two aromatic atoms.
+
+    Returns:
+        The fragment graph, or None if the text does not parse
+    """
+    elements: List[str] = []
+    aromatic: List[bool] = []
+    bonds: List[Tuple[int, int, str]] = []
+    branch_stack: List[int] = []
+    rings: Dict[str, Tuple[int, Optional[str]]] = {}
+    previous: Optional[int] = None
+    pending: Optional[str] = None
+    position = 0
+
+    def bond_between(i, j, symbol):
+        if symbol is not None:
+            return symbol
+        return ':' if aromatic[i] and aromatic[j] else '-'
+
+    while position < len(smiles):
+        char = smiles[position]
+        atom = _SMILES_ATOM.match(smiles, position)
+        if atom:
+            bracket, organic, lower = atom.groups()
+            symbol = bracket or organic or lower
+            is_aromatic = symbol.islower()
+            elements.append(symbol.capitalize())
+            aromatic.append(is_aromatic)
+            index = len(elements) - 1
+            if previous is not None:
+                bonds.append((previous, index, bond_between(previous, index, pending)))
+            previous, pending = index, None
+            position = atom.end()
+            continue
+        if char in '-=#:~':
+            if pending is not None or previous is None:
+                return None
+            pending = char
+        elif char == '(':
+            if previous is None:
+                return None
+            branch_stack.append(previous)
+        elif char == ')':
+            if not branch_stack:
+                return None
+            previous, pending = branch_stack.pop(), None
+        elif char.isdigit():
+            if previous is None:
+                return None
+            if char in rings:
+                other, symbol = rings.pop(char)
+                bonds.append((other, previous, bond_between(other, previous, pending or symbol)))
+            else:
+                rings[char] = (previous, pending)
+            pending = None
+        else:
+            return None
+        position += 1
+
+    if not elements or rings or branch_stack or pending is not None:
+        return None
+    return MoleculeGraph(elements, bonds, aromatic)
+
+
+def _bond_matches(query: str, target: str) -> bool:
+    return query == ANY_BOND or query == target
+
+
+def has_substructure(molecule: MoleculeGraph, fragment: MoleculeGraph) -> bool:
+    """
+    Exact subgraph match (every fragment atom and bond maps to a distinct
+    molecule atom and a compatible bond), by backtracking in fragment BFS order.
+    """
+    if len(fragment) > len(molecule):
+        return False
+
+    # Visit fragment atoms so that each one (after the first of its
+    # component) is bonded to an already mapped atom
+    order: List[int] = []
+    seen: Set[int] = set()
+    for start in range(len(fragment)):
+        if start in seen:
+            continue
+        seen.add(start)
+        queue = [start]
+        while queue:
+            atom = queue.pop(0)
+            order.append(atom)
+            for other, _ in fragment.neighbors[atom]:
+                if other not in seen:
+                    seen.add(other)
+                    queue.append(other)
+
+    mapping: Dict[int, int] = {}
+    used: Set[int] = set()
+
+    def compatible(q: int, t: int) -> bool:
+        if fragment.elements[q] != molecule.elements[t] or t in used:
+            return False
+        if fragment.aromatic[q] and not molecule.aromatic[t]:
+            return False
+        if len(fragment.neighbors[q]) > len(molecule.neighbors[t]):
+            return False
+        target_bonds = dict(molecule.neighbors[t])
+        for other, symbol in fragment.neighbors[q]:
+            if other in mapping:
+                bond = target_bonds.get(mapping[other])
+                if bond is None or not _bond_matches(symbol, bond):
+                    return False
+        return True
+
+    def extend(depth: int) -> bool:
+        if depth == len(order):
+            return True
+        q = order[depth]
+        anchors = [mapping[other] for other, _ in fragment.neighbors[q] if other in mapping]
+        candidates = ([t for t, _ in molecule.neighbors[anchors[0]]] if anchors
+                      else range(len(molecule)))
+        for t in candidates:
+            if compatible(q, t):
+                mapping[q] = t
+                used.add(t)
+                if extend(depth + 1):
+                    return True
+                del mapping[q]
+                used.discard(t)
+        return False
+
+    return extend(0)
+
+
+# ==================== Search Index ====================
+
+class _Entry:
+    """Indexed data of one molecule"""
+
+    __slots__ = ('slot', 'counts', 'hill', 'graph', 'features')
+
+    def __init__(self, slot: int, counts: Dict[str, int], hill: str, graph: MoleculeGraph, features: Set[str]):
+        self.slot = slot
+        self.counts = counts
+        self.hill = hill
+        self.graph = graph
+        self.features = features
+
+
+class MoleculeSearchIndex:
+    """Hill formulas, element-count postings and fingerprint bitsets over molecule records"""
+
+    def __init__(self, molecules: Iterable[Dict] = (), key_field: str = 'Name'):
+        """
+        Initialize and build the index.
+
+        Args:
+            molecules: Molecule records
+            key_field: Field holding each record's unique key
+        """
+        self.key_field = key_field
+        self.rebuild(molecules)
+
+    # ==================== Build / Maintain ====================
+
+    def rebuild(self, molecules: Iterable[Dict]):
+        """
+        Rebuild the index from scratch. Postings are collected per element and
+        per feature, sorted once, and each feature bitset is created once.
+        """
+        self._entries: Dict[str, _Entry] = {}
+        self._names: Dict[str, str] = {}
+        for molecule in molecules:
+            key = molecule[self.key_field]
+            # A later record with the same key replaces the earlier one
+            self._entries.pop(key, None)
+            self._entries[key] = self._make_entry(molecule, 0)
+            self._names[key] = str(molecule.get('Name', key)).lower()
+
+        self._slot_keys: List[Optional[str]] = list(self._entries)
+        self._free_slots: List[int] = []
+        self._by_hill: Dict[str, Set[str]] = {}
+        postings: Dict[str, List[Tuple[int, str]]] = {}
+        feature_slots: Dict[str, List[int]] = {}
+        for slot, (key, entry) in enumerate(self._entries.items()):
+            entry.slot = slot
+            self._by_hill.setdefault(entry.hill, set()).add(key)
+            for element, count in entry.counts.items():
+                postings.setdefault(element, []).append((count, key))
+            for feature in entry.features:
+                feature_slots.setdefault(feature, []).append(slot)
+
+        self._element_counts: Dict[str, Tuple[List[int], List[str]]] = {}
+        for element, pairs in postings.items():
+            pairs.sort()
+            self._element_counts[element] = ([count for count, _ in pairs], [key for _, key in pairs])
+
+        size = (len(self._slot_keys) + 7) // 8
+        self._feature_masks: Dict[str, int] = {}
+        for feature, slots in feature_slots.items():
+            bits = bytearray(size)
+            for slot in slots:
+                bits[slot >> 3] |= 1 << (slot & 7)
+            self._feature_masks[feature] = int.from_bytes(bits, 'little')
+
+    def add(self, molecule: Dict):
+        """Index a record (replaces any record with the same key)"""
+        key = molecule[self.key_field]
+        if key in self._entries:
+            self.remove(key)
+
+        # Reuse a slot freed by remove() so the bitsets do not grow across upserts
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._slot_keys[slot] = key
+        else:
+            slot = len(self._slot_keys)
+            self._slot_keys.append(key)
+        entry = self._make_entry(molecule, slot)
+        self._entries[key] = entry
+        self._names[key] = str(molecule.get('Name', key)).lower()
+
+        self._by_hill.setdefault(entry.hill, set()).add(key)
+        for element, count in entry.counts.items():
+            values, keys = self._element_counts.setdefault(element, ([], []))
+            position = self._posting_position(values, keys, count, key)
+            values.insert(position, count)
+            keys.insert(position, key)
+        bit = 1 << slot
+        for feature in entry.features:
+            self._feature_masks[feature] = self._feature_masks.get(feature, 0) | bit
+
+    def remove(self, key: str):
+        """Drop a record from the index"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._slot_keys[entry.slot] = None
+        self._free_slots.append(entry.slot)
+        self._names.pop(key, None)
+
+        bucket = self._by_hill.get(entry.hill)
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self._by_hill[entry.hill]
+        for element, count in entry.counts.items():
+            values, keys = self._element_counts[element]
+            position = self._posting_position(values, keys, count, key)
+            if position < len(keys) and keys[position] == key:
+                del values[position]
+                del keys[position]
+        clear = ~(1 << entry.slot)
+        for feature in entry.features:
+            mask = self._feature_masks[feature] & clear
+            if mask:
+                self._feature_masks[feature] = mask
+            else:
+                del self._feature_masks[feature]
+
+    def _make_entry(self, molecule: Dict, slot: int) -> _Entry:
+        counts = self._record_counts(molecule)
+        graph = MoleculeGraph.from_record(molecule)
+        features = graph.features() if len(graph) else self._count_features(counts)
+        return _Entry(slot, counts, hill_formula(counts), graph, features)
+
+    @staticmethod
+    def _posting_position(values: List[int], keys: List[str], count: int, key: str) -> int:
+        """Position of (count, key) in postings sorted by count, then key"""
+        low = bisect_left(values, count)
+        return bisect_left(keys, key, low, bisect_right(values, count, low))
+
+    @staticmethod
+    def _record_counts(molecule: Dict) -> Dict[str, int]:
+        """Element counts from the record's Composition, else its Formula"""
+        counts: Dict[str, int] = {}
+        for entry in molecule.get('Composition', []):
+            element = entry.get('Element')
+            if element:
+                counts[element] = counts.get(element, 0) + int(entry.get('Count', 1))
+        if not counts:
+            counts = parse_formula(str(molecule.get('Formula', ''))) or {}
+        return counts
+
+    @staticmethod
+    def _count_features(counts: Dict[str, int]) -> Set[str]:
+        return {f'{element}*{n}' for element, count in counts.items()
+                for n in range(1, min(count, MAX_COUNT_FEATURE) + 1)}
+
+    # ==================== Queries ====================
+
+    def keys_for_formula(self, formula: str) -> Set[str]:
+        """Keys of molecules with exactly this formula, in any element order"""
+        counts = parse_formula(formula)
+        return set(self._by_hill.get(hill_formula(counts), ())) if counts else set()
+
+    def keys_with_element(self, element: str, low: int = 1, high: Optional[int] = None) -> Set[str]:
+        """Keys of molecules containing between low and high atoms of an element"""
+        if low <= 0:
+            raise ValueError("Element ranges start at one atom; absent elements are not indexed")
+        values, keys = self._element_counts.get(element, ([], []))
+        end = len(values) if high is None else bisect_right(values, high)
+        return set(keys[bisect_left(values, low):end])
+
+    def keys_matching_formula(self, pattern: str) -> Set[str]:
+        """
+        Keys of molecules matching a formula pattern (see parse_formula_pattern).
+
+        Raises:
+            ValueError: If the pattern does not parse
+        """
+        parsed = parse_formula_pattern(pattern)
+        if parsed is None:
+            raise ValueError(f"Invalid formula pattern: {pattern}")
+        ranges, open_ended = parsed
+
+        result: Optional[Set[str]] = None
+        for element, (low, high) in sorted(ranges.items(), key=lambda item: item[1][0] == 0):
+            if low == 0:
+                # "0 or more": only the upper bound filters, applied below
+                continue
+            matched = self.keys_with_element(element, low, high)
+            result = matched if result is None else result & matched
+            if not result:
+                return set()
+        if result is None:
+            result = set(self._entries)
+
+        allowed = set(ranges)
+        keep = set()
+        for key in result:
+            counts = self._entries[key].counts
+            if not open_ended and not allowed.issuperset(counts):
+                continue
+            if any(high is not None and counts.get(e, 0) > high for e, (_, high) in ranges.items()):
+                continue
+            keep.add(key)
+        return keep
+
+    def keys_with_substructure(self, fragment: str) -> Set[str]:
+        """
+        Keys of molecules containing a fragment (SMILES subset or a FRAGMENTS name).
+
+        Raises:
+            ValueError: If the fragment does not parse
+        """
+        graph = parse_fragment(FRAGMENTS.get(fragment.strip().lower(), fragment.strip()))
+        if graph is None:
+            raise ValueError(f"Invalid fragment: {fragment}")
+
+        # Fingerprint pre-filter: AND the slot bitsets of the fragment's features
+        candidates = -1
+        for feature in graph.features():
+            candidates &= self._feature_masks.get(feature, 0)
+            if not candidates:
+                return set()
+        if candidates == -1:
+            candidates = (1 << len(self._slot_keys)) - 1
+
+        result = set()
+        while candidates:
+            low_bit = candidates & -candidates
+            candidates ^= low_bit
+            key = self._slot_keys[low_bit.bit_length() - 1]
+            if key is not None and has_substructure(self._entries[key].graph, graph):
+                result.add(key)
+        return result
+
+    def keys_with_name(self, text: str) -> Set[str]:
+        """Keys of molecules whose name contains the text (case-insensitive)"""
+        needle = text.strip().lower()
+        return {key for key, name in self._names.items() if needle in name}
+
+    def search(self, text: str) -> Set[str]:
+        """
+        Keys matching search-box text (see the module docstring for the syntax).
+        Text that is neither a formula nor a fragment is matched against names.
+        """
+        text = text.strip()
+        if not text:
+            return set(self._entries)
+        lowered = text.lower()
+        for prefix in ('has:', 'contains '):
+            if lowered.startswith(prefix):
+                try:
+                    return self.keys_with_substructure(text[len(prefix):])
+                except ValueError:
+                    return set()
+        if lowered in FRAGMENTS:
+            return self.keys_with_substructure(lowered)
+        parsed = parse_formula_pattern(text)
+        if parsed is not None:
+            return self.keys_matching_formula(text)
+        # Formulas with groups, such as Ca(OH)2, are not patterns but still exact formulas
+        if parse_formula(text) is not None:
+            return self.keys_for_formula(text)
+        if parse_fragment(text) is not None:
+            # Lowercase words such as 'co' also parse as aromatic fragments
+            keys = self.keys_with_substructure(text)
+            if keys:
+                return keys
+        return self.keys_with_name(text)
+
+
+class MoleculeSearch(Condition):
+    """Search-box text as a query condition (combines with the DataIndex conditions)"""
+
+    def __init__(self, search_index: MoleculeSearchIndex, text: str):
+        self.search_index = search_index
+        self.text = text
+
+    def resolve(self, index: DataIndex) -> Set[str]:
+        return self.search_index.search(self.text)
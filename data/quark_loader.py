@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from core.quark_enums import ParticleType, QuarkGeneration
+from utils.profiler import profiled
 
 
 class QuarkDataLoader:
@@ -37,6 +38,7 @@ class QuarkDataLoader:
         self.antiquarks_dir = self.base_dir / "active" / "antiquarks"
         self.subatomic_dir = self.base_dir / "active" / "subatomic"
 
+    @profiled('data.load_quarks', 'data')
     def load_all_particles(self, include_antiparticles: bool = True,
                           include_composite: bool = True) -> List[Dict]:
         """
@@ -6,8 +6,213 @@ Loads particle data from JSON files in the SubAtomic folder.
 import json
 import os
 import math
+from bisect import bisect_right
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+from data.data_index import Condition, DataIndex
+from utils.profiler import profiled
+
+
+# Fields indexed for fast filtering
+PARTICLE_CATEGORICAL_FIELDS = ('Charge_e', '_category', 'Type', 'Stability',
+                               '_is_baryon', '_is_meson')
+PARTICLE_NUMERIC_FIELDS = ('Mass_MeVc2', '_log_mass', 'HalfLife_s', '_stability_factor',
+                           'Spin_hbar', 'Isospin_I3', 'Strangeness')
+
+
+class DecayGraph:
+    """
+    Precomputed decay graph over a particle catalog.
+
+    Built once from the ``DecayProducts`` lists of the loaded particles.
+    Edges are restricted to products that exist in the catalog (unknown
+    products are kept separately so callers can still show them), duplicate
+    products are collapsed, and any edge that would close a cycle is moved to
+    ``cycle_edges`` so that the remaining graph is a DAG.  Terminal-product
+    sets are memoized per particle.
+    """
+
+    def __init__(self, particles: List[Dict]):
+        self.nodes: Set[str] = {p['Name'] for p in particles}
+        self.edges: Dict[str, Tuple[str, ...]] = {}
+        self.unknown_products: Dict[str, Tuple[str, ...]] = {}
+        self._listed_products: Dict[str, Tuple[str, ...]] = {}
+        self.cycle_edges: Set[Tuple[str, str]] = set()
+        self._terminal_cache: Dict[str, FrozenSet[str]] = {}
+
+        for particle in particles:
+            name = particle['Name']
+            listed = tuple(dict.fromkeys(particle.get('DecayProducts', []) or []))
+            known = [product for product in listed if product in self.nodes]
+            unknown = [product for product in listed if product not in self.nodes]
+            self._listed_products[name] = listed
+            self.edges[name] = tuple(known)
+            self.unknown_products[name] = tuple(unknown)
+
+        self._remove_cycles()
+        self.topological_order: List[str] = self._topological_sort()
+        self._topological_index = {name: i for i, name in enumerate(self.topological_order)}
+
+    def _remove_cycles(self):
+        """Detect back edges with an iterative DFS and drop them from the DAG"""
+        WHITE, GREY, BLACK = 0, 1, 2
+        state = {name: WHITE for name in self.edges}
+
+        for root in sorted(self.edges):
+            if state[root] != WHITE:
+                continue
+            state[root] = GREY
+            stack = [(root, iter(self.edges[root]))]
+            while stack:
+                node, children = stack[-1]
+                advanced = False
+                for child in children:
+                    if state[child] == GREY:
+                        self.cycle_edges.add((node, child))
+                    elif state[child] == WHITE:
+                        state[child] = GREY
+                        stack.append((child, iter(self.edges[child])))
+                        advanced = True
+                        break
+                if not advanced:
+                    state[node] = BLACK
+                    stack.pop()
+
+        self._closing_edges: Dict[str, Tuple[str, ...]] = {}
+        for source, target in self.cycle_edges:
+            self.edges[source] = tuple(p for p in self.edges[source] if p != target)
+            self._closing_edges[source] = self._closing_edges.get(source, ()) + (target,)
+
+    def _topological_sort(self) -> List[str]:
+        """Order particles so every parent precedes its decay products"""
+        in_degree = {name: 0 for name in self.edges}
+        for products in self.edges.values():
+            for product in products:
+                in_degree[product] += 1
+
+        queue = sorted(name for name, degree in in_degree.items() if degree == 0)
+        order = []
+        while queue:
+            node = queue.pop()
+            order.append(node)
+            for product in self.edges[node]:
+                in_degree[product] -= 1
+                if in_degree[product] == 0:
+                    queue.append(product)
+        return order
+
+    @property
+    def has_cycles(self) -> bool:
+        """True if the source data contained cyclic decay relationships"""
+        return bool(self.cycle_edges)
+
+    def get_products(self, name: str) -> Tuple[str, ...]:
+        """Get the direct (known, acyclic) decay products of a particle"""
+        return self.edges.get(name, ())
+
+    def get_all_edges(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over every (parent, product) edge of the DAG"""
+        for source, products in self.edges.items():
+            for product in products:
+                yield source, product
+
+    def get_terminal_products(self, name: str) -> FrozenSet[str]:
+        """
+        Get the set of final-state particles a particle eventually decays to.
+
+        Particles with no decay products inside the catalog are their own
+        terminal product.  Results are memoized and
+        filled in reverse topological order, so each node is expanded once.
+        """
+        if name not in self.edges:
+            return frozenset()
+        cached = self._terminal_cache.get(name)
+        if cached is not None:
+            return cached
+
+        # Fill the cache bottom-up for everything reachable from this node
+        pending = [name]
+        reachable = []
+        seen = {name}
+        while pending:
+            node = pending.pop()
+            reachable.append(node)
+            for product in self.edges[node]:
+                if product not in seen:
+                    seen.add(product)
+                    pending.append(product)
+
+        position = self._topological_index
+        for node in sorted(reachable, key=position.__getitem__, reverse=True):
+            if node in self._terminal_cache:
+                continue
+            products = self.edges[node]
+            if not products:
+                self._terminal_cache[node] = frozenset((node,))
+            else:
+                terminals = set()
+                for product in products:
+                    terminals |= self._terminal_cache[product]
+                self._terminal_cache[node] = frozenset(terminals)
+
+        return self._terminal_cache[name]
+
+    def decays_to(self, name: str, product: str) -> bool:
+        """Check whether ``product`` appears anywhere downstream of ``name``"""
+        pending = list(self.edges.get(name, ()))
+        seen = set()
+        while pending:
+            node = pending.pop()
+            if node == product:
+                return True
+            if node not in seen:
+                seen.add(node)
+                pending.extend(self.edges[node])
+        return False
+
+    def iter_decay_chains(self, name: str, max_depth: int = 5) -> Iterator[List[str]]:
+        """
+        Lazily enumerate root-to-leaf decay chains starting at a particle.
+
+        Chains stop at stable particles, at ``max_depth`` (where the next
+        product is still listed) and at cycle-closing edges (where the
+        revisited product is listed once).  Products outside the catalog are
+        skipped, matching the historical ``get_decay_chain`` behaviour.
+
+        Args:
+            name: Name of the particle
+            max_depth: Maximum decay depth to trace
+
+        Yields:
+            Lists of particle names, parent first
+        """
+        if name not in self.edges:
+            return
+
+        stack = [(name, max_depth, [name])]
+        while stack:
+            node, depth, chain = stack.pop()
+            products = self.edges[node]
+            closing = self._closing_edges.get(node, ())
+
+            if depth <= 0:
+                listed = self._listed_products[node]
+                if not listed:
+                    yield chain
+                for product in listed:
+                    yield chain + [product]
+                continue
+
+            if not products and not closing:
+                yield chain
+                continue
+
+            # Push in reverse so chains come out in data order
+            for product in reversed(products):
+                stack.append((product, depth - 1, chain + [product]))
+            for product in closing:
+                yield chain + [product]
 
 
 class SubatomicDataLoader:
@@ -32,7 +237,11 @@ class SubatomicDataLoader:
         self.particles_by_symbol: Dict[str, Dict] = {}
         self.baryons: List[Dict] = []
         self.mesons: List[Dict] = []
+        self.decay_graph: DecayGraph = DecayGraph([])
+        self.index = DataIndex(key_field='Name', categorical=PARTICLE_CATEGORICAL_FIELDS,
+                               numeric=PARTICLE_NUMERIC_FIELDS)
 
+    @profiled('data.load_subatomic', 'data')
     def load_all_particles(self) -> List[Dict]:
         """
         Load all particle data from JSON files.
@@ -73,6 +282,10 @@ class SubatomicDataLoader:
         # Categorize particles
         self._categorize_particles()
 
+        # Precompute decay relationships and filter indexes
+        self.decay_graph = DecayGraph(loaded_particles)
+        self.index.rebuild(loaded_particles)
+
         return loaded_particles
 
     def _load_particle_file(self, filepath: Path) -> Optional[Dict]:
@@ -110,6 +323,7 @@ class SubatomicDataLoader:
                     return None
 
             # Add computed fields
+            data['_filename'] = filepath.stem
             data = self._add_computed_fields(data)
 
             return data
@@ -248,6 +462,60 @@ class SubatomicDataLoader:
         self.baryons = [p for p in self.particles if p.get('_is_baryon', False)]
         self.mesons = [p for p in self.particles if p.get('_is_meson', False)]
 
+    # ==================== Incremental Edits ====================
+
+    def reload_items(self, filenames: Iterable[str]) -> Tuple[List[Dict], List[str]]:
+        """
+        Re-read only the given particle files and patch the catalog in place.
+
+        The decay graph is rebuilt afterwards since a single edit can add or
+        remove edges anywhere; it is linear in the catalog size.
+
+        Args:
+            filenames: Filename stems that were added, edited or deleted
+
+        Returns:
+            (particles that were loaded or replaced, names of particles removed)
+        """
+        updated, removed = [], []
+        by_filename = {p.get('_filename'): p for p in self.particles}
+
+        for filename in filenames:
+            previous = by_filename.get(filename)
+            filepath = self.subatomic_dir / f"{filename}.json"
+            particle = self._load_particle_file(filepath) if filepath.exists() else None
+
+            if previous is not None:
+                self._remove_particle_entry(previous)
+                if particle is None or previous['Name'] != particle['Name']:
+                    removed.append(previous['Name'])
+            if particle is not None:
+                self._insert_particle_entry(particle)
+                updated.append(particle)
+
+        if updated or removed:
+            self._categorize_particles()
+            self.decay_graph = DecayGraph(self.particles)
+            self.index.set_order(self.particles)
+        return updated, removed
+
+    def _insert_particle_entry(self, particle: Dict):
+        """Insert a particle keeping the list sorted by mass"""
+        masses = [p.get('Mass_MeVc2', 0) for p in self.particles]
+        self.particles.insert(bisect_right(masses, particle.get('Mass_MeVc2', 0)), particle)
+        self.particles_by_name[particle['Name']] = particle
+        self.particles_by_symbol[particle.get('Symbol', particle['Name'])] = particle
+        self.index.add(particle)
+
+    def _remove_particle_entry(self, particle: Dict):
+        """Remove a particle from the list, lookups and index"""
+        self.particles.remove(particle)
+        self.particles_by_name.pop(particle['Name'], None)
+        symbol = particle.get('Symbol', particle['Name'])
+        if self.particles_by_symbol.get(symbol) is particle:
+            del self.particles_by_symbol[symbol]
+        self.index.remove(particle['Name'])
+
     def get_particle_by_name(self, name: str) -> Optional[Dict]:
         """Get particle data by name"""
         return self.particles_by_name.get(name)
@@ -270,11 +538,23 @@ class SubatomicDataLoader:
 
     def get_particles_by_charge(self, charge: int) -> List[Dict]:
         """Get particles with specific charge"""
-        return [p for p in self.particles if p.get('Charge_e', 0) == charge]
+        keys = set(self.index.keys_for('Charge_e', charge))
+        if charge == 0:
+            keys |= self.index.keys_for('Charge_e', None)
+        return self.index.items_for(keys)
 
     def get_particles_by_category(self, category: str) -> List[Dict]:
         """Get particles by internal category"""
-        return [p for p in self.particles if p.get('_category', '') == category]
+        return self.index.items_for(self.index.keys_for('_category', category))
+
+    def query(self, *conditions: Condition) -> List[Dict]:
+        """
+        Query particles with indexed conditions (see data.data_index).
+
+        Example:
+            loader.query(In('_category', {'pion', 'kaon'}), Between('Mass_MeVc2', 100, 600))
+        """
+        return self.index.query(*conditions)
 
     def get_particle_count(self) -> int:
         """Get total number of loaded particles"""
@@ -282,10 +562,12 @@ class SubatomicDataLoader:
 
     def get_mass_range(self) -> tuple:
         """Get min and max mass of all particles"""
+        if not self.particles:
+            return 0, 0
+        if len(self.index.sorted_columns['Mass_MeVc2'][0]) == len(self.particles):
+            return self.index.value_range('Mass_MeVc2')
         masses = [p.get('Mass_MeVc2', 0) for p in self.particles]
-        if masses:
-            return min(masses), max(masses)
-        return 0, 0
+        return min(masses), max(masses)
 
     def get_decay_chain(self, particle_name: str, max_depth: int = 5) -> List[List[str]]:
         """
@@ -298,25 +580,17 @@ class SubatomicDataLoader:
         Returns:
             List of decay chains (list of particle names)
         """
-        particle = self.get_particle_by_name(particle_name)
-        if not particle:
+        if particle_name not in self.particles_by_name:
             return []
+        return list(self.decay_graph.iter_decay_chains(particle_name, max_depth))
 
-        chains = []
-        decay_products = particle.get('DecayProducts', [])
-
-        if not decay_products:
-            return [[particle_name]]
-
-        for product in decay_products:
-            if max_depth > 0:
-                sub_chains = self.get_decay_chain(product, max_depth - 1)
-                for chain in sub_chains:
-                    chains.append([particle_name] + chain)
-            else:
-                chains.append([particle_name, product])
+    def iter_decay_chains(self, particle_name: str, max_depth: int = 5) -> Iterator[List[str]]:
+        """Iterate decay chains without materializing them all (see DecayGraph)"""
+        return self.decay_graph.iter_decay_chains(particle_name, max_depth)
 
-        return chains if chains else [[particle_name]]
+    def get_terminal_products(self, particle_name: str) -> FrozenSet[str]:
+        """Get the memoized set of final-state products for a particle"""
+        return self.decay_graph.get_terminal_products(particle_name)
 
 
 # Singleton instance for easy access
@@ -26,6 +26,7 @@ from layouts.molecule_phase_diagram_layout import MoleculePhaseDiagramLayout
 from layouts.molecule_dipole_layout import MoleculeDipoleLayout
 from layouts.molecule_density_layout import MoleculeDensityLayout
 from layouts.molecule_bond_complexity_layout import MoleculeBondComplexityLayout
+from layouts.molecule_vibrational_layout import MoleculeVibrationalLayout
 
 # Quark/Particle layouts
 from layouts.quark_base_layout import QuarkBaseLayoutRenderer
@@ -59,6 +60,7 @@ __all__ = [
     'MoleculeDipoleLayout',
     'MoleculeDensityLayout',
     'MoleculeBondComplexityLayout',
+    'MoleculeVibrationalLayout',
     # Quark layouts
     'QuarkBaseLayoutRenderer',
     'QuarkStandardLayoutRenderer',
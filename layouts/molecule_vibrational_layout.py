@@ -0,0 +1,184 @@
+"""
+Molecule Vibrational Spectrum Layout
+Scatter plot of computed vibrational spectra.
+X-axis: Characteristic band (strongest IR-active fundamental, cm^-1)
+Y-axis: Zero-point vibrational energy (kJ/mol)
+Grouped and colored by the spectral region of the characteristic band.
+Normal modes for the whole visible catalog are solved in one batch.
+"""
+
+from typing import List, Dict
+
+from data.layout_config_loader import get_layout_config
+from utils.normal_modes import catalog_normal_modes
+
+
+# Spectral regions (lower bound cm^-1, name, color), highest first
+SPECTRAL_REGIONS = [
+    (2500, 'X-H Stretch', '#FF7043'),
+    (2000, 'Triple Bond Stretch', '#AB47BC'),
+    (1500, 'Double Bond Stretch', '#42A5F5'),
+    (0, 'Fingerprint', '#66BB6A'),
+]
+MAX_WAVENUMBER = 4000
+
+
+def characteristic_band(analysis: Dict) -> float:
+    """Frequency of the strongest IR-active mode, else the highest fundamental"""
+    modes = [m for m in analysis.get('modes', []) if m.get('frequency_cm-1', 0) > 0]
+    if not modes:
+        return 0.0
+    active = [m for m in modes if m.get('ir_active')]
+    if active:
+        return max(active, key=lambda m: m.get('ir_intensity', 0))['frequency_cm-1']
+    return max(m['frequency_cm-1'] for m in modes)
+
+
+def spectral_region(wavenumber: float):
+    """(name, color) of the spectral region containing a wavenumber"""
+    for lower, name, color in SPECTRAL_REGIONS:
+        if wavenumber >= lower:
+            return name, color
+    return SPECTRAL_REGIONS[-1][1], SPECTRAL_REGIONS[-1][2]
+
+
+class MoleculeVibrationalLayout:
+    """Vibrational spectrum scatter plot layout for molecules"""
+
+    def __init__(self, widget_width: int, widget_height: int):
+        self.widget_width = widget_width
+        self.widget_height = widget_height
+
+        # Load configuration from JSON
+        config = get_layout_config()
+        card_size = config.get_card_size('molecules')
+        margins = config.get_margins('molecules')
+
+        # Scatter plot card sizes based on config
+        self.base_card_size = card_size.get('width', 150) - 50
+        self.min_card_size = card_size.get('min_width', 120) - 50
+        self.max_card_size = card_size.get('max_width', 200) - 70
+        self.padding = margins.get('top', 80)  # Extra padding for axis labels
+        self.axis_margin = 60
+
+    def calculate_layout(self, molecules: List[Dict]) -> List[Dict]:
+        """
+        Calculate positions for molecules from their computed normal modes.
+
+        Args:
+            molecules: List of molecule dictionaries
+
+        Returns:
+            List of molecules with position data added (molecules without a
+            3D structure or without vibrations are left out)
+        """
+        if not molecules:
+            return []
+
+        analyzed = [(mol, analysis) for mol, analysis in zip(molecules, catalog_normal_modes(molecules))
+                    if analysis is not None and analysis.get('total_modes', 0) > 0]
+        if not analyzed:
+            return []
+
+        energies = [analysis['zero_point_energy_kJ_mol'] for _, analysis in analyzed]
+        max_energy = max(energies) if max(energies) > 0 else 1.0
+        max_modes = max(analysis['total_modes'] for _, analysis in analyzed)
+
+        # Calculate plot area
+        plot_left = self.padding + self.axis_margin
+        plot_right = self.widget_width - self.padding
+        plot_top = self.padding
+        plot_bottom = self.widget_height - self.padding - self.axis_margin
+        plot_width = plot_right - plot_left
+        plot_height = plot_bottom - plot_top
+
+        positioned_molecules = []
+
+        for mol, analysis in analyzed:
+            band = characteristic_band(analysis)
+            energy = analysis['zero_point_energy_kJ_mol']
+            region, region_color = spectral_region(band)
+
+            # X-axis: characteristic band (left = low wavenumber)
+            x_ratio = min(band / MAX_WAVENUMBER, 1.0)
+            # Y-axis: zero-point energy (bottom = low, inverted for screen coords)
+            y_ratio = energy / max_energy
+
+            x = plot_left + x_ratio * plot_width
+            y = plot_bottom - y_ratio * plot_height
+
+            # Larger cards for molecules with more vibrational modes
+            mode_ratio = analysis['total_modes'] / max_modes
+            card_size = self.min_card_size + mode_ratio * (self.max_card_size - self.min_card_size)
+
+            mol_copy = mol.copy()
+            mol_copy['x'] = x - card_size / 2  # Center on point
+            mol_copy['y'] = y - card_size / 2
+            mol_copy['width'] = card_size
+            mol_copy['height'] = card_size
+            mol_copy['scatter_x'] = x
+            mol_copy['scatter_y'] = y
+            mol_copy['group'] = region
+            mol_copy['group_color'] = region_color
+            mol_copy['characteristic_band'] = band
+            mol_copy['zero_point_energy'] = energy
+            mol_copy['vibrational_frequencies'] = analysis['frequencies_cm-1']
+            positioned_molecules.append(mol_copy)
+
+        return positioned_molecules
+
+    def get_axis_info(self, molecules: List[Dict]) -> Dict:
+        """Get axis information for rendering"""
+        if not molecules:
+            return {}
+
+        energies = [m.get('zero_point_energy', 0) for m in molecules]
+
+        return {
+            'x_label': 'Characteristic Band (cm-1)',
+            'y_label': 'Zero-Point Energy (kJ/mol)',
+            'x_min': 0,
+            'x_max': MAX_WAVENUMBER,
+            'y_min': 0,
+            'y_max': max(energies) if energies else 1,
+            'plot_left': self.padding + self.axis_margin,
+            'plot_right': self.widget_width - self.padding,
+            'plot_top': self.padding,
+            'plot_bottom': self.widget_height - self.padding - self.axis_margin
+        }
+
+    def get_legend_info(self) -> List[Dict]:
+        """Get legend information for spectral region colors"""
+        return [{'name': name, 'color': color} for _, name, color in SPECTRAL_REGIONS]
+
+    def get_group_headers(self, molecules: List[Dict]) -> List[Dict]:
+        """Get group header information for rendering (legend style)"""
+        if not molecules:
+            return []
+
+        present = {mol.get('group') for mol in molecules}
+        return [{'name': name, 'y': self.padding, 'color': color}
+                for _, name, color in SPECTRAL_REGIONS if name in present]
+
+    def get_molecule_at_position(self, x: float, y: float, molecules: List[Dict]) -> Dict:
+        """Find molecule at given position."""
+        for mol in molecules:
+            mx = mol.get('x', 0)
+            my = mol.get('y', 0)
+            mw = mol.get('width', self.base_card_size)
+            mh = mol.get('height', self.base_card_size)
+
+            if mx <= x <= mx + mw and my <= y <= my + mh:
+                return mol
+
+        return None
+
+    def update_dimensions(self, width: int, height: int):
+        """Update widget dimensions"""
+        self.widget_width = width
+        self.widget_height = height
+
+    def get_content_height(self, molecules: List[Dict]) -> int:
+        """Calculate total content height for scrolling"""
+        # Scatter plot fits in viewport, minimal scrolling needed
+        return max(self.widget_height, 600)
@@ -43,6 +43,29 @@ class QuarkBaseLayoutRenderer(ABC):
         """
         pass
 
+    def update_layout(self, previous, particles, added, removed, **kwargs):
+        """
+        Update a layout after the filtered particle set changed.
+
+        Called instead of create_layout() when the widget size and layout
+        parameters are unchanged since the previous layout. Renderers whose
+        positions do not depend on the other members override this to place
+        only the added particles; the default lays everything out again.
+
+        Args:
+            previous: Particle list returned by the previous layout call
+            particles: New filtered particle list
+            added: Particles in particles but not in previous
+            removed: Particles in previous but not in particles
+            **kwargs: Additional layout-specific parameters
+
+        Returns:
+            List of particle dictionaries with layout-specific position data
+        """
+        if not added and not removed:
+            return previous
+        return self.create_layout(particles, **kwargs)
+
     @abstractmethod
     def paint(self, painter, particles, table_state, **kwargs):
         """
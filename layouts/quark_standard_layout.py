@@ -39,6 +39,9 @@ class QuarkStandardLayoutRenderer(QuarkBaseLayoutRenderer):
         self.sm_rows = sm_config.get('row_count', 4)
         self.sm_cols = sm_config.get('col_count', 6)
 
+        # (start_x, start_y, rows) of the grid from the last create_layout()
+        self._grid_origin = None
+
     def create_layout(self, particles, **kwargs):
         """
         Create Standard Model grid layout.
@@ -75,23 +78,52 @@ class QuarkStandardLayoutRenderer(QuarkBaseLayoutRenderer):
         # Starting position
         start_x = (self.widget_width - (cols * self.cell_size + (cols - 1) * self.cell_spacing)) / 2 + self.cell_size / 2
         start_y = margins.get('top', 100) + self.cell_size / 2
+        self._grid_origin = (start_x, start_y, rows)
 
         # Position particles based on their Standard Model position
         for particle in particles:
-            sm_row = particle.get('sm_row', -1)
-            sm_col = particle.get('sm_col', -1)
-
-            if sm_row >= 0 and sm_col >= 0:
-                particle['x'] = start_x + sm_col * (self.cell_size + self.cell_spacing)
-                particle['y'] = start_y + sm_row * (self.cell_size + self.cell_spacing)
-                particle['display_size'] = self.cell_size
-                particle['in_layout'] = True
-            else:
-                # Particles not in Standard Model layout
-                particle['in_layout'] = False
-                particle['display_size'] = self.cell_size * 0.8
+            self._place_particle(particle)
 
         # Position antiparticles and composites below main layout
+        self._place_extra_particles(particles)
+
+        return particles
+
+    def update_layout(self, previous, particles, added, removed, **kwargs):
+        """
+        Update the layout after a filter change. Standard Model cells are fixed
+        by (sm_row, sm_col), so only added particles are placed and the rows of
+        antiparticles and composites below the grid are repacked.
+        """
+        if not added and not removed:
+            return previous
+        if self._grid_origin is None:
+            return self.create_layout(particles, **kwargs)
+
+        for particle in added:
+            self._place_particle(particle)
+        self._place_extra_particles(particles)
+        return particles
+
+    def _place_particle(self, particle):
+        """Position a particle in its Standard Model cell, or mark it for the extra rows"""
+        start_x, start_y, _ = self._grid_origin
+        sm_row = particle.get('sm_row', -1)
+        sm_col = particle.get('sm_col', -1)
+
+        if sm_row >= 0 and sm_col >= 0:
+            particle['x'] = start_x + sm_col * (self.cell_size + self.cell_spacing)
+            particle['y'] = start_y + sm_row * (self.cell_size + self.cell_spacing)
+            particle['display_size'] = self.cell_size
+            particle['in_layout'] = True
+        else:
+            # Particles not in Standard Model layout
+            particle['in_layout'] = False
+            particle['display_size'] = self.cell_size * 0.8
+
+    def _place_extra_particles(self, particles):
+        """Pack particles outside the Standard Model grid into rows below it"""
+        start_x, start_y, rows = self._grid_origin
         non_sm_particles = [p for p in particles if not p.get('in_layout', False)]
         if non_sm_particles:
             extra_start_y = start_y + rows * (self.cell_size + self.cell_spacing) + self.section_spacing * 2
@@ -101,8 +133,6 @@ class QuarkStandardLayoutRenderer(QuarkBaseLayoutRenderer):
                 particle['x'] = start_x + col * (self.cell_size * 0.8 + self.cell_spacing)
                 particle['y'] = extra_start_y + row * (self.cell_size * 0.8 + self.cell_spacing)
 
-        return particles
-
     def paint(self, painter, particles, table_state, **kwargs):
         """
         Paint the Standard Model layout.
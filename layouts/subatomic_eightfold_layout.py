@@ -9,6 +9,30 @@ Uses data-driven configuration from layout_config.json
 import math
 
 from data.layout_config_loader import get_subatomic_config, get_layout_config
+from utils.physics_calculator_v2 import SubatomicCalculatorV2
+
+
+def eightfold_coordinates(particle, hadron=None):
+    """
+    Isospin I3 and hypercharge Y = S + B of a particle.
+
+    Quantum numbers missing from the particle data are taken from the
+    enumerated hadron of the same quark content, then default to 0.
+
+    Args:
+        particle: Particle dictionary
+        hadron: Enumerated hadron (SubatomicCalculatorV2.enumerated_hadrons_for), if any
+
+    Returns:
+        (i3, hypercharge) tuple
+    """
+    def value(field):
+        number = particle.get(field)
+        if number is None and hadron is not None:
+            number = hadron.get(field)
+        return number or 0
+
+    return value('Isospin_I3'), value('Strangeness') + value('BaryonNumber_B')
 
 
 class SubatomicEightfoldLayout:
@@ -91,12 +115,9 @@ class SubatomicEightfoldLayout:
 
         # Get I3 and Y values
         particle_coords = []
-        for p in all_particles:
-            i3 = p.get('Isospin_I3', 0)
-            strangeness = p.get('Strangeness', 0)
-            baryon_num = p.get('BaryonNumber_B', 0)
+        for p, hadron in zip(all_particles, SubatomicCalculatorV2.enumerated_hadrons_for(all_particles)):
             # Hypercharge: Y = S + B (simplified Gell-Mann-Nishijima)
-            hypercharge = strangeness + baryon_num
+            i3, hypercharge = eightfold_coordinates(p, hadron)
             particle_coords.append((p, i3, hypercharge))
 
         # Determine plot bounds
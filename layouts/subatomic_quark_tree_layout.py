@@ -12,6 +12,31 @@ Uses data-driven configuration from layout_config.json
 import math
 
 from data.layout_config_loader import get_subatomic_config, get_layout_config
+from utils.physics_calculator_v2 import SubatomicCalculatorV2
+
+
+def quark_tree_level(particle, hadron=None):
+    """
+    Tree level of a particle: 'bottom', 'charm', 'strange' or 'light'.
+
+    Args:
+        particle: Particle dictionary
+        hadron: Enumerated hadron of the same quark content
+            (SubatomicCalculatorV2.enumerated_hadrons_for), if any
+
+    Returns:
+        Level name of the heaviest flavour the particle contains
+    """
+    if hadron is not None:
+        flavours = {symbol.replace('\u0305', '') for symbol in hadron['QuarkContent']['symbols']}
+    else:
+        # Flavour mixtures (eta, pi0) have no single quark content: scan the constituents
+        flavours = {c.get('Constituent', '').lower().replace('anti', '').lstrip('- ')[:1]
+                    for c in particle.get('Composition', [])}
+    for flavour, level in (('b', 'bottom'), ('c', 'charm'), ('s', 'strange')):
+        if flavour in flavours:
+            return level
+    return 'light'
 
 
 class SubatomicQuarkTreeLayout:
@@ -98,23 +123,13 @@ class SubatomicQuarkTreeLayout:
         charm_hadrons = []      # Contains c quark
         bottom_hadrons = []     # Contains b quark
 
-        for p in particles:
-            quark_content = p.get('QuarkContent', '').lower()
-            composition = p.get('Composition', [])
-
-            # Check for heavy quarks
-            has_bottom = 'b' in quark_content or any(
-                'bottom' in c.get('Constituent', '').lower() for c in composition)
-            has_charm = 'c' in quark_content or any(
-                'charm' in c.get('Constituent', '').lower() for c in composition)
-            has_strange = 's' in quark_content or any(
-                'strange' in c.get('Constituent', '').lower() for c in composition)
-
-            if has_bottom:
+        for p, hadron in zip(particles, SubatomicCalculatorV2.enumerated_hadrons_for(particles)):
+            level = quark_tree_level(p, hadron)
+            if level == 'bottom':
                 bottom_hadrons.append(p)
-            elif has_charm:
+            elif level == 'charm':
                 charm_hadrons.append(p)
-            elif has_strange:
+            elif level == 'strange':
                 strange_hadrons.append(p)
             else:
                 light_hadrons.append(p)
@@ -327,22 +342,13 @@ class SubatomicQuarkTreeLayout:
         charm_hadrons = []
         bottom_hadrons = []
 
-        for p in particles:
-            quark_content = p.get('QuarkContent', '').lower()
-            composition = p.get('Composition', [])
-
-            has_bottom = 'b' in quark_content or any(
-                'bottom' in c.get('Constituent', '').lower() for c in composition)
-            has_charm = 'c' in quark_content or any(
-                'charm' in c.get('Constituent', '').lower() for c in composition)
-            has_strange = 's' in quark_content or any(
-                'strange' in c.get('Constituent', '').lower() for c in composition)
-
-            if has_bottom:
+        for p, hadron in zip(particles, SubatomicCalculatorV2.enumerated_hadrons_for(particles)):
+            level = quark_tree_level(p, hadron)
+            if level == 'bottom':
                 bottom_hadrons.append(p)
-            elif has_charm:
+            elif level == 'charm':
                 charm_hadrons.append(p)
-            elif has_strange:
+            elif level == 'strange':
                 strange_hadrons.append(p)
             else:
                 light_hadrons.append(p)
@@ -9,12 +9,13 @@ Main entry point with tabbed interface for different views:
 """
 
 import sys
+import time
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QSplitter, QMessageBox, QStatusBar, QLabel
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QPalette, QColor
+from PySide6.QtGui import QFont, QPalette, QColor, QKeySequence, QShortcut
 
 # Import tab components
 # Atoms tab
@@ -70,7 +71,11 @@ except ImportError as e:
 
 # Data management
 from data.data_manager import get_data_manager, DataCategory
+from data.data_watcher import get_data_watcher
 from ui.data_editor_dialog import DataEditorDialog
+from utils.backend_manager import BackendManager
+from utils.profiler import get_profiler
+from utils.cache_paths import get_cache_path
 
 
 class PeriodicsMainWindow(QMainWindow):
@@ -82,7 +87,9 @@ class PeriodicsMainWindow(QMainWindow):
         self.setMinimumSize(1400, 900)
 
         self.setup_ui()
+        self.setup_data_watcher()
         self.setup_statusbar()
+        self.setup_profiler_shortcuts()
         self.apply_dark_theme()
 
     def setup_ui(self):
@@ -137,6 +144,36 @@ class PeriodicsMainWindow(QMainWindow):
 
         main_layout.addWidget(self.tabs)
 
+    def setup_data_watcher(self):
+        """Route item-level data changes to the tables and watch the data directories.
+
+        Edits made in the app and edits made on disk both arrive as DataChangeEvents,
+        so each table only re-reads the files that changed.
+        """
+        manager = get_data_manager()
+        routes = []
+        if HAS_ATOMS_TAB:
+            routes.append((DataCategory.ELEMENTS, self.atom_table))
+        if HAS_QUARKS_TAB:
+            for category in (DataCategory.QUARKS, DataCategory.ANTIQUARKS, DataCategory.SUBATOMIC):
+                routes.append((category, self.quark_table))
+        if HAS_SUBATOMIC_TAB:
+            routes.append((DataCategory.SUBATOMIC, self.subatomic_table))
+        if HAS_MOLECULES_TAB:
+            routes.append((DataCategory.MOLECULES, self.molecule_table))
+        if HAS_ALLOYS_TAB:
+            routes.append((DataCategory.ALLOYS, self.alloy_table))
+
+        for category, table in routes:
+            manager.register_item_change_callback(category, table.apply_data_changes)
+        if HAS_ALLOYS_TAB:
+            manager.register_item_change_callback(
+                DataCategory.ALLOYS,
+                lambda event: self.alloy_control.update_item_count(len(self.alloy_table.base_alloys)))
+
+        self.data_watcher = get_data_watcher()
+        self.data_watcher.start()
+
     def _add_atoms_tab(self):
         """Add the Atoms (Periodic Table) tab"""
         atoms_widget = QWidget()
@@ -330,9 +367,7 @@ class PeriodicsMainWindow(QMainWindow):
     def _on_alloy_add(self):
         """Handle alloy add request"""
         dialog = DataEditorDialog(DataCategory.ALLOYS, parent=self)
-        if dialog.exec():
-            self.alloy_table.reload_data()
-            self.alloy_control.update_item_count(len(self.alloy_table.base_alloys))
+        dialog.exec()
 
     def _on_alloy_edit(self):
         """Handle alloy edit request"""
@@ -342,8 +377,7 @@ class PeriodicsMainWindow(QMainWindow):
                 existing_data=self.alloy_table.selected_alloy,
                 parent=self
             )
-            if dialog.exec():
-                self.alloy_table.reload_data()
+            dialog.exec()
 
     def _on_alloy_remove(self):
         """Handle alloy remove request"""
@@ -359,8 +393,6 @@ class PeriodicsMainWindow(QMainWindow):
                 manager = get_data_manager()
                 filename = self.alloy_table.selected_alloy.get('_filename', name.replace(' ', '_'))
                 if manager.remove_item(DataCategory.ALLOYS, filename):
-                    self.alloy_table.reload_data()
-                    self.alloy_control.update_item_count(len(self.alloy_table.base_alloys))
                     self.alloy_info.show_default()
                     self.alloy_control.set_item_selected(False)
 
@@ -375,8 +407,6 @@ class PeriodicsMainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             manager = get_data_manager()
             if manager.reset_category(DataCategory.ALLOYS):
-                self.alloy_table.reload_data()
-                self.alloy_control.update_item_count(len(self.alloy_table.base_alloys))
                 self.alloy_info.show_default()
                 QMessageBox.information(self, "Success", "Alloys reset to defaults.")
 
@@ -388,7 +418,6 @@ class PeriodicsMainWindow(QMainWindow):
 
     def _on_alloy_created(self):
         """Called when a new alloy is created"""
-        self.alloy_table.reload_data()
         self.alloy_control.update_item_count(len(self.alloy_table.base_alloys))
 
     # ==================== ATOMS TAB HANDLERS ====================
@@ -428,7 +457,6 @@ class PeriodicsMainWindow(QMainWindow):
                 symbol = elem.get('symbol', 'X')
                 filename = f"{z:03d}_{symbol}"
                 if manager.remove_item(DataCategory.ELEMENTS, filename):
-                    self.atom_table.reload_data()
                     self.atom_info.show_default()
                     self.atom_control.set_item_selected(False)
 
@@ -443,7 +471,6 @@ class PeriodicsMainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             manager = get_data_manager()
             if manager.reset_category(DataCategory.ELEMENTS):
-                self.atom_table.reload_data()
                 self.atom_info.show_default()
                 QMessageBox.information(self, "Success", "Elements reset to defaults.")
 
@@ -456,7 +483,6 @@ class PeriodicsMainWindow(QMainWindow):
 
     def _on_atom_data_saved(self, data):
         """Called when atom data is saved"""
-        self.atom_table.reload_data()
         self.atom_info.show_default()
 
     # ==================== QUARKS TAB HANDLERS ====================
@@ -493,7 +519,6 @@ class PeriodicsMainWindow(QMainWindow):
                 manager = get_data_manager()
                 filename = name.replace(' ', '_')
                 if manager.remove_item(DataCategory.QUARKS, filename):
-                    self.quark_table.reload_data()
                     self.quark_info.show_default()
                     self.quark_control.set_item_selected(False)
 
@@ -508,7 +533,6 @@ class PeriodicsMainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             manager = get_data_manager()
             if manager.reset_category(DataCategory.QUARKS):
-                self.quark_table.reload_data()
                 self.quark_info.show_default()
                 QMessageBox.information(self, "Success", "Quarks reset to defaults.")
 
@@ -518,7 +542,6 @@ class PeriodicsMainWindow(QMainWindow):
 
     def _on_quark_data_saved(self, data):
         """Called when quark data is saved"""
-        self.quark_table.reload_data()
         self.quark_info.show_default()
 
     # ==================== SUBATOMIC TAB HANDLERS ====================
@@ -555,7 +578,6 @@ class PeriodicsMainWindow(QMainWindow):
                 manager = get_data_manager()
                 filename = name.replace(' ', '_')
                 if manager.remove_item(DataCategory.SUBATOMIC, filename):
-                    self.subatomic_table.reload_data()
                     self.subatomic_info.show_default()
                     self.subatomic_control.set_item_selected(False)
 
@@ -570,7 +592,6 @@ class PeriodicsMainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             manager = get_data_manager()
             if manager.reset_category(DataCategory.SUBATOMIC):
-                self.subatomic_table.reload_data()
                 self.subatomic_info.show_default()
                 QMessageBox.information(self, "Success", "Subatomic particles reset to defaults.")
 
@@ -583,7 +604,6 @@ class PeriodicsMainWindow(QMainWindow):
 
     def _on_subatomic_data_saved(self, data):
         """Called when subatomic data is saved"""
-        self.subatomic_table.reload_data()
         self.subatomic_info.show_default()
 
     # ==================== MOLECULES TAB HANDLERS ====================
@@ -620,7 +640,6 @@ class PeriodicsMainWindow(QMainWindow):
                 manager = get_data_manager()
                 filename = name.replace(' ', '_')
                 if manager.remove_item(DataCategory.MOLECULES, filename):
-                    self.molecule_table.reload_data()
                     self.molecule_info.show_default()
                     self.molecule_control.set_item_selected(False)
 
@@ -635,7 +654,6 @@ class PeriodicsMainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             manager = get_data_manager()
             if manager.reset_category(DataCategory.MOLECULES):
-                self.molecule_table.reload_data()
                 self.molecule_info.show_default()
                 QMessageBox.information(self, "Success", "Molecules reset to defaults.")
 
@@ -648,7 +666,6 @@ class PeriodicsMainWindow(QMainWindow):
 
     def _on_molecule_data_saved(self, data):
         """Called when molecule data is saved"""
-        self.molecule_table.reload_data()
         self.molecule_info.show_default()
 
     def setup_statusbar(self):
@@ -662,6 +679,35 @@ class PeriodicsMainWindow(QMainWindow):
         """)
         self.statusBar().showMessage("Ready")
 
+    def setup_profiler_shortcuts(self):
+        """F3 toggles the profiler overlay; Shift+F3 exports a Chrome trace"""
+        QShortcut(QKeySequence("F3"), self, activated=self.toggle_profiler_overlay)
+        QShortcut(QKeySequence("Shift+F3"), self, activated=self.export_profiler_trace)
+
+    def toggle_profiler_overlay(self):
+        """Show or hide the FPS / costliest-scopes overlay on the tables"""
+        profiler = get_profiler()
+        visible = not profiler.overlay_visible
+        profiler.set_overlay_visible(visible)
+        if not visible:
+            profiler.set_enabled(False)
+        current = self.tabs.currentWidget()
+        if current is not None:
+            current.update()
+            for child in current.findChildren(QWidget):
+                child.update()
+        self.statusBar().showMessage("Profiler overlay on" if visible else "Profiler overlay off", 3000)
+
+    def export_profiler_trace(self):
+        """Write the recorded profiler events as Chrome trace-event JSON"""
+        path = get_cache_path(f"traces/periodics_trace_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        try:
+            count = get_profiler().export_chrome_trace(path)
+        except OSError as e:
+            self.statusBar().showMessage(f"Could not export trace: {e}", 5000)
+            return
+        self.statusBar().showMessage(f"Exported {count} profiler events to {path}", 8000)
+
     def apply_dark_theme(self):
         """Apply dark theme to the application"""
         palette = QPalette()
@@ -691,6 +737,9 @@ def main():
     font = QFont("Segoe UI", 10)
     app.setFont(font)
 
+    # Measure (or load persisted) pure/library crossover sizes before the first render
+    BackendManager.calibrate_dispatch()
+
     window = PeriodicsMainWindow()
     window.show()
 
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Parallel Test Runner for Periodics
+==================================
+
+Shards the test suite across worker processes and schedules the longest
+shards first using recorded per-test timings.
+
+Each test file is a shard. Files whose recorded duration exceeds the split
+threshold (e.g. test_all_118_elements.py, test_physics_calculations.py) are
+split into their individual test cases, including each parameterized case,
+and regrouped into shards of roughly equal cost. Every shard runs pytest in
+its own subprocess. Durations are read back from JUnit XML and merged into a
+JSON timing history, which the next run uses to order the shards.
+
+Usage:
+    python tests/parallel_runner.py
+    python tests/parallel_runner.py -j 16 --slowest 20
+    python tests/parallel_runner.py tests/test_physics_calculations.py tests/test_prediction_chain.py
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Add parent directory to path
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from utils.cache_paths import get_cache_path
+
+
+HISTORY_FILENAME = 'test_timings.json'
+DEFAULT_SPLIT_THRESHOLD = 5.0    # seconds; longer files are split into cases
+DEFAULT_UNKNOWN_COST = 1.0       # seconds assumed for a file with no history
+SHARD_TIMEOUT = 600              # seconds per shard subprocess
+
+
+@dataclass
+class Shard:
+    """A batch of pytest node ids run in one subprocess"""
+    node_ids: List[str]
+    estimate: float
+    label: str
+
+
+@dataclass
+class ShardResult:
+    """Outcome of one shard"""
+    shard: Shard
+    seconds: float
+    returncode: int
+    # node id -> (outcome, seconds); outcome in passed/failed/error/skipped
+    tests: Dict[str, Tuple[str, float]] = field(default_factory=dict)
+    output: str = ""
+
+
+# ==================== Timing history ====================
+
+def load_history(path: str) -> Dict:
+    """Load the timing history ({'tests': {node_id: s}, 'files': {file: s}})"""
+    if not os.path.exists(path):
+        return {'tests': {}, 'files': {}}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            history = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read test timings from {path}: {e}")
+        return {'tests': {}, 'files': {}}
+    history.setdefault('tests', {})
+    history.setdefault('files', {})
+    return history
+
+
+def update_history(history: Dict, results: List[ShardResult]):
+    """Merge measured durations (latest run wins) and recompute file totals"""
+    for result in results:
+        for node_id, (_, seconds) in result.tests.items():
+            history['tests'][node_id] = seconds
+    files: Dict[str, float] = {}
+    for node_id, seconds in history['tests'].items():
+        file_path = node_id.split('::', 1)[0]
+        files[file_path] = files.get(file_path, 0.0) + seconds
+    history['files'] = files
+
+
+def save_history(history: Dict, path: str):
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(history, f, indent=2, sort_keys=True)
+    except OSError as e:
+        print(f"Warning: Could not save test timings to {path}: {e}")
+
+
+# ==================== Sharding ====================
+
+def discover_test_files(paths: Optional[List[str]] = None) -> List[str]:
+    """Test files relative to the repository root (default: tests/test_*.py)"""
+    if paths:
+        return [os.path.relpath(os.path.abspath(p), ROOT_DIR).replace(os.sep, '/') for p in paths]
+    return sorted(f"tests/{p.name}" for p in (ROOT_DIR / 'tests').glob('test_*.py'))
+
+
+def collect_node_ids(test_file: str) -> List[str]:
+    """Collect the individual test node ids (one per parameterized case) of a file"""
+    result = subprocess.run(
+        [sys.executable, '-m', 'pytest', '--collect-only', '-q', '-p', 'no:cacheprovider', test_file],
+        cwd=ROOT_DIR, capture_output=True, text=True
+    )
+    return [line.strip() for line in result.stdout.splitlines() if '::' in line and not line.startswith(' ')]
+
+
+def build_shards(test_files: List[str], history: Dict, workers: int,
+                 split_threshold: float = DEFAULT_SPLIT_THRESHOLD) -> List[Shard]:
+    """
+    Turn test files into shards ordered longest-first.
+
+    Files recorded as slower than split_threshold are split into their test
+    cases, which are packed (longest-first, into the cheapest bin) into up to
+    `workers` shards per file so the slow file is spread across the pool.
+
+    Args:
+        test_files: Files to run
+        history: Timing history from load_history()
+        workers: Number of parallel workers
+        split_threshold: File duration (s) above which the file is split
+
+    Returns:
+        Shards sorted by estimated cost, longest first
+    """
+    known = history.get('files', {})
+    tests = history.get('tests', {})
+    shards = []
+    for test_file in test_files:
+        estimate = known.get(test_file, DEFAULT_UNKNOWN_COST)
+        node_ids = collect_node_ids(test_file) if estimate > split_threshold and workers > 1 else []
+        if len(node_ids) < 2:
+            shards.append(Shard([test_file], estimate, test_file))
+            continue
+
+        default_cost = estimate / len(node_ids)
+        costs = sorted(((tests.get(n, default_cost), n) for n in node_ids), reverse=True)
+        bins: List[Tuple[float, List[str]]] = [(0.0, []) for _ in range(min(workers, len(node_ids)))]
+        for cost, node_id in costs:
+            index = min(range(len(bins)), key=lambda i: bins[i][0])
+            total, members = bins[index]
+            bins[index] = (total + cost, members + [node_id])
+        for i, (total, members) in enumerate(bins):
+            if members:
+                shards.append(Shard(members, total, f"{test_file} [{i + 1}/{len(bins)}]"))
+
+    shards.sort(key=lambda s: s.estimate, reverse=True)
+    return shards
+
+
+# ==================== Execution ====================
+
+def _junit_node_id(case: ET.Element) -> str:
+    """Rebuild a pytest node id from an xunit1 JUnit testcase element"""
+    file_path = case.get('file', '')
+    classname = case.get('classname', '')
+    name = case.get('name', '')
+    if not classname:
+        # Collection error: the whole module failed to import
+        return file_path or name
+    module = file_path[:-3].replace('/', '.') if file_path.endswith('.py') else ''
+    classes = classname[len(module) + 1:] if module and classname.startswith(module) else ''
+    parts = [file_path] + ([p for p in classes.split('.') if p]) + [name]
+    return '::'.join(parts)
+
+
+def parse_junit(path: str) -> Dict[str, Tuple[str, float]]:
+    """Per-test outcome and duration from a JUnit XML report"""
+    tests = {}
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError):
+        return tests
+    for case in root.iter('testcase'):
+        outcome = 'passed'
+        for tag in ('error', 'failure', 'skipped'):
+            if case.find(tag) is not None:
+                outcome = {'failure': 'failed', 'error': 'error', 'skipped': 'skipped'}[tag]
+                break
+        tests[_junit_node_id(case)] = (outcome, float(case.get('time', 0.0)))
+    return tests
+
+
+def run_shard(shard: Shard, report_dir: str, index: int) -> ShardResult:
+    """Run one shard in a pytest subprocess"""
+    junit_path = os.path.join(report_dir, f'shard_{index}.xml')
+    command = [sys.executable, '-m', 'pytest', '-q', '-p', 'no:cacheprovider',
+               '--continue-on-collection-errors', '-o', 'junit_family=xunit1',
+               f'--junitxml={junit_path}'] + shard.node_ids
+    start = time.perf_counter()
+    try:
+        completed = subprocess.run(command, cwd=ROOT_DIR, capture_output=True, text=True,
+                                   timeout=SHARD_TIMEOUT)
+        returncode, output = completed.returncode, completed.stdout + completed.stderr
+    except subprocess.TimeoutExpired:
+        returncode, output = -1, f"Shard timed out after {SHARD_TIMEOUT}s"
+    elapsed = time.perf_counter() - start
+    return ShardResult(shard, elapsed, returncode, parse_junit(junit_path), output)
+
+
+def run_shards(shards: List[Shard], workers: int, verbose: bool = False) -> List[ShardResult]:
+    """
+    Run shards on a pool of worker subprocesses, longest first.
+
+    Each pool thread only supervises its pytest subprocess, so the tests
+    themselves run in parallel processes.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as report_dir:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_shard, shard, report_dir, i) for i, shard in enumerate(shards)]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                failed = sum(1 for outcome, _ in result.tests.values() if outcome in ('failed', 'error'))
+                status = "ok" if result.returncode in (0, 5) and not failed else f"{failed} failed"
+                print(f"  {result.shard.label:<52} {result.seconds:7.2f}s  {status}", flush=True)
+                if verbose and status != "ok":
+                    for line in result.output.splitlines()[-20:]:
+                        print(f"      {line}")
+    return results
+
+
+# ==================== Reporting ====================
+
+def print_report(results: List[ShardResult], wall_seconds: float, slowest: int):
+    """Print totals, the slowest tests and any failures"""
+    all_tests = {}
+    for result in results:
+        all_tests.update(result.tests)
+    counts: Dict[str, int] = {}
+    for outcome, _ in all_tests.values():
+        counts[outcome] = counts.get(outcome, 0) + 1
+    serial_seconds = sum(r.seconds for r in results)
+
+    print()
+    print("=" * 80)
+    print("PARALLEL TEST RUN SUMMARY")
+    print("=" * 80)
+    print(f"  Shards: {len(results)}   Tests: {len(all_tests)}   " +
+          "   ".join(f"{k.capitalize()}: {v}" for k, v in sorted(counts.items())))
+    speedup = serial_seconds / wall_seconds if wall_seconds > 0 else 0.0
+    print(f"  Wall time: {wall_seconds:.2f}s   Summed shard time: {serial_seconds:.2f}s   Speedup: {speedup:.1f}x")
+
+    if slowest > 0 and all_tests:
+        print()
+        print(f"SLOWEST {min(slowest, len(all_tests))} TESTS")
+        print("-" * 80)
+        ranked = sorted(all_tests.items(), key=lambda item: item[1][1], reverse=True)[:slowest]
+        for node_id, (outcome, seconds) in ranked:
+            print(f"  {seconds:8.2f}s  {node_id}")
+
+    failures = sorted(n for n, (outcome, _) in all_tests.items() if outcome in ('failed', 'error'))
+    if failures:
+        print()
+        print("FAILURES")
+        print("-" * 80)
+        for node_id in failures:
+            print(f"  [{all_tests[node_id][0].upper()}] {node_id}")
+    print("=" * 80)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the Periodics tests in parallel shards")
+    parser.add_argument('paths', nargs='*', help="Test files (default: tests/test_*.py)")
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1,
+                        help="Parallel worker processes (default: CPU count)")
+    parser.add_argument('--split-threshold', type=float, default=DEFAULT_SPLIT_THRESHOLD,
+                        help="Split files slower than this many seconds into cases (default: %(default)s)")
+    parser.add_argument('--history', default=None,
+                        help=f"Timing history JSON (default: {HISTORY_FILENAME} in the cache directory)")
+    parser.add_argument('--slowest', type=int, default=15, help="Number of slowest tests to report")
+    parser.add_argument('--verbose', '-v', action='store_true', help="Show output of failing shards")
+    args = parser.parse_args(argv)
+
+    history_path = args.history or get_cache_path(HISTORY_FILENAME)
+    history = load_history(history_path)
+    test_files = discover_test_files(args.paths)
+    workers = max(1, args.workers)
+    shards = build_shards(test_files, history, workers, args.split_threshold)
+
+    print(f"Running {len(test_files)} test files as {len(shards)} shards on {workers} workers")
+    start = time.perf_counter()
+    results = run_shards(shards, workers, args.verbose)
+    wall_seconds = time.perf_counter() - start
+
+    update_history(history, results)
+    save_history(history, history_path)
+    print_report(results, wall_seconds, args.slowest)
+
+    failed = any(outcome in ('failed', 'error') for r in results for outcome, _ in r.tests.values())
+    crashed = any(r.returncode not in (0, 1, 5) and not r.tests for r in results)
+    return 1 if failed or crashed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Unit tests for per-call backend dispatch and crossover calibration
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.backend_dispatch import BackendDispatcher, get_dispatcher
+
+
+def _busy(xs):
+    """Deliberately slow path"""
+    total = 0.0
+    for _ in range(2000):
+        total += len(xs)
+    return total
+
+
+def _fast(xs):
+    """Near-free path"""
+    return None
+
+
+def _fail(xs):
+    raise AssertionError("calibration should not run")
+
+
+class TestBackendDispatch(unittest.TestCase):
+    """Test dispatch decisions, call counting and persisted calibration"""
+
+    def setUp(self):
+        """Use a temporary crossover file"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'crossovers.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_dispatch_by_size_and_mode(self):
+        """Calls below the crossover stay on pure Python, and every decision is counted"""
+        dispatcher = BackendDispatcher(self.path)
+        dispatcher.crossovers['lpmv'] = 64
+        self.assertFalse(dispatcher.use_library('lpmv', 1))
+        self.assertTrue(dispatcher.use_library('lpmv', 625))
+        dispatcher.crossovers['never'] = None
+        self.assertFalse(dispatcher.use_library('never', 10 ** 6))
+
+        dispatcher.set_mode('library')
+        self.assertTrue(dispatcher.use_library('lpmv', 1))
+        with self.assertRaises(ValueError):
+            dispatcher.set_mode('fastest')
+
+        self.assertEqual(dispatcher.get_status()['calls']['lpmv'], {'pure': 1, 'library': 2})
+
+    def test_calibration_is_persisted(self):
+        """Crossovers are measured once and reloaded for the same environment"""
+        dispatcher = BackendDispatcher(self.path)
+        dispatcher.register('slow_library', _fast, _busy)
+        dispatcher.register('fast_library', _busy, _fast)
+        crossovers = dispatcher.calibrate()
+        self.assertIsNone(crossovers['slow_library'])
+        self.assertEqual(crossovers['fast_library'], 1)
+        self.assertTrue(os.path.exists(self.path))
+
+        reloaded = BackendDispatcher(self.path)
+        reloaded.register('slow_library', _fail, _fail)
+        reloaded.register('fast_library', _fail, _fail)
+        self.assertEqual(reloaded.calibrate(), crossovers)
+        self.assertTrue(reloaded.calibrated)
+
+    def test_new_function_triggers_calibration(self):
+        """Persisted crossovers missing a registered function are not reused"""
+        dispatcher = BackendDispatcher(self.path)
+        dispatcher.register('first', _fast, _busy)
+        dispatcher.calibrate()
+
+        extended = BackendDispatcher(self.path)
+        extended.register('first', _fast, _busy)
+        extended.register('second', _busy, _fast)
+        self.assertFalse(extended.load())
+
+    def test_pure_backend_calls_are_recorded(self):
+        """Orbital helpers report the pure path when scipy is not active"""
+        from utils import orbital_clouds
+        if orbital_clouds.get_backend() != 'pure_python':
+            self.skipTest("scipy backend active")
+        before = dict(get_dispatcher().calls.get('lpmv', {'pure': 0}))
+        orbital_clouds.angular_wavefunction(2, 1, 0.4)
+        self.assertEqual(get_dispatcher().calls['lpmv']['pure'], before['pure'] + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
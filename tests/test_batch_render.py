@@ -0,0 +1,51 @@
+"""
+Unit tests for the headless batch renderer job matrix and offscreen painting
+"""
+
+import unittest
+import sys
+import os
+import importlib.util
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HAS_PYSIDE6 = importlib.util.find_spec('PySide6') is not None
+
+import batch_render
+
+
+@unittest.skipUnless(HAS_PYSIDE6, "PySide6 not installed")
+class TestBatchRender(unittest.TestCase):
+    """Test job expansion and rendering a table without showing it"""
+
+    def test_job_matrix(self):
+        """Every layout is combined with every fill mapping"""
+        jobs = batch_render.build_jobs('out', ['quarks', 'subatomic'], size=(320, 200))
+        spec = batch_render.TABLE_SPECS['quarks']
+        quark_jobs = [j for j in jobs if j.table == 'quarks']
+        self.assertEqual(len(quark_jobs), len(spec.layouts()) * len(spec.mappings()))
+        self.assertEqual(len(set(j.output_path for j in jobs)), len(jobs))
+        self.assertTrue(all(j.mapping == 'default' for j in jobs if j.table == 'subatomic'))
+
+    def test_filters_and_unknown_table(self):
+        """Layout and mapping filters narrow the matrix"""
+        jobs = batch_render.build_jobs('out', ['atoms'], layouts=['table'], mappings=['density'])
+        self.assertEqual([(j.layout, j.mapping) for j in jobs], [('table', 'density')])
+        with self.assertRaises(KeyError):
+            batch_render.build_jobs('out', ['nonexistent'])
+
+    def test_render_job_offscreen(self):
+        """A job renders to a PNG of the requested size in-process"""
+        from PySide6.QtGui import QImage
+        with tempfile.TemporaryDirectory() as temp_dir:
+            job = batch_render.build_jobs(temp_dir, ['subatomic'], size=(320, 200))[0]
+            result = batch_render.render_job(job)
+            self.assertTrue(result['ok'], result['error'])
+            image = QImage(job.output_path)
+            self.assertEqual((image.width(), image.height()), (320, 200))
+
+
+if __name__ == '__main__':
+    unittest.main()
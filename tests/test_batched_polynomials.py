@@ -0,0 +1,46 @@
+"""
+Unit tests for batched Laguerre/Legendre evaluation
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pure_math import GeneralizedLaguerre, lpmv
+from utils.orbital_clouds import get_orbital_probability, get_orbital_probability_many
+
+
+class TestBatchedPolynomials(unittest.TestCase):
+    """Batched results must equal the per-point calls"""
+
+    def setUp(self):
+        """Set up shared evaluation points"""
+        self.xs = [-0.95, -0.4, 0.0, 0.3, 0.8, 1.0]
+
+    def test_laguerre_sequence(self):
+        """One sweep gives the same value at every point"""
+        points = [0.0, 0.5, 2.0, 9.0]
+        for n in (0, 1, 6):
+            L = GeneralizedLaguerre(n, 3.0)
+            self.assertEqual(L(points), [L(x) for x in points])
+
+    def test_lpmv_sequence(self):
+        """lpmv accepts a sequence of points, including negative orders"""
+        for m, l in ((0, 4), (1, 1), (2, 5), (-3, 4), (5, 3)):
+            self.assertEqual(lpmv(m, l, self.xs), [lpmv(m, l, x) for x in self.xs])
+
+    def test_orbital_probability_many(self):
+        """Batched orbital densities match point-by-point densities"""
+        radii = [0.2, 1.0, 4.0, 9.0]
+        thetas = [0.3, 1.0, 1.6, 2.8]
+        batch = get_orbital_probability_many(3, 2, -1, radii, thetas, Z=2)
+        single = [get_orbital_probability(3, 2, -1, r, t, 0, 2) for r, t in zip(radii, thetas)]
+        for a, b in zip(batch, single):
+            self.assertAlmostEqual(a, b, places=14)
+
+
+if __name__ == '__main__':
+    unittest.main()
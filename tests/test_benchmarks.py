@@ -0,0 +1,83 @@
+"""
+Unit tests for the benchmark runner statistics and baseline comparison
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.runner import (
+    Scenario, ScenarioSkipped, percentile, run_scenario, select_scenarios,
+    save_report, load_report, compare_reports
+)
+import benchmarks.scenarios  # noqa: F401
+
+
+def _report(**medians):
+    """Minimal report with the given scenario medians (seconds)"""
+    return {'results': {name: {'median_s': value, 'peak_memory_kb': 100.0}
+                        for name, value in medians.items()}}
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    """Test scenario statistics, selection, reports and regression detection"""
+
+    def test_percentile(self):
+        """Percentiles interpolate between sorted samples"""
+        values = [5.0, 1.0, 3.0, 2.0, 4.0]
+        self.assertEqual(percentile(values, 0.5), 3.0)
+        self.assertEqual(percentile(values, 1.0), 5.0)
+        self.assertAlmostEqual(percentile(values, 0.95), 4.8)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_run_scenario_counts_and_stats(self):
+        """Warm-up, timed and memory iterations all call the body"""
+        calls = []
+        bench = Scenario('test.append', lambda ctx: ctx.append([0] * 1000), setup=lambda: calls)
+        result = run_scenario(bench, warmup=2, repeat=4)
+        self.assertEqual(len(calls), 2 + 4 + 1)
+        self.assertEqual(len(result.times_s), 4)
+        self.assertLessEqual(result.min_s, result.median_s)
+        self.assertLessEqual(result.median_s, result.p95_s)
+        self.assertGreater(result.peak_memory_kb, 0)
+
+    def test_skipped_scenario(self):
+        """A setup raising ScenarioSkipped is reported, not run"""
+        def setup():
+            raise ScenarioSkipped("no display")
+        result = run_scenario(Scenario('test.skip', lambda ctx: self.fail("ran"), setup=setup))
+        self.assertEqual(result.skipped, "no display")
+
+    def test_select_by_prefix(self):
+        """Dotted prefixes select every scenario in an area"""
+        names = [s.name for s in select_scenarios(['atoms'])]
+        self.assertEqual(names, ['atoms.create_all_118'])
+        with self.assertRaises(KeyError):
+            select_scenarios(['no_such_area'])
+
+    def test_compare_flags_regressions(self):
+        """Slowdowns beyond the threshold and noise floor are regressions"""
+        baseline = _report(fast=0.100, tiny=0.0001, same=0.050)
+        current = _report(fast=0.130, tiny=0.0003, same=0.051)
+        current['results']['same']['peak_memory_kb'] = 200.0
+        by_name = {c.name: c for c in compare_reports(current, baseline, time_threshold=0.15)}
+        self.assertTrue(by_name['fast'].regression)
+        self.assertFalse(by_name['tiny'].regression)
+        self.assertTrue(by_name['same'].regression)
+        self.assertIn('peak memory', by_name['same'].reasons[0])
+
+    def test_report_round_trip(self):
+        """Reports survive a JSON round trip"""
+        report = _report(a=0.01)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'nested', 'report.json')
+            save_report(report, path)
+            self.assertEqual(load_report(path), report)
+
+
+if __name__ == '__main__':
+    unittest.main()
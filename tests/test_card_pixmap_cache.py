@@ -0,0 +1,90 @@
+"""
+Unit tests for the per-card pixmap LRU cache
+"""
+
+import unittest
+import sys
+import os
+import importlib.util
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HAS_PYSIDE6 = importlib.util.find_spec('PySide6') is not None
+
+
+@unittest.skipUnless(HAS_PYSIDE6, "PySide6 not installed")
+class TestCardPixmapCache(unittest.TestCase):
+    """Test hits, invalidation and the memory bound"""
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PySide6.QtGui import QGuiApplication
+        cls.app = QGuiApplication.instance() or QGuiApplication([])
+
+    def setUp(self):
+        from PySide6.QtGui import QImage, QPainter
+        from utils.card_pixmap_cache import CardPixmapCache
+        self.cache = CardPixmapCache()
+        self.image = QImage(400, 300, QImage.Format.Format_ARGB32_Premultiplied)
+        self.painter = QPainter(self.image)
+        self.renders = []
+
+    def tearDown(self):
+        self.painter.end()
+
+    def draw(self, item_id, state='', encoding=(), x=10, y=10):
+        render = lambda painter: self.renders.append(item_id) or painter.drawRect(x, y, 100, 120)
+        self.cache.draw_card(self.painter, 'test', item_id, encoding, state, x, y, 100, 120, render, pad=4)
+
+    def test_repeat_paints_blit(self):
+        """A card is rendered once and blitted afterwards, even when moved"""
+        self.draw('Proton')
+        self.draw('Proton', x=200)
+        self.assertEqual(self.renders, ['Proton'])
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_state_encoding_and_zoom_are_keyed(self):
+        """Hover state, encoding and raster scale each get their own pixmap"""
+        self.draw('Proton')
+        self.draw('Proton', state='hovered')
+        self.draw('Proton', encoding=('Density',))
+        self.painter.scale(2.0, 2.0)
+        self.draw('Proton')
+        self.assertEqual(len(self.renders), 4)
+
+    def test_invalidate_items(self):
+        """Invalidating an item only re-renders that item"""
+        self.draw('Proton')
+        self.draw('Neutron')
+        self.cache.invalidate('test', ['Proton'])
+        self.cache.invalidate('other')
+        self.draw('Proton')
+        self.draw('Neutron')
+        self.assertEqual(self.renders, ['Proton', 'Neutron', 'Proton'])
+
+    def test_memory_bound_evicts_least_recent(self):
+        """The byte budget evicts the least recently used card"""
+        self.draw('a')
+        one_card = self.cache.stats()['bytes']
+        self.cache.set_max_bytes(2 * one_card)
+        self.draw('b')
+        self.draw('a')
+        self.draw('c')
+        self.assertLessEqual(self.cache.stats()['bytes'], 2 * one_card)
+        self.draw('a')
+        self.draw('b')
+        self.assertEqual(self.renders, ['a', 'b', 'c', 'b'])
+
+    def test_raster_scale_buckets(self):
+        """Device scales snap to quarter-octave steps"""
+        from utils.card_pixmap_cache import raster_scale_bucket
+        self.assertEqual(raster_scale_bucket(1.0), 1.0)
+        self.assertEqual(raster_scale_bucket(1.05), 1.0)
+        self.assertEqual(raster_scale_bucket(2.0), 2.0)
+        self.assertEqual(raster_scale_bucket(100.0), 8.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
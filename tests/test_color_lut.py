@@ -0,0 +1,47 @@
+"""
+Unit tests for the precomputed color lookup tables
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.calculations import wavelength_to_rgb, wavelength_to_rgb_tuple, _spectrum_rgb
+from utils.color_lut import gradient_lut, spectrum_lut, GRADIENT_LUT_SIZE
+
+
+class TestColorLUT(unittest.TestCase):
+    """Test gradient and spectrum tables"""
+
+    def test_gradient_endpoints_and_alpha(self):
+        """Gradient tables span the endpoints with alpha baked in"""
+        lut = gradient_lut((0, 0, 0), (255, 100, 50), 200)
+        self.assertEqual(lut.size, GRADIENT_LUT_SIZE)
+        self.assertEqual(lut.color_at(0.0).getRgb(), (0, 0, 0, 200))
+        self.assertEqual(lut.color_at(1.0).getRgb(), (255, 100, 50, 200))
+        self.assertEqual(lut.color_at(-5.0).getRgb(), (0, 0, 0, 200))
+
+    def test_tables_are_cached(self):
+        """Tables are only built again when their parameters change"""
+        self.assertIs(gradient_lut((1, 2, 3), (4, 5, 6), 255), gradient_lut((1, 2, 3), (4, 5, 6), 255))
+        self.assertIsNot(gradient_lut((1, 2, 3), (4, 5, 6), 255), gradient_lut((1, 2, 3), (4, 5, 6), 128))
+        self.assertIs(spectrum_lut(255), spectrum_lut(255))
+
+    def test_spectrum_matches_direct_calculation(self):
+        """Table lookups stay within a few levels of the exact spectrum"""
+        for wavelength in range(380, 781, 5):
+            exact = _spectrum_rgb((wavelength - 380) / 400)
+            table = wavelength_to_rgb_tuple(wavelength)
+            for a, b in zip(exact, table):
+                self.assertLessEqual(abs(a - b), 4)
+
+    def test_wavelength_to_rgb_fade(self):
+        """Fade still maps to alpha"""
+        self.assertEqual(wavelength_to_rgb(550, fade=0.5).alpha(), 127)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Unit tests for the secondary indexes and query API in data.data_index
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.data_index import DataIndex, Equals, In, Matches, Between
+from data.molecule_loader import MoleculeDataLoader
+from data.alloy_loader import AlloyDataLoader
+
+
+class TestDataIndex(unittest.TestCase):
+    """Test index construction, queries and in-place maintenance"""
+
+    def setUp(self):
+        """Set up a small indexed catalog"""
+        self.items = [
+            {'Name': 'A', 'kind': 'x', 'value': 3.0},
+            {'Name': 'B', 'kind': 'y', 'value': 1.0},
+            {'Name': 'C', 'kind': 'x', 'value': 2.0},
+            {'Name': 'D', 'kind': 'z', 'value': None},
+        ]
+        self.index = DataIndex(self.items, categorical=['kind'], numeric=['value'])
+
+    def names(self, records):
+        return [r['Name'] for r in records]
+
+    def test_categorical_lookup(self):
+        """Hash lookups return records in catalog order"""
+        self.assertEqual(self.names(self.index.query(Equals('kind', 'x'))), ['A', 'C'])
+        self.assertEqual(self.names(self.index.query(In('kind', {'y', 'z'}))), ['B', 'D'])
+        self.assertEqual(self.names(self.index.query(Matches('kind', lambda v: v != 'x'))), ['B', 'D'])
+
+    def test_numeric_range(self):
+        """Range queries use the sorted column and skip missing values"""
+        self.assertEqual(self.names(self.index.query(Between('value', 1.5, 3.0))), ['A', 'C'])
+        self.assertEqual(self.names(self.index.query(Between('value', high=2.0, include_high=False))), ['B'])
+        self.assertEqual(self.index.value_range('value'), (1.0, 3.0))
+        self.assertEqual(self.index.value_range('value', exclusive_min=1.0), (2.0, 3.0))
+
+    def test_composition(self):
+        """Conditions intersect by default and combine with & and |"""
+        self.assertEqual(self.names(self.index.query(Equals('kind', 'x'), Between('value', 2.5))), ['A'])
+        either = Equals('kind', 'y') | Between('value', 2.5)
+        self.assertEqual(self.names(self.index.query(either)), ['A', 'B'])
+        self.assertEqual(self.index.query(Equals('kind', 'x') & Equals('kind', 'y')), [])
+
+    def test_maintenance(self):
+        """Add, update and remove keep every index consistent"""
+        self.index.add({'Name': 'E', 'kind': 'y', 'value': 0.5})
+        self.assertEqual(self.names(self.index.query(Equals('kind', 'y'))), ['B', 'E'])
+        self.assertEqual(self.index.value_range('value'), (0.5, 3.0))
+
+        self.index.update({'Name': 'A', 'kind': 'y', 'value': 10.0})
+        self.assertEqual(self.names(self.index.query(Equals('kind', 'x'))), ['C'])
+        self.assertEqual(self.names(self.index.query(Equals('kind', 'y'))), ['A', 'B', 'E'])
+        self.assertEqual(self.index.value_range('value'), (0.5, 10.0))
+
+        self.index.remove('E')
+        self.assertEqual(self.index.value_range('value'), (1.0, 10.0))
+        self.assertNotIn('E', self.names(self.index.query()))
+
+
+class TestLoaderIndexes(unittest.TestCase):
+    """Test that loader helpers agree with a plain scan"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.molecules = MoleculeDataLoader()
+        cls.molecules.load_all_molecules()
+        cls.alloys = AlloyDataLoader()
+        cls.alloys.load_all_alloys()
+
+    def test_molecule_filters_match_scan(self):
+        """Indexed molecule filters return the same records as a scan"""
+        for category in self.molecules.get_unique_categories():
+            expected = [m for m in self.molecules.molecules if m.get('category') == category]
+            self.assertEqual(self.molecules.get_molecules_by_category(category), expected)
+        for state in self.molecules.get_unique_states():
+            expected = [m for m in self.molecules.molecules if m.get('state') == state]
+            self.assertEqual(self.molecules.get_molecules_by_state(state), expected)
+
+    def test_alloy_filters_match_scan(self):
+        """Indexed alloy filters return the same records as a scan"""
+        expected = [a for a in self.alloys.alloys if a.get('category', '').lower() == 'steel']
+        self.assertEqual(self.alloys.get_alloys_by_category('STEEL'), expected)
+        values = [a['density'] for a in self.alloys.alloys if a['density'] > 0]
+        self.assertEqual(self.alloys.get_property_range('density'), (min(values), max(values)))
+
+    def test_upsert_and_remove_molecule(self):
+        """Single-molecule edits update the indexes without a reload"""
+        loader = MoleculeDataLoader()
+        loader.load_all_molecules()
+        original = dict(loader.molecules[0])
+        edited = dict(original, Category='Testing')
+
+        loader.upsert_molecule(edited)
+        self.assertIn('Testing', loader.get_unique_categories())
+        self.assertEqual(loader.get_molecules_by_category('Testing')[0]['Name'], original['Name'])
+
+        loader.remove_molecule(original['Name'])
+        self.assertNotIn('Testing', loader.get_unique_categories())
+        self.assertIsNone(loader.get_molecule_by_name(original['Name']))
+
+
+if __name__ == '__main__':
+    unittest.main()
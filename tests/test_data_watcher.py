@@ -0,0 +1,147 @@
+"""
+Unit tests for item-level change events, the data watcher and loader hot reload
+"""
+
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.data_manager import DataManager, DataCategory, DataChangeEvent
+from data.data_watcher import DataWatcher
+from data.molecule_loader import MoleculeDataLoader
+from data.subatomic_loader import SubatomicDataLoader
+
+DATA_DIR = Path(__file__).parent.parent / "data" / "active"
+
+
+class TestDataChangeEvent(unittest.TestCase):
+    """Test event bookkeeping"""
+
+    def test_merge(self):
+        """Later events fold into earlier ones without double counting"""
+        event = DataChangeEvent(DataCategory.MOLECULES, added={'A'}, modified={'B'})
+        event.merge(DataChangeEvent(DataCategory.MOLECULES, modified={'A', 'C'}, removed={'B'}))
+        self.assertEqual(event.added, {'A'})
+        self.assertEqual(event.modified, {'C'})
+        self.assertEqual(event.removed, {'B'})
+
+        event.merge(DataChangeEvent(DataCategory.MOLECULES, removed={'A'}))
+        self.assertNotIn('A', event.names)
+        self.assertFalse(event.is_empty())
+        self.assertTrue(DataChangeEvent(DataCategory.MOLECULES).is_empty())
+
+
+class TestDataWatcher(unittest.TestCase):
+    """Test change detection on a temporary data directory"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.manager = DataManager(base_dir=self.tmp)
+        self.active = self.manager.get_active_path(DataCategory.MOLECULES)
+        self.watcher = DataWatcher(self.manager, categories=[DataCategory.MOLECULES])
+        self.received = []
+        self.manager.register_item_change_callback(DataCategory.MOLECULES, self.received.append)
+
+    def tearDown(self):
+        self.watcher.stop()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def write(self, name, data):
+        with open(self.active / f"{name}.json", 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def test_external_changes_are_reported(self):
+        """Files added, rewritten and deleted on disk produce one event"""
+        self.write('Keep', {'Name': 'Keep'})
+        self.write('Gone', {'Name': 'Gone'})
+        self.watcher.poll()
+        self.received.clear()
+
+        self.write('Keep', {'Name': 'Keep', 'Formula': 'K2'})
+        os.remove(self.active / "Gone.json")
+        self.write('New', {'Name': 'New'})
+
+        events = self.watcher.poll()
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].added, {'New'})
+        self.assertEqual(events[0].modified, {'Keep'})
+        self.assertEqual(events[0].removed, {'Gone'})
+        self.assertEqual(self.received, events)
+        self.assertEqual(self.watcher.poll(), [])
+
+    def test_manager_writes_are_not_reported_twice(self):
+        """Edits made through the manager are announced once, by the manager"""
+        self.manager.add_item(DataCategory.MOLECULES, 'Water', {'Name': 'Water'})
+        self.assertEqual(len(self.received), 1)
+        self.assertEqual(self.received[0].added, {'Water'})
+        self.assertEqual(self.watcher.poll(), [])
+
+        self.manager.remove_item(DataCategory.MOLECULES, 'Water')
+        self.assertEqual(self.received[-1].removed, {'Water'})
+        self.assertEqual(self.watcher.poll(), [])
+
+
+class TestLoaderReloadItems(unittest.TestCase):
+    """Test that loaders re-read only the changed files"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def copy_dir(self, name):
+        target = Path(self.tmp) / name
+        shutil.copytree(DATA_DIR / name, target)
+        return target
+
+    def test_molecule_reload_items(self):
+        """Edited molecules are patched and deleted ones removed"""
+        directory = self.copy_dir('molecules')
+        loader = MoleculeDataLoader(str(directory))
+        loader.load_all_molecules()
+        count = len(loader.molecules)
+
+        with open(directory / "Water.json", encoding='utf-8') as f:
+            water = json.load(f)
+        water['Category'] = 'Testing'
+        with open(directory / "Water.json", 'w', encoding='utf-8') as f:
+            json.dump(water, f)
+        os.remove(directory / "Ammonia.json")
+
+        updated, removed = loader.reload_items(['Water', 'Ammonia'])
+        self.assertEqual([m['Name'] for m in updated], [water['Name']])
+        self.assertEqual(removed, ['Ammonia'])
+        self.assertEqual(len(loader.molecules), count - 1)
+        self.assertEqual(loader.get_molecules_by_category('Testing')[0]['Name'], water['Name'])
+        self.assertIsNone(loader.get_molecule_by_name('Ammonia'))
+
+    def test_subatomic_reload_items(self):
+        """Particle edits keep mass order and refresh the decay graph"""
+        directory = self.copy_dir('subatomic')
+        loader = SubatomicDataLoader(str(directory))
+        loader.load_all_particles()
+        lambda_file = loader.get_particle_by_name('Lambda')['_filename']
+
+        os.remove(directory / f"{lambda_file}.json")
+        updated, removed = loader.reload_items([lambda_file])
+        self.assertEqual((updated, removed), ([], ['Lambda']))
+        self.assertNotIn('Lambda', loader.decay_graph.edges)
+
+        shutil.copy(DATA_DIR / 'subatomic' / f"{lambda_file}.json", directory)
+        updated, removed = loader.reload_items([lambda_file])
+        self.assertEqual([p['Name'] for p in updated], ['Lambda'])
+        masses = [p.get('Mass_MeVc2', 0) for p in loader.particles]
+        self.assertEqual(masses, sorted(masses))
+        self.assertIn(['Lambda', 'Neutron', 'Proton'], loader.get_decay_chain('Lambda', 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Unit tests for the precomputed decay graph in SubatomicDataLoader
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.subatomic_loader import DecayGraph, SubatomicDataLoader
+
+
+class TestDecayGraph(unittest.TestCase):
+    """Test decay graph construction, cycle handling and chain enumeration"""
+
+    def setUp(self):
+        """Set up a small synthetic catalog"""
+        self.particles = [
+            {'Name': 'Heavy', 'DecayProducts': ['Middle', 'Light', 'Middle']},
+            {'Name': 'Middle', 'DecayProducts': ['Light', 'Photon']},
+            {'Name': 'Light', 'DecayProducts': []},
+        ]
+        self.graph = DecayGraph(self.particles)
+
+    def test_duplicate_and_unknown_products(self):
+        """Duplicates collapse and unknown products stay out of the DAG"""
+        self.assertEqual(self.graph.get_products('Heavy'), ('Middle', 'Light'))
+        self.assertEqual(self.graph.get_products('Middle'), ('Light',))
+        self.assertEqual(self.graph.unknown_products['Middle'], ('Photon',))
+
+    def test_topological_order(self):
+        """Parents come before their decay products"""
+        order = self.graph.topological_order
+        self.assertLess(order.index('Heavy'), order.index('Middle'))
+        self.assertLess(order.index('Middle'), order.index('Light'))
+
+    def test_terminal_products(self):
+        """Terminal products are the catalog leaves reachable from a particle"""
+        self.assertEqual(self.graph.get_terminal_products('Heavy'), frozenset({'Light'}))
+        self.assertEqual(self.graph.get_terminal_products('Light'), frozenset({'Light'}))
+        self.assertEqual(self.graph.get_terminal_products('Missing'), frozenset())
+
+    def test_chains(self):
+        """Chains follow the DAG and honour the depth cap"""
+        chains = list(self.graph.iter_decay_chains('Heavy', 5))
+        self.assertEqual(chains, [['Heavy', 'Middle', 'Light'], ['Heavy', 'Light']])
+
+        capped = list(self.graph.iter_decay_chains('Heavy', 0))
+        self.assertEqual(capped, [['Heavy', 'Middle'], ['Heavy', 'Light']])
+
+    def test_cycle_detection(self):
+        """Cyclic data is detected and chains terminate without the depth cap"""
+        graph = DecayGraph([
+            {'Name': 'A', 'DecayProducts': ['B']},
+            {'Name': 'B', 'DecayProducts': ['A', 'C']},
+            {'Name': 'C'},
+        ])
+        self.assertTrue(graph.has_cycles)
+        self.assertEqual(graph.cycle_edges, {('B', 'A')})
+
+        chains = list(graph.iter_decay_chains('A', 1000))
+        self.assertIn(['A', 'B', 'C'], chains)
+        self.assertIn(['A', 'B', 'A'], chains)
+        self.assertEqual(graph.get_terminal_products('A'), frozenset({'C'}))
+        self.assertTrue(graph.decays_to('A', 'C'))
+        self.assertFalse(graph.decays_to('C', 'A'))
+
+
+class TestLoaderDecayChains(unittest.TestCase):
+    """Test decay chain access through the loader on the shipped data"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.loader = SubatomicDataLoader()
+        cls.loader.load_all_particles()
+
+    def test_graph_built_at_load(self):
+        """The graph covers every loaded particle"""
+        self.assertEqual(set(self.loader.decay_graph.edges),
+                         {p['Name'] for p in self.loader.get_all_particles()})
+
+    def test_lambda_chain(self):
+        """Lambda decays through Neutron to Proton"""
+        chains = self.loader.get_decay_chain('Lambda', 3)
+        self.assertIn(['Lambda', 'Neutron', 'Proton'], chains)
+        self.assertEqual(self.loader.get_decay_chain('NotAParticle'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
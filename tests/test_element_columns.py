@@ -0,0 +1,66 @@
+"""
+Unit tests for the columnar element store used by UnifiedTable
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.element_columns import ElementColumns
+
+
+class TestElementColumns(unittest.TestCase):
+    """Test column construction, filter masks and indexed reads"""
+
+    def setUp(self):
+        """Set up three element records in row order"""
+        self.records = [
+            {'z': 1, 'symbol': 'H', 'ie': 13.6, 'melting_point': 14, 'wavelength_nm': 121.6,
+             'isotopes': [(1, 99.98), (2, 0.02)]},
+            {'z': 2, 'symbol': 'He', 'ie': 24.6, 'melting_point': 1, 'wavelength_nm': 58.4,
+             'isotopes': []},
+            {'z': 3, 'symbol': 'Li', 'ie': 5.4, 'melting_point': 453, 'wavelength_nm': 670.8,
+             'isotopes': [(7, 92.4), (6, 7.6)]},
+        ]
+        self.columns = ElementColumns(self.records)
+
+    def test_columns_and_ranges(self):
+        """Numeric properties become typed columns with precomputed ranges"""
+        self.assertEqual(list(self.columns.property_column('ionization')), [13.6, 24.6, 5.4])
+        self.assertEqual(self.columns.property_range('melting'), (1.0, 453.0))
+        self.assertEqual(self.columns.value('melting', 2), 453.0)
+        self.assertEqual(self.columns.value('block', 0), 0.0)
+        self.assertEqual(self.columns.row({'z': 3}), 2)
+        self.assertIsNone(self.columns.row({'z': 99}))
+
+    def test_filter_mask(self):
+        """Only active filters apply, and wavelength filters use the primary emission line"""
+        filters = {
+            'ionization': {'min': 5.0, 'max': 20.0, 'active': True},
+            'spectrum': {'min': 100, 'max': 1000, 'active': True},
+            'melting': {'min': 0, 'max': 1, 'active': False},
+        }
+        self.assertEqual(list(self.columns.filter_mask(filters)), [1, 0, 1])
+        filters['melting']['active'] = True
+        self.assertEqual(list(self.columns.filter_mask(filters)), [0, 0, 0])
+
+    def test_isotope_offset_mask(self):
+        """The neutron offset check matches elements that have such an isotope"""
+        self.assertEqual(list(self.columns.filter_mask({}, neutron_offset=1)), [0, 0, 1])
+        self.assertEqual(list(self.columns.filter_mask({}, neutron_offset=-1)), [1, 0, 0])
+
+    def test_filter_signature(self):
+        """Signatures ignore inactive and unknown filters"""
+        filters = {
+            'melting': {'min': 0, 'max': 10, 'active': True},
+            'block': {'min': 0, 'max': 1, 'active': True},
+            'density': {'min': 0, 'max': 1, 'active': False},
+        }
+        self.assertEqual(ElementColumns.filter_signature(filters), (('melting', 0, 10),))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Unit tests for the table-driven factorial helpers in pure_math
+"""
+
+import unittest
+import sys
+import os
+import math
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pure_math import (
+    factorial, factorial_float, log_factorial, factorial_ratio, lpmv,
+    FACTORIAL_TABLE_MAX
+)
+from utils.orbital_clouds import _radial_normalization
+
+
+class TestFactorialTables(unittest.TestCase):
+    """Test float factorials, log factorials and ratios"""
+
+    def test_table_matches_exact_factorial(self):
+        """Float and log tables agree with the exact integer factorial"""
+        for n in (0, 1, 5, 20, 100, FACTORIAL_TABLE_MAX):
+            self.assertEqual(factorial_float(n), float(factorial(n)))
+            self.assertAlmostEqual(log_factorial(n), math.log(factorial(n)), places=9)
+        self.assertEqual(factorial_float(FACTORIAL_TABLE_MAX + 1), math.inf)
+        self.assertAlmostEqual(log_factorial(200), math.lgamma(201), places=9)
+        with self.assertRaises(ValueError):
+            log_factorial(-1)
+
+    def test_factorial_ratio(self):
+        """Ratios are exact inside the table and finite beyond it"""
+        self.assertEqual(factorial_ratio(5, 3), 20.0)
+        self.assertAlmostEqual(factorial_ratio(2, 4), 1.0 / 12.0)
+        self.assertEqual(factorial_ratio(200, 198), 200.0 * 199.0)
+        self.assertAlmostEqual(factorial_ratio(400, 300) / math.exp(math.lgamma(401) - math.lgamma(301)), 1.0)
+
+    def test_lpmv_negative_m(self):
+        """Negative orders use (l-m)!/(l+m)! from the table"""
+        ratio = factorial(2) / factorial(8)
+        self.assertAlmostEqual(lpmv(-3, 5, 0.3), -ratio * lpmv(3, 5, 0.3))
+
+    def test_radial_normalization(self):
+        """Log-space normalization matches the direct formula and survives high n"""
+        for n, l in ((1, 0), (3, 2), (6, 1)):
+            direct = math.sqrt((2.0 * 2 / n)**3 * factorial(n - l - 1) /
+                               (2.0 * n * factorial(n + l)**3))
+            self.assertAlmostEqual(_radial_normalization(n, l, 2) / direct, 1.0, places=12)
+        high = _radial_normalization(80, 79, 1)
+        self.assertTrue(0.0 <= high < math.inf)
+
+
+if __name__ == '__main__':
+    unittest.main()
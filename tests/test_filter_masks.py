@@ -0,0 +1,84 @@
+"""
+Unit tests for the per-filter bitset masks used by the particle tables
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.filter_masks import FilterMasks, build_mask
+
+
+PARTICLES = [
+    {'Name': 'Proton', 'baryon': True, 'Charge_e': 1, 'Stability': 'Stable'},
+    {'Name': 'Pion+', 'baryon': False, 'Charge_e': 1, 'Stability': 'Unstable'},
+    {'Name': 'Neutron', 'baryon': True, 'Charge_e': 0, 'Stability': 'Unstable'},
+    {'Name': 'Kaon0', 'baryon': False, 'Charge_e': 0, 'Stability': 'Unstable'},
+]
+
+
+class TestFilterMasks(unittest.TestCase):
+    """Test mask combination, caching and diffs"""
+
+    def setUp(self):
+        self.calls = []
+        self.masks = FilterMasks(PARTICLES)
+
+    def counted(self, predicate):
+        return lambda p: self.calls.append(p['Name']) or predicate(p)
+
+    def names(self, items):
+        return [p['Name'] for p in items]
+
+    def test_build_mask_bit_order(self):
+        """Bit i corresponds to item i"""
+        self.assertEqual(build_mask(PARTICLES, lambda p: p['baryon']), 0b0101)
+        self.assertEqual(build_mask([], lambda p: True), 0)
+
+    def test_filters_combine_with_and(self):
+        """The selection passes every filter and keeps display order"""
+        self.assertEqual(self.names(self.masks.selected()), ['Proton', 'Pion+', 'Neutron', 'Kaon0'])
+        self.masks.set_filter('baryons', True, lambda p: p['baryon'])
+        self.masks.set_filter('charge', 0, lambda p: p['Charge_e'] == 0)
+        self.assertEqual(self.names(self.masks.selected()), ['Neutron'])
+        self.masks.set_filter('charge', None, None)
+        self.assertEqual(self.names(self.masks.selected()), ['Proton', 'Neutron'])
+
+    def test_toggle_reuses_cached_masks(self):
+        """Each (filter, setting) is evaluated once; other filters are untouched"""
+        self.masks.set_filter('stable', True, self.counted(lambda p: p['Stability'] == 'Stable'))
+        self.masks.set_filter('charged', True, self.counted(lambda p: p['Charge_e'] != 0))
+        self.assertEqual(self.names(self.masks.selected()), ['Proton'])
+        self.assertEqual(len(self.calls), 8)
+
+        self.assertTrue(self.masks.set_filter('stable', False, self.counted(lambda p: True)))
+        self.assertEqual(self.names(self.masks.selected()), ['Proton', 'Pion+'])
+        self.assertEqual(len(self.calls), 12)
+
+        self.assertTrue(self.masks.set_filter('stable', True, self.counted(lambda p: p['Stability'] == 'Stable')))
+        self.assertFalse(self.masks.set_filter('charged', True, self.counted(lambda p: p['Charge_e'] != 0)))
+        self.assertEqual(self.names(self.masks.selected()), ['Proton'])
+        self.assertEqual(len(self.calls), 12)
+
+    def test_diff(self):
+        """Added and removed items between two masks"""
+        before = self.masks.mask
+        self.masks.set_filter('baryons', True, lambda p: p['baryon'])
+        added, removed = self.masks.diff(before)
+        self.assertEqual(added, [])
+        self.assertEqual(self.names(removed), ['Pion+', 'Kaon0'])
+        added, removed = self.masks.diff(self.masks.mask, before)
+        self.assertEqual(self.names(added), ['Pion+', 'Kaon0'])
+
+    def test_set_items_rebuilds(self):
+        """Replacing the items re-evaluates the active filters"""
+        self.masks.set_filter('baryons', True, lambda p: p['baryon'])
+        self.masks.set_items(PARTICLES[2:])
+        self.assertEqual(self.names(self.masks.selected()), ['Neutron'])
+
+
+if __name__ == '__main__':
+    unittest.main()
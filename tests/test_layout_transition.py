@@ -0,0 +1,118 @@
+"""
+Unit tests for layout transition interpolation and background layout prefetching
+"""
+
+import unittest
+import sys
+import os
+import threading
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.layout_transition import LayoutTransition, LayoutPrefetcher, ease_in_out_cubic
+
+
+def linear(t):
+    return t
+
+
+class TestLayoutTransition(unittest.TestCase):
+    """Test interpolation, entering/leaving items and timing"""
+
+    def setUp(self):
+        source = {'Proton': (0.0, 0.0), 'Pion+': (100.0, 50.0), 'Kaon0': (10.0, 10.0)}
+        target = {'Proton': (200.0, 100.0), 'Pion+': (100.0, 50.0), 'Neutron': (40.0, 60.0)}
+        self.transition = LayoutTransition(source, target, duration=1.0, easing=linear,
+                                           clock=lambda: 0.0).start(0.0)
+
+    def values_at(self, now):
+        values, opacities = self.transition.frame(now)
+        keys = self.transition.keys
+        return ({key: tuple(values[2 * i:2 * i + 2]) for i, key in enumerate(keys)},
+                {key: opacities[i] for i, key in enumerate(keys)})
+
+    def test_keys_and_moving(self):
+        """Target items come first, then items that only leave"""
+        self.assertEqual(self.transition.keys, ['Proton', 'Pion+', 'Neutron', 'Kaon0'])
+        self.assertEqual(self.transition.channels, 2)
+        self.assertEqual(self.transition.moving, 3)
+
+    def test_endpoints_and_midpoint(self):
+        """Values run from the source to the target layout"""
+        start, _ = self.values_at(0.0)
+        middle, _ = self.values_at(0.5)
+        end, _ = self.values_at(1.0)
+        self.assertEqual(start['Proton'], (0.0, 0.0))
+        self.assertEqual(middle['Proton'], (100.0, 50.0))
+        self.assertEqual(end['Proton'], (200.0, 100.0))
+        self.assertEqual(middle['Pion+'], (100.0, 50.0))
+
+    def test_entering_and_leaving_fade(self):
+        """New items fade in at their target, removed items fade out in place"""
+        positions, opacities = self.values_at(0.25)
+        self.assertEqual(positions['Neutron'], (40.0, 60.0))
+        self.assertEqual(positions['Kaon0'], (10.0, 10.0))
+        self.assertAlmostEqual(opacities['Neutron'], 0.25)
+        self.assertAlmostEqual(opacities['Kaon0'], 0.75)
+        self.assertEqual(opacities['Proton'], 1.0)
+
+    def test_timing(self):
+        """Progress is clamped and the transition finishes after its duration"""
+        self.assertFalse(self.transition.is_finished(0.5))
+        self.assertTrue(self.transition.is_finished(1.0))
+        self.assertEqual(self.transition.progress(5.0), 1.0)
+        unstarted = LayoutTransition({'a': (0.0,)}, {'a': (1.0,)})
+        self.assertEqual(unstarted.progress(), 0.0)
+        self.assertFalse(unstarted.is_finished())
+
+    def test_identical_layouts_do_not_move(self):
+        """Nothing moves when source and target agree"""
+        layout = {'a': (1.0, 2.0, 3.0)}
+        self.assertEqual(LayoutTransition(layout, dict(layout)).moving, 0)
+
+    def test_easing_endpoints(self):
+        """The default easing is symmetric and fixes its endpoints"""
+        self.assertEqual(ease_in_out_cubic(0.0), 0.0)
+        self.assertEqual(ease_in_out_cubic(0.5), 0.5)
+        self.assertEqual(ease_in_out_cubic(1.0), 1.0)
+
+
+class TestLayoutPrefetcher(unittest.TestCase):
+    """Test background computation, take and discard"""
+
+    def setUp(self):
+        self.prefetcher = LayoutPrefetcher(max_entries=2)
+
+    def test_take_returns_computed_layout_once(self):
+        """A prefetched layout is computed off the calling thread and taken once"""
+        threads = []
+        self.prefetcher.prefetch(('test', 'grid'), lambda: threads.append(threading.get_ident()) or 'layout')
+        self.assertEqual(self.prefetcher.take(('test', 'grid')), 'layout')
+        self.assertNotEqual(threads, [threading.get_ident()])
+        self.assertIsNone(self.prefetcher.take(('test', 'grid')))
+
+    def test_duplicate_prefetch_is_ignored(self):
+        """Hovering the same selector again does not recompute"""
+        calls = []
+        self.prefetcher.prefetch(('test', 'grid'), lambda: calls.append(1))
+        self.prefetcher.prefetch(('test', 'grid'), lambda: calls.append(2))
+        self.prefetcher.take(('test', 'grid'))
+        self.assertEqual(calls, [1])
+
+    def test_discard_namespace(self):
+        """Discarding a table's layouts leaves other tables alone"""
+        self.prefetcher.prefetch(('test', 'grid'), lambda: 'a')
+        self.prefetcher.prefetch(('other', 'grid'), lambda: 'b')
+        self.prefetcher.discard('test')
+        self.assertIsNone(self.prefetcher.take(('test', 'grid')))
+        self.assertEqual(self.prefetcher.take(('other', 'grid')), 'b')
+
+    def test_failed_prefetch_returns_none(self):
+        """A failing computation falls back to computing on demand"""
+        self.prefetcher.prefetch(('test', 'bad'), lambda: 1 / 0)
+        self.assertIsNone(self.prefetcher.take(('test', 'bad')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Unit tests for the packed, catalog-wide molecular descriptor engine
+"""
+
+import unittest
+import sys
+import os
+import math
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.molecular_descriptors import (
+    PackedMolecules, compute_descriptors, distance_statistics, partial_charges,
+    apply_descriptors, principal_moments
+)
+from utils.physics_calculator_v2 import MoleculeCalculatorV2
+
+
+WATER = (['O', 'H', 'H'], [(0.0, 0.0, 0.1173), (0.0, 0.7572, -0.4692), (0.0, -0.7572, -0.4692)],
+         [{'from': 0, 'to': 1}, {'from': 0, 'to': 2}])
+METHANE = (['C', 'H', 'H', 'H', 'H'],
+           [(0.0, 0.0, 0.0), (0.629, 0.629, 0.629), (-0.629, -0.629, 0.629),
+            (-0.629, 0.629, -0.629), (0.629, -0.629, -0.629)],
+           [{'from': 0, 'to': i} for i in range(1, 5)])
+HYDROGEN_CHLORIDE = (['H', 'Cl'], [(0.0, 0.0, 0.0), (1.2746, 0.0, 0.0)], [{'from': 0, 'to': 1}])
+
+
+def pack(*molecules):
+    packed = PackedMolecules()
+    for k, (elements, coordinates, bonds) in enumerate(molecules):
+        packed.add(str(k), elements, coordinates, bonds)
+    return packed
+
+
+class TestMolecularDescriptors(unittest.TestCase):
+    """Test inertia, distances, dipoles and batching"""
+
+    def test_principal_moments(self):
+        """Moments alone match the full descriptors and come out ascending"""
+        packed = pack(WATER, METHANE, HYDROGEN_CHLORIDE)
+        for moments, descriptors in zip(principal_moments(packed), compute_descriptors(packed)):
+            self.assertEqual(list(moments), sorted(moments))
+            for moment, expected in zip(moments, descriptors['principal_moments']):
+                self.assertAlmostEqual(moment, expected, places=9)
+        self.assertAlmostEqual(principal_moments(pack(HYDROGEN_CHLORIDE))[0][0], 0.0, places=9)
+
+    def test_rotational_constants(self):
+        """Methane is a spherical top; HCl is linear with B near 10.6 cm^-1"""
+        methane, hcl = compute_descriptors(pack(METHANE, HYDROGEN_CHLORIDE))
+        a, b, c = methane['rotational_constants_cm-1']
+        self.assertAlmostEqual(a, c, places=6)
+        self.assertAlmostEqual(b, 5.24, delta=0.1)
+        self.assertAlmostEqual(methane['anisotropy'], 0.0, places=6)
+        self.assertEqual(hcl['rotational_constants_cm-1'][0], 0.0)
+        self.assertAlmostEqual(hcl['rotational_constants_cm-1'][1], 10.6, delta=0.2)
+        self.assertAlmostEqual(hcl['anisotropy'], 1.0, places=6)
+
+    def test_distance_statistics_match_brute_force(self):
+        """Per-molecule mean, min and max over all atom pairs"""
+        _, coordinates, _ = METHANE
+        distances = [math.dist(p, q) for i, p in enumerate(coordinates) for q in coordinates[i + 1:]]
+        stats = distance_statistics(pack(WATER, METHANE))[1]
+        self.assertAlmostEqual(stats[0], sum(distances) / len(distances))
+        self.assertAlmostEqual(stats[1], min(distances))
+        self.assertAlmostEqual(stats[2], max(distances))
+        self.assertEqual(stats[3], 10)
+
+    def test_dipoles(self):
+        """Charges are neutral; symmetric molecules cancel, HCl points from Cl to H"""
+        charges = partial_charges(WATER[0], WATER[2])
+        self.assertAlmostEqual(sum(charges), 0.0)
+        self.assertLess(charges[0], 0.0)
+        water, methane, hcl = compute_descriptors(pack(WATER, METHANE, HYDROGEN_CHLORIDE))
+        self.assertGreater(water['dipole_D'], 1.0)
+        self.assertAlmostEqual(methane['dipole_D'], 0.0, places=6)
+        self.assertAlmostEqual(hcl['dipole_D'], 1.08, delta=0.1)
+        self.assertLess(hcl['dipole_vector_D'][0], 0.0)
+
+    def test_batch_matches_single(self):
+        """Packing order and neighbors do not change a molecule's descriptors"""
+        batch = compute_descriptors(pack(WATER, METHANE, HYDROGEN_CHLORIDE))
+        single = compute_descriptors(pack(METHANE))[0]
+        for key in ('mass_amu', 'dipole_D', 'polarizability_A3', 'mean_distance'):
+            self.assertAlmostEqual(batch[1][key], single[key], places=9)
+        for moment, expected in zip(batch[1]['principal_moments'], single['principal_moments']):
+            self.assertAlmostEqual(moment, expected, places=9)
+
+    def test_empty_and_single_atom(self):
+        """Molecules without pairs get zero statistics"""
+        self.assertEqual(compute_descriptors(PackedMolecules()), [])
+        atom = compute_descriptors(pack((['He'], [(1.0, 2.0, 3.0)], [])))[0]
+        self.assertEqual(atom['pair_count'], 0)
+        self.assertEqual(atom['rotational_constants_cm-1'], (0.0, 0.0, 0.0))
+        self.assertEqual(atom['center_of_mass'], (1.0, 2.0, 3.0))
+
+    def test_apply_descriptors_fills_missing_values(self):
+        """Measured dipoles are kept; records without one get the computed value"""
+        elements, coordinates, bonds = HYDROGEN_CHLORIDE
+        atoms = [{'element': e, 'x': x, 'y': y, 'z': z} for e, (x, y, z) in zip(elements, coordinates)]
+        measured = {'Name': 'HCl', 'Atoms3D': atoms, 'Bonds3D': bonds, 'DipoleMoment_D': 1.08, 'dipole_moment': 1.08}
+        missing = {'Name': 'HCl?', 'Atoms3D': atoms, 'Bonds3D': bonds, 'dipole_moment': 0}
+        apply_descriptors([measured, missing])
+        self.assertEqual(measured['dipole_moment'], 1.08)
+        self.assertAlmostEqual(missing['dipole_moment'], 1.08, delta=0.1)
+        self.assertIn('principal_moments', missing['descriptors'])
+        self.assertGreater(missing['polarizability'], 0.0)
+
+    def test_generated_molecule_rotor(self):
+        """Generated water is an asymmetric top; CO2 is linear with its inertia about the centre of mass"""
+        oxygen = {'symbol': 'O', 'atomic_number': 8, 'atomic_mass': 15.999, 'electronegativity': 3.44,
+                  'valence_electrons': 6, 'atomic_radius': 60}
+        hydrogen = {'symbol': 'H', 'atomic_number': 1, 'atomic_mass': 1.008, 'electronegativity': 2.2,
+                    'valence_electrons': 1, 'atomic_radius': 25}
+        carbon = {'symbol': 'C', 'atomic_number': 6, 'atomic_mass': 12.011, 'electronegativity': 2.55,
+                  'valence_electrons': 4, 'atomic_radius': 70}
+        water = MoleculeCalculatorV2.create_molecule_from_atoms([oxygen, hydrogen], [1, 2], 'Water')
+        rotation = water['SimulationData']['RotationalConstants']
+        self.assertEqual(rotation['rotor_type'], 'asymmetric')
+        self.assertGreater(rotation['A_cm-1'], rotation['B_cm-1'])
+        self.assertGreater(rotation['B_cm-1'], rotation['C_cm-1'])
+
+        co2 = MoleculeCalculatorV2.create_molecule_from_atoms([carbon, oxygen], [1, 2], 'Carbon Dioxide')
+        rotation = co2['SimulationData']['RotationalConstants']
+        self.assertEqual(rotation['rotor_type'], 'linear')
+        self.assertEqual(rotation['A_cm-1'], 0.0)
+        inertia = co2['SimulationData']['MomentOfInertia']
+        self.assertAlmostEqual(inertia['principal_moments_amu_angstrom2'][0], 0.0, places=6)
+        for value in inertia['center_of_mass_angstrom']:
+            self.assertAlmostEqual(value, 0.0, places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Unit tests for the cached molecule card layer under structure rotation
+"""
+
+import unittest
+import sys
+import os
+import importlib.util
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HAS_PYSIDE6 = importlib.util.find_spec('PySide6') is not None
+
+
+@unittest.skipUnless(HAS_PYSIDE6, "PySide6 not installed")
+class TestMoleculeCardCache(unittest.TestCase):
+    """Test that rotating the structures only re-projects them"""
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PySide6.QtWidgets import QApplication
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from core.molecule_unified_table import MoleculeUnifiedTable
+        from utils.card_pixmap_cache import get_card_pixmap_cache
+        self.cache = get_card_pixmap_cache()
+        self.cache.clear()
+        self.table = MoleculeUnifiedTable()
+        self.table.resize(1200, 800)
+        self.table._update_layout()
+
+    def test_rotation_reuses_card_pixmaps(self):
+        """A rotation-only change blits every visible card and renders none"""
+        self.table.grab()
+        visible = len(self.table.get_visible_molecules())
+        self.assertGreater(visible, 0)
+        before = self.cache.stats()
+
+        self.table.set_rotation(30.0, 45.0, 10.0)
+        self.assertEqual(self.table._projected_structures, {})
+        self.table.grab()
+        after = self.cache.stats()
+        self.assertEqual(after['misses'], before['misses'])
+        self.assertEqual(after['entries'], before['entries'])
+        self.assertGreaterEqual(after['hits'] - before['hits'], visible)
+        self.assertGreaterEqual(len(self.table._projected_structures), visible)
+
+    def test_data_change_still_invalidates(self):
+        """Cards of changed molecules are rendered again"""
+        self.table.grab()
+        before = self.cache.stats()['entries']
+        self.table._invalidate_cards()
+        self.assertEqual(self.cache.stats()['entries'], 0)
+        self.assertGreater(before, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Unit tests for batched molecule structure projection
+"""
+
+import unittest
+import sys
+import os
+import math
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pure_array import Vec3, matrix_vector_multiply_3x3
+from utils.molecule_projection import project_structures, structure_rotation_matrix
+
+
+WATER = [
+    {'element': 'O', 'x': 0.0, 'y': 0.0, 'z': 0.0, 'radius': 14},
+    {'element': 'H', 'x': 20.0, 'y': 10.0, 'z': 5.0, 'radius': 8},
+    {'element': 'H', 'x': -20.0, 'y': 10.0, 'z': -5.0, 'radius': 8},
+]
+
+
+class TestMoleculeProjection(unittest.TestCase):
+    """Test the rotation convention, batching and depth sorting"""
+
+    def test_rotation_order(self):
+        """Pitch about X, then yaw about Y, then roll about Z"""
+        pitch, yaw, roll = 30.0, -45.0, 60.0
+        point = Vec3(1.0, 2.0, 3.0)
+        expected = (point.rotate_x(math.radians(pitch))
+                    .rotate_y(math.radians(yaw))
+                    .rotate_z(math.radians(roll)))
+        rotated = matrix_vector_multiply_3x3(structure_rotation_matrix(pitch, yaw, roll), point.to_tuple())
+        for actual, wanted in zip(rotated, expected.to_tuple()):
+            self.assertAlmostEqual(actual, wanted)
+
+    def test_batch_matches_single(self):
+        """Projecting structures together equals projecting them one by one"""
+        other = [{'element': 'C', 'x': 5.0, 'y': -5.0, 'z': 12.0, 'radius': 14}]
+        batch = project_structures([(WATER, 40, 100, 50), (other, 30, 0, 0)], 20, 35, -10)
+        single = [project_structures([(WATER, 40, 100, 50)], 20, 35, -10)[0],
+                  project_structures([(other, 30, 0, 0)], 20, 35, -10)[0]]
+        self.assertEqual(batch, single)
+
+    def test_depth_sorted_and_centered(self):
+        """Draw lists run far to near and are offset by the structure center"""
+        atoms = project_structures([(WATER, 40, 100, 50)], 0, 0, 0)[0]
+        self.assertEqual([a['z'] for a in atoms], [-5.0, 0.0, 5.0])
+        self.assertEqual((atoms[1]['x'], atoms[1]['y']), (100.0, 50.0))
+
+    def test_perspective_scale_is_clamped(self):
+        """Atom radii follow depth within the clamp"""
+        deep = [{'element': 'C', 'x': 0.0, 'y': 0.0, 'z': 1000.0, 'radius': 10}]
+        atom = project_structures([(deep, 10, 0, 0)], 0, 0, 0, min_scale=0.6, max_scale=1.4)[0][0]
+        self.assertAlmostEqual(atom['radius'], 14.0)
+        self.assertAlmostEqual(atom['depth_scale'], 26.0)
+
+    def test_empty(self):
+        """Structures without atoms project to empty draw lists"""
+        self.assertEqual(project_structures([([], 10, 0, 0)], 10, 20, 30), [[]])
+        self.assertEqual(project_structures([], 10, 20, 30), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+Unit tests for the molecule formula and substructure search index
+"""
+
+import unittest
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.data_index import DataIndex, Equals
+from data.molecule_search import (
+    MoleculeSearchIndex, MoleculeSearch, parse_formula, hill_formula, parse_formula_pattern,
+    parse_fragment, has_substructure, MoleculeGraph
+)
+
+
+def record(name, composition, bonds, category='Organic'):
+    """Molecule record with a Composition and a Bonds3D list over the expanded atoms"""
+    return {
+        'Name': name,
+        'Formula': hill_formula(dict(composition)),
+        'category': category,
+        'Composition': [{'Element': e, 'Count': n} for e, n in composition],
+        'Bonds3D': [{'from': i, 'to': j, 'type': t} for i, j, t in bonds],
+    }
+
+
+# Atoms: C C O O H H H H
+ACETIC_ACID = record('Acetic Acid', [('C', 2), ('O', 2), ('H', 4)], [
+    (0, 1, 'single'), (1, 2, 'double'), (1, 3, 'single'), (3, 7, 'single'),
+    (0, 4, 'single'), (0, 5, 'single'), (0, 6, 'single')])
+# Atoms: C C O H H H H H H
+ETHANOL = record('Ethanol', [('C', 2), ('O', 1), ('H', 6)], [
+    (0, 1, 'single'), (1, 2, 'single'), (2, 8, 'single'),
+    (0, 3, 'single'), (0, 4, 'single'), (0, 5, 'single'), (1, 6, 'single'), (1, 7, 'single')])
+BENZENE = record('Benzene', [('C', 6), ('H', 6)],
+                 [(i, (i + 1) % 6, 'aromatic') for i in range(6)] + [(i, i + 6, 'single') for i in range(6)])
+WATER = record('Water', [('H', 2), ('O', 1)], [(2, 0, 'single'), (2, 1, 'single')], category='Inorganic')
+CARBON_DIOXIDE = record('Carbon Dioxide', [('C', 1), ('O', 2)], [(0, 1, 'double'), (0, 2, 'double')],
+                        category='Inorganic')
+CATALOG = [ACETIC_ACID, BENZENE, CARBON_DIOXIDE, ETHANOL, WATER]
+
+
+class TestFormulas(unittest.TestCase):
+    """Test formula parsing, Hill order and patterns"""
+
+    def test_parse_and_hill_order(self):
+        """Groups, subscripts and element order all canonicalize"""
+        self.assertEqual(parse_formula('Ca(OH)2'), {'Ca': 1, 'O': 2, 'H': 2})
+        self.assertEqual(parse_formula('H₂O'), {'H': 2, 'O': 1})
+        self.assertIsNone(parse_formula('H2O)'))
+        self.assertEqual(hill_formula(parse_formula('OHCCH3OH')), 'C2H5O2')
+        self.assertEqual(hill_formula(parse_formula('ClNa')), 'ClNa')
+        self.assertEqual(hill_formula({'O': 2, 'C': 1}), 'CO2')
+
+    def test_formula_patterns(self):
+        """Exact counts, ?, ranges, open minimums and the trailing wildcard"""
+        self.assertEqual(parse_formula_pattern('C2H?O?'), ({'C': (2, 2), 'H': (1, None), 'O': (1, None)}, False))
+        self.assertEqual(parse_formula_pattern('C1-4H3+*'), ({'C': (1, 4), 'H': (3, None)}, True))
+        self.assertIsNone(parse_formula_pattern('C=O'))
+        self.assertIsNone(parse_formula_pattern('ethanol'))
+
+
+class TestFragments(unittest.TestCase):
+    """Test the fragment parser and subgraph matching"""
+
+    def test_parse_fragment(self):
+        """Branches, ring closures and aromatic atoms"""
+        ring = parse_fragment('c1ccccc1')
+        self.assertEqual(len(ring), 6)
+        self.assertTrue(all(len(n) == 2 and all(b == ':' for _, b in n) for n in ring.neighbors))
+        carboxyl = parse_fragment('C(=O)O')
+        self.assertEqual(sorted(b for _, b in carboxyl.neighbors[0]), ['-', '='])
+        for invalid in ('C(=O', 'c1cc', '=C', 'Xx'):
+            self.assertIsNone(parse_fragment(invalid), invalid)
+
+    def test_has_substructure(self):
+        """Bond orders must agree and atoms map one to one"""
+        acid = MoleculeGraph.from_record(ACETIC_ACID)
+        self.assertTrue(has_substructure(acid, parse_fragment('C(=O)OH')))
+        self.assertFalse(has_substructure(acid, parse_fragment('C=C')))
+        self.assertFalse(has_substructure(acid, parse_fragment('O=C=O')))
+        self.assertTrue(has_substructure(MoleculeGraph.from_record(CARBON_DIOXIDE), parse_fragment('O=C=O')))
+
+
+class TestMoleculeSearchIndex(unittest.TestCase):
+    """Test search queries and incremental maintenance"""
+
+    def setUp(self):
+        self.search = MoleculeSearchIndex(CATALOG)
+
+    def test_formula_queries(self):
+        """Exact formulas in any order, patterns and element ranges"""
+        self.assertEqual(self.search.search('OH2'), {'Water'})
+        self.assertEqual(self.search.search('C2H?O?'), {'Acetic Acid', 'Ethanol'})
+        self.assertEqual(self.search.search('C?H?'), {'Benzene'})
+        self.assertEqual(self.search.search('O2*'), {'Acetic Acid', 'Carbon Dioxide'})
+        self.assertEqual(self.search.keys_with_element('H', 4, 6), {'Acetic Acid', 'Benzene', 'Ethanol'})
+        self.assertRaises(ValueError, self.search.keys_with_element, 'H', 0)
+
+    def test_substructure_queries(self):
+        """Carbonyls, named rings and hydroxyls"""
+        self.assertEqual(self.search.search('C=O'), {'Acetic Acid', 'Carbon Dioxide'})
+        self.assertEqual(self.search.search('benzene ring'), {'Benzene'})
+        self.assertEqual(self.search.search('hydroxyl'), {'Acetic Acid', 'Ethanol', 'Water'})
+        self.assertEqual(self.search.search('has:CC'), {'Acetic Acid', 'Ethanol'})
+        self.assertEqual(self.search.search('C~C'), {'Acetic Acid', 'Benzene', 'Ethanol'})
+        self.assertEqual(self.search.search('C#N'), set())
+
+    def test_name_fallback(self):
+        """Text that is neither formula nor fragment matches names"""
+        self.assertEqual(self.search.search('ac'), {'Acetic Acid'})
+        self.assertEqual(len(self.search.search('')), len(CATALOG))
+
+    def test_empty_fragment_falls_back_to_names(self):
+        """Lowercase words made of aromatic atoms match names when no fragment matches"""
+        self.search.add(record('Cobalt Chloride', [('Co', 1), ('Cl', 2)], [(0, 1, 'ionic'), (0, 2, 'ionic')],
+                               category='Inorganic'))
+        self.assertEqual(self.search.search('no'), {'Ethanol'})
+        self.assertEqual(self.search.search('co'), {'Cobalt Chloride'})
+        self.assertEqual(self.search.search('c1ccccc1'), {'Benzene'})
+
+    def test_parenthesised_formula(self):
+        """Formulas with groups are looked up as exact formulas"""
+        self.search.add(record('Calcium Hydroxide', [('Ca', 1), ('O', 2), ('H', 2)],
+                               [(0, 1, 'ionic'), (0, 2, 'ionic'), (1, 3, 'single'), (2, 4, 'single')],
+                               category='Inorganic'))
+        self.assertEqual(self.search.search('Ca(OH)2'), {'Calcium Hydroxide'})
+        self.assertEqual(self.search.search('Mg(OH)2'), set())
+
+    def test_add_and_remove(self):
+        """Incremental edits update formulas, postings and fingerprints"""
+        self.search.remove('Ethanol')
+        self.assertEqual(self.search.search('C2H?O?'), {'Acetic Acid'})
+        self.assertEqual(self.search.search('hydroxyl'), {'Acetic Acid', 'Water'})
+        self.search.add(ETHANOL)
+        self.search.add(ETHANOL)
+        self.assertEqual(self.search.search('C2H6O'), {'Ethanol'})
+        self.assertEqual(self.search.keys_with_element('O', 1, 1), {'Ethanol', 'Water'})
+
+    def test_upserts_reuse_slots(self):
+        """Replacing records keeps the fingerprint bitsets the same size"""
+        slots = len(self.search._slot_keys)
+        for _ in range(10):
+            self.search.add(ETHANOL)
+            self.search.add(dict(ACETIC_ACID))
+        self.assertEqual(len(self.search._slot_keys), slots)
+        self.assertLess(max(self.search._feature_masks.values()).bit_length(), slots + 1)
+        self.assertEqual(self.search.search('C=O'), {'Acetic Acid', 'Carbon Dioxide'})
+        self.assertEqual(self.search.keys_with_element('C', 2, 2), {'Acetic Acid', 'Ethanol'})
+
+    def test_rebuild_matches_incremental(self):
+        """The bulk build gives the same answers as adding records one by one"""
+        incremental = MoleculeSearchIndex()
+        for molecule in CATALOG + [ETHANOL]:
+            incremental.add(molecule)
+        bulk = MoleculeSearchIndex(CATALOG + [ETHANOL])
+        for text in ('C2H?O?', 'C=O', 'hydroxyl', 'C~C', 'OH2', 'ac'):
+            self.assertEqual(bulk.search(text), incremental.search(text), text)
+        self.assertEqual(bulk.keys_with_element('H', 1, 6), incremental.keys_with_element('H', 1, 6))
+
+    def test_condition_combines_with_data_index(self):
+        """MoleculeSearch intersects with the loader's other conditions"""
+        index = DataIndex(CATALOG, key_field='Name', categorical=('category',))
+        matched = index.query(MoleculeSearch(self.search, 'C=O'), Equals('category', 'Organic'))
+        self.assertEqual([m['Name'] for m in matched], ['Acetic Acid'])
+
+    def test_large_catalog(self):
+        """Fragment queries over many molecules stay fast"""
+        catalog = [dict(ETHANOL, Name=f'Ethanol {k}') for k in range(5000)]
+        catalog += [dict(ACETIC_ACID, Name=f'Acid {k}') for k in range(5000)]
+        search = MoleculeSearchIndex(catalog)
+        start = time.perf_counter()
+        self.assertEqual(len(search.search('C=O')), 5000)
+        self.assertEqual(len(search.search('C2H6O')), 5000)
+        self.assertLess(time.perf_counter() - start, 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
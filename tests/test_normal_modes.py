@@ -0,0 +1,215 @@
+"""
+Unit tests for the harmonic normal-mode (vibrational) analysis
+"""
+
+import unittest
+import sys
+import os
+import math
+import random
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.normal_modes import (
+    normal_modes, solve_normal_modes, catalog_normal_modes,
+    internal_coordinates, assemble_hessian, WAVENUMBER_PER_ROOT_EIGENVALUE, MAX_PURE_PYTHON_ATOMS
+)
+from utils.pure_array import symmetric_eigen, set_array_backend
+from utils.physics_calculator import MoleculeCalculator
+from utils.physics_calculator_v2 import MoleculeCalculatorV2
+
+
+WATER = (['O', 'H', 'H'], [(0.0, 0.0, 0.1173), (0.0, 0.7572, -0.4692), (0.0, -0.7572, -0.4692)],
+         [{'from': 0, 'to': 1, 'type': 'single'}, {'from': 0, 'to': 2, 'type': 'single'}])
+CARBON_DIOXIDE = (['C', 'O', 'O'], [(0.0, 0.0, 0.0), (1.16, 0.0, 0.0), (-1.16, 0.0, 0.0)],
+                  [{'from': 0, 'to': 1, 'type': 'double'}, {'from': 0, 'to': 2, 'type': 'double'}])
+METHANE = (['C', 'H', 'H', 'H', 'H'],
+           [(0.0, 0.0, 0.0), (0.629, 0.629, 0.629), (-0.629, -0.629, 0.629),
+            (-0.629, 0.629, -0.629), (0.629, -0.629, -0.629)],
+           [{'from': 0, 'to': i, 'type': 'single'} for i in range(1, 5)])
+HYDROGEN = (['H', 'H'], [(0.0, 0.0, 0.0), (0.74, 0.0, 0.0)], [{'from': 0, 'to': 1, 'type': 'single'}])
+
+
+def benzene():
+    """Planar benzene with aromatic ring bonds"""
+    elements, coordinates, bonds = [], [], []
+    for k in range(6):
+        angle = math.pi * k / 3
+        elements.append('C')
+        coordinates.append((1.39 * math.cos(angle), 1.39 * math.sin(angle), 0.0))
+    for k in range(6):
+        angle = math.pi * k / 3
+        elements.append('H')
+        coordinates.append((2.48 * math.cos(angle), 2.48 * math.sin(angle), 0.0))
+        bonds.append({'from': k, 'to': (k + 1) % 6, 'type': 'aromatic'})
+        bonds.append({'from': k, 'to': k + 6, 'type': 'single'})
+    return elements, coordinates, bonds
+
+
+class TestSymmetricEigen(unittest.TestCase):
+    """Test the pure-Python eigensolver"""
+
+    def test_random_symmetric(self):
+        """Eigenpairs satisfy A v = lambda v, ascending, with orthonormal vectors"""
+        rng = random.Random(3)
+        n = 12
+        matrix = [[0.0] * n for _ in range(n)]
+        for r in range(n):
+            for c in range(r, n):
+                matrix[r][c] = matrix[c][r] = rng.uniform(-1.0, 1.0)
+        values, vectors = symmetric_eigen(matrix)
+        self.assertEqual(values, sorted(values))
+        for value, vector in zip(values, vectors):
+            for r in range(n):
+                self.assertAlmostEqual(sum(matrix[r][c] * vector[c] for c in range(n)), value * vector[r], places=9)
+        for p in range(n):
+            for q in range(n):
+                self.assertAlmostEqual(sum(a * b for a, b in zip(vectors[p], vectors[q])), float(p == q), places=9)
+
+    def test_degenerate(self):
+        """Repeated and zero eigenvalues"""
+        values, _ = symmetric_eigen([[2.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 0.0, 0.0]])
+        self.assertEqual(values, [0.0, 2.0, 2.0])
+        self.assertEqual(symmetric_eigen([]), ([], []))
+
+
+class TestNormalModes(unittest.TestCase):
+    """Test frequencies, mode counts, activities and batching"""
+
+    def test_diatomic_matches_analytic(self):
+        """A diatomic's single mode is sqrt(k / mu)"""
+        result = normal_modes(*HYDROGEN)
+        self.assertEqual(result['total_modes'], 1)
+        self.assertTrue(result['is_linear'])
+        k = internal_coordinates(*HYDROGEN)[0].force_constant
+        mass = MoleculeCalculator.ATOMIC_MASSES['H']
+        expected = WAVENUMBER_PER_ROOT_EIGENVALUE * math.sqrt(k / (mass / 2))
+        self.assertAlmostEqual(result['frequencies_cm-1'][0], expected, delta=0.1)
+        self.assertFalse(result['modes'][0]['ir_active'])
+        self.assertTrue(result['modes'][0]['raman_active'])
+
+    def test_hessian_is_translation_invariant(self):
+        """Every row of the assembled Hessian sums to zero over each axis"""
+        elements, coordinates, bonds = METHANE
+        blocks = assemble_hessian(internal_coordinates(elements, coordinates, bonds))
+        for atom in range(len(elements)):
+            for r in range(3):
+                total = [0.0, 0.0, 0.0]
+                for (a, b), block in blocks.items():
+                    if a == atom:
+                        for c in range(3):
+                            total[c] += block[r][c]
+                    if b == atom and a != b:
+                        for c in range(3):
+                            total[c] += block[c][r]
+                for value in total:
+                    self.assertAlmostEqual(value, 0.0, places=9)
+
+    def test_water(self):
+        """Three modes: a bend below the two O-H stretches, all IR active"""
+        result = normal_modes(*WATER)
+        self.assertEqual(result['total_modes'], 3)
+        bend, symmetric, antisymmetric = result['modes']
+        self.assertEqual(bend['type'], 'bend')
+        self.assertEqual((symmetric['type'], antisymmetric['type']), ('stretch', 'stretch'))
+        self.assertLess(bend['frequency_cm-1'], 2000)
+        self.assertGreater(symmetric['frequency_cm-1'], 3000)
+        self.assertTrue(all(m['ir_active'] for m in result['modes']))
+
+    def test_carbon_dioxide_selection_rules(self):
+        """Linear CO2: degenerate IR bends, Raman-only symmetric stretch, IR asymmetric stretch"""
+        result = normal_modes(*CARBON_DIOXIDE)
+        self.assertTrue(result['is_linear'])
+        self.assertEqual(result['total_modes'], 4)
+        bend_a, bend_b, symmetric, antisymmetric = result['modes']
+        self.assertAlmostEqual(bend_a['frequency_cm-1'], bend_b['frequency_cm-1'], places=3)
+        self.assertTrue(bend_a['ir_active'] and bend_b['ir_active'])
+        self.assertFalse(symmetric['ir_active'])
+        self.assertTrue(symmetric['raman_active'])
+        self.assertTrue(antisymmetric['ir_active'])
+        self.assertFalse(antisymmetric['raman_active'])
+
+    def test_methane_degeneracy(self):
+        """Tetrahedral symmetry gives a triply degenerate IR-active stretch"""
+        frequencies = normal_modes(*METHANE)['frequencies_cm-1']
+        self.assertEqual(len(frequencies), 9)
+        self.assertAlmostEqual(frequencies[-1], frequencies[-3], places=1)
+        self.assertLess(frequencies[-4], frequencies[-3])
+
+    def test_planar_molecule_has_no_free_modes(self):
+        """Torsions and out-of-plane wags stiffen every benzene mode"""
+        result = normal_modes(*benzene())
+        self.assertEqual(result['total_modes'], 30)
+        self.assertGreater(min(result['frequencies_cm-1']), 50)
+
+    def test_batch_matches_single_and_caches(self):
+        """Batched solves agree with single solves and repeat from the cache"""
+        batch = solve_normal_modes([WATER, CARBON_DIOXIDE, METHANE])
+        single = normal_modes(*CARBON_DIOXIDE)
+        self.assertIs(batch[1], single)
+        for a, b in zip(normal_modes(*WATER)['frequencies_cm-1'], batch[0]['frequencies_cm-1']):
+            self.assertAlmostEqual(a, b)
+
+    def test_pure_python_size_limit(self):
+        """Without numpy, bonded components above the limit are skipped; small fragments still solve"""
+        count = MAX_PURE_PYTHON_ATOMS + 1
+        chain = (['C'] * count, [(1.3 * i, 0.75 * (i % 2), 0.0) for i in range(count)],
+                 [{'from': i, 'to': i + 1, 'type': 'single'} for i in range(count - 1)])
+        elements, coordinates, bonds = [], [], []
+        for w in range(count // 3 + 1):
+            for b in WATER[2]:
+                bonds.append(dict(b, **{'from': b['from'] + len(elements), 'to': b['to'] + len(elements)}))
+            elements += WATER[0]
+            coordinates += [(x + 5.0 * w, y, z) for x, y, z in WATER[1]]
+        set_array_backend(False)
+        try:
+            self.assertIsNone(normal_modes(*chain))
+            self.assertIsNone(solve_normal_modes([WATER, chain])[1])
+            waters = normal_modes(elements, coordinates, bonds)
+            self.assertIsNotNone(waters)
+            self.assertGreater(len(elements), MAX_PURE_PYTHON_ATOMS)
+        finally:
+            set_array_backend(True)
+
+    def test_catalog_records(self):
+        """Records without a 3D structure get None"""
+        elements, coordinates, bonds = WATER
+        record = {'Atoms3D': [{'element': e, 'x': x, 'y': y, 'z': z} for e, (x, y, z) in zip(elements, coordinates)],
+                  'Bonds3D': bonds}
+        water, missing = catalog_normal_modes([record, {'Composition': []}])
+        self.assertEqual(water['total_modes'], 3)
+        self.assertIsNone(missing)
+
+    def test_generated_molecule_uses_solver(self):
+        """MoleculeCalculatorV2 reports normal modes of its generated geometry"""
+        atoms = [{'symbol': 'O', 'atomic_number': 8, 'atomic_mass': 15.999, 'electronegativity': 3.44,
+                  'valence_electrons': 6, 'atomic_radius': 60},
+                 {'symbol': 'H', 'atomic_number': 1, 'atomic_mass': 1.008, 'electronegativity': 2.2,
+                  'valence_electrons': 1, 'atomic_radius': 25}]
+        molecule = MoleculeCalculatorV2.create_molecule_from_atoms(atoms, [1, 2], 'Water')
+        modes = molecule['SimulationData']['VibrationalModes']
+        self.assertEqual(modes['total_modes'], 3)
+        self.assertEqual(modes['method'], 'harmonic_valence_force_field')
+
+    def test_generated_molecule_keeps_every_atom(self):
+        """Repeated atoms of the central element still vibrate without a bond graph"""
+        atoms = {
+            'N': {'symbol': 'N', 'atomic_number': 7, 'atomic_mass': 14.007, 'electronegativity': 3.04,
+                  'valence_electrons': 5, 'atomic_radius': 65},
+            'C': {'symbol': 'C', 'atomic_number': 6, 'atomic_mass': 12.011, 'electronegativity': 2.55,
+                  'valence_electrons': 4, 'atomic_radius': 70},
+            'H': {'symbol': 'H', 'atomic_number': 1, 'atomic_mass': 1.008, 'electronegativity': 2.2,
+                  'valence_electrons': 1, 'atomic_radius': 25},
+        }
+        nitrogen = MoleculeCalculatorV2.create_molecule_from_atoms([atoms['N']], [2], 'Nitrogen')
+        modes = nitrogen['SimulationData']['VibrationalModes']
+        self.assertEqual(modes['total_modes'], 1)
+        self.assertGreater(modes['frequencies_cm-1'][0], 2000)
+
+        ethane = MoleculeCalculatorV2.create_molecule_from_atoms([atoms['C'], atoms['H']], [2, 6], 'Ethane')
+        self.assertEqual(ethane['SimulationData']['VibrationalModes']['total_modes'], 18)
+
+
+if __name__ == '__main__':
+    unittest.main()
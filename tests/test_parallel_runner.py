@@ -0,0 +1,74 @@
+"""
+Unit tests for the parallel test runner's sharding, JUnit parsing and timing history
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests.parallel_runner import (
+    Shard, ShardResult, build_shards, parse_junit, update_history, load_history, save_history
+)
+
+
+JUNIT_XML = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest">
+<testcase classname="tests.test_x.TestA" name="test_one" file="tests/test_x.py" time="1.5"/>
+<testcase classname="tests.test_x" name="test_two[p1]" file="tests/test_x.py" time="0.25"><failure message="x"/></testcase>
+<testcase classname="" name="tests.test_y" file="tests/test_y.py" time="0.0"><error message="collection failure"/></testcase>
+<testcase classname="tests.test_x.TestA" name="test_skip" file="tests/test_x.py" time="0.0"><skipped/></testcase>
+</testsuite></testsuites>
+"""
+
+
+class TestParallelRunner(unittest.TestCase):
+    """Test shard scheduling and history bookkeeping"""
+
+    def test_shards_longest_first(self):
+        """Files are ordered by recorded duration; unknown files get a default cost"""
+        history = {'files': {'tests/a.py': 3.0, 'tests/b.py': 0.2}, 'tests': {}}
+        shards = build_shards(['tests/b.py', 'tests/new.py', 'tests/a.py'], history, workers=4)
+        self.assertEqual([s.label for s in shards], ['tests/a.py', 'tests/new.py', 'tests/b.py'])
+
+    def test_slow_file_is_split(self):
+        """A file above the threshold is split into balanced case shards"""
+        test_file = 'tests/test_factorial_tables.py'
+        history = {'files': {test_file: 10.0}, 'tests': {}}
+        shards = build_shards([test_file], history, workers=2, split_threshold=5.0)
+        self.assertEqual(len(shards), 2)
+        node_ids = [n for s in shards for n in s.node_ids]
+        self.assertEqual(len(node_ids), len(set(node_ids)))
+        self.assertTrue(all(n.startswith(test_file + '::') for n in node_ids))
+        self.assertAlmostEqual(sum(s.estimate for s in shards), 10.0)
+
+    def test_parse_junit(self):
+        """Outcomes and durations are keyed by pytest node id"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'report.xml')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(JUNIT_XML)
+            tests = parse_junit(path)
+        self.assertEqual(tests['tests/test_x.py::TestA::test_one'], ('passed', 1.5))
+        self.assertEqual(tests['tests/test_x.py::test_two[p1]'], ('failed', 0.25))
+        self.assertEqual(tests['tests/test_y.py'][0], 'error')
+        self.assertEqual(tests['tests/test_x.py::TestA::test_skip'][0], 'skipped')
+
+    def test_history_round_trip(self):
+        """Measured durations update per-test and per-file totals"""
+        history = {'tests': {'tests/a.py::t1': 5.0}, 'files': {}}
+        result = ShardResult(Shard(['tests/a.py'], 0.0, 'a'), 1.0, 0,
+                             {'tests/a.py::t1': ('passed', 1.0), 'tests/a.py::t2': ('passed', 0.5)})
+        update_history(history, [result])
+        self.assertEqual(history['files'], {'tests/a.py': 1.5})
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'timings.json')
+            save_history(history, path)
+            self.assertEqual(load_history(path), history)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Unit tests for profiler scopes, frame statistics and Chrome trace export
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.profiler import Profiler, get_profiler, profiled
+
+
+@profiled('test.work', 'test')
+def _work(n):
+    return sum(range(n))
+
+
+class TestProfiler(unittest.TestCase):
+    """Test recording, ring buffers, aggregation and export"""
+
+    def setUp(self):
+        """Isolate the global profiler state"""
+        self.profiler = get_profiler()
+        self.was_enabled = self.profiler.enabled
+        self.profiler.reset()
+
+    def tearDown(self):
+        self.profiler.set_enabled(self.was_enabled)
+        self.profiler.reset()
+
+    def test_disabled_records_nothing(self):
+        """Disabled scopes are the shared no-op and decorated calls pass through"""
+        profiler = Profiler(enabled=False)
+        self.assertIs(profiler.scope('a'), profiler.scope('b'))
+        with profiler.scope('a'):
+            pass
+        self.profiler.set_enabled(False)
+        self.assertEqual(_work(10), 45)
+        self.assertEqual(profiler.summary(), {})
+        self.assertEqual(self.profiler.summary(), {})
+
+    def test_scopes_and_frames(self):
+        """Per-frame scope costs are averaged and the frame scope is excluded"""
+        profiler = Profiler(enabled=True)
+        for _ in range(3):
+            profiler.begin_frame()
+            with profiler.scope('paint.elements', 'paint'):
+                sum(range(20000))
+            with profiler.scope('paint.labels', 'paint'):
+                pass
+            profiler.end_frame('Table.paint')
+        names = [name for name, _ in profiler.top_scopes(5)]
+        self.assertEqual(names[0], 'paint.elements')
+        self.assertNotIn('Table.paint', names)
+        self.assertEqual(profiler.summary()['paint.labels']['count'], 3)
+        self.assertGreater(profiler.fps(), 0)
+        self.assertGreater(profiler.frame_time_ms(), 0)
+
+    def test_ring_buffer_capacity(self):
+        """Only the newest events and frames are kept"""
+        profiler = Profiler(enabled=True, event_capacity=4, frame_capacity=2)
+        for _ in range(5):
+            profiler.begin_frame()
+            with profiler.scope('s'):
+                pass
+            profiler.end_frame()
+        self.assertEqual(len(profiler.to_chrome_trace()['traceEvents']), 4)
+        self.assertEqual(profiler.summary()['s']['count'], 5)
+
+    def test_decorator_and_chrome_trace(self):
+        """Decorated calls appear as complete events in the exported trace"""
+        self.profiler.set_enabled(True)
+        _work(1000)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'trace.json')
+            self.assertEqual(self.profiler.export_chrome_trace(path), 1)
+            with open(path, 'r', encoding='utf-8') as f:
+                event = json.load(f)['traceEvents'][0]
+        self.assertEqual((event['name'], event['cat'], event['ph']), ('test.work', 'test', 'X'))
+        self.assertGreaterEqual(event['dur'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
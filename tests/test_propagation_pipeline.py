@@ -0,0 +1,148 @@
+"""
+Unit tests for the memoized quark-to-alloy propagation pipeline
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.data_manager import DataManager, DataCategory, DataChangeEvent
+from utils.propagation_pipeline import PropagationPipeline, STAGE_DAG, SOURCE_CATEGORIES
+from utils.simulation_schema import propagate_atoms_to_molecule
+
+DATA_DIR = Path(__file__).parent.parent / "data" / "active"
+
+
+class TestPropagationPipeline(unittest.TestCase):
+    """Test the chain on a temporary copy of the active data"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        for category in SOURCE_CATEGORIES:
+            shutil.copytree(DATA_DIR / category.value, Path(self.tmp) / "active" / category.value)
+        self.manager = DataManager(base_dir=self.tmp)
+        self.pipeline = PropagationPipeline(self.manager, workers=1)
+        for stage in STAGE_DAG:
+            self.pipeline.cache(stage).clear()
+        self.report = self.pipeline.run()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def edit(self, category, name, old, new):
+        """Replace text in a data file and move its mtime forward"""
+        path = self.manager.get_active_path(category) / f"{name}.json"
+        text = path.read_text(encoding='utf-8')
+        self.assertIn(old, text)
+        path.write_text(text.replace(old, new, 1), encoding='utf-8')
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    def computed(self, report):
+        return {stage: set(r['computed']) for stage, r in report['stages'].items()}
+
+    def test_cold_run_builds_every_stage(self):
+        """Every data file yields a node and the values match direct propagation"""
+        for stage, category in (('hadrons', DataCategory.SUBATOMIC), ('atoms', DataCategory.ELEMENTS),
+                                ('molecules', DataCategory.MOLECULES), ('alloys', DataCategory.ALLOYS)):
+            self.assertEqual(set(self.report['stages'][stage]['computed']),
+                             set(self.manager.list_items(category)), stage)
+        self.assertAlmostEqual(self.pipeline.get('hadrons', 'Proton')['mass_MeV'], 938.27)
+        self.assertAlmostEqual(self.pipeline.get('hadrons', 'DeltaPlus')['mass_MeV'], 1232.0)
+        self.assertEqual(self.pipeline.get('atoms', '026_Fe')['nucleus']['neutrons'], 30)
+
+        hydrogen = self.pipeline.get('atoms', '001_H')
+        oxygen = self.pipeline.get('atoms', '008_O')
+        atoms = [{'symbol': a['symbol'], 'atomic_mass': a['properties']['atomic_mass_amu'],
+                  'atomic_number': a['atomic_number']} for a in (hydrogen, hydrogen, oxygen)]
+        water = self.pipeline.get('molecules', 'Water')
+        self.assertAlmostEqual(water['properties']['molecular_mass_amu'],
+                               propagate_atoms_to_molecule(atoms, []).molecular_mass_amu)
+
+        fractions = self.pipeline.get('alloys', 'Brass_C36000')['composition']['weight_fractions']
+        self.assertAlmostEqual(sum(fractions), 1.0)
+
+    def test_rerun_computes_nothing(self):
+        """Unchanged files leave every node untouched"""
+        report = self.pipeline.run()
+        self.assertTrue(all(not r['changed'] for r in report['sources'].values()))
+        self.assertEqual(self.computed(report), {stage: set() for stage in STAGE_DAG})
+        self.assertEqual(report['stages']['atoms']['unchanged'], 118)
+
+    def test_quark_edit_touches_only_its_hadrons(self):
+        """Editing the up quark mass recomputes hadrons containing u and nothing else"""
+        self.edit(DataCategory.QUARKS, 'UpQuark', '"Mass_MeVc2": 2.2,', '"Mass_MeVc2": 2.16,')
+        report = self.pipeline.run()
+        self.assertEqual(report['sources']['quarks']['changed'], ['UpQuark'])
+
+        with_up = {name for name in self.manager.list_items(DataCategory.SUBATOMIC)
+                   if any('Up' in c['Constituent'] for c in
+                          self.manager.get_item(DataCategory.SUBATOMIC, name)['Composition'])}
+        computed = self.computed(report)
+        self.assertEqual(computed['hadrons'], with_up)
+        self.assertIn('Proton', with_up)
+        self.assertNotIn('Omega_Minus', with_up)
+        # Nucleon masses come from the experimental table, so the atoms keep their inputs
+        self.assertEqual(computed['atoms'], set())
+        self.assertEqual(computed['molecules'], set())
+        self.assertEqual(computed['alloys'], set())
+
+    def test_changes_propagate_downstream(self):
+        """A changed atom recomputes exactly the molecules and alloys that read it"""
+        self.edit(DataCategory.ELEMENTS, '008_O', '"atomic_mass": 15.999', '"atomic_mass": 17.999')
+        self.edit(DataCategory.ELEMENTS, '050_Sn', '"density": 7.29,', '"density": 7.365,')
+        computed = self.computed(self.pipeline.run())
+        self.assertEqual(computed['atoms'], {'008_O', '050_Sn'})
+        self.assertEqual(self.pipeline.get('atoms', '008_O')['nucleus']['neutrons'], 10)
+
+        with_oxygen = {name for name in self.manager.list_items(DataCategory.MOLECULES)
+                       if any(c['Element'] == 'O' for c in
+                              self.manager.get_item(DataCategory.MOLECULES, name)['Composition'])}
+        self.assertEqual(computed['molecules'], with_oxygen)
+        self.assertIn('Water', with_oxygen)
+        self.assertNotIn('Methane', with_oxygen)
+
+        with_tin = {name for name in self.manager.list_items(DataCategory.ALLOYS)
+                    if any(c['Element'] in ('O', 'Sn') for c in
+                           self.manager.get_item(DataCategory.ALLOYS, name)['Components'])}
+        self.assertEqual(computed['alloys'], with_tin)
+        self.assertIn('Pewter', with_tin)
+
+    def test_revert_is_served_from_memo(self):
+        """Restoring a file reuses the memoized results for its old inputs"""
+        self.edit(DataCategory.QUARKS, 'StrangeQuark', '"Mass_MeVc2": 95.0,', '"Mass_MeVc2": 93.4,')
+        self.pipeline.run()
+        self.edit(DataCategory.QUARKS, 'StrangeQuark', '"Mass_MeVc2": 93.4,', '"Mass_MeVc2": 95.0,')
+        report = self.pipeline.run()['stages']['hadrons']
+        self.assertEqual(report['computed'], [])
+        self.assertIn('Omega_Minus', report['cached'])
+
+    def test_invalidate_and_removal(self):
+        """Change events force a re-read and deleted files drop their nodes"""
+        self.pipeline.invalidate(DataChangeEvent(DataCategory.QUARKS, full=True))
+        report = self.pipeline.run()
+        self.assertEqual(report['sources']['quarks'], {'changed': [], 'unchanged': 17})
+
+        (self.manager.get_active_path(DataCategory.SUBATOMIC) / "Omega_Minus.json").unlink()
+        self.assertIn('Omega_Minus', self.pipeline.run()['sources']['subatomic']['changed'])
+        self.assertIsNone(self.pipeline.get('hadrons', 'Omega_Minus'))
+
+    def test_process_pool_matches_serial(self):
+        """Stages computed in worker processes give the same results"""
+        for stage in STAGE_DAG:
+            self.pipeline.cache(stage).clear()
+        parallel = PropagationPipeline(self.manager, workers=2, parallel_threshold=1)
+        report = parallel.run()
+        self.assertEqual(len(report['stages']['atoms']['computed']), 118)
+        for stage in STAGE_DAG:
+            self.assertEqual(parallel.results(stage), self.pipeline.results(stage), stage)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+"""
+Tests for the content-addressed calculator result cache.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cache_paths import CACHE_DIR_ENV
+from utils.result_cache import ResultCache, content_hash, get_result_cache, make_key, memo_content_hash
+from utils.physics_calculator_v2 import AtomCalculatorV2, SubatomicCalculatorV2, create_proton_from_quarks
+from utils.simulation_schema import propagate_quark_to_hadron
+
+
+PROTON = {'Name': 'Proton', 'Mass_MeVc2': 938.272, 'Charge_e': 1, 'Spin_hbar': 0.5, 'BaryonNumber_B': 1}
+NEUTRON = {'Name': 'Neutron', 'Mass_MeVc2': 939.565, 'Charge_e': 0, 'Spin_hbar': 0.5, 'BaryonNumber_B': 1}
+ELECTRON = {'Name': 'Electron', 'Mass_MeVc2': 0.511, 'Charge_e': -1, 'Spin_hbar': 0.5, 'BaryonNumber_B': 0}
+
+UP = {'Name': 'Up Quark', 'Symbol': 'u', 'Charge_e': 2/3, 'Mass_MeVc2': 2.2, 'Spin_hbar': 0.5,
+      'BaryonNumber_B': 1/3, 'Isospin_I': 0.5, 'Isospin_I3': 0.5,
+      'Antiparticle': {'Name': 'Antiup Quark', 'Symbol': 'u\u0305'}}
+DOWN = {'Name': 'Down Quark', 'Symbol': 'd', 'Charge_e': -1/3, 'Mass_MeVc2': 4.7, 'Spin_hbar': 0.5,
+        'BaryonNumber_B': 1/3, 'Isospin_I': 0.5, 'Isospin_I3': -0.5,
+        'Antiparticle': {'Name': 'Antidown Quark', 'Symbol': 'd\u0305'}}
+
+
+class TestContentHash(unittest.TestCase):
+    """Key construction"""
+
+    def test_key_order_independent(self):
+        self.assertEqual(content_hash({'a': 1, 'b': [1, 2]}), content_hash({'b': [1, 2], 'a': 1}))
+
+    def test_value_sensitive(self):
+        self.assertNotEqual(content_hash({'a': 1}), content_hash({'a': 1.5}))
+        self.assertNotEqual(make_key('x', 1), make_key('x', 2))
+
+    def test_memo_detects_in_place_edit(self):
+        data = {'Mass_MeVc2': 2.2, 'Classification': ['Quark']}
+        self.assertEqual(memo_content_hash(data), content_hash(data))
+        data['Classification'].append('Fermion')
+        self.assertEqual(memo_content_hash(data), content_hash(data))
+
+
+class TestResultCache(unittest.TestCase):
+    """Memory and disk tiers"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.old_cache_dir = os.environ.get(CACHE_DIR_ENV)
+        os.environ[CACHE_DIR_ENV] = self.temp_dir.name
+
+    def tearDown(self):
+        if self.old_cache_dir is None:
+            os.environ.pop(CACHE_DIR_ENV, None)
+        else:
+            os.environ[CACHE_DIR_ENV] = self.old_cache_dir
+        self.temp_dir.cleanup()
+
+    def test_hit_returns_private_copy(self):
+        cache = ResultCache('test')
+        cache.put('k', {'values': [1, 2, 3]})
+        first = cache.get('k')
+        first['values'].append(4)
+        self.assertEqual(cache.get('k'), {'values': [1, 2, 3]})
+        self.assertEqual(cache.stats()['hits'], 2)
+
+    def test_lru_eviction(self):
+        cache = ResultCache('test', max_entries=2)
+        cache.put('a', {'v': 1})
+        cache.put('b', {'v': 2})
+        cache.get('a')  # 'b' is now least recently used
+        cache.put('c', {'v': 3})
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+
+    def test_get_or_compute_computes_once(self):
+        cache = ResultCache('test')
+        calls = []
+        compute = lambda: calls.append(1) or {'v': len(calls)}
+        self.assertEqual(cache.get_or_compute('k', compute), {'v': 1})
+        self.assertEqual(cache.get_or_compute('k', compute), {'v': 1})
+        self.assertEqual(len(calls), 1)
+
+    def test_disk_round_trip(self):
+        ResultCache('test', disk=True).put('k' * 64, {'v': 42})
+        fresh = ResultCache('test', disk=True)
+        self.assertEqual(fresh.get('k' * 64), {'v': 42})
+        self.assertEqual(fresh.stats()['disk_hits'], 1)
+        self.assertIsNone(ResultCache('test').get('k' * 64))
+
+        fresh.clear(disk=True)
+        self.assertIsNone(ResultCache('test', disk=True).get('k' * 64))
+
+
+class TestAtomCache(unittest.TestCase):
+    """AtomCalculatorV2 integration"""
+
+    def setUp(self):
+        get_result_cache('atoms').clear()
+
+    def test_cached_matches_uncached(self):
+        direct = AtomCalculatorV2.create_atom_from_particles(
+            PROTON, NEUTRON, ELECTRON, 26, 30, 26, "Iron", "Fe", use_cache=False)
+        first = AtomCalculatorV2.create_atom_from_particles(PROTON, NEUTRON, ELECTRON, 26, 30, 26, "Iron", "Fe")
+        second = AtomCalculatorV2.create_atom_from_particles(PROTON, NEUTRON, ELECTRON, 26, 30, 26, "Iron", "Fe")
+        self.assertEqual(first, direct)
+        self.assertEqual(second, direct)
+        self.assertEqual(get_result_cache('atoms').stats()['hits'], 1)
+
+    def test_particle_data_change_misses(self):
+        heavy = dict(NEUTRON, Mass_MeVc2=945.0)
+        base = AtomCalculatorV2.create_atom_from_particles(PROTON, NEUTRON, ELECTRON, 2, 2, 2)
+        changed = AtomCalculatorV2.create_atom_from_particles(PROTON, heavy, ELECTRON, 2, 2, 2)
+        self.assertNotEqual(base['atomic_mass'], changed['atomic_mass'])
+        self.assertNotEqual(
+            AtomCalculatorV2.atom_cache_key(PROTON, NEUTRON, ELECTRON, 2, 2, 2),
+            AtomCalculatorV2.atom_cache_key(PROTON, heavy, ELECTRON, 2, 2, 2))
+
+
+class TestHadronCache(unittest.TestCase):
+    """SubatomicCalculatorV2 canonical quark multisets"""
+
+    def setUp(self):
+        get_result_cache('hadrons').clear()
+
+    def test_permutations_share_result(self):
+        direct = SubatomicCalculatorV2.create_particle_from_quarks([UP, UP, DOWN], "Proton", "p", use_cache=False)
+        permuted = SubatomicCalculatorV2.create_particle_from_quarks([DOWN, UP, UP], "Proton", "p")
+        again = SubatomicCalculatorV2.create_particle_from_quarks([UP, DOWN, UP], "Proton", "p")
+        self.assertEqual(permuted, direct)
+        self.assertEqual(again, direct)
+        self.assertEqual(direct['QuarkContent']['symbols'], ['u', 'u', 'd'])
+        self.assertEqual(get_result_cache('hadrons').stats()['hits'], 1)
+
+    def test_name_is_not_part_of_key(self):
+        key = SubatomicCalculatorV2.hadron_cache_key([UP, UP, DOWN])
+        self.assertEqual(key, SubatomicCalculatorV2.hadron_cache_key([DOWN, UP, UP]))
+        self.assertNotEqual(key, SubatomicCalculatorV2.hadron_cache_key([UP, DOWN, DOWN]))
+
+        proton = SubatomicCalculatorV2.create_particle_from_quarks([UP, UP, DOWN], "Proton", "p")
+        custom = SubatomicCalculatorV2.create_particle_from_quarks([DOWN, UP, UP])
+        self.assertEqual(get_result_cache('hadrons').stats()['hits'], 1)
+        self.assertEqual((proton['Name'], proton['Symbol']), ("Proton", "p"))
+        self.assertEqual((custom['Name'], custom['Symbol']), ("Custom Hadron", "X"))
+        self.assertEqual(custom['Antiparticle'], {'Name': 'Anticustom hadron', 'Symbol': 'X\u0305'})
+        self.assertEqual(custom['Mass_MeVc2'], proton['Mass_MeVc2'])
+
+    def test_propagate_uses_canonical_order(self):
+        anti_down = SubatomicCalculatorV2.make_antiquark(DOWN)
+        self.assertEqual(propagate_quark_to_hadron([DOWN, UP, UP]).quark_content_string, 'uud')
+        self.assertEqual(propagate_quark_to_hadron([anti_down, UP]).quark_content_string, 'ud\u0305')
+
+    def test_enumerate_mesons_and_baryons(self):
+        hadrons = SubatomicCalculatorV2.enumerate_all_hadrons(3, [UP, DOWN], workers=1)
+        # 2x2 quark-antiquark mesons + 4 three-quark multisets (uuu, uud, udd, ddd)
+        self.assertEqual(len(hadrons), 8)
+        names = [h['Name'] for h in hadrons]
+        self.assertIn('ud\u0305', names)
+        self.assertIn('uud', names)
+        proton = SubatomicCalculatorV2.create_particle_from_quarks([DOWN, UP, UP], 'uud', 'uud')
+        self.assertEqual(proton, hadrons[names.index('uud')])
+        named = create_proton_from_quarks(UP, DOWN)
+        self.assertEqual(named['Name'], 'Proton')
+        self.assertEqual(named['Mass_MeVc2'], proton['Mass_MeVc2'])
+        self.assertEqual(get_result_cache('hadrons').stats()['hits'], 2)
+
+        # A second pass is served from the cache
+        SubatomicCalculatorV2.enumerate_all_hadrons(3, [UP, DOWN], workers=1)
+        self.assertEqual(get_result_cache('hadrons').stats()['misses'], 8)
+
+    def test_match_particles_to_enumeration(self):
+        proton = {'Composition': [{'Constituent': 'Up Quark', 'Count': 2}, {'Constituent': 'Down Quark', 'Count': 1}]}
+        kaon = {'Composition': [{'Constituent': 'Strange Quark', 'Count': 1},
+                                {'Constituent': 'Anti-Up Quark', 'Count': 1, 'IsAnti': True}]}
+        mixture = {'Composition': [{'Constituent': 'Up Quark', 'Count': 1}, {'Constituent': 'Anti-Up Quark', 'Count': 1},
+                                   {'Constituent': 'Down Quark', 'Count': 1}, {'Constituent': 'Anti-Down Quark', 'Count': 1}]}
+        matches = SubatomicCalculatorV2.enumerated_hadrons_for([proton, kaon, mixture, {}])
+        self.assertEqual(matches[0]['Name'], 'uud')
+        self.assertEqual(matches[0]['Isospin_I3'], 0.5)
+        self.assertEqual(matches[1]['Name'], 'su\u0305')
+        self.assertEqual(matches[1]['Strangeness'], -1)
+        self.assertEqual(matches[2:], [None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Tests for the uniform-grid spatial index used for viewport culling.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.spatial_index import SpatialIndex, visible_world_rect
+
+
+def grid_cards(columns, rows, width=100, height=120, gap=10):
+    """Card dicts laid out in a simple grid, in draw order"""
+    return [{'id': r * columns + c, 'x': c * (width + gap), 'y': r * (height + gap),
+             'width': width, 'height': height}
+            for r in range(rows) for c in range(columns)]
+
+
+def card_rect(card):
+    return card['x'], card['y'], card['width'], card['height']
+
+
+class TestSpatialIndex(unittest.TestCase):
+    """Queries against a card grid"""
+
+    def setUp(self):
+        self.cards = grid_cards(20, 20)
+        self.index = SpatialIndex.build(self.cards, card_rect, cell_size=240)
+
+    def brute_force(self, left, top, right, bottom):
+        return [c for c in self.cards
+                if c['x'] <= right and c['x'] + c['width'] >= left
+                and c['y'] <= bottom and c['y'] + c['height'] >= top]
+
+    def test_query_matches_brute_force_in_draw_order(self):
+        for rect in [(0, 0, 500, 400), (333, 777, 1200, 1500), (-500, -500, 5, 5), (2150, 2550, 9000, 9000)]:
+            self.assertEqual(self.index.query(*rect), self.brute_force(*rect))
+
+    def test_query_outside_content_is_empty(self):
+        self.assertEqual(self.index.query(-1000, -1000, -10, -10), [])
+        self.assertEqual(self.index.query(10, 10, 0, 0), [])
+        self.assertEqual(SpatialIndex().query(0, 0, 100, 100), [])
+
+    def test_huge_query_returns_everything(self):
+        self.assertEqual(self.index.query(-1e9, -1e9, 1e9, 1e9), self.cards)
+
+    def test_item_at_returns_first_overlapping(self):
+        index = SpatialIndex(cell_size=50)
+        index.insert('under', 0, 0, 100, 100)
+        index.insert('over', 50, 50, 100, 100)
+        self.assertEqual(index.item_at(75, 75), 'under')
+        self.assertEqual(index.item_at(125, 125), 'over')
+        self.assertIsNone(index.item_at(300, 300))
+        self.assertEqual(self.index.item_at(115, 135)['id'], 21)
+        self.assertIsNone(self.index.item_at(105, 5))  # in the gap between cards
+
+
+class TestVisibleWorldRect(unittest.TestCase):
+    """Inverse of translate(pan_x, pan_y - scroll_y) then scale(zoom)"""
+
+    def test_identity(self):
+        self.assertEqual(visible_world_rect(800, 600, 0, 0, 1.0), (0, 0, 800, 600))
+
+    def test_pan_zoom_scroll_and_margin(self):
+        left, top, right, bottom = visible_world_rect(800, 600, 100, 50, 2.0, scroll_y=250, margin=10)
+        self.assertAlmostEqual(left, -50 - 10)
+        self.assertAlmostEqual(top, 100 - 10)
+        self.assertAlmostEqual(right, -50 + 400 + 10)
+        self.assertAlmostEqual(bottom, 100 + 300 + 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
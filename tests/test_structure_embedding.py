@@ -0,0 +1,159 @@
+"""
+Unit tests for spanning-tree embedding and neighbor-list relaxation of bonded graphs
+"""
+
+import unittest
+import sys
+import os
+import math
+import random
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.molecular_geometry import MolecularGeometryCalculator
+from utils.structure_embedding import embed_structure, neighbor_pairs, molecule_atoms_3d, valence_bond_graph
+
+
+def alkane(carbons):
+    """Composition and bonds of a straight-chain alkane CnH2n+2"""
+    composition, bonds = [], []
+    previous = None
+    for k in range(carbons):
+        c = len(composition)
+        composition.append({'element': 'C'})
+        if previous is not None:
+            bonds.append({'from': previous, 'to': c, 'type': 'single'})
+        hydrogens = 3 if k in (0, carbons - 1) else 2
+        if carbons == 1:
+            hydrogens = 4
+        for _ in range(hydrogens):
+            composition.append({'element': 'H'})
+            bonds.append({'from': c, 'to': len(composition) - 1, 'type': 'single'})
+        previous = c
+    return composition, bonds
+
+
+BENZENE_COMPOSITION = [{'element': 'C'}] * 6 + [{'element': 'H'}] * 6
+BENZENE_BONDS = ([{'from': i, 'to': (i + 1) % 6, 'type': 'aromatic'} for i in range(6)] +
+                 [{'from': i, 'to': i + 6, 'type': 'single'} for i in range(6)])
+
+
+class TestStructureEmbedding(unittest.TestCase):
+    """Test bond lengths, angles, ring closure and overlap removal"""
+
+    def setUp(self):
+        self.calculator = MolecularGeometryCalculator()
+
+    def bond_errors(self, composition, bonds, positions):
+        return [abs(math.dist(positions[b['from']], positions[b['to']]) -
+                    self.calculator.get_bond_length(composition[b['from']]['element'],
+                                                    composition[b['to']]['element'], b['type']))
+                for b in bonds]
+
+    def test_chain_bond_lengths_and_angles(self):
+        """An alkane keeps standard bond lengths and tetrahedral C-C-C angles"""
+        composition, bonds = alkane(8)
+        positions = embed_structure(composition, bonds)
+        self.assertLess(max(self.bond_errors(composition, bonds, positions)), 0.1)
+
+        carbons = [i for i, atom in enumerate(composition) if atom['element'] == 'C']
+        for a, b, c in zip(carbons, carbons[1:], carbons[2:]):
+            u = [p - q for p, q in zip(positions[a], positions[b])]
+            v = [p - q for p, q in zip(positions[c], positions[b])]
+            cos_angle = sum(x * y for x, y in zip(u, v)) / (math.hypot(*u) * math.hypot(*v))
+            self.assertAlmostEqual(math.degrees(math.acos(cos_angle)), 109.5, delta=8.0)
+
+    def test_ring_closes(self):
+        """Ring-closure bonds are pulled to their bond length"""
+        positions = embed_structure(BENZENE_COMPOSITION, BENZENE_BONDS)
+        self.assertLess(max(self.bond_errors(BENZENE_COMPOSITION, BENZENE_BONDS, positions)), 0.1)
+
+    def test_invalid_bonds_are_skipped(self):
+        """Bonds to missing atoms are ignored instead of raising"""
+        bonds = BENZENE_BONDS + [{'from': 0, 'to': 12, 'type': 'single'}, {'from': -1, 'to': 3, 'type': 'single'}]
+        positions = embed_structure(BENZENE_COMPOSITION, bonds)
+        self.assertEqual(len(positions), 12)
+        self.assertLess(max(self.bond_errors(BENZENE_COMPOSITION, BENZENE_BONDS, positions)), 0.1)
+
+    def test_no_overlapping_atoms(self):
+        """Non-bonded atoms are pushed apart and nothing stays at the origin"""
+        composition, bonds = alkane(12)
+        positions = embed_structure(composition, bonds)
+        closest = min(math.dist(p, q) for i, p in enumerate(positions) for q in positions[i + 1:])
+        self.assertGreater(closest, 0.9)
+
+    def test_disconnected_components_are_separated(self):
+        """Unbonded fragments do not overlap"""
+        composition = [{'element': 'Na'}, {'element': 'Cl'}, {'element': 'O'}]
+        positions = embed_structure(composition, [], iterations=0)
+        self.assertEqual(len(positions), 3)
+        self.assertGreater(min(math.dist(p, q) for i, p in enumerate(positions) for q in positions[i + 1:]), 2.0)
+
+    def test_calculate_structure_places_every_atom(self):
+        """Multi-center molecules no longer leave atoms at the central atom"""
+        composition, bonds = alkane(3)
+        structure = self.calculator.calculate_structure(composition, bonds)
+        self.assertEqual(sorted(a['index'] for a in structure['atoms']), list(range(len(composition))))
+        central = structure['atoms'][0]
+        self.assertEqual((central['x'], central['y'], central['z']), (0.0, 0.0, 0.0))
+        self.assertTrue(all(math.dist((a['x'], a['y'], a['z']), (0, 0, 0)) > 0.9
+                            for a in structure['atoms'][1:]))
+
+    def test_molecule_atoms_3d(self):
+        """Stored coordinates are used as is; a bare bond graph is embedded"""
+        stored = [{'element': 'H', 'x': 0.0, 'y': 0.0, 'z': 0.0, 'index': 0}]
+        self.assertIs(molecule_atoms_3d({'Atoms3D': stored}), stored)
+        record = {'Composition': [{'Element': 'O', 'Count': 1}, {'Element': 'H', 'Count': 2}],
+                  'Bonds3D': [{'from': 0, 'to': 1, 'type': 'single'}, {'from': 0, 'to': 2, 'type': 'single'}]}
+        atoms = molecule_atoms_3d(record)
+        self.assertEqual([a['element'] for a in atoms], ['O', 'H', 'H'])
+        self.assertEqual(molecule_atoms_3d({'Composition': record['Composition']}), [])
+
+    def test_valence_bond_graph(self):
+        """Formulas get connected graphs with multiple bonds where valence is left over"""
+        def described(elements):
+            return sorted((b['from'], b['to'], b['type']) for b in valence_bond_graph(elements))
+        self.assertEqual(described(['N', 'N']), [(0, 1, 'triple')])
+        self.assertEqual(described(['C', 'O', 'O']), [(0, 1, 'double'), (0, 2, 'double')])
+        self.assertEqual(described(['H', 'Cl']), [(0, 1, 'single')])
+        ethanol = valence_bond_graph(['C', 'C', 'O'] + ['H'] * 6)
+        self.assertEqual(len(ethanol), 8)
+        self.assertTrue(all(b['type'] == 'single' for b in ethanol))
+        degree = [0] * 9
+        for bond in ethanol:
+            degree[bond['from']] += 1
+            degree[bond['to']] += 1
+        self.assertEqual(degree, [4, 4, 2] + [1] * 6)
+        self.assertEqual(len(valence_bond_graph(['S'] + ['F'] * 6)), 6)
+
+    def test_large_polymer(self):
+        """A thousand-atom chain embeds quickly with correct bonds"""
+        composition, bonds = alkane(340)
+        start = time.perf_counter()
+        positions = embed_structure(composition, bonds, iterations=50)
+        self.assertLess(time.perf_counter() - start, 30.0)
+        self.assertEqual(len(positions), 1022)
+        self.assertLess(max(self.bond_errors(composition, bonds, positions)), 0.15)
+
+
+class TestNeighborPairs(unittest.TestCase):
+    """Test the cell-list neighbor search"""
+
+    def test_matches_brute_force(self):
+        """Cell-list pairs equal the all-pairs result"""
+        rng = random.Random(7)
+        points = [(rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(200)]
+        expected = sorted((i, j) for i in range(len(points)) for j in range(i + 1, len(points))
+                          if math.dist(points[i], points[j]) < 1.5)
+        self.assertEqual(sorted(neighbor_pairs(points, 1.5)), expected)
+
+    def test_empty_and_degenerate(self):
+        """No points or a non-positive cutoff give no pairs"""
+        self.assertEqual(neighbor_pairs([], 2.0), [])
+        self.assertEqual(neighbor_pairs([(0, 0, 0), (0, 0, 0)], 0.0), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Unit tests for the structure-of-arrays Vec3Array
+"""
+
+import unittest
+import sys
+import os
+import math
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pure_array import (
+    Vec3, Vec3Array, generate_nucleon_array, generate_nucleon_positions,
+    rotation_matrix_euler, apply_rotation_matrix,
+    vector_sub, vector_scale, vector_dot, vector_cross, vector_normalize
+)
+
+
+class TestVec3Array(unittest.TestCase):
+    """Test bulk vector operations against the per-point Vec3 results"""
+
+    def setUp(self):
+        """Set up a small pure-Python point cloud"""
+        self.points = [(1.0, 2.0, 3.0), (-4.0, 0.5, 2.0), (0.0, 0.0, 0.0)]
+        self.array = Vec3Array.from_points(self.points, use_numpy=False)
+
+    def assertPointsAlmostEqual(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for a, e in zip(actual, expected):
+            for ac, ec in zip(a, e):
+                self.assertAlmostEqual(ac, ec, places=12)
+
+    def test_construction_and_conversion(self):
+        """Points round-trip through the component buffers"""
+        self.assertEqual(len(self.array), 3)
+        self.assertFalse(self.array.uses_numpy)
+        self.assertEqual(self.array.to_tuples(), self.points)
+        self.assertEqual(self.array[1].to_tuple(), (-4.0, 0.5, 2.0))
+        self.assertEqual(Vec3Array.zeros(2, use_numpy=False).to_tuples(), [(0.0, 0.0, 0.0)] * 2)
+        with self.assertRaises(ValueError):
+            Vec3Array([1.0], [2.0], [], use_numpy=False)
+
+    def test_arithmetic(self):
+        """Add, subtract and scale with broadcast and per-point operands"""
+        shifted = self.array + (1, 1, 1)
+        self.assertEqual(shifted[0].to_tuple(), (2.0, 3.0, 4.0))
+        self.assertEqual(self.array[0].to_tuple(), (1.0, 2.0, 3.0))
+        self.assertEqual((shifted - self.array).to_tuples(), [(1.0, 1.0, 1.0)] * 3)
+        self.assertEqual(self.array.scale([1, 2, 0])[1].to_tuple(), (-8.0, 1.0, 4.0))
+
+        result = self.array.copy()
+        self.assertIs(result.scale_(2).add_(Vec3(1, 0, 0)), result)
+        self.assertEqual(result[0].to_tuple(), (3.0, 4.0, 6.0))
+
+    def test_products_and_normalize(self):
+        """Dot, cross, lengths and normalize match Vec3"""
+        other = Vec3Array.from_points([(0, 1, 0), (1, 0, 0), (0, 0, 1)], use_numpy=False)
+        vecs = [Vec3(*p) for p in self.points]
+        others = other.to_vec3s()
+        self.assertEqual(list(self.array.dot(other)), [v.dot(o) for v, o in zip(vecs, others)])
+        self.assertPointsAlmostEqual(self.array.cross(other).to_tuples(),
+                                     [v.cross(o).to_tuple() for v, o in zip(vecs, others)])
+        self.assertAlmostEqual(self.array.lengths()[0], math.sqrt(14))
+        self.assertPointsAlmostEqual(self.array.normalized().to_tuples(),
+                                     [v.normalized().to_tuple() for v in vecs])
+
+    def test_rotation_matches_apply_rotation_matrix(self):
+        """Batch rotation equals rotating each Vec3 individually"""
+        M = rotation_matrix_euler(0.3, -1.1, 2.0)
+        expected = [apply_rotation_matrix(M, Vec3(*p)).to_tuple() for p in self.points]
+        result = self.array.copy()
+        x_buffer = result.x
+        result.rotate_(M)
+        self.assertIs(result.x, x_buffer)
+        self.assertPointsAlmostEqual(result.to_tuples(), expected)
+        self.assertPointsAlmostEqual(self.array.rotate(M).to_tuples(), expected)
+
+    def test_nucleon_array_matches_positions(self):
+        """Nucleon arrays hold the same positions as the tuple generator"""
+        points, is_proton = generate_nucleon_array(6, 8, 2.5, seed=7, use_numpy=False)
+        positions = generate_nucleon_positions(6, 8, 2.5, seed=7)
+        self.assertEqual([p[:3] for p in positions], points.to_tuples())
+        self.assertEqual([p[3] for p in positions], is_proton)
+        self.assertEqual(sum(is_proton), 6)
+
+
+class TestVectorHelpers(unittest.TestCase):
+    """Test the tuple vector helpers against Vec3"""
+
+    def test_matches_vec3(self):
+        """Tuple helpers give the same results as the Vec3 methods"""
+        a, b = (1.0, -2.0, 0.5), (0.3, 4.0, -1.5)
+        va, vb = Vec3(*a), Vec3(*b)
+        self.assertEqual(vector_sub(a, b), (va - vb).to_tuple())
+        self.assertEqual(vector_scale(a, 2.5), (va * 2.5).to_tuple())
+        self.assertAlmostEqual(vector_dot(a, b), va.dot(vb))
+        for x, y in zip(vector_cross(a, b), va.cross(vb).to_tuple()):
+            self.assertAlmostEqual(x, y)
+        for x, y in zip(vector_normalize(a), va.normalized().to_tuple()):
+            self.assertAlmostEqual(x, y)
+        self.assertEqual(vector_normalize((0.0, 0.0, 0.0)), (0.0, 0.0, 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,7 @@ UI Components for the Quantum Orbit visualization
 Reusable widget classes for legends and gradient bars
 """
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QCheckBox, QPushButton, QLabel
-from PySide6.QtCore import Qt, QPointF, QRectF, Signal
+from PySide6.QtCore import Qt, QPointF, QRectF, Signal, QObject, QEvent
 from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QRadialGradient, QPolygonF, QPainterPath
 
 from utils.calculations import (get_block_color, get_ie_color, get_electroneg_color,
@@ -1297,3 +1297,33 @@ class UnifiedPropertyControl(QWidget):
     def _forward_filter_range_changed(self, min_filter, max_filter):
         """Forward filter range changed signal"""
         self.filter_range_changed.emit(min_filter, max_filter)
+
+
+class HoverCallbackFilter(QObject):
+    """Event filter that calls a function when the mouse enters a widget"""
+
+    def __init__(self, callback, parent=None):
+        super().__init__(parent)
+        self.callback = callback
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Enter:
+            self.callback()
+        return False
+
+
+def install_hover_callback(widget, callback):
+    """
+    Call a function whenever the mouse enters a widget (e.g. to prefetch the
+    layout behind a layout selector before it is clicked).
+
+    Args:
+        widget: Widget to watch
+        callback: Function taking no arguments
+
+    Returns:
+        The installed event filter (owned by the widget)
+    """
+    hover_filter = HoverCallbackFilter(callback, widget)
+    widget.installEventFilter(hover_filter)
+    return hover_filter
@@ -14,7 +14,7 @@ from data.data_manager import get_data_manager, DataCategory
 
 from ui.components import (ColorGradientBar, BorderThicknessLegend, GlowIntensityLegend, InnerRingLegend,
                            DistanceMappingVisualizer, SpectrumMappingVisualizer, ColorMappingVisualizer,
-                           UnifiedPropertyMappingWidget, UnifiedPropertyControl)
+                           UnifiedPropertyMappingWidget, UnifiedPropertyControl, install_hover_callback)
 from data.element_data import get_property_metadata
 from core.pt_enums import PTPropertyName, PTEncodingKey, PTWavelengthMode, PTPropertyType, PTEncodingType, PTLayoutMode, ENCODING_KEY_TO_TYPE
 
@@ -249,6 +249,7 @@ class PropertyControl(QWidget):
                 self.parent_panel.table.filters[self.current_property_name]['max'] = max_filter
                 # Filter is always active with unified widget (controlled by unified widget's filter checkbox)
                 self.parent_panel.table.filters[self.current_property_name]['active'] = self.unified_mapping.filter_enabled
+                self.parent_panel.table.invalidate_filters()
                 self.parent_panel.table.update()
 
     def on_wavelength_mode_toggled(self, checked):
@@ -776,6 +777,11 @@ class ControlPanel(QWidget):
         self.serpentine_radio.toggled.connect(lambda: self._on_layout_mode_changed("serpentine") if self.serpentine_radio.isChecked() else None)
         self.table_radio.toggled.connect(lambda: self._on_layout_mode_changed("table") if self.table_radio.isChecked() else None)
 
+        # Compute a layout in the background while its button is hovered
+        for radio, mode in ((self.circular_radio, "circular"), (self.spiral_radio, "spiral"),
+                            (self.serpentine_radio, "serpentine"), (self.table_radio, "table")):
+            install_hover_callback(radio, lambda mode=mode: self.table.prefetch_layout(mode))
+
         layout_box.addWidget(self.circular_radio)
         layout_box.addWidget(self.spiral_radio)
         layout_box.addWidget(self.serpentine_radio)
@@ -1184,6 +1190,7 @@ class ControlPanel(QWidget):
         """Handle neutron offset selection change"""
         neutron_offset = self.neutron_offset_combo.itemData(index)
         self.table.selected_neutron_offset = neutron_offset
+        self.table.invalidate_filters()
         self.table.update()
 
     def on_spectrum_lines_changed(self, state):
@@ -6,15 +6,19 @@ Polished to match Atoms tab features with visual property encodings and filters.
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
                                 QScrollArea, QRadioButton, QComboBox, QCheckBox,
-                                QPushButton, QSlider, QToolButton, QFrame)
-from PySide6.QtCore import Qt, QPropertyAnimation, Signal
+                                QPushButton, QSlider, QToolButton, QFrame, QLineEdit)
+from PySide6.QtCore import Qt, QPropertyAnimation, QTimer, Signal
 from PySide6.QtGui import QFont
 
 from core.molecule_enums import (MoleculeLayoutMode, MoleculeCategory, MoleculePolarity,
                                   MoleculeState, MoleculeProperty, BondType)
 from data.data_manager import get_data_manager, DataCategory
+from ui.components import install_hover_callback
 
 
+# Quiet period after the last keystroke before the search box runs a search
+SEARCH_DEBOUNCE_MS = 250
+
 # Molecule property metadata for slider ranges and units
 MOLECULE_PROPERTY_METADATA = {
     "molecular_mass": {
@@ -741,6 +745,7 @@ class MoleculeControlPanel(QWidget):
         self.dipole_radio = QRadioButton("Dipole-Polarity")
         self.density_radio = QRadioButton("Density-Mass")
         self.bond_complexity_radio = QRadioButton("Bond Complexity")
+        self.vibrational_radio = QRadioButton("Vibrational Spectrum")
 
         self.grid_radio.setChecked(True)
 
@@ -748,7 +753,8 @@ class MoleculeControlPanel(QWidget):
         all_radios = [
             self.grid_radio, self.mass_radio, self.polarity_radio,
             self.bond_radio, self.geometry_radio, self.phase_diagram_radio,
-            self.dipole_radio, self.density_radio, self.bond_complexity_radio
+            self.dipole_radio, self.density_radio, self.bond_complexity_radio,
+            self.vibrational_radio
         ]
 
         for radio in all_radios:
@@ -765,6 +771,13 @@ class MoleculeControlPanel(QWidget):
         self.dipole_radio.toggled.connect(lambda: self._on_layout_changed("dipole") if self.dipole_radio.isChecked() else None)
         self.density_radio.toggled.connect(lambda: self._on_layout_changed("density") if self.density_radio.isChecked() else None)
         self.bond_complexity_radio.toggled.connect(lambda: self._on_layout_changed("bond_complexity") if self.bond_complexity_radio.isChecked() else None)
+        self.vibrational_radio.toggled.connect(lambda: self._on_layout_changed("vibrational") if self.vibrational_radio.isChecked() else None)
+
+        # Compute a layout in the background while its button is hovered
+        layout_modes = ["grid", "mass_order", "polarity", "bond_type", "geometry",
+                        "phase_diagram", "dipole", "density", "bond_complexity", "vibrational"]
+        for radio, mode in zip(all_radios, layout_modes):
+            install_hover_callback(radio, lambda mode=mode: self.table.prefetch_layout(mode))
 
         # Zoom controls info
         zoom_info = QLabel("Camera Controls:\n- Scroll wheel: Zoom\n- Ctrl+drag: Pan")
@@ -936,9 +949,39 @@ class MoleculeControlPanel(QWidget):
         """Create filter options with checkboxes for state, polarity, bond type, category"""
         collapsible = CollapsibleBox("Filter Options", "#4CAF50")
 
+        # Search (formula pattern, fragment or name)
+        search_label = QLabel("Search:")
+        search_label.setStyleSheet("color: white; font-weight: bold; font-size: 10px; margin-top: 5px;")
+        collapsible.content_layout.addWidget(search_label)
+
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Formula (C2H?O?), fragment (C=O, benzene ring) or name")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.setStyleSheet("""
+            QLineEdit {
+                background: rgba(255, 255, 255, 20);
+                color: white;
+                border: 1px solid rgba(76, 175, 80, 120);
+                border-radius: 4px;
+                padding: 4px 6px;
+                font-size: 10px;
+            }
+            QLineEdit:focus {
+                border: 1px solid #4CAF50;
+            }
+        """)
+        # Substructure searches over large catalogs are slow; search once typing pauses
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_search)
+        self.search_edit.textChanged.connect(self._on_search_changed)
+        self.search_edit.returnPressed.connect(self._apply_search)
+        collapsible.content_layout.addWidget(self.search_edit)
+
         # State Filter (Solid, Liquid, Gas)
         state_label = QLabel("State at STP:")
-        state_label.setStyleSheet("color: white; font-weight: bold; font-size: 10px; margin-top: 5px;")
+        state_label.setStyleSheet("color: white; font-weight: bold; font-size: 10px; margin-top: 10px;")
         collapsible.content_layout.addWidget(state_label)
 
         state_container = QWidget()
@@ -1398,6 +1441,16 @@ class MoleculeControlPanel(QWidget):
         elif hasattr(self.table, 'set_category_filter'):
             self.table.set_category_filter(categories[0] if len(categories) == 1 else None)
 
+    def _on_search_changed(self, text):
+        """Handle search box edits (restarts the debounce timer)"""
+        self._search_timer.start()
+
+    def _apply_search(self):
+        """Run the search box query on the table"""
+        self._search_timer.stop()
+        if hasattr(self.table, 'set_search_query'):
+            self.table.set_search_query(self.search_edit.text().strip())
+
     def _on_3d_toggle_changed(self, state):
         """Handle 3D visualization toggle"""
         if hasattr(self.table, 'set_3d_mode'):
@@ -1451,6 +1504,7 @@ class MoleculeControlPanel(QWidget):
                       self.ionic_check, self.covalent_check, self.polar_covalent_check,
                       self.organic_check, self.inorganic_check]:
             check.setChecked(True)
+        self.search_edit.clear()
 
     def _reset_property_mappings(self):
         """Reset all property controls to their default mappings"""
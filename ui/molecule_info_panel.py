@@ -13,6 +13,8 @@ from PySide6.QtGui import QFont, QPainter, QColor, QBrush, QPen, QRadialGradient
 from core.molecule_enums import (MolecularGeometry, BondType, MoleculePolarity,
                                   MoleculeCategory, MoleculeState, get_element_color)
 from data.data_manager import DataCategory, get_data_manager
+from utils.molecule_projection import project_structures
+from utils.structure_embedding import molecule_atoms_3d
 import json
 from pathlib import Path
 
@@ -243,7 +245,8 @@ class MoleculeStructureWidget(QFrame):
         Calculate atom positions based on geometry with 3D rotation support.
 
         Priority for position data:
-        1. Use Atoms3D from molecule JSON if available (most accurate)
+        1. Use Atoms3D from molecule JSON if available (most accurate), or
+           embed the Bonds3D graph when only the bonds are stored
         2. Calculate using BondAngle_deg from molecule JSON
         3. Fall back to default geometry angles
         """
@@ -254,7 +257,7 @@ class MoleculeStructureWidget(QFrame):
             return []
 
         # Try to use Atoms3D data from molecule JSON (most accurate)
-        if self.molecule and 'Atoms3D' in self.molecule:
+        if self.molecule and ('Atoms3D' in self.molecule or 'Bonds3D' in self.molecule):
             positions_3d = self._positions_from_atoms3d(radius)
             if positions_3d:
                 return self._apply_rotation_and_project(positions_3d, cx, cy, radius)
@@ -306,8 +309,9 @@ class MoleculeStructureWidget(QFrame):
         """
         Generate position data from molecule's Atoms3D field.
         This provides the most accurate molecular geometry from pre-calculated coordinates.
+        Molecules with only a Bonds3D graph are embedded (see structure_embedding).
         """
-        atoms_3d = self.molecule.get('Atoms3D', [])
+        atoms_3d = molecule_atoms_3d(self.molecule)
         if not atoms_3d:
             return []
 
@@ -599,30 +603,10 @@ class MoleculeStructureWidget(QFrame):
         return radius * scale
 
     def _apply_rotation_and_project(self, positions_3d, cx, cy, radius):
-        """Apply 3D rotation and project to 2D screen coordinates"""
-        positions = []
-
-        for atom in positions_3d:
-            x_rot, y_rot, z_rot = rotate_point_3d(
-                atom['x'], atom['y'], atom['z'],
-                self.pitch, self.yaw, self.roll
-            )
-            # Simple orthographic projection (just use x, y)
-            # Add depth-based scaling for perspective effect
-            depth_scale = 1.0 + z_rot / (radius * 4)  # Subtle perspective
-            positions.append({
-                'element': atom['element'],
-                'x': cx + x_rot,
-                'y': cy + y_rot,
-                'z': z_rot,  # Keep Z for depth sorting
-                'radius': atom['radius'] * max(0.6, min(1.4, depth_scale)),
-                'depth_scale': depth_scale
-            })
-
-        # Sort by Z depth (draw far atoms first)
-        positions.sort(key=lambda p: p.get('z', 0))
-
-        return positions
+        """Apply 3D rotation and project to 2D screen coordinates (sorted far to near)"""
+        # One rotation matrix and one batched rotation for all atoms
+        return project_structures([(positions_3d, radius, cx, cy)], self.pitch, self.yaw, self.roll,
+                                  min_scale=0.6, max_scale=1.4)[0]
 
     def _get_atom_radius(self, element):
         """
@@ -12,7 +12,7 @@ from PySide6.QtGui import QFont
 
 from core.subatomic_enums import SubatomicLayoutMode, SubatomicProperty, ParticleCategory
 from data.data_manager import get_data_manager, DataCategory
-from ui.components import UnifiedPropertyMappingWidget
+from ui.components import UnifiedPropertyMappingWidget, install_hover_callback
 
 
 class CollapsibleBox(QWidget):
@@ -571,6 +571,18 @@ class SubatomicControlPanel(QWidget):
         self.discovery_radio.toggled.connect(
             lambda: self._on_layout_changed(SubatomicLayoutMode.DISCOVERY_TIMELINE) if self.discovery_radio.isChecked() else None)
 
+        # Compute a layout in the background while its button is hovered
+        for radio, mode in ((self.baryon_meson_radio, SubatomicLayoutMode.BARYON_MESON),
+                            (self.mass_radio, SubatomicLayoutMode.MASS_ORDER),
+                            (self.charge_radio, SubatomicLayoutMode.CHARGE_ORDER),
+                            (self.decay_radio, SubatomicLayoutMode.DECAY_CHAIN),
+                            (self.quark_radio, SubatomicLayoutMode.QUARK_CONTENT),
+                            (self.eightfold_radio, SubatomicLayoutMode.EIGHTFOLD_WAY),
+                            (self.lifetime_radio, SubatomicLayoutMode.LIFETIME_SPECTRUM),
+                            (self.quark_tree_radio, SubatomicLayoutMode.QUARK_TREE),
+                            (self.discovery_radio, SubatomicLayoutMode.DISCOVERY_TIMELINE)):
+            install_hover_callback(radio, lambda mode=mode: self.table.prefetch_layout(mode))
+
         layout_box.addWidget(self.baryon_meson_radio)
         layout_box.addWidget(self.mass_radio)
         layout_box.addWidget(self.charge_radio)
@@ -37,6 +37,9 @@ except ImportError:
 from utils.pure_math import (
     factorial,
     double_factorial,
+    factorial_float,
+    log_factorial,
+    factorial_ratio,
     genlaguerre,
     lpmv,
     GeneralizedLaguerre,
@@ -58,8 +61,11 @@ from utils.pure_array import (
     random_uniform, random_seed,
     # Vector class
     Vec3,
+    Vec3Array,
+    set_array_backend, get_array_backend,
     # Nucleon generation
     generate_nucleon_positions,
+    generate_nucleon_array,
     generate_shell_positions,
     # Utility functions
     lerp, clamp, smoothstep, distance,
@@ -90,15 +96,17 @@ __all__ = [
     'MoleculeCalculator',
     'SDFRenderer',
     # pure_math exports
-    'factorial', 'double_factorial', 'genlaguerre', 'lpmv', 'GeneralizedLaguerre',
-    'spherical_harmonic', 'spherical_harmonic_real', 'spherical_harmonic_prefactor',
+    'factorial', 'double_factorial', 'factorial_float', 'log_factorial', 'factorial_ratio',
+    'genlaguerre', 'lpmv', 'GeneralizedLaguerre',
+    'spherical_harmonic', 'spherical_harmonic_real',
+    'spherical_harmonic_prefactor',
     'binomial', 'gamma_half_integer',
     # pure_array exports
     'pi',
     'sqrt', 'cos', 'sin', 'acos', 'atan2',
     'random_uniform', 'random_seed',
-    'Vec3',
-    'generate_nucleon_positions',
+    'Vec3', 'Vec3Array', 'set_array_backend', 'get_array_backend',
+    'generate_nucleon_positions', 'generate_nucleon_array',
     'generate_shell_positions',
     'lerp', 'clamp', 'smoothstep', 'distance',
     # 3D rotation matrices
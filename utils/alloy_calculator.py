@@ -8,6 +8,8 @@ import math
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
+from utils.profiler import profiled
+
 
 # ==================== Physical Constants ====================
 
@@ -90,6 +92,7 @@ class AlloyCalculator:
     """
 
     @classmethod
+    @profiled('calc.alloy', 'calc')
     def create_alloy_from_components(
         cls,
         component_data: List[Dict],
@@ -0,0 +1,275 @@
+"""
+Backend Dispatch
+Per-call-site choice between the pure Python and library (scipy/numpy) paths.
+
+The library paths carry a fixed per-call overhead (array conversion, ufunc
+dispatch, building scipy polynomial objects), so for scalar or small inputs
+the pure Python path is faster and only larger batches benefit from the
+library. Each dual-path function registers a pair of benchmark callables; a
+short micro-benchmark finds the input size at which the library starts to
+win (the crossover), and the result is persisted so calibration only runs
+again when the Python or library versions change.
+
+Call sites ask use_library(name, size); the dispatcher also counts which path
+each function actually took, which BackendManager.get_status() reports.
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils.cache_paths import get_cache_path
+
+
+CROSSOVER_FILENAME = 'backend_crossovers.json'
+
+# Input sizes probed during calibration
+CALIBRATION_SIZES: Tuple[int, ...] = (1, 4, 16, 64, 256, 1024)
+
+# Crossover used for functions that have not been calibrated yet
+DEFAULT_CROSSOVER = 32
+
+DISPATCH_MODES = ('auto', 'pure', 'library')
+
+
+def _default_input(size: int) -> list:
+    """Evenly spaced sample points in (-1, 1) for a calibration run."""
+    return [-0.95 + 1.9 * (i + 0.5) / size for i in range(size)]
+
+
+def _best_time(func: Callable[[Any], Any], arg: Any, repeats: int) -> float:
+    """Fastest of several timed calls, in seconds."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class BackendDispatcher:
+    """Chooses a backend per call from the input size and calibrated crossovers"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            path: Crossover file (default: backend_crossovers.json in the cache dir)
+        """
+        self.path = path
+        self.mode = 'auto'
+        self.calibrated = False
+        # name -> smallest input size where the library is faster (None: never)
+        self.crossovers: Dict[str, Optional[int]] = {}
+        # name -> {'pure': count, 'library': count}
+        self.calls: Dict[str, Dict[str, int]] = {}
+        self._benchmarks: Dict[str, Tuple[Callable, Callable, Callable[[int], Any]]] = {}
+
+    # ==================== Registration ====================
+
+    def register(self, name: str, pure_call: Callable[[Any], Any], library_call: Callable[[Any], Any],
+                 make_input: Callable[[int], Any] = _default_input):
+        """
+        Register a dual-path function for calibration.
+
+        Args:
+            name: Dispatch name used by the call site (e.g. 'lpmv')
+            pure_call: Runs the pure Python path on one calibration input
+            library_call: Runs the library path on the same input
+            make_input: Builds the calibration input for a given size
+        """
+        self._benchmarks[name] = (pure_call, library_call, make_input)
+        self.calls.setdefault(name, {'pure': 0, 'library': 0})
+
+    def registered(self) -> Tuple[str, ...]:
+        """Names of the registered dual-path functions"""
+        return tuple(self._benchmarks)
+
+    # ==================== Dispatch ====================
+
+    def set_mode(self, mode: str):
+        """
+        Set the dispatch mode.
+
+        Args:
+            mode: 'auto' (per-call by size), 'pure' or 'library' (always that path
+                  whenever the library is available)
+        """
+        if mode not in DISPATCH_MODES:
+            raise ValueError(f"Unknown dispatch mode: {mode} (expected one of {DISPATCH_MODES})")
+        self.mode = mode
+
+    def crossover(self, name: str) -> Optional[int]:
+        """Input size from which the library path is used for a function"""
+        return self.crossovers.get(name, DEFAULT_CROSSOVER)
+
+    def use_library(self, name: str, size: int = 1) -> bool:
+        """
+        Decide the path for one call and record the decision.
+
+        Callers only ask when the library is available for that function.
+
+        Args:
+            name: Dispatch name
+            size: Number of points in the call
+
+        Returns:
+            True to take the library path, False for pure Python
+        """
+        if self.mode == 'auto':
+            crossover = self.crossovers.get(name, DEFAULT_CROSSOVER)
+            library = crossover is not None and size >= crossover
+        else:
+            library = self.mode == 'library'
+
+        counts = self.calls.get(name)
+        if counts is None:
+            counts = self.calls[name] = {'pure': 0, 'library': 0}
+        counts['library' if library else 'pure'] += 1
+        return library
+
+    def record(self, name: str, library: bool):
+        """Record a call whose path was decided elsewhere (e.g. forced by the backend switch)"""
+        counts = self.calls.get(name)
+        if counts is None:
+            counts = self.calls[name] = {'pure': 0, 'library': 0}
+        counts['library' if library else 'pure'] += 1
+
+    def reset_counts(self):
+        """Zero the per-function path counters"""
+        for counts in self.calls.values():
+            counts['pure'] = 0
+            counts['library'] = 0
+
+    # ==================== Calibration ====================
+
+    @staticmethod
+    def environment_signature() -> Dict[str, str]:
+        """Versions that invalidate persisted crossovers when they change"""
+        signature = {'python': '.'.join(str(v) for v in sys.version_info[:3])}
+        for module_name in ('numpy', 'scipy'):
+            module = sys.modules.get(module_name)
+            if module is None:
+                try:
+                    module = __import__(module_name)
+                except ImportError:
+                    continue
+            signature[module_name] = getattr(module, '__version__', 'unknown')
+        return signature
+
+    def _crossover_path(self) -> str:
+        return self.path or get_cache_path(CROSSOVER_FILENAME)
+
+    def load(self) -> bool:
+        """
+        Load persisted crossovers if they were measured in this environment.
+
+        Returns:
+            True if every registered function has a stored crossover
+        """
+        path = self._crossover_path()
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read backend crossovers from {path}: {e}")
+            return False
+
+        if stored.get('signature') != self.environment_signature():
+            return False
+        crossovers = stored.get('crossovers', {})
+        if any(name not in crossovers for name in self._benchmarks):
+            return False
+
+        self.crossovers.update(crossovers)
+        self.calibrated = True
+        return True
+
+    def save(self):
+        """Persist the crossovers for this environment"""
+        path = self._crossover_path()
+        data = {'signature': self.environment_signature(), 'crossovers': self.crossovers}
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+        except OSError as e:
+            print(f"Warning: Could not save backend crossovers to {path}: {e}")
+
+    def measure(self, name: str, sizes: Tuple[int, ...] = CALIBRATION_SIZES, repeats: int = 3) -> Optional[int]:
+        """
+        Time both paths of one function and find its crossover.
+
+        Args:
+            name: Registered dispatch name
+            sizes: Input sizes to probe (ascending)
+            repeats: Timed calls per size and path (fastest is kept)
+
+        Returns:
+            Smallest probed size from which the library is faster at every
+            larger probed size, or None if the library never wins
+        """
+        pure_call, library_call, make_input = self._benchmarks[name]
+        library_wins = []
+        for size in sizes:
+            arg = make_input(size)
+            # Warm up both paths (imports, polynomial construction caches)
+            pure_call(arg)
+            library_call(arg)
+            library_wins.append(_best_time(library_call, arg, repeats) < _best_time(pure_call, arg, repeats))
+
+        crossover = None
+        for size, wins in zip(reversed(sizes), reversed(library_wins)):
+            if not wins:
+                break
+            crossover = size
+        return crossover
+
+    def calibrate(self, force: bool = False) -> Dict[str, Optional[int]]:
+        """
+        Calibrate crossovers once, reusing persisted values when still valid.
+
+        Args:
+            force: Measure again even if valid persisted crossovers exist
+
+        Returns:
+            Crossovers by function name
+        """
+        if not self._benchmarks:
+            return {}
+        if not force and (self.calibrated or self.load()):
+            return dict(self.crossovers)
+
+        for name in self._benchmarks:
+            try:
+                self.crossovers[name] = self.measure(name)
+            except Exception as e:
+                print(f"Warning: Backend calibration failed for {name}: {e}")
+        self.calibrated = True
+        self.save()
+        return dict(self.crossovers)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Mode, crossovers and per-function path counts"""
+        return {
+            'mode': self.mode,
+            'calibrated': self.calibrated,
+            'crossovers': {name: self.crossover(name) for name in self.calls},
+            'calls': {name: dict(counts) for name, counts in self.calls.items()},
+        }
+
+
+# Global dispatcher instance
+_dispatcher: Optional[BackendDispatcher] = None
+
+
+def get_dispatcher() -> BackendDispatcher:
+    """Get the global backend dispatcher"""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = BackendDispatcher()
+    return _dispatcher
@@ -24,6 +24,8 @@ Usage:
 from typing import Dict, Optional, Callable, Any, List
 import math
 
+from utils.backend_dispatch import get_dispatcher
+
 
 class BackendManager:
     """
@@ -33,9 +35,16 @@ class BackendManager:
     implementations in the codebase, including:
     - orbital_clouds.py (scipy vs pure_math)
     - sdf_renderer.py (numpy vs pure_array)
+    - pure_array.Vec3Array (numpy buffers vs array('d'))
 
     The manager also provides validation utilities to compare results
     between backends.
+
+    When libraries are enabled, each dual-path call site still picks its
+    path per call from the input size (see utils.backend_dispatch): scalar
+    and small inputs stay on pure Python, where the library call overhead
+    dominates, and larger batches use the library. calibrate_dispatch()
+    measures the crossover sizes once and persists them.
     """
 
     # Track which modules have been initialized
@@ -57,7 +66,7 @@ class BackendManager:
 
         Example:
             >>> BackendManager.set_all_backends(use_libraries=False)
-            {'orbital_clouds': True, 'sdf_renderer': True}
+            {'orbital_clouds': True, 'sdf_renderer': True, 'pure_array': True}
         """
         results = {}
 
@@ -88,6 +97,14 @@ class BackendManager:
         except Exception as e:
             results['sdf_renderer'] = False
 
+        # Set pure_array Vec3Array storage (numpy buffers vs array('d'))
+        try:
+            from utils import pure_array
+            pure_array.set_array_backend(use_numpy=use_libraries)
+            results['pure_array'] = True
+        except Exception as e:
+            results['pure_array'] = False
+
         cls._initialized = True
         return results
 
@@ -111,6 +128,37 @@ class BackendManager:
         """
         return cls.set_all_backends(use_libraries=True)
 
+    @classmethod
+    def set_dispatch_mode(cls, mode: str = 'auto'):
+        """
+        Set how dual-path call sites choose their backend.
+
+        Args:
+            mode: 'auto' (by input size against calibrated crossovers),
+                  'pure' or 'library' (always that path when available)
+        """
+        get_dispatcher().set_mode(mode)
+
+    @classmethod
+    def calibrate_dispatch(cls, force: bool = False) -> Dict[str, Optional[int]]:
+        """
+        Calibrate per-function crossover sizes (once; persisted between runs).
+
+        Args:
+            force: Re-measure even if persisted crossovers are still valid
+
+        Returns:
+            Dictionary mapping function name to the input size from which
+            the library path is used (None if it never pays off)
+        """
+        # Importing the dual-path modules registers their benchmarks
+        for module_name in ('orbital_clouds', 'sdf_renderer'):
+            try:
+                __import__(f'utils.{module_name}')
+            except ImportError:
+                pass
+        return get_dispatcher().calibrate(force=force)
+
     @classmethod
     def get_status(cls) -> Dict[str, Dict[str, Any]]:
         """
@@ -123,6 +171,12 @@ class BackendManager:
                     'current_backend': 'scipy' or 'pure_python',
                     'library_available': True/False,
                     'pure_python_available': True (always)
+                },
+                'dispatch': {
+                    'mode': 'auto' / 'pure' / 'library',
+                    'calibrated': True/False,
+                    'crossovers': {function_name: size or None},
+                    'calls': {function_name: {'pure': count, 'library': count}}
                 }
             }
         """
@@ -158,6 +212,24 @@ class BackendManager:
                 'pure_python_available': True
             }
 
+        # Check pure_array (Vec3Array storage)
+        try:
+            from utils import pure_array
+            status['pure_array'] = {
+                'current_backend': pure_array.get_array_backend(),
+                'library_available': cls._check_numpy_available(),
+                'pure_python_available': True
+            }
+        except ImportError:
+            status['pure_array'] = {
+                'current_backend': 'unknown',
+                'library_available': False,
+                'pure_python_available': True
+            }
+
+        # Per-call dispatch decisions
+        status['dispatch'] = get_dispatcher().get_status()
+
         # Check overall library availability
         status['libraries'] = {
             'scipy_available': cls._check_scipy_available(),
@@ -206,6 +278,7 @@ class BackendManager:
             ],
             'pure_array': [
                 'Vec3 (class with rotate_x, rotate_y, rotate_z)',
+                'Vec3Array (batch add/scale/dot/cross/normalize/rotate)',
                 'rotation_matrix_x',
                 'rotation_matrix_y',
                 'rotation_matrix_z',
@@ -220,6 +293,7 @@ class BackendManager:
                 'radial_wavefunction',
                 'angular_wavefunction',
                 'get_orbital_probability',
+                'get_orbital_probability_many',
                 'radial_wavefunction_enhanced',
                 'get_orbital_probability_enhanced',
             ],
@@ -390,7 +464,7 @@ class BackendManager:
 
         # Module backends
         print("\nModule Backends:")
-        for module in ['orbital_clouds', 'sdf_renderer']:
+        for module in ['orbital_clouds', 'sdf_renderer', 'pure_array']:
             if module in status:
                 mod = status[module]
                 print(f"  {module}:")
@@ -398,6 +472,14 @@ class BackendManager:
                 print(f"    Library available: {mod.get('library_available', False)}")
                 print(f"    Pure Python available: {mod.get('pure_python_available', True)}")
 
+        # Per-call dispatch
+        dispatch = status.get('dispatch', {})
+        print(f"\nPer-Call Dispatch (mode: {dispatch.get('mode')}, calibrated: {dispatch.get('calibrated')}):")
+        for name, counts in dispatch.get('calls', {}).items():
+            crossover = dispatch.get('crossovers', {}).get(name)
+            threshold = f">= {crossover} points" if crossover is not None else "never"
+            print(f"  {name}: library {threshold}; calls pure={counts['pure']} library={counts['library']}")
+
         # Available functions
         print("\nDual-Pathway Functions:")
         funcs = cls.get_available_functions()
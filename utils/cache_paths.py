@@ -0,0 +1,46 @@
+"""
+Cache Paths
+Location of Periodics' on-disk caches (calibration data, computed results).
+
+Caches live under ~/.periodics/cache by default; set PERIODICS_CACHE_DIR to
+move them (for example to a temporary directory in tests or CI).
+"""
+
+import os
+
+
+CACHE_DIR_ENV = 'PERIODICS_CACHE_DIR'
+
+
+def get_cache_dir(create: bool = True) -> str:
+    """
+    Get the directory for on-disk caches.
+
+    Args:
+        create: Create the directory if it does not exist
+
+    Returns:
+        Absolute path of the cache directory
+    """
+    path = os.environ.get(CACHE_DIR_ENV) or os.path.join(os.path.expanduser('~'), '.periodics', 'cache')
+    path = os.path.abspath(path)
+    if create:
+        os.makedirs(path, exist_ok=True)
+    return path
+
+
+def get_cache_path(filename: str, create_dir: bool = True) -> str:
+    """
+    Get the path of a file inside the cache directory.
+
+    Args:
+        filename: File name (may include a subdirectory)
+        create_dir: Create the containing directory if needed
+
+    Returns:
+        Absolute file path
+    """
+    path = os.path.join(get_cache_dir(create=create_dir), filename)
+    if create_dir:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
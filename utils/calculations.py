@@ -186,35 +186,26 @@ def draw_spectrum_bar(painter, rect, spectrum_lines, show_prominent_only=False):
     painter.restore()
 
 
-def wavelength_to_rgb(wavelength_nm, range_min=380, range_max=780, fade=0.0):
+SPECTRUM_TABLE_SIZE = 1024
+
+
+def _spectrum_rgb(normalized):
     """
-    Convert wavelength to visible RGB color using rainbow spectrum.
-    Small wavelengths lerp toward white, large wavelengths lerp toward black.
+    Rainbow color for a position in the mapped wavelength range.
 
     Args:
-        wavelength_nm: Wavelength value to map
-        range_min: Minimum wavelength to map to violet (default 380nm)
-        range_max: Maximum wavelength to map to red (default 780nm)
-        fade: Fade towards transparent (0.0 = no fade, 1.0 = fully transparent)
+        normalized: 0.0 at range_min (violet) to 1.0 at range_max (red); values
+                    outside [0, 1] fade further toward white or black
 
     Returns:
-        QColor representing the wavelength in the visible spectrum with alpha
+        (r, g, b) integer tuple
     """
-    # Map input wavelength to visible spectrum range (380-780nm)
-    # This allows shifting the color mapping
-    if range_min >= range_max:
-        range_max = range_min + 1
-
-    normalized = (wavelength_nm - range_min) / (range_max - range_min)
     w = 380 + normalized * (780 - 380)  # Map to visible spectrum
 
     # Clamp to visible range
     w = max(380, min(780, w))
 
     # Rainbow spectrum mapping (violet -> blue -> cyan -> green -> yellow -> orange -> red)
-    if w < 380 or w > 780:
-        return QColor(120, 120, 150)  # UV/IR gray-blue
-
     if 380 <= w < 440:  # Violet to Blue
         r, g, b = -(w - 440) / 60, 0.0, 1.0
     elif 440 <= w < 490:  # Blue to Cyan
@@ -254,12 +245,66 @@ def wavelength_to_rgb(wavelength_nm, range_min=380, range_max=780, fade=0.0):
         g = g * (1 - black_factor)
         b = b * (1 - black_factor)
 
+    return int(r * 255), int(g * 255), int(b * 255)
+
+
+_spectrum_tables = {}
+
+
+def spectrum_rgb_table(size=SPECTRUM_TABLE_SIZE):
+    """
+    Precomputed rainbow colors sampled evenly over the mapped range.
+
+    Args:
+        size: Number of samples (entry i is normalized position i / (size - 1))
+
+    Returns:
+        Tuple of (r, g, b) tuples, built once per size
+    """
+    table = _spectrum_tables.get(size)
+    if table is None:
+        table = tuple(_spectrum_rgb(i / (size - 1)) for i in range(size))
+        _spectrum_tables[size] = table
+    return table
+
+
+def wavelength_to_rgb_tuple(wavelength_nm, range_min=380, range_max=780):
+    """
+    Rainbow (r, g, b) for a wavelength without allocating a QColor.
+
+    In-range wavelengths are read from the precomputed spectrum table.
+    """
+    if range_min >= range_max:
+        range_max = range_min + 1
+
+    normalized = (wavelength_nm - range_min) / (range_max - range_min)
+    if 0.0 <= normalized <= 1.0:
+        return spectrum_rgb_table()[int(normalized * (SPECTRUM_TABLE_SIZE - 1) + 0.5)]
+    return _spectrum_rgb(normalized)
+
+
+def wavelength_to_rgb(wavelength_nm, range_min=380, range_max=780, fade=0.0):
+    """
+    Convert wavelength to visible RGB color using rainbow spectrum.
+    Small wavelengths lerp toward white, large wavelengths lerp toward black.
+
+    Args:
+        wavelength_nm: Wavelength value to map
+        range_min: Minimum wavelength to map to violet (default 380nm)
+        range_max: Maximum wavelength to map to red (default 780nm)
+        fade: Fade towards transparent (0.0 = no fade, 1.0 = fully transparent)
+
+    Returns:
+        QColor representing the wavelength in the visible spectrum with alpha
+    """
+    r, g, b = wavelength_to_rgb_tuple(wavelength_nm, range_min, range_max)
+
     # Apply fade parameter to alpha channel
     # fade = 0.0: alpha = 255 (fully opaque)
     # fade = 1.0: alpha = 0 (fully transparent)
     alpha = int(255 * (1.0 - fade))
 
-    return QColor(int(r * 255), int(g * 255), int(b * 255), alpha)
+    return QColor(r, g, b, alpha)
 
 
 def get_ie_color(ie, fade=0.0):
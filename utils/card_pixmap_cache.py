@@ -0,0 +1,149 @@
+"""
+Card Pixmap Cache
+Memory-bounded LRU cache of pre-rendered table cards.
+
+A card is painted once, through the table's own draw method, into a QPixmap
+at the painter's current device scale (zoom x device pixel ratio, bucketed so
+that small zoom steps reuse the same raster), and later paints only blit it.
+Entries are keyed by (namespace, item id, encoding state, hover/selection
+state, card size, raster scale); tables drop entries explicitly when an item's
+data or the table's visual encoding changes.
+"""
+
+import math
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QPainter, QPixmap
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+SCALE_STEPS_PER_OCTAVE = 4      # raster scales per doubling of zoom
+MIN_RASTER_SCALE = 0.25
+MAX_RASTER_SCALE = 8.0
+
+
+def raster_scale_bucket(scale: float) -> float:
+    """Round a device scale to the nearest cached raster scale (2^(k/4))"""
+    scale = max(MIN_RASTER_SCALE, min(MAX_RASTER_SCALE, scale))
+    return 2.0 ** (round(math.log2(scale) * SCALE_STEPS_PER_OCTAVE) / SCALE_STEPS_PER_OCTAVE)
+
+
+class CardPixmapCache:
+    """LRU map of card keys to rendered pixmaps, bounded by pixel memory"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Pixmap memory budget shared by all tables
+        """
+        self.max_bytes = max_bytes
+        self.enabled = True
+        self._entries: 'OrderedDict[Tuple, Tuple[QPixmap, int]]' = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def draw_card(self, painter: QPainter, namespace: str, item_id: Hashable, encoding: Hashable,
+                  state: str, x: float, y: float, width: float, height: float,
+                  render: Callable[[QPainter], None], pad: float = 0.0):
+        """
+        Blit a card, rendering it into the cache on a miss.
+
+        Args:
+            painter: Table painter with the pan/zoom transform applied
+            namespace: Table name (keeps item ids of different tables apart)
+            item_id: Stable item identifier (the data 'Name')
+            encoding: Hashable table-wide visual encoding state
+            state: Interaction state ('', 'hovered' or 'selected')
+            x, y, width, height: Card rectangle in layout units
+            render: Draws the card at (x, y) with the given painter
+            pad: Layout units drawn outside the card (glows, thick borders)
+        """
+        if not self.enabled:
+            render(painter)
+            return
+
+        transform = painter.transform()
+        device_scale = math.hypot(transform.m11(), transform.m12()) * painter.device().devicePixelRatioF()
+        scale = raster_scale_bucket(device_scale)
+        key = (namespace, item_id, encoding, state, width, height, pad, scale)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            pixmap = entry[0]
+        else:
+            self.misses += 1
+            pixmap = self._render(x, y, width, height, pad, scale, render)
+            size = pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+            if size <= self.max_bytes:
+                self._entries[key] = (pixmap, size)
+                self._bytes += size
+                self._evict()
+
+        target = QRectF(x - pad, y - pad, width + 2 * pad, height + 2 * pad)
+        source = QRectF(0, 0, target.width() * scale, target.height() * scale)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, scale != device_scale)
+        painter.drawPixmap(target, pixmap, source)
+
+    @staticmethod
+    def _render(x: float, y: float, width: float, height: float, pad: float, scale: float,
+                render: Callable[[QPainter], None]) -> QPixmap:
+        """Paint a card into a new transparent pixmap at the given raster scale"""
+        pixmap = QPixmap(math.ceil((width + 2 * pad) * scale), math.ceil((height + 2 * pad) * scale))
+        pixmap.fill(Qt.GlobalColor.transparent)
+        card_painter = QPainter(pixmap)
+        card_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        card_painter.scale(scale, scale)
+        card_painter.translate(pad - x, pad - y)
+        render(card_painter)
+        card_painter.end()
+        return pixmap
+
+    def invalidate(self, namespace: str, item_ids: Optional[Any] = None):
+        """
+        Drop cached cards of a table.
+
+        Args:
+            namespace: Table name
+            item_ids: Item ids to drop (default: every card of the table)
+        """
+        ids = None if item_ids is None else set(item_ids)
+        for key in [k for k in self._entries if k[0] == namespace and (ids is None or k[1] in ids)]:
+            self._bytes -= self._entries.pop(key)[1]
+
+    def clear(self):
+        """Drop every cached card"""
+        self._entries.clear()
+        self._bytes = 0
+
+    def set_max_bytes(self, max_bytes: int):
+        """Change the memory budget, evicting if needed"""
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count, memory use and hit/miss counters"""
+        return {'entries': len(self._entries), 'bytes': self._bytes,
+                'hits': self.hits, 'misses': self.misses}
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+
+
+_card_pixmap_cache: Optional[CardPixmapCache] = None
+
+
+def get_card_pixmap_cache() -> CardPixmapCache:
+    """Get the pixmap cache shared by the unified tables"""
+    global _card_pixmap_cache
+    if _card_pixmap_cache is None:
+        _card_pixmap_cache = CardPixmapCache()
+    return _card_pixmap_cache
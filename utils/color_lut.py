@@ -0,0 +1,112 @@
+"""
+Color Lookup Tables
+Precomputed property-to-color tables for the visual encoding channels.
+
+A two-color gradient or the rainbow spectrum is sampled once into a fixed
+number of QColor entries with the channel's alpha baked in, so mapping a
+normalized value to a color is an index into a list.  Tables are cached by
+their defining parameters (endpoints and alpha), so a table is only built
+again when a channel's gradient endpoints or fade change.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+from PySide6.QtGui import QColor
+
+from utils.calculations import SPECTRUM_TABLE_SIZE, spectrum_rgb_table
+
+
+GRADIENT_LUT_SIZE = 256
+
+RGB = Tuple[int, int, int]
+
+
+class ColorLUT:
+    """Fixed-size table of colors over the normalized range [0, 1]"""
+
+    def __init__(self, rgb: Sequence[RGB], alpha: int = 255):
+        """
+        Initialize the table.
+
+        Args:
+            rgb: Sampled (r, g, b) entries; entry i is position i / (len - 1)
+            alpha: Alpha applied to every entry
+        """
+        self.rgb = tuple(rgb)
+        self.alpha = alpha
+        self.size = len(self.rgb)
+        self.colors: List[QColor] = [QColor(r, g, b, alpha) for r, g, b in self.rgb]
+
+    def index(self, t: float) -> int:
+        """Table index for a normalized position (clamped to the table)"""
+        if t <= 0.0:
+            return 0
+        if t >= 1.0:
+            return self.size - 1
+        return int(t * (self.size - 1) + 0.5)
+
+    def color_at(self, t: float) -> QColor:
+        """Shared QColor for a normalized position (copy it before modifying)"""
+        return self.colors[self.index(t)]
+
+    def rgb_at(self, t: float) -> RGB:
+        """(r, g, b) for a normalized position"""
+        return self.rgb[self.index(t)]
+
+
+_gradient_luts: Dict[Tuple[RGB, RGB, int, int], ColorLUT] = {}
+_spectrum_luts: Dict[Tuple[int, int], ColorLUT] = {}
+
+# Endpoints and fade change with user edits; keep the caches bounded
+_MAX_GRADIENT_LUTS = 64
+_MAX_SPECTRUM_LUTS = 16
+
+
+def gradient_lut(start: RGB, end: RGB, alpha: int = 255, size: int = GRADIENT_LUT_SIZE) -> ColorLUT:
+    """
+    Linear A-to-B gradient table.
+
+    Args:
+        start: (r, g, b) at position 0
+        end: (r, g, b) at position 1
+        alpha: Alpha for every entry
+        size: Number of entries
+
+    Returns:
+        Cached ColorLUT for these parameters
+    """
+    key = (tuple(start), tuple(end), alpha, size)
+    lut = _gradient_luts.get(key)
+    if lut is None:
+        if len(_gradient_luts) >= _MAX_GRADIENT_LUTS:
+            _gradient_luts.clear()
+        sr, sg, sb = start
+        er, eg, eb = end
+        rgb = []
+        for i in range(size):
+            t = i / (size - 1)
+            rgb.append((int(sr * (1 - t) + er * t), int(sg * (1 - t) + eg * t), int(sb * (1 - t) + eb * t)))
+        lut = ColorLUT(rgb, alpha)
+        _gradient_luts[key] = lut
+    return lut
+
+
+def spectrum_lut(alpha: int = 255, size: int = SPECTRUM_TABLE_SIZE) -> ColorLUT:
+    """
+    Rainbow spectrum table matching wavelength_to_rgb over the mapped range.
+
+    Args:
+        alpha: Alpha for every entry
+        size: Number of entries
+
+    Returns:
+        Cached ColorLUT for these parameters
+    """
+    key = (alpha, size)
+    lut = _spectrum_luts.get(key)
+    if lut is None:
+        if len(_spectrum_luts) >= _MAX_SPECTRUM_LUTS:
+            _spectrum_luts.clear()
+        lut = ColorLUT(spectrum_rgb_table(size), alpha)
+        _spectrum_luts[key] = lut
+    return lut
@@ -0,0 +1,120 @@
+"""
+Filter Masks
+Per-filter bitsets over a fixed item list, combined with AND.
+
+Each filter is evaluated once per (filter, setting) into an integer bitset
+with bit i set when item i passes. Toggling a filter swaps in that filter's
+cached bitset and re-ANDs a handful of integers, so no other filter is
+re-evaluated and flipping a toggle back costs a dictionary lookup. The
+combined mask doubles as a cache key for layouts of the filtered items.
+"""
+
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+Predicate = Callable[[Any], bool]
+
+
+def build_mask(items: Sequence[Any], predicate: Predicate) -> int:
+    """Bitset with bit i set when predicate(items[i]) is true"""
+    bits = ''.join('1' if predicate(item) else '0' for item in reversed(items))
+    return int(bits, 2) if bits else 0
+
+
+class FilterMasks:
+    """Named filters over an item list, each cached as a bitset per setting"""
+
+    def __init__(self, items: Sequence[Any] = ()):
+        """
+        Initialize with no active filters.
+
+        Args:
+            items: Items in display order
+        """
+        self._filters: Dict[str, Tuple[Hashable, Predicate]] = {}
+        self.set_items(items)
+
+    def set_items(self, items: Sequence[Any]):
+        """Replace the item list; cached bitsets are rebuilt lazily"""
+        self.items = list(items)
+        self._full = (1 << len(self.items)) - 1
+        self._masks: Dict[Tuple[str, Hashable], int] = {}
+        self._combined: Optional[int] = None
+        self._selected: Optional[List[Any]] = None
+
+    def set_filter(self, name: str, setting: Hashable, predicate: Optional[Predicate]) -> bool:
+        """
+        Set or clear one filter.
+
+        Args:
+            name: Filter name
+            setting: Hashable description of the filter's current setting; the
+                predicate is only evaluated the first time a setting is seen
+            predicate: Item -> passes, or None to remove the filter
+
+        Returns:
+            True if the filter's setting changed
+        """
+        if predicate is None:
+            changed = self._filters.pop(name, None) is not None
+        else:
+            current = self._filters.get(name)
+            changed = current is None or current[0] != setting
+            self._filters[name] = (setting, predicate)
+        if changed:
+            self._combined = None
+            self._selected = None
+        return changed
+
+    def filter_mask(self, name: str) -> int:
+        """Bitset of one filter (all items pass when the filter is not set)"""
+        if name not in self._filters:
+            return self._full
+        setting, predicate = self._filters[name]
+        key = (name, setting)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = build_mask(self.items, predicate)
+            self._masks[key] = mask
+        return mask
+
+    @property
+    def mask(self) -> int:
+        """AND of all filter bitsets"""
+        if self._combined is None:
+            combined = self._full
+            for name in self._filters:
+                combined &= self.filter_mask(name)
+            self._combined = combined
+        return self._combined
+
+    def selected(self) -> List[Any]:
+        """Items passing every filter, in display order"""
+        if self._selected is None:
+            self._selected = self.items_for(self.mask)
+        return list(self._selected)
+
+    def items_for(self, mask: int) -> List[Any]:
+        """Items whose bits are set in a mask"""
+        items = self.items
+        result = []
+        while mask:
+            low = mask & -mask
+            result.append(items[low.bit_length() - 1])
+            mask ^= low
+        return result
+
+    def diff(self, old_mask: int, new_mask: Optional[int] = None) -> Tuple[List[Any], List[Any]]:
+        """
+        Items added and removed between two masks.
+
+        Args:
+            old_mask: Previous combined mask
+            new_mask: New mask (default: the current combined mask)
+
+        Returns:
+            (added items, removed items), each in display order
+        """
+        if new_mask is None:
+            new_mask = self.mask
+        return self.items_for(new_mask & ~old_mask), self.items_for(old_mask & ~new_mask)
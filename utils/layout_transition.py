@@ -0,0 +1,192 @@
+"""
+Layout Transition
+Interpolated layout switches and background layout prefetching.
+
+A LayoutTransition takes the per-item values (position, and optionally size)
+of the source and target layouts, flattens them into arrays once, and on each
+animation frame evaluates start + delta * eased(t) over the flat arrays.
+Items only in the target fade in at their target position and items only in
+the source fade out at their source position. The tables drive transitions
+from a QTimer and repaint only the moving items while one is active.
+
+LayoutPrefetcher computes candidate layouts on a background thread, e.g. when
+the user hovers a layout selector, so that the switch itself only has to pick
+up the finished result.
+"""
+
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+DEFAULT_TRANSITION_SECONDS = 0.3
+TRANSITION_FRAME_MS = 16
+MAX_PREFETCHED_LAYOUTS = 8
+
+
+def ease_in_out_cubic(t: float) -> float:
+    """Cubic ease-in/ease-out of t in [0, 1]"""
+    if t < 0.5:
+        return 4 * t * t * t
+    u = 2 * t - 2
+    return 1 + u * u * u / 2
+
+
+class LayoutTransition:
+    """Interpolation between two layouts over flat value arrays"""
+
+    def __init__(self, source: Dict[Hashable, Sequence[float]], target: Dict[Hashable, Sequence[float]],
+                 duration: float = DEFAULT_TRANSITION_SECONDS,
+                 easing: Callable[[float], float] = ease_in_out_cubic,
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize a transition (call start() to begin timing).
+
+        Args:
+            source: Item key -> values (e.g. (x, y) or (x, y, size)) in the current layout
+            target: Item key -> values in the new layout, same number of values per item
+            duration: Length in seconds
+            easing: Maps linear progress in [0, 1] to eased progress
+            clock: Time source in seconds
+        """
+        self.keys: List[Hashable] = list(target) + [k for k in source if k not in target]
+        sample = next(iter(target.values()), None) or next(iter(source.values()), ())
+        self.channels = len(sample)
+        self.duration = max(1e-6, duration)
+        self.easing = easing
+        self.clock = clock
+        self._start_time: Optional[float] = None
+
+        self._start = array('d')
+        self._delta = array('d')
+        self._opacity_start = array('d')
+        self._opacity_delta = array('d')
+        self.moving = 0
+        for key in self.keys:
+            begin, end = source.get(key), target.get(key)
+            if begin is not None and end is not None:
+                self._start.extend(begin)
+                self._delta.extend(e - b for b, e in zip(begin, end))
+                self._opacity_start.append(1.0)
+                self._opacity_delta.append(0.0)
+                if any(e != b for b, e in zip(begin, end)):
+                    self.moving += 1
+            elif end is not None:
+                # Entering: fade in at the target position
+                self._start.extend(end)
+                self._delta.extend([0.0] * self.channels)
+                self._opacity_start.append(0.0)
+                self._opacity_delta.append(1.0)
+                self.moving += 1
+            else:
+                # Leaving: fade out at the source position
+                self._start.extend(begin)
+                self._delta.extend([0.0] * self.channels)
+                self._opacity_start.append(1.0)
+                self._opacity_delta.append(-1.0)
+                self.moving += 1
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def start(self, now: Optional[float] = None) -> 'LayoutTransition':
+        """Begin timing; returns self"""
+        self._start_time = self.clock() if now is None else now
+        return self
+
+    def progress(self, now: Optional[float] = None) -> float:
+        """Eased progress in [0, 1] (0 before start())"""
+        if self._start_time is None:
+            return 0.0
+        now = self.clock() if now is None else now
+        t = min(1.0, max(0.0, (now - self._start_time) / self.duration))
+        return self.easing(t)
+
+    def is_finished(self, now: Optional[float] = None) -> bool:
+        """True once the full duration has elapsed"""
+        if self._start_time is None:
+            return False
+        now = self.clock() if now is None else now
+        return now - self._start_time >= self.duration
+
+    def frame(self, now: Optional[float] = None) -> Tuple[array, array]:
+        """
+        Interpolated values for the current time.
+
+        Returns:
+            (values, opacities): values holds `channels` floats per item in
+            self.keys order, opacities one float per item
+        """
+        t = self.progress(now)
+        values = array('d', [s + d * t for s, d in zip(self._start, self._delta)])
+        opacities = array('d', [s + d * t for s, d in zip(self._opacity_start, self._opacity_delta)])
+        return values, opacities
+
+
+class LayoutPrefetcher:
+    """Background-thread layout computation keyed by layout parameters"""
+
+    def __init__(self, max_entries: int = MAX_PREFETCHED_LAYOUTS):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            max_entries: Prefetched layouts kept before the oldest is dropped
+        """
+        self.max_entries = max_entries
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: 'OrderedDict[Tuple, Future]' = OrderedDict()
+
+    def prefetch(self, key: Tuple, compute: Callable[[], Any]):
+        """
+        Start computing a layout unless it is already pending or done.
+
+        Args:
+            key: Tuple starting with the table namespace, followed by everything
+                the layout depends on (mode, widget size, filter state, ...)
+            compute: Function returning the layout; it must only read state
+                captured at submission time
+        """
+        if key in self._futures:
+            self._futures.move_to_end(key)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='layout-prefetch')
+        self._futures[key] = self._executor.submit(compute)
+        while len(self._futures) > self.max_entries:
+            _, future = self._futures.popitem(last=False)
+            future.cancel()
+
+    def take(self, key: Tuple) -> Optional[Any]:
+        """
+        Remove and return a prefetched layout, waiting if it is still running.
+
+        Returns:
+            The layout, or None if it was never prefetched or failed
+        """
+        future = self._futures.pop(key, None)
+        if future is None or future.cancelled():
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"Warning: Layout prefetch failed for {key[0]}: {e}")
+            return None
+
+    def discard(self, namespace: str):
+        """Drop every prefetched layout of a table (e.g. after a data change)"""
+        for key in [k for k in self._futures if k[0] == namespace]:
+            self._futures.pop(key).cancel()
+
+
+_layout_prefetcher: Optional[LayoutPrefetcher] = None
+
+
+def get_layout_prefetcher() -> LayoutPrefetcher:
+    """Get the prefetcher shared by the unified tables"""
+    global _layout_prefetcher
+    if _layout_prefetcher is None:
+        _layout_prefetcher = LayoutPrefetcher()
+    return _layout_prefetcher
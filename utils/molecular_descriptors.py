@@ -0,0 +1,352 @@
+"""
+Molecular Descriptors
+Catalog-wide geometric and electrostatic descriptors in one vectorized pass.
+
+The atoms of every molecule are packed into flat arrays (coordinates, masses,
+partial charges, atomic polarizabilities) with an offsets array marking where
+each molecule starts. Descriptors are then computed for the whole catalog at
+once: per-molecule sums are segment reductions over the packed arrays, the
+3x3 inertia tensors are diagonalized as one stack, and intramolecular
+distances are evaluated over one concatenated pair list. numpy is used when
+the array backend is numpy; otherwise the same passes run over array('d').
+
+Descriptors per molecule:
+    - Center of mass, full inertia tensor, principal moments and axes
+    - Rotational constants A >= B >= C from the principal moments
+    - Radius of gyration and relative shape anisotropy (kappa^2)
+    - Pairwise-distance statistics (mean, min, max)
+    - Dipole vector and magnitude from bond partial charges
+    - Polarizability from additive atomic values with a shape correction
+"""
+
+import math
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from utils.physics_calculator import MoleculeCalculator
+from utils.physics_calculator_v2 import MoleculeCalculatorV2
+from utils.pure_array import array_numpy, symmetric_eigen_batch
+from utils.structure_embedding import molecule_atoms_3d
+
+
+# Partial charge moved across a bond per unit of electronegativity difference (e),
+# which reproduces the dipole of HCl
+CHARGE_PER_EN_DIFFERENCE = 0.18
+# e * Angstrom in Debye
+DEBYE_PER_E_ANGSTROM = 4.80320
+# h / (8 pi^2 c) in amu * Angstrom^2 * cm^-1
+ROTATIONAL_CONSTANT_FACTOR = 16.8576
+# Polarizability: bond correction and extra factor for fully anisotropic (linear) shapes
+POLARIZABILITY_BOND_CORRECTION = 0.95
+POLARIZABILITY_ANISOTROPY_GAIN = 0.15
+DEFAULT_ATOMIC_POLARIZABILITY = 2.0
+
+# Per-molecule segment sums, in this order
+_SUM_FIELDS = ('mass', 'mx', 'my', 'mz', 'mxx', 'myy', 'mzz', 'mxy', 'mxz', 'myz',
+               'qx', 'qy', 'qz', 'alpha')
+
+
+def partial_charges(elements: Sequence[str], bonds: Iterable[Dict]) -> List[float]:
+    """
+    Bond-increment partial charges: each bond moves charge toward its more
+    electronegative atom in proportion to the electronegativity difference.
+
+    Args:
+        elements: Element symbol per atom
+        bonds: Bond dictionaries with 'from' and 'to' atom indices
+
+    Returns:
+        Charge (e) per atom; the charges sum to zero
+    """
+    electronegativity = MoleculeCalculator.ELECTRONEGATIVITIES
+    charges = [0.0] * len(elements)
+    for bond in bonds:
+        i, j = bond['from'], bond['to']
+        if i == j or max(i, j) >= len(elements):
+            continue
+        shift = CHARGE_PER_EN_DIFFERENCE * (electronegativity.get(elements[j], 2.0) -
+                                            electronegativity.get(elements[i], 2.0))
+        charges[i] += shift
+        charges[j] -= shift
+    return charges
+
+
+class PackedMolecules:
+    """Atoms of many molecules in flat arrays with per-molecule offsets"""
+
+    def __init__(self):
+        """Initialize an empty catalog"""
+        self.names: List[str] = []
+        self.offsets = array('l', [0])
+        self.x = array('d')
+        self.y = array('d')
+        self.z = array('d')
+        self.mass = array('d')
+        self.charge = array('d')
+        self.alpha = array('d')
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str, elements: Sequence[str], coordinates: Sequence[Tuple[float, float, float]],
+            bonds: Iterable[Dict] = (), masses: Optional[Sequence[float]] = None):
+        """
+        Append one molecule.
+
+        Args:
+            name: Molecule name
+            elements: Element symbol per atom
+            coordinates: (x, y, z) in Angstroms per atom
+            bonds: Bond dictionaries ('from', 'to') used for partial charges
+            masses: Atomic mass (amu) per atom (default: looked up by element)
+        """
+        if masses is None:
+            table = MoleculeCalculator.ATOMIC_MASSES
+            masses = [table.get(element, 1.0) for element in elements]
+        polarizabilities = MoleculeCalculatorV2.ATOMIC_POLARIZABILITIES
+        self.names.append(name)
+        for element, (x, y, z), mass in zip(elements, coordinates, masses):
+            self.x.append(x)
+            self.y.append(y)
+            self.z.append(z)
+            self.mass.append(mass)
+            self.alpha.append(polarizabilities.get(element, DEFAULT_ATOMIC_POLARIZABILITY))
+        self.charge.extend(partial_charges(elements, bonds))
+        self.offsets.append(len(self.x))
+
+    @classmethod
+    def from_records(cls, molecules: Iterable[Dict]) -> 'PackedMolecules':
+        """
+        Pack molecule records using their Atoms3D (or embedded Bonds3D) and Bonds3D.
+
+        Args:
+            molecules: Molecule dictionaries as loaded from JSON
+        """
+        packed = cls()
+        for molecule in molecules:
+            atoms = molecule_atoms_3d(molecule)
+            packed.add(molecule.get('Name', ''),
+                       [a.get('element', '?') for a in atoms],
+                       [(a.get('x', 0.0), a.get('y', 0.0), a.get('z', 0.0)) for a in atoms],
+                       molecule.get('Bonds3D', []))
+        return packed
+
+
+# ==================== Segment Sums ====================
+
+def _segment_sums(packed: PackedMolecules) -> Dict[str, Sequence[float]]:
+    """Per-molecule sums of the atom quantities in _SUM_FIELDS"""
+    count = len(packed)
+    np = array_numpy()
+    if np is not None:
+        ids = np.repeat(np.arange(count), np.diff(np.array(packed.offsets)))
+        x, y, z = (np.array(c, dtype=np.float64) for c in (packed.x, packed.y, packed.z))
+        m = np.array(packed.mass, dtype=np.float64)
+        q = np.array(packed.charge, dtype=np.float64)
+        weights = {'mass': m, 'mx': m * x, 'my': m * y, 'mz': m * z,
+                   'mxx': m * x * x, 'myy': m * y * y, 'mzz': m * z * z,
+                   'mxy': m * x * y, 'mxz': m * x * z, 'myz': m * y * z,
+                   'qx': q * x, 'qy': q * y, 'qz': q * z,
+                   'alpha': np.array(packed.alpha, dtype=np.float64)}
+        return {field: np.bincount(ids, weights=weights[field], minlength=count).tolist()
+                for field in _SUM_FIELDS}
+
+    sums = {field: array('d', [0.0]) * count for field in _SUM_FIELDS}
+    xs, ys, zs, ms, qs, alphas = packed.x, packed.y, packed.z, packed.mass, packed.charge, packed.alpha
+    for k in range(count):
+        totals = [0.0] * len(_SUM_FIELDS)
+        for i in range(packed.offsets[k], packed.offsets[k + 1]):
+            x, y, z, m, q = xs[i], ys[i], zs[i], ms[i], qs[i]
+            mx, my, mz = m * x, m * y, m * z
+            totals[0] += m
+            totals[1] += mx
+            totals[2] += my
+            totals[3] += mz
+            totals[4] += mx * x
+            totals[5] += my * y
+            totals[6] += mz * z
+            totals[7] += mx * y
+            totals[8] += mx * z
+            totals[9] += my * z
+            totals[10] += q * x
+            totals[11] += q * y
+            totals[12] += q * z
+            totals[13] += alphas[i]
+        for field, total in zip(_SUM_FIELDS, totals):
+            sums[field][k] = total
+    return sums
+
+
+# ==================== Principal Axes ====================
+
+def _inertia_tensors(sums: Dict[str, Sequence[float]], count: int) -> Tuple[List, List, List]:
+    """Centers of mass, second moments about them and inertia tensors from the segment sums"""
+    centers, seconds, tensors = [], [], []
+    for k in range(count):
+        mass = sums['mass'][k] or 1.0
+        c = (sums['mx'][k] / mass, sums['my'][k] / mass, sums['mz'][k] / mass)
+        # Mass-weighted second moments about the center of mass (parallel axis theorem)
+        sxx = sums['mxx'][k] - mass * c[0] * c[0]
+        syy = sums['myy'][k] - mass * c[1] * c[1]
+        szz = sums['mzz'][k] - mass * c[2] * c[2]
+        sxy = sums['mxy'][k] - mass * c[0] * c[1]
+        sxz = sums['mxz'][k] - mass * c[0] * c[2]
+        syz = sums['myz'][k] - mass * c[1] * c[2]
+        centers.append(c)
+        seconds.append((sxx, syy, szz, sxy, sxz, syz))
+        tensors.append([[syy + szz, -sxy, -sxz],
+                        [-sxy, sxx + szz, -syz],
+                        [-sxz, -syz, sxx + syy]])
+    return centers, seconds, tensors
+
+
+def principal_moments(packed: PackedMolecules) -> List[Tuple[float, float, float]]:
+    """
+    Principal moments of inertia of every packed molecule, without the other descriptors.
+
+    Returns:
+        Moments (amu * Angstrom^2) in ascending order per molecule
+    """
+    _, _, tensors = _inertia_tensors(_segment_sums(packed), len(packed))
+    return [tuple(max(0.0, moment) for moment in moments) for moments, _ in symmetric_eigen_batch(tensors)]
+
+
+# ==================== Distance Statistics ====================
+
+def distance_statistics(packed: PackedMolecules) -> List[Tuple[float, float, float, int]]:
+    """
+    Intramolecular pairwise-distance statistics of every molecule.
+
+    Returns:
+        (mean, min, max, pair count) per molecule; zeros for fewer than two atoms
+    """
+    count = len(packed)
+    offsets = packed.offsets
+    np = array_numpy()
+    if np is not None:
+        firsts, seconds, owners = [], [], []
+        for k in range(count):
+            n = offsets[k + 1] - offsets[k]
+            if n > 1:
+                i, j = np.triu_indices(n, 1)
+                firsts.append(i + offsets[k])
+                seconds.append(j + offsets[k])
+                owners.append(np.full(len(i), k))
+        if not firsts:
+            return [(0.0, 0.0, 0.0, 0)] * count
+        i, j, owner = np.concatenate(firsts), np.concatenate(seconds), np.concatenate(owners)
+        x, y, z = (np.array(c, dtype=np.float64) for c in (packed.x, packed.y, packed.z))
+        distances = np.sqrt((x[i] - x[j]) ** 2 + (y[i] - y[j]) ** 2 + (z[i] - z[j]) ** 2)
+        pairs = np.bincount(owner, minlength=count)
+        totals = np.bincount(owner, weights=distances, minlength=count)
+        # Pairs are grouped by molecule, so each nonempty group is one reduceat segment
+        present = np.flatnonzero(pairs)
+        starts = np.concatenate(([0], np.cumsum(pairs)[:-1]))[present]
+        lows = np.minimum.reduceat(distances, starts)
+        highs = np.maximum.reduceat(distances, starts)
+        stats = [(0.0, 0.0, 0.0, 0)] * count
+        for k, low, high in zip(present.tolist(), lows.tolist(), highs.tolist()):
+            stats[k] = (totals[k] / pairs[k], low, high, int(pairs[k]))
+        return stats
+
+    xs, ys, zs = packed.x, packed.y, packed.z
+    stats = []
+    for k in range(count):
+        start, end = offsets[k], offsets[k + 1]
+        total, low, high, pairs = 0.0, math.inf, 0.0, 0
+        for i in range(start, end):
+            x, y, z = xs[i], ys[i], zs[i]
+            for j in range(i + 1, end):
+                distance = math.sqrt((xs[j] - x) ** 2 + (ys[j] - y) ** 2 + (zs[j] - z) ** 2)
+                total += distance
+                low = min(low, distance)
+                high = max(high, distance)
+                pairs += 1
+        stats.append((total / pairs, low, high, pairs) if pairs else (0.0, 0.0, 0.0, 0))
+    return stats
+
+
+# ==================== Descriptors ====================
+
+def compute_descriptors(packed: PackedMolecules) -> List[Dict]:
+    """
+    Compute the descriptors of every packed molecule.
+
+    Args:
+        packed: Catalog built with PackedMolecules
+
+    Returns:
+        One descriptor dictionary per molecule, in packing order
+    """
+    sums = _segment_sums(packed)
+    count = len(packed)
+    centers, seconds, tensors = _inertia_tensors(sums, count)
+    axes = symmetric_eigen_batch(tensors)
+    distances = distance_statistics(packed)
+
+    descriptors = []
+    for k in range(count):
+        mass = sums['mass'][k]
+        sxx, syy, szz, sxy, sxz, syz = seconds[k]
+        moments, principal = axes[k]
+        moments = [max(0.0, moment) for moment in moments]
+
+        # Relative shape anisotropy from the invariants of the second-moment tensor
+        trace = sxx + syy + szz
+        minors = sxx * syy + sxx * szz + syy * szz - sxy * sxy - sxz * sxz - syz * syz
+        anisotropy = max(0.0, min(1.0, 1.0 - 3.0 * minors / (trace * trace))) if trace > 1e-12 else 0.0
+
+        dipole = (sums['qx'][k] * DEBYE_PER_E_ANGSTROM,
+                  sums['qy'][k] * DEBYE_PER_E_ANGSTROM,
+                  sums['qz'][k] * DEBYE_PER_E_ANGSTROM)
+        polarizability = (sums['alpha'][k] * POLARIZABILITY_BOND_CORRECTION *
+                          (1.0 + POLARIZABILITY_ANISOTROPY_GAIN * anisotropy))
+        mean_distance, min_distance, max_distance, pairs = distances[k]
+
+        # A >= B >= C from the smallest to the largest principal moment
+        constants = [ROTATIONAL_CONSTANT_FACTOR / moment if moment > 1e-9 else 0.0 for moment in moments]
+
+        descriptors.append({
+            'name': packed.names[k],
+            'atom_count': packed.offsets[k + 1] - packed.offsets[k],
+            'mass_amu': mass,
+            'center_of_mass': centers[k],
+            'inertia_tensor': tensors[k],
+            'principal_moments': tuple(moments),
+            'principal_axes': tuple(tuple(axis) for axis in principal),
+            'rotational_constants_cm-1': tuple(constants),
+            'radius_of_gyration': math.sqrt(trace / mass) if mass > 0 and trace > 0 else 0.0,
+            'anisotropy': anisotropy,
+            'mean_distance': mean_distance,
+            'min_distance': min_distance,
+            'max_distance': max_distance,
+            'pair_count': pairs,
+            'dipole_vector_D': dipole,
+            'dipole_D': math.sqrt(dipole[0] ** 2 + dipole[1] ** 2 + dipole[2] ** 2),
+            'polarizability_A3': polarizability,
+        })
+    return descriptors
+
+
+def apply_descriptors(molecules: List[Dict]) -> List[Dict]:
+    """
+    Compute descriptors for a list of molecule records in one pass and attach
+    them as record['descriptors'] (called on demand; catalog loading does not).
+    Records without a measured dipole moment or polarizability get the
+    computed values as their 'dipole_moment' / 'polarizability' fields.
+
+    Args:
+        molecules: Molecule dictionaries (modified in place)
+
+    Returns:
+        The same list
+    """
+    if not molecules:
+        return molecules
+    for molecule, descriptors in zip(molecules, compute_descriptors(PackedMolecules.from_records(molecules))):
+        molecule['descriptors'] = descriptors
+        if molecule.get('DipoleMoment_D') is None:
+            molecule['dipole_moment'] = round(descriptors['dipole_D'], 2)
+        measured = molecule.get('Polarizability_A3')
+        molecule['polarizability'] = measured if measured is not None else round(descriptors['polarizability_A3'], 2)
+    return molecules
@@ -8,6 +8,7 @@ Pure Python implementation with no external dependencies.
 """
 
 import math
+import re
 from typing import Dict, List, Optional, Tuple
 
 
@@ -563,16 +564,23 @@ class MolecularGeometryCalculator:
                 'index': bonded_idx
             })
 
-        # Add any atoms not yet placed (in larger molecules)
+        # Larger molecules (several centers, or more neighbors than the template
+        # holds) are embedded as a whole graph, keeping the central atom at the origin
         placed_indices = {central_idx} | set(bonded_indices)
-        for i, atom in enumerate(composition):
-            if i not in placed_indices:
-                # Place at a default position (will need refinement for complex molecules)
+        if len(positions) < len(bonded_indices) or len(placed_indices) < len(composition):
+            from utils.structure_embedding import embed_structure
+            coordinates = embed_structure(composition, bonds, calculator=self)
+            ox, oy, oz = coordinates[central_idx]
+            order = [central_idx] + bonded_indices + \
+                [i for i in range(len(composition)) if i not in placed_indices]
+            atoms = []
+            for i in order:
+                x, y, z = coordinates[i]
                 atoms.append({
-                    'element': atom['element'],
-                    'x': 0.0,
-                    'y': 0.0,
-                    'z': 0.0,
+                    'element': composition[i]['element'],
+                    'x': round(x - ox, 4),
+                    'y': round(y - oy, 4),
+                    'z': round(z - oz, 4),
                     'index': i
                 })
 
@@ -822,16 +830,17 @@ def get_molecule_structure(formula: str) -> Dict:
     }
 
 
+# Two-element formula such as HCl or H2O (compiled once, not per call)
+_SIMPLE_FORMULA_PATTERN = re.compile(r'([A-Z][a-z]?)(\d*)([A-Z][a-z]?)(\d*)')
+
+
 def _parse_simple_formula(formula: str) -> Optional[Dict]:
     """
     Parse a simple molecular formula and attempt to create structure.
     Only handles basic cases like HCl, NaCl, etc.
     """
-    import re
-
     # Simple two-element compounds
-    pattern = r'([A-Z][a-z]?)(\d*)([A-Z][a-z]?)(\d*)'
-    match = re.match(pattern, formula)
+    match = _SIMPLE_FORMULA_PATTERN.match(formula)
 
     if match:
         elem1, count1, elem2, count2 = match.groups()
@@ -0,0 +1,80 @@
+"""
+Molecule Projection
+Batched 3D rotation, projection and depth sorting of molecule structures.
+
+The rotation matrix is built once per frame from (pitch, yaw, roll). The atoms
+of every structure being drawn are packed into one Vec3Array and rotated in a
+single call (numpy-backed when numpy is installed, array('d') otherwise), and
+each structure gets back a draw list of projected atoms sorted back to front.
+"""
+
+import math
+from typing import Dict, List, Sequence, Tuple
+
+from utils.pure_array import Vec3Array, rotation_matrix_euler
+
+
+# Perspective: atom radii scale by 1 + z / (structure radius * PERSPECTIVE_DEPTH)
+PERSPECTIVE_DEPTH = 4
+
+# (atoms, structure radius, center x, center y); atoms are dicts with
+# 'element', 'x', 'y', 'z' (relative to the center) and 'radius'
+Structure = Tuple[Sequence[Dict], float, float, float]
+
+
+def structure_rotation_matrix(pitch: float, yaw: float, roll: float) -> List[List[float]]:
+    """
+    Rotation matrix of the molecule views, matching rotate_point_3d: pitch
+    about X, then yaw about Y, then roll about Z.
+
+    Args:
+        pitch, yaw, roll: Angles in degrees
+
+    Returns:
+        3x3 rotation matrix as list of lists
+    """
+    # rotation_matrix_euler applies its X, Y, Z angles in that order
+    return rotation_matrix_euler(math.radians(pitch), math.radians(yaw), math.radians(roll))
+
+
+def project_structures(structures: Sequence[Structure], pitch: float, yaw: float, roll: float,
+                       min_scale: float = 0.7, max_scale: float = 1.3) -> List[List[Dict]]:
+    """
+    Rotate, project and depth-sort the atoms of several structures at once.
+
+    Args:
+        structures: (atoms, radius, cx, cy) per structure
+        pitch, yaw, roll: Rotation in degrees
+        min_scale, max_scale: Clamp of the perspective scale applied to atom radii
+
+    Returns:
+        One draw list per structure: atom dicts with projected 'x' and 'y',
+        rotated 'z', scaled 'radius' and 'depth_scale', far atoms first
+    """
+    points = Vec3Array.from_points((atom['x'], atom['y'], atom['z'])
+                                   for atoms, _, _, _ in structures for atom in atoms)
+    if len(points):
+        points.rotate_(structure_rotation_matrix(pitch, yaw, roll))
+    xs, ys, zs = points.x.tolist(), points.y.tolist(), points.z.tolist()
+
+    draw_lists = []
+    offset = 0
+    for atoms, radius, cx, cy in structures:
+        depth = radius * PERSPECTIVE_DEPTH or 1.0
+        projected = []
+        for i, atom in enumerate(atoms, offset):
+            z = zs[i]
+            depth_scale = 1.0 + z / depth
+            projected.append({
+                'element': atom['element'],
+                'x': cx + xs[i],
+                'y': cy + ys[i],
+                'z': z,
+                'radius': atom['radius'] * max(min_scale, min(max_scale, depth_scale)),
+                'depth_scale': depth_scale
+            })
+        # Draw far atoms first
+        projected.sort(key=lambda p: p['z'])
+        draw_lists.append(projected)
+        offset += len(atoms)
+    return draw_lists
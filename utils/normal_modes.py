@@ -0,0 +1,465 @@
+"""
+Normal Modes
+Harmonic vibrational analysis of 3D structures with a simple bonded force field.
+
+The structure is taken as the force-field minimum, so the Cartesian Hessian
+is H = B^T K B: B holds the first derivatives (Wilson B-matrix rows) of the
+internal coordinates - bond stretches, angle bends (split into two
+perpendicular bends for linear angles), torsions and out-of-plane wags at
+three-coordinate atoms - and K their force constants. Each internal
+coordinate touches at most four atoms, so the Hessian is assembled as
+sparse 3x3 atom blocks (upper triangle only, as it is symmetric) and split
+into bonded components, which are diagonalized independently after mass
+weighting. numpy's eigh is used when the array backend is numpy (stacked
+over every block of the same size when a whole catalog is solved at once);
+otherwise Householder tridiagonalization with implicit QL runs in pure
+Python. That dense solve is O((3N)^3), so without numpy structures whose
+largest bonded component exceeds MAX_PURE_PYTHON_ATOMS are not analyzed
+(about 0.3 s at the limit; every catalog molecule is well below it).
+
+Per mode the potential-energy distribution over the internal coordinates
+names the mode ("C=O stretch"), bond partial charges give a relative IR
+intensity, and the summed bond-length change (bond polarizability model)
+decides Raman activity. Results are cached by geometry.
+"""
+
+import math
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from utils.molecular_descriptors import PackedMolecules, partial_charges, principal_moments
+from utils.physics_calculator import MoleculeCalculator
+from utils.pure_array import array_numpy, symmetric_eigen_batch, vector_cross, vector_dot, vector_scale, vector_sub
+from utils.structure_embedding import molecule_atoms_3d
+
+
+# sqrt(mdyn / (Angstrom * amu)) in cm^-1
+WAVENUMBER_PER_ROOT_EIGENVALUE = 1302.79
+# h * c * N_A in kJ/mol per cm^-1
+KJ_MOL_PER_WAVENUMBER = 0.0119627
+
+# Force constants: stretches in mdyn/Angstrom, bends/torsions/wags in mdyn*Angstrom/rad^2
+STRETCH_FORCE_CONSTANTS = {'single': 4.5, 'aromatic': 6.5, 'resonance': 6.5,
+                           'double': 9.5, 'triple': 18.0, 'ionic': 1.0}
+# X-H stretches by partner element (single bonds)
+HYDROGEN_STRETCH_FORCE_CONSTANTS = {'H': 5.7, 'C': 4.9, 'N': 6.4, 'O': 7.8, 'F': 9.7,
+                                    'S': 4.1, 'Cl': 5.2, 'Br': 4.1, 'P': 3.2, 'Si': 2.9}
+DEFAULT_HYDROGEN_STRETCH_FORCE_CONSTANT = 5.0
+BEND_FORCE_CONSTANT = 0.7
+HYDROGEN_BEND_FORCE_CONSTANT = 0.5
+TORSION_FORCE_CONSTANTS = {'single': 0.02, 'aromatic': 0.12, 'resonance': 0.12, 'double': 0.25}
+OUT_OF_PLANE_FORCE_CONSTANT = 0.1
+
+BOND_SYMBOLS = {'single': '-', 'double': '=', 'triple': '#', 'aromatic': ':', 'resonance': ':', 'ionic': '~'}
+
+# Angles closer than this (sin theta) to 180 degrees use linear bend coordinates
+LINEAR_ANGLE_SINE = 0.05
+# Eigenvalues (mdyn / (Angstrom amu)) below this are free motions
+ZERO_EIGENVALUE = 1e-6
+# Squared dipole / bond-length derivatives below this count as inactive
+ACTIVITY_TOLERANCE = 1e-6
+# Relative principal moment below which a structure counts as linear
+LINEAR_INERTIA_RATIO = 1e-3
+
+MAX_CACHED_MODES = 256
+# Largest bonded component (atoms) diagonalized by the pure-Python solver
+MAX_PURE_PYTHON_ATOMS = 36
+
+
+# ==================== Internal Coordinates ====================
+
+class InternalCoordinate:
+    """One force-field term: its atoms, B-matrix rows, force constant and label"""
+
+    __slots__ = ('kind', 'atoms', 'rows', 'force_constant', 'label')
+
+    def __init__(self, kind: str, atoms: Tuple[int, ...], rows: List[Tuple[float, float, float]],
+                 force_constant: float, label: str):
+        self.kind = kind
+        self.atoms = atoms
+        self.rows = rows
+        self.force_constant = force_constant
+        self.label = label
+
+    def project(self, displacement: Sequence[float]) -> float:
+        """Change of the coordinate for a Cartesian displacement (3 values per atom)"""
+        return sum(r[0] * displacement[3 * a] + r[1] * displacement[3 * a + 1] + r[2] * displacement[3 * a + 2]
+                   for a, r in zip(self.atoms, self.rows))
+
+
+def _perpendiculars(axis):
+    """Two unit vectors perpendicular to a unit axis and to each other"""
+    helper = (1.0, 0.0, 0.0) if abs(axis[0]) < 0.9 else (0.0, 1.0, 0.0)
+    first = vector_cross(axis, helper)
+    first = vector_scale(first, 1.0 / math.sqrt(vector_dot(first, first)))
+    return first, vector_cross(axis, first)
+
+
+def _bond_kind(bond: Dict) -> str:
+    kind = str(bond.get('type', bond.get('Type', 'single'))).lower()
+    return kind if kind in STRETCH_FORCE_CONSTANTS else 'single'
+
+
+def internal_coordinates(elements: Sequence[str], coordinates: Sequence[Sequence[float]],
+                         bonds: Iterable[Dict]) -> List[InternalCoordinate]:
+    """
+    Stretch, bend, torsion and out-of-plane coordinates of a bonded structure.
+
+    Args:
+        elements: Element symbol per atom
+        coordinates: (x, y, z) per atom in Angstroms
+        bonds: Bond dictionaries with 'from', 'to' and optional 'type'
+
+    Returns:
+        Internal coordinates with their B-matrix rows at this geometry
+    """
+    xyz = [tuple(float(c) for c in p) for p in coordinates]
+    neighbors: List[Dict[int, str]] = [{} for _ in xyz]
+    terms: List[InternalCoordinate] = []
+
+    for bond in bonds:
+        i, j = bond['from'], bond['to']
+        if i == j or max(i, j) >= len(xyz) or j in neighbors[i]:
+            continue
+        d = vector_sub(xyz[j], xyz[i])
+        length = math.sqrt(vector_dot(d, d))
+        if length < 1e-6:
+            continue
+        kind = _bond_kind(bond)
+        neighbors[i][j] = neighbors[j][i] = kind
+        u = vector_scale(d, 1.0 / length)
+        if kind == 'single' and 'H' in (elements[i], elements[j]):
+            partner = elements[j] if elements[i] == 'H' else elements[i]
+            k = HYDROGEN_STRETCH_FORCE_CONSTANTS.get(partner, DEFAULT_HYDROGEN_STRETCH_FORCE_CONSTANT)
+        else:
+            k = STRETCH_FORCE_CONSTANTS[kind]
+        terms.append(InternalCoordinate('stretch', (i, j), [vector_scale(u, -1.0), u], k,
+                                        f'{elements[i]}{BOND_SYMBOLS[kind]}{elements[j]} stretch'))
+
+    for center, bonded in enumerate(neighbors):
+        others = sorted(bonded)
+        for a, i in enumerate(others):
+            for k in others[a + 1:]:
+                terms.extend(_bend_terms(elements, xyz, i, center, k))
+        if len(others) == 3:
+            term = _dihedral_term(xyz, (others[0], center, others[1], others[2]))
+            if term is not None:
+                rows, atoms = term
+                terms.append(InternalCoordinate('out_of_plane', atoms, rows, OUT_OF_PLANE_FORCE_CONSTANT,
+                                                f'{elements[center]} out-of-plane wag'))
+
+    for j, bonded in enumerate(neighbors):
+        for k, kind in bonded.items():
+            if k < j or kind not in TORSION_FORCE_CONSTANTS:
+                continue
+            for i in bonded:
+                for l in neighbors[k]:
+                    if i == k or l == j or i == l:
+                        continue
+                    term = _dihedral_term(xyz, (i, j, k, l))
+                    if term is not None:
+                        rows, atoms = term
+                        label = f'{elements[i]}-{elements[j]}{BOND_SYMBOLS[kind]}{elements[k]}-{elements[l]} torsion'
+                        terms.append(InternalCoordinate('torsion', atoms, rows, TORSION_FORCE_CONSTANTS[kind], label))
+    return terms
+
+
+def _bend_terms(elements, xyz, i, j, k) -> List[InternalCoordinate]:
+    """Bend coordinate(s) of the angle i-j-k (two perpendicular bends when linear)"""
+    a, b = vector_sub(xyz[i], xyz[j]), vector_sub(xyz[k], xyz[j])
+    ra, rb = math.sqrt(vector_dot(a, a)), math.sqrt(vector_dot(b, b))
+    u, v = vector_scale(a, 1.0 / ra), vector_scale(b, 1.0 / rb)
+    cos_angle = max(-1.0, min(1.0, vector_dot(u, v)))
+    sin_angle = math.sqrt(1.0 - cos_angle * cos_angle)
+    k_bend = HYDROGEN_BEND_FORCE_CONSTANT if 'H' in (elements[i], elements[k]) else BEND_FORCE_CONSTANT
+    label = f'{elements[i]}-{elements[j]}-{elements[k]} bend'
+
+    if sin_angle < LINEAR_ANGLE_SINE:
+        terms = []
+        for p in _perpendiculars(u):
+            row_i, row_k = vector_scale(p, 1.0 / ra), vector_scale(p, 1.0 / rb)
+            row_j = vector_scale(p, -(1.0 / ra + 1.0 / rb))
+            terms.append(InternalCoordinate('bend', (i, j, k), [row_i, row_j, row_k], k_bend, label))
+        return terms
+
+    row_i = vector_scale(vector_sub(vector_scale(u, cos_angle), v), 1.0 / (ra * sin_angle))
+    row_k = vector_scale(vector_sub(vector_scale(v, cos_angle), u), 1.0 / (rb * sin_angle))
+    row_j = vector_scale((row_i[0] + row_k[0], row_i[1] + row_k[1], row_i[2] + row_k[2]), -1.0)
+    return [InternalCoordinate('bend', (i, j, k), [row_i, row_j, row_k], k_bend, label)]
+
+
+def _dihedral_term(xyz, atoms) -> Optional[Tuple[List[Tuple[float, float, float]], Tuple[int, ...]]]:
+    """B-matrix rows of the dihedral i-j-k-l, or None when three atoms are collinear"""
+    i, j, k, l = atoms
+    f, g, h = vector_sub(xyz[i], xyz[j]), vector_sub(xyz[j], xyz[k]), vector_sub(xyz[l], xyz[k])
+    a, b = vector_cross(f, g), vector_cross(h, g)
+    aa, bb, gg = vector_dot(a, a), vector_dot(b, b), vector_dot(g, g)
+    if gg < 1e-12 or aa < 1e-6 * gg * vector_dot(f, f) or bb < 1e-6 * gg * vector_dot(h, h):
+        return None
+    g_norm = math.sqrt(gg)
+    fg, hg = vector_dot(f, g) / (aa * g_norm), vector_dot(h, g) / (bb * g_norm)
+    row_i = vector_scale(a, -g_norm / aa)
+    row_l = vector_scale(b, g_norm / bb)
+    row_j = tuple(-row_i[c] + fg * a[c] - hg * b[c] for c in range(3))
+    row_k = tuple(-row_l[c] - fg * a[c] + hg * b[c] for c in range(3))
+    return [row_i, row_j, row_k, row_l], atoms
+
+
+# ==================== Hessian Assembly ====================
+
+def assemble_hessian(terms: Sequence[InternalCoordinate]) -> Dict[Tuple[int, int], List[List[float]]]:
+    """
+    Sparse Cartesian Hessian sum_c k_c * b_c b_c^T as 3x3 atom blocks.
+
+    Returns:
+        (a, b) -> 3x3 block for a <= b (the lower triangle is its transpose)
+    """
+    blocks: Dict[Tuple[int, int], List[List[float]]] = {}
+    for term in terms:
+        k = term.force_constant
+        for p, (a, ra) in enumerate(zip(term.atoms, term.rows)):
+            for b, rb in zip(term.atoms[p:], term.rows[p:]):
+                if a <= b:
+                    key, left, right = (a, b), ra, rb
+                else:
+                    key, left, right = (b, a), rb, ra
+                block = blocks.get(key)
+                if block is None:
+                    block = blocks[key] = [[0.0] * 3 for _ in range(3)]
+                for r in range(3):
+                    kl = k * left[r]
+                    row = block[r]
+                    row[0] += kl * right[0]
+                    row[1] += kl * right[1]
+                    row[2] += kl * right[2]
+    return blocks
+
+
+def _components(atom_count: int, blocks: Dict[Tuple[int, int], List[List[float]]]) -> List[List[int]]:
+    """Atom sets coupled by the Hessian (union-find over off-diagonal blocks)"""
+    parent = list(range(atom_count))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in blocks:
+        if a != b:
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                parent[ra] = rb
+    groups: Dict[int, List[int]] = {}
+    for atom in range(atom_count):
+        groups.setdefault(find(atom), []).append(atom)
+    return list(groups.values())
+
+
+def _mass_weighted_block(atoms: List[int], masses: Sequence[float],
+                         blocks: Dict[Tuple[int, int], List[List[float]]]) -> List[List[float]]:
+    """Dense mass-weighted Hessian H_ab / sqrt(m_a m_b) of one component"""
+    local = {atom: n for n, atom in enumerate(atoms)}
+    size = 3 * len(atoms)
+    matrix = [[0.0] * size for _ in range(size)]
+    for (a, b), block in blocks.items():
+        if a not in local:
+            continue
+        la, lb = 3 * local[a], 3 * local[b]
+        weight = 1.0 / math.sqrt(masses[a] * masses[b])
+        for r in range(3):
+            for c in range(3):
+                value = block[r][c] * weight
+                matrix[la + r][lb + c] = value
+                matrix[lb + c][la + r] = value
+    return matrix
+
+
+# ==================== Normal Modes ====================
+
+def _linear_flags(systems: Sequence['_System']) -> List[bool]:
+    """Whether each structure is linear (one vanishing principal moment), from one inertia pass"""
+    packed = PackedMolecules()
+    for system in systems:
+        packed.add('', system.elements, system.coordinates)
+    return [len(system.elements) < 3 or moments[0] <= LINEAR_INERTIA_RATIO * max(moments[2], 1e-12)
+            for system, moments in zip(systems, principal_moments(packed))]
+
+
+class _System:
+    """One structure queued for diagonalization"""
+
+    __slots__ = ('elements', 'coordinates', 'bonds', 'masses', 'terms', 'components', 'first_block', 'too_large')
+
+    def __init__(self, elements, coordinates, bonds):
+        self.elements = list(elements)
+        self.coordinates = [tuple(float(c) for c in p) for p in coordinates]
+        self.bonds = list(bonds)
+        masses = MoleculeCalculator.ATOMIC_MASSES
+        self.masses = [masses.get(e, 12.0) for e in self.elements]
+        self.terms = internal_coordinates(self.elements, self.coordinates, self.bonds)
+        blocks = assemble_hessian(self.terms)
+        groups = _components(len(self.elements), blocks)
+        self.too_large = array_numpy() is None and max(map(len, groups), default=0) > MAX_PURE_PYTHON_ATOMS
+        self.components = [] if self.too_large else [
+            (atoms, _mass_weighted_block(atoms, self.masses, blocks)) for atoms in groups]
+        self.first_block = 0
+
+
+def _geometry_key(elements, coordinates, bonds) -> Tuple:
+    return (tuple(elements),
+            tuple(tuple(round(float(c), 4) for c in p) for p in coordinates),
+            tuple((b['from'], b['to'], _bond_kind(b)) for b in bonds))
+
+
+def _analyze(system: _System, eigenpairs: List[Tuple[List[float], List[List[float]]]], linear: bool) -> Dict:
+    """Frequencies, mode labels and activities from the eigenpairs of a system's components"""
+    atom_count = len(system.elements)
+    dof = max(0, 3 * atom_count - (5 if linear else 6)) if atom_count > 1 else 0
+
+    # Full-length Cartesian displacement per mode (mass-weighted vector / sqrt(m))
+    candidates = []
+    for (atoms, _), (values, vectors) in zip(system.components, eigenpairs):
+        for value, vector in zip(values, vectors):
+            displacement = [0.0] * (3 * atom_count)
+            for n, atom in enumerate(atoms):
+                root_mass = math.sqrt(system.masses[atom])
+                for c in range(3):
+                    displacement[3 * atom + c] = vector[3 * n + c] / root_mass
+            candidates.append((value, displacement))
+    candidates.sort(key=lambda item: item[0])
+    vibrations = candidates[len(candidates) - dof:] if dof else []
+
+    charges = partial_charges(system.elements, system.bonds)
+    stretches = [t for t in system.terms if t.kind == 'stretch']
+    modes = []
+    for index, (value, displacement) in enumerate(vibrations):
+        frequency = WAVENUMBER_PER_ROOT_EIGENVALUE * math.sqrt(value) if value > ZERO_EIGENVALUE else 0.0
+
+        # Potential-energy distribution over the internal coordinates
+        energies = [t.force_constant * t.project(displacement) ** 2 for t in system.terms]
+        total = sum(energies)
+        if frequency > 0.0 and total > 0.0:
+            shares: Dict[Tuple[str, str], float] = {}
+            for term, energy in zip(system.terms, energies):
+                shares[(term.kind, term.label)] = shares.get((term.kind, term.label), 0.0) + energy
+            kind, label = max(shares, key=shares.get)
+        else:
+            label, kind = 'Free internal rotation', 'torsion'
+
+        dipole = [sum(q * displacement[3 * a + c] for a, q in enumerate(charges)) for c in range(3)]
+        ir_intensity = dipole[0] ** 2 + dipole[1] ** 2 + dipole[2] ** 2
+        bond_change = sum(t.project(displacement) for t in stretches)
+
+        modes.append({
+            'index': index,
+            'type': kind,
+            'frequency_cm-1': round(frequency, 1),
+            'ir_intensity': round(ir_intensity, 6),
+            'ir_active': ir_intensity > ACTIVITY_TOLERANCE,
+            'raman_active': bond_change * bond_change > ACTIVITY_TOLERANCE,
+            'description': label[0].upper() + label[1:]
+        })
+
+    frequencies = [m['frequency_cm-1'] for m in modes]
+    return {
+        'modes': modes,
+        'frequencies_cm-1': frequencies,
+        'total_modes': dof,
+        'is_linear': linear,
+        'zero_point_energy_kJ_mol': round(0.5 * KJ_MOL_PER_WAVENUMBER * sum(frequencies), 3),
+        'degrees_of_freedom': {
+            'total': 3 * atom_count,
+            'translational': 3,
+            'rotational': 0 if atom_count < 2 else (2 if linear else 3),
+            'vibrational': dof
+        },
+        'method': 'harmonic_valence_force_field'
+    }
+
+
+def solve_normal_modes(structures: Sequence[Tuple[Sequence[str], Sequence[Sequence[float]], Sequence[Dict]]]) -> List[Dict]:
+    """
+    Normal modes of many structures, diagonalizing all Hessian blocks together.
+
+    Args:
+        structures: (elements, coordinates, bonds) per structure
+
+    Returns:
+        Mode analysis per structure, in input order (see normal_modes); None
+        for structures too large for the pure-Python solver
+    """
+    results: List[Optional[Dict]] = [None] * len(structures)
+    pending: List[Tuple[int, Tuple, _System]] = []
+    for n, (elements, coordinates, bonds) in enumerate(structures):
+        key = _geometry_key(elements, coordinates, bonds)
+        cached = _mode_cache.get(key)
+        if cached is not None:
+            _mode_cache.move_to_end(key)
+            results[n] = cached
+            continue
+        system = _System(elements, coordinates, bonds)
+        if not system.too_large:
+            pending.append((n, key, system))
+
+    matrices = []
+    for _, _, system in pending:
+        system.first_block = len(matrices)
+        matrices.extend(matrix for _, matrix in system.components)
+    eigenpairs = symmetric_eigen_batch(matrices)
+    linear_flags = _linear_flags([system for _, _, system in pending])
+
+    for (n, key, system), linear in zip(pending, linear_flags):
+        result = _analyze(system, eigenpairs[system.first_block:system.first_block + len(system.components)], linear)
+        _mode_cache[key] = result
+        while len(_mode_cache) > MAX_CACHED_MODES:
+            _mode_cache.popitem(last=False)
+        results[n] = result
+    return results
+
+
+def normal_modes(elements: Sequence[str], coordinates: Sequence[Sequence[float]],
+                 bonds: Sequence[Dict]) -> Optional[Dict]:
+    """
+    Harmonic normal modes of one structure (cached by geometry).
+
+    Args:
+        elements: Element symbol per atom
+        coordinates: (x, y, z) per atom in Angstroms, taken as the minimum
+        bonds: Bond dictionaries with 'from', 'to' and optional 'type'
+
+    Returns:
+        Dictionary with 'modes' (index, type, frequency_cm-1, ir_intensity,
+        ir_active, raman_active, description), 'frequencies_cm-1',
+        'total_modes', 'is_linear', 'zero_point_energy_kJ_mol' and
+        'degrees_of_freedom'; None when a bonded component has more than
+        MAX_PURE_PYTHON_ATOMS atoms and numpy is not the array backend
+    """
+    return solve_normal_modes([(elements, coordinates, bonds)])[0]
+
+
+def catalog_normal_modes(molecules: Sequence[Dict]) -> List[Optional[Dict]]:
+    """
+    Normal modes of molecule records (Atoms3D or an embedded Bonds3D graph),
+    solved as one batch.
+
+    Returns:
+        Mode analysis per record; None for records without a 3D structure
+        (or too large to analyze without numpy)
+    """
+    structures, owners = [], []
+    for n, molecule in enumerate(molecules):
+        atoms = molecule_atoms_3d(molecule)
+        if not atoms:
+            continue
+        structures.append(([a.get('element', '?') for a in atoms],
+                           [(a.get('x', 0.0), a.get('y', 0.0), a.get('z', 0.0)) for a in atoms],
+                           [b for b in molecule.get('Bonds3D', []) if max(b['from'], b['to']) < len(atoms)]))
+        owners.append(n)
+    results: List[Optional[Dict]] = [None] * len(molecules)
+    for n, result in zip(owners, solve_normal_modes(structures)):
+        results[n] = result
+    return results
+
+
+_mode_cache: 'OrderedDict[Tuple, Dict]' = OrderedDict()
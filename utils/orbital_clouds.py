@@ -28,14 +28,19 @@ try:
 except ImportError:
     _SCIPY_AVAILABLE = False
 
-if not _SCIPY_AVAILABLE:
-    from utils.pure_math import genlaguerre as _pure_genlaguerre
-    from utils.pure_math import lpmv as _pure_lpmv
-    from utils.pure_math import factorial as _pure_factorial
+# Pure Python paths are always loaded; the dispatcher uses them for small inputs
+from utils.pure_math import genlaguerre as _pure_genlaguerre
+from utils.pure_math import lpmv as _pure_lpmv
+from utils.pure_math import factorial as _pure_factorial
+
+from utils.backend_dispatch import get_dispatcher
 
 # Import improved orbital calculator for enhanced accuracy
 from utils.pure_math import ImprovedOrbitalCalculator, FINE_STRUCTURE_CONSTANT, RYDBERG_ENERGY_EV
 
+# Table-driven factorials for normalization constants (no big-int arithmetic)
+from utils.pure_math import log_factorial, factorial_ratio
+
 
 # =============================================================================
 # Unified API - Backend wrapper functions
@@ -48,20 +53,77 @@ def _factorial(n):
     return float(_pure_factorial(int(n)))
 
 
+def _radial_normalization(n, l, Z):
+    """
+    Hydrogen-like radial normalization sqrt[(2Z/n)^3 * (n-l-1)! / (2n[(n+l)!]^3)].
+
+    The factorial part is evaluated in log space, so it stays finite for
+    high-n orbitals where (n+l)!^3 would overflow a float.
+    """
+    log_ratio = log_factorial(n - l - 1) - 3.0 * log_factorial(n + l)
+    return (2.0 * Z / n) ** 1.5 * math.exp(0.5 * log_ratio) / math.sqrt(2.0 * n)
+
+
+def _use_scipy(name, size=1):
+    """
+    Choose the path for one call.
+
+    scipy is only used when it is the active backend and the dispatcher's
+    calibrated crossover says this input size is large enough to pay off.
+    """
+    if not _SCIPY_AVAILABLE:
+        get_dispatcher().record(name, library=False)
+        return False
+    return get_dispatcher().use_library(name, size)
+
+
 def _genlaguerre(n, alpha):
-    """Return generalized Laguerre polynomial function using the active backend."""
-    if _SCIPY_AVAILABLE:
+    """Return a generalized Laguerre polynomial function for scalar evaluation."""
+    if _use_scipy('genlaguerre'):
         return _scipy_genlaguerre(n, alpha)
     return _pure_genlaguerre(n, alpha)
 
 
 def _lpmv(m, l, x):
-    """Compute associated Legendre polynomial using the active backend."""
-    if _SCIPY_AVAILABLE:
+    """Compute associated Legendre polynomial at a single point."""
+    if _use_scipy('lpmv'):
         return float(_scipy_lpmv(m, l, x))
     return float(_pure_lpmv(m, l, x))
 
 
+def _genlaguerre_many(n, alpha, xs):
+    """Evaluate L_n^alpha at many points in one call."""
+    if _use_scipy('genlaguerre', len(xs)):
+        return _scipy_genlaguerre(n, alpha)(np.asarray(xs, dtype=float)).tolist()
+    return _pure_genlaguerre(n, alpha)(xs)
+
+
+def _lpmv_many(m, l, xs):
+    """Evaluate P_l^m at many points in one call."""
+    if _use_scipy('lpmv', len(xs)):
+        return _scipy_lpmv(m, l, np.asarray(xs, dtype=float)).tolist()
+    return _pure_lpmv(m, l, xs)
+
+
+def _register_dispatch():
+    """Register the scipy/pure Python pairs with the dispatcher for calibration."""
+    dispatcher = get_dispatcher()
+    dispatcher.register(
+        'genlaguerre',
+        lambda xs: _pure_genlaguerre(4, 3.0)(xs),
+        lambda xs: _scipy_genlaguerre(4, 3.0)(np.asarray(xs, dtype=float)).tolist(),
+    )
+    dispatcher.register(
+        'lpmv',
+        lambda xs: _pure_lpmv(2, 4, xs),
+        lambda xs: _scipy_lpmv(2, 4, np.asarray(xs, dtype=float)).tolist(),
+    )
+
+
+if _SCIPY_AVAILABLE:
+    _register_dispatch()
+
+
 # =============================================================================
 # Backend management functions
 # =============================================================================
@@ -89,6 +151,7 @@ def set_backend(use_scipy: bool):
             import numpy as np
             _SCIPY_AVAILABLE = True
             USE_SCIPY = True
+            _register_dispatch()
         except ImportError:
             raise ImportError("scipy is not available")
     else:
@@ -168,11 +231,7 @@ def radial_wavefunction(n, l, r, Z=1):
     rho = 2.0 * Z * r / (n * a0)
 
     # Normalization constant
-    norm_factor = math.sqrt(
-        (2.0 * Z / (n * a0))**3 *
-        _factorial(n - l - 1) /
-        (2.0 * n * _factorial(n + l)**3)
-    )
+    norm_factor = _radial_normalization(n, l, Z / a0)
 
     # Associated Laguerre polynomial L_{n-l-1}^{2l+1}(rho)
     laguerre_poly = _genlaguerre(n - l - 1, 2 * l + 1)
@@ -204,8 +263,8 @@ def angular_wavefunction(l, m, theta, phi=0):
 
     # Normalization constant for spherical harmonics
     norm = math.sqrt(
-        (2 * l + 1) * _factorial(l - abs(m)) /
-        (4 * math.pi * _factorial(l + abs(m)))
+        (2 * l + 1) * factorial_ratio(l - abs(m), l + abs(m)) /
+        (4 * math.pi)
     )
 
     # Associated Legendre polynomial P_l^m(cos(theta))
@@ -244,6 +303,85 @@ def get_orbital_probability(n, l, m, r, theta, phi=0, Z=1):
     return radial**2 * angular
 
 
+def radial_wavefunction_many(n, l, r_values, Z=1):
+    """
+    Radial wavefunction R_{n,l}(r) at many radii.
+
+    The normalization and Laguerre polynomial are set up once and the
+    polynomial is evaluated for every radius in a single recurrence sweep.
+
+    Args:
+        n: Principal quantum number (1, 2, 3, ...)
+        l: Angular momentum quantum number (0, 1, ..., n-1)
+        r_values: Sequence of radii in Bohr radii (a₀)
+        Z: Nuclear charge (default 1 for hydrogen)
+
+    Returns:
+        List of radial wavefunction values, one per radius
+    """
+    r_values = [float(r) for r in r_values]
+    if n < 1 or l < 0 or l >= n:
+        return [0.0] * len(r_values)
+
+    a0 = 1.0  # Normalized to Bohr radius
+    norm_factor = _radial_normalization(n, l, Z / a0)
+    rhos = [2.0 * Z * max(r, 0.0) / (n * a0) for r in r_values]
+    laguerre_values = _genlaguerre_many(n - l - 1, 2 * l + 1, rhos)
+
+    return [
+        norm_factor * (rho**l) * math.exp(-rho / 2.0) * laguerre_value if r >= 0 else 0.0
+        for r, rho, laguerre_value in zip(r_values, rhos, laguerre_values)
+    ]
+
+
+def angular_wavefunction_many(l, m, theta_values):
+    """
+    Spherical harmonic magnitude squared |Y_{l,m}|² at many polar angles.
+
+    Args:
+        l: Angular momentum quantum number (0, 1, 2, ...)
+        m: Magnetic quantum number (-l, ..., 0, ..., +l)
+        theta_values: Sequence of polar angles (0 to π)
+
+    Returns:
+        List of |Y_{l,m}|² values, one per angle
+    """
+    theta_values = list(theta_values)
+    if l < 0 or abs(m) > l:
+        return [0.0] * len(theta_values)
+
+    norm = math.sqrt(
+        (2 * l + 1) * factorial_ratio(l - abs(m), l + abs(m)) /
+        (4 * math.pi)
+    )
+    legendre_values = _lpmv_many(abs(m), l, [math.cos(theta) for theta in theta_values])
+    return [(norm * value)**2 for value in legendre_values]
+
+
+def get_orbital_probability_many(n, l, m, r_values, theta_values, Z=1):
+    """
+    Probability density |ψ|² at many points for one orbital.
+
+    Equivalent to calling get_orbital_probability for each (r, θ) pair
+    (|ψ|² does not depend on φ), but the radial and angular polynomials are
+    each evaluated in one batched sweep.
+
+    Args:
+        n: Principal quantum number
+        l: Angular momentum quantum number
+        m: Magnetic quantum number
+        r_values: Sequence of radii in Bohr radii
+        theta_values: Sequence of polar angles, same length as r_values
+        Z: Nuclear charge (for multi-electron approximation)
+
+    Returns:
+        List of probability densities, one per point
+    """
+    radial = radial_wavefunction_many(n, l, r_values, Z)
+    angular = angular_wavefunction_many(l, m, theta_values)
+    return [R * R * Y for R, Y in zip(radial, angular)]
+
+
 def get_available_orbitals(max_n=4):
     """
     Get list of available orbitals up to principal quantum number max_n.
@@ -429,11 +567,7 @@ def radial_wavefunction_enhanced(n, l, r, Z=1, use_corrections=True):
     rho = 2.0 * Z_eff * r_eff / (n * a0)
 
     # Normalization constant with Z_eff
-    norm_factor = math.sqrt(
-        (2.0 * Z_eff / (n * a0))**3 *
-        _factorial(n - l - 1) /
-        (2.0 * n * _factorial(n + l)**3)
-    )
+    norm_factor = _radial_normalization(n, l, Z_eff / a0)
 
     # Associated Laguerre polynomial L_{n-l-1}^{2l+1}(rho)
     laguerre_poly = _genlaguerre(n - l - 1, 2 * l + 1)
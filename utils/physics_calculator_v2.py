@@ -22,6 +22,9 @@ from typing import Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 
+from utils.profiler import profiled
+from utils.result_cache import get_result_cache, make_key, memo_content_hash
+
 
 # ==================== Physical Constants (Non-particle specific) ====================
 
@@ -110,12 +113,17 @@ class SubatomicCalculatorV2:
     HYPERFINE_COUPLING_BARYON = 1700000.0    # MeV^3 for baryons
     HYPERFINE_COUPLING_MESON = 74000000.0    # MeV^3 for mesons
 
+    # Bump whenever a formula or constant changes so cached hadrons are recomputed
+    CALCULATOR_VERSION = '2.0'
+
     @classmethod
+    @profiled('calc.hadron', 'calc')
     def create_particle_from_quarks(
         cls,
         quark_data_list: List[Dict],
         particle_name: str = "Custom Hadron",
-        particle_symbol: str = "X"
+        particle_symbol: str = "X",
+        use_cache: bool = True
     ) -> Dict:
         """
         Create a hadron (baryon or meson) from quark JSON objects.
@@ -132,6 +140,7 @@ class SubatomicCalculatorV2:
                 - Isospin_I3: isospin z-component
             particle_name: Name for the created particle
             particle_symbol: Symbol for the created particle
+            use_cache: Serve repeated quark multisets from the result cache
 
         Returns:
             Complete particle JSON with all properties calculated from quark inputs:
@@ -167,10 +176,233 @@ class SubatomicCalculatorV2:
                - For 3 quarks: S = 1/2 or 3/2
                - For 2 quarks: S = 0 or 1
             5. Isospin_I3 = Σ(quark.Isospin_I3)
+
+        Quarks are put into canonical order (see canonical_quark_order()) first,
+        so every permutation of the same quark multiset gives the same result.
         """
         if not quark_data_list:
             raise ValueError("quark_data_list cannot be empty")
 
+        quarks, hashes = cls._canonical_quarks(quark_data_list)
+        if not use_cache:
+            return cls._compute_particle_from_quarks(quarks, particle_name, particle_symbol)
+        # Cached on quark content alone; the caller's name and symbol go on the returned copy
+        particle = get_result_cache('hadrons').get_or_compute(
+            cls._hadron_key(quarks, hashes),
+            lambda: cls._compute_particle_from_quarks(quarks, particle_name, particle_symbol))
+        return cls._stamp_identity(particle, particle_name, particle_symbol)
+
+    # ==================== Canonical quark multisets ====================
+
+    # Flavour order used for canonical quark content strings (uud, ud\u0305, ...)
+    QUARK_FLAVOR_ORDER = 'udscbt'
+
+    @classmethod
+    def _quark_order_key(cls, quark_data: Dict) -> Tuple[int, int, str]:
+        """Sort key: quarks before antiquarks, then by flavour (u, d, s, c, b, t)."""
+        is_antiquark = quark_data.get('BaryonNumber_B', 1/3) < 0
+        flavor = quark_data.get('Symbol', '').lower().replace('\u0305', '')
+        index = cls.QUARK_FLAVOR_ORDER.find(flavor) if len(flavor) == 1 else -1
+        return (int(is_antiquark), index if index >= 0 else len(cls.QUARK_FLAVOR_ORDER), flavor)
+
+    @classmethod
+    def canonical_quark_order(cls, quark_data_list: List[Dict]) -> List[Dict]:
+        """
+        Sort quarks into canonical order: quarks before antiquarks, each by
+        flavour (u, d, s, c, b, t), e.g. [d, u, u] -> [u, u, d].
+
+        Args:
+            quark_data_list: List of quark JSON objects
+
+        Returns:
+            New list with the same quark objects in canonical order
+        """
+        return sorted(quark_data_list, key=cls._quark_order_key)
+
+    @classmethod
+    def _canonical_quarks(cls, quark_data_list: List[Dict]) -> Tuple[List[Dict], List[str]]:
+        """Canonical order with content-hash tie-breaks, plus each quark's hash."""
+        hashed = [(cls._quark_order_key(q), memo_content_hash(q), q) for q in quark_data_list]
+        hashed.sort(key=lambda item: (item[0], item[1]))
+        return [q for _, _, q in hashed], [h for _, h, _ in hashed]
+
+    @classmethod
+    def _hadron_key(cls, quarks: List[Dict], hashes: List[str]) -> str:
+        symbols = [q.get('Symbol', '?') for q in quarks]
+        return make_key(symbols, hashes, cls.CALCULATOR_VERSION)
+
+    @classmethod
+    def hadron_cache_key(cls, quark_data_list: List[Dict]) -> str:
+        """
+        Result cache key for a quark multiset.
+
+        Built from the sorted quark symbols, the content hash of every quark
+        JSON object and CALCULATOR_VERSION, so the key is independent of quark
+        order and of the name/symbol the caller gives the particle.
+        """
+        quarks, hashes = cls._canonical_quarks(quark_data_list)
+        return cls._hadron_key(quarks, hashes)
+
+    @staticmethod
+    def _stamp_identity(particle: Dict, particle_name: str, particle_symbol: str) -> Dict:
+        """Set the name and symbol (and the antiparticle's) on a hadron result."""
+        particle['Name'] = particle_name
+        particle['Symbol'] = particle_symbol
+        particle['Antiparticle'] = {
+            "Name": f"Anti{particle_name.lower()}",
+            "Symbol": f"{particle_symbol}\u0305"
+        }
+        return particle
+
+    @classmethod
+    def make_antiquark(cls, quark_data: Dict) -> Dict:
+        """
+        Build an antiquark JSON object from a quark JSON object.
+
+        Charge, baryon number and isospin I3 are negated; the name and symbol
+        come from the quark's Antiparticle entry (or an Anti- prefix and overline).
+
+        Args:
+            quark_data: Quark JSON object
+
+        Returns:
+            New antiquark JSON object
+        """
+        antiquark = dict(quark_data)
+        for field_name in ('Charge_e', 'BaryonNumber_B', 'Isospin_I3'):
+            if field_name in antiquark and antiquark[field_name]:
+                antiquark[field_name] = -antiquark[field_name]
+        antiparticle = quark_data.get('Antiparticle') or {}
+        antiquark['Name'] = antiparticle.get('Name') or f"Anti-{quark_data.get('Name', 'Quark')}"
+        antiquark['Symbol'] = antiparticle.get('Symbol') or f"{quark_data.get('Symbol', '?')}\u0305"
+        antiquark['Antiparticle'] = {'Name': quark_data.get('Name'), 'Symbol': quark_data.get('Symbol')}
+        return antiquark
+
+    @classmethod
+    def enumerate_all_hadrons(
+        cls,
+        max_quarks: int = 3,
+        quark_data_list: Optional[List[Dict]] = None,
+        workers: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Compute every colour-singlet quark combination once and cache it.
+
+        A combination of n_q quarks and n_qbar antiquarks is a colour singlet
+        when n_q - n_qbar is a multiple of 3; with max_quarks=3 that is every
+        meson (q qbar) and baryon (qqq). Antibaryons and other negative
+        baryon-number states are left out as mirrors of their partners.
+        Results fill the 'hadrons' result cache, so later
+        create_particle_from_quarks() calls for the same multiset are hits
+        whatever name they pass; multisets already cached are not recomputed.
+
+        Args:
+            max_quarks: Largest number of constituents (4 adds tetraquarks, 5 pentaquarks)
+            quark_data_list: Quark JSON objects (default: the quarks in the data manager)
+            workers: Worker processes (default: CPU count; 1 computes in-process)
+
+        Returns:
+            Particle JSON objects in canonical order, named by quark content (e.g. "uud")
+        """
+        from itertools import combinations_with_replacement
+        from concurrent.futures import ProcessPoolExecutor
+        import os
+
+        if quark_data_list is None:
+            quark_data_list = cls._load_quarks()
+        quarks = cls.canonical_quark_order(quark_data_list)
+        antiquarks = [cls.make_antiquark(q) for q in quarks]
+
+        jobs = []
+        for total in range(2, max_quarks + 1):
+            for num_anti in range(0, total // 2 + 1):
+                if (total - 2 * num_anti) % 3 != 0:
+                    continue
+                for quark_set in combinations_with_replacement(quarks, total - num_anti):
+                    for anti_set in combinations_with_replacement(antiquarks, num_anti):
+                        members = list(quark_set) + list(anti_set)
+                        content = ''.join(q.get('Symbol', '?') for q in members)
+                        jobs.append((members, content, content))
+
+        cache = get_result_cache('hadrons')
+        keys = [cls.hadron_cache_key(members) for members, _, _ in jobs]
+        results = [cache.get(key) for key in keys]
+        pending = [i for i, result in enumerate(results) if result is None]
+        missing = [jobs[i] for i in pending]
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(missing) < 2:
+            computed = [cls._compute_particle_from_quarks(*job) for job in missing]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                computed = list(executor.map(cls._compute_particle_from_quarks, *zip(*missing),
+                                             chunksize=max(1, len(missing) // (workers * 4))))
+
+        for i, result in zip(pending, computed):
+            cache.put(keys[i], result)
+            results[i] = result
+        return [cls._stamp_identity(result, name, symbol)
+                for (_, name, symbol), result in zip(jobs, results)]
+
+    # Enumerated hadrons by canonical quark content, for the current quark data
+    _enumerated_by_content: Tuple[Optional[str], Dict[str, Dict]] = (None, {})
+
+    @classmethod
+    def enumerated_hadrons_for(cls, particles: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Match particle JSON objects to the enumerate_all_hadrons() results.
+
+        Each particle's Composition is reduced to its canonical quark content
+        (e.g. "uud", "ud\u0305"). The enumeration runs once per version of the
+        quark data and is then served from the result cache.
+
+        Args:
+            particles: Particle JSON objects with a Composition list
+
+        Returns:
+            The enumerated hadron for each particle, or None when its
+            composition is a flavour mixture or not made of quarks
+        """
+        quarks = cls._load_quarks()
+        version = make_key(sorted(memo_content_hash(q) for q in quarks), cls.CALCULATOR_VERSION)
+        if cls._enumerated_by_content[0] != version:
+            hadrons = cls.enumerate_all_hadrons(3, quarks, workers=1)
+            cls._enumerated_by_content = (version, {h['Name']: h for h in hadrons})
+        lookup = cls._enumerated_by_content[1]
+
+        by_name = {q.get('Name', '').lower(): q for q in quarks}
+        matches = []
+        for particle in particles:
+            members = []
+            for entry in particle.get('Composition', []):
+                name = entry.get('Constituent', '').lower()
+                is_anti = name.startswith('anti') or bool(entry.get('IsAnti'))
+                quark = by_name.get(name[4:].lstrip('- ') if name.startswith('anti') else name)
+                if quark is None:
+                    members = []
+                    break
+                members.extend([cls.make_antiquark(quark) if is_anti else quark] * int(entry.get('Count', 1)))
+            content = ''.join(q.get('Symbol', '?') for q in cls.canonical_quark_order(members))
+            matches.append(lookup.get(content))
+        return matches
+
+    @classmethod
+    def _load_quarks(cls) -> List[Dict]:
+        """The six quark JSON objects from the data manager (loader metadata removed)."""
+        from data.data_manager import get_data_manager, DataCategory
+        # Drop loader keys such as _filename so the content hashes match get_item() data
+        return [{k: v for k, v in q.items() if not k.startswith('_')}
+                for q in get_data_manager().get_all_items(DataCategory.QUARKS)
+                if 'Quark' in q.get('Classification', [])]
+
+    @classmethod
+    def _compute_particle_from_quarks(
+        cls,
+        quark_data_list: List[Dict],
+        particle_name: str,
+        particle_symbol: str
+    ) -> Dict:
+        """Uncached body of create_particle_from_quarks()."""
         num_quarks = len(quark_data_list)
 
         # Determine particle type from quark count
@@ -1174,6 +1406,8 @@ class SubatomicCalculatorV2:
         Returns:
             Dictionary of calculated properties
         """
+        # Canonical order makes the float sums identical for every permutation
+        quark_data_list = cls.canonical_quark_order(quark_data_list)
         total_charge = sum(q['Charge_e'] for q in quark_data_list)
         total_baryon = sum(q['BaryonNumber_B'] for q in quark_data_list)
         total_lepton = sum(q.get('LeptonNumber_L', 0) for q in quark_data_list)
@@ -1644,6 +1878,9 @@ class AtomCalculatorV2:
     - Multi-scale electronegativity (Mulliken/Pauling)
     """
 
+    # Bump whenever a formula or constant changes so cached atoms are recomputed
+    CALCULATOR_VERSION = '2.1'
+
     # ========== Clementi-Raimondi Effective Nuclear Charges ==========
     # J. Chem. Phys. 38, 2686 (1963) and 47, 1300 (1967)
     CLEMENTI_ZEFF = {
@@ -1855,6 +2092,7 @@ class AtomCalculatorV2:
         return max(0, 0.005 + 0.05 * (period - 5))
 
     @classmethod
+    @profiled('calc.atom', 'calc')
     def create_atom_from_particles(
         cls,
         proton_data: Dict,
@@ -1864,7 +2102,8 @@ class AtomCalculatorV2:
         neutron_count: int,
         electron_count: int,
         element_name: str = "Custom Element",
-        element_symbol: str = "X"
+        element_symbol: str = "X",
+        use_cache: bool = True
     ) -> Dict:
         """
         Create an atom from subatomic particle JSON objects.
@@ -1878,6 +2117,7 @@ class AtomCalculatorV2:
             electron_count: Number of electrons
             element_name: Name for the created element
             element_symbol: Symbol for the created element
+            use_cache: Serve repeated inputs from the result cache (see utils.result_cache)
 
         Returns:
             Complete atom/element JSON with all properties calculated:
@@ -1906,6 +2146,55 @@ class AtomCalculatorV2:
             4. Electronegativity from periodic position
             5. Atomic radius from quantum shell model
         """
+        if not use_cache:
+            return cls._compute_atom_from_particles(
+                proton_data, neutron_data, electron_data,
+                proton_count, neutron_count, electron_count, element_name, element_symbol)
+        key = cls.atom_cache_key(proton_data, neutron_data, electron_data,
+                                 proton_count, neutron_count, electron_count, element_name, element_symbol)
+        return get_result_cache('atoms').get_or_compute(
+            key, lambda: cls._compute_atom_from_particles(
+                proton_data, neutron_data, electron_data,
+                proton_count, neutron_count, electron_count, element_name, element_symbol))
+
+    @classmethod
+    def atom_cache_key(
+        cls,
+        proton_data: Dict,
+        neutron_data: Dict,
+        electron_data: Dict,
+        proton_count: int,
+        neutron_count: int,
+        electron_count: int,
+        element_name: str = "Custom Element",
+        element_symbol: str = "X"
+    ) -> str:
+        """
+        Result cache key for create_atom_from_particles().
+
+        Hashes the full particle JSON (so edited particle data never hits a
+        stale entry), the counts, the name/symbol copied into the result and
+        CALCULATOR_VERSION.
+        """
+        return make_key(
+            memo_content_hash(proton_data), memo_content_hash(neutron_data), memo_content_hash(electron_data),
+            proton_count, neutron_count, electron_count, element_name, element_symbol,
+            cls.CALCULATOR_VERSION
+        )
+
+    @classmethod
+    def _compute_atom_from_particles(
+        cls,
+        proton_data: Dict,
+        neutron_data: Dict,
+        electron_data: Dict,
+        proton_count: int,
+        neutron_count: int,
+        electron_count: int,
+        element_name: str,
+        element_symbol: str
+    ) -> Dict:
+        """Uncached body of create_atom_from_particles()."""
         Z = proton_count
         N = neutron_count
         A = Z + N  # Mass number
@@ -3723,13 +4012,28 @@ class MoleculeCalculatorV2:
     NO hardcoded element properties - all values derived from input JSON.
     """
 
+    # Atomic polarizabilities (A^3) - Tkatchenko-Scheffler reference values
+    ATOMIC_POLARIZABILITIES = {
+        'H': 0.67, 'He': 0.21,
+        'Li': 24.3, 'Be': 5.60, 'B': 3.03, 'C': 1.76, 'N': 1.10, 'O': 0.80,
+        'F': 0.56, 'Ne': 0.39,
+        'Na': 24.1, 'Mg': 10.6, 'Al': 6.80, 'Si': 5.38, 'P': 3.63, 'S': 2.90,
+        'Cl': 2.18, 'Ar': 1.64,
+        'K': 43.4, 'Ca': 22.8, 'Fe': 8.40, 'Cu': 6.10, 'Zn': 5.75,
+        'Br': 3.05, 'Kr': 2.48,
+        'Ag': 7.20, 'I': 5.35, 'Xe': 4.04,
+        'Au': 5.80, 'Hg': 5.70,
+    }
+
     @classmethod
+    @profiled('calc.molecule', 'calc')
     def create_molecule_from_atoms(
         cls,
         atom_data_list: List[Dict],
         counts: List[int],
         molecule_name: str = "Custom Molecule",
-        molecule_formula: Optional[str] = None
+        molecule_formula: Optional[str] = None,
+        bond_graph: Optional[List[Dict]] = None
     ) -> Dict:
         """
         Create a molecule from element JSON objects.
@@ -3746,6 +4050,10 @@ class MoleculeCalculatorV2:
             counts: List of counts for each element
             molecule_name: Name for the molecule
             molecule_formula: Chemical formula (auto-generated if not provided)
+            bond_graph: Optional explicit bonds ({'from', 'to', 'type'}) between
+                atom indices in composition order (each element repeated by its
+                count). When given, atom positions (and the moment of inertia)
+                come from embedding this graph instead of a central-atom template.
 
         Returns:
             Complete molecule JSON with all properties calculated:
@@ -3813,7 +4121,7 @@ class MoleculeCalculatorV2:
         bonds = cls._estimate_bonds(atom_data_list, counts, geometry_result)
 
         # === Calculate Atom Positions in Molecule (3D coordinates) ===
-        atom_positions = cls._calculate_atom_positions(atom_data_list, counts, geometry_result, bonds)
+        atom_positions = cls._calculate_atom_positions(atom_data_list, counts, geometry_result, bonds, bond_graph)
 
         # === Calculate Detailed Bond Data ===
         bond_data = cls._calculate_bond_data(atom_data_list, counts, bonds, geometry_result)
@@ -3822,7 +4130,7 @@ class MoleculeCalculatorV2:
         molecular_orbitals = cls._calculate_molecular_orbitals(atom_data_list, counts, bond_analysis)
 
         # === Calculate Vibrational Modes ===
-        vibrational_modes = cls._calculate_vibrational_modes(atom_data_list, counts, bonds, molecular_mass)
+        vibrational_modes = cls._calculate_vibrational_modes(atom_data_list, counts, atom_positions, bond_graph)
 
         # === Preserve ALL Input Atomic Properties ===
         preserved_atoms = []
@@ -3853,6 +4161,9 @@ class MoleculeCalculatorV2:
         # === Calculate Polarizability ===
         polarizability = cls._calculate_polarizability(atom_data_list, counts, molecular_mass, geometry_result)
 
+        # === Principal moments of inertia (shared by the rotational constants) ===
+        inertia = cls._inertia_descriptors(preserved_atoms)
+
         return {
             "Name": molecule_name,
             "Formula": molecule_formula,
@@ -3882,8 +4193,8 @@ class MoleculeCalculatorV2:
                 "MolecularOrbitals": molecular_orbitals,
                 "VibrationalModes": vibrational_modes,
                 "Symmetry": cls._determine_symmetry(geometry_result),
-                "RotationalConstants": cls._calculate_rotational_constants(atom_positions, molecular_mass),
-                "MomentOfInertia": cls._calculate_moment_of_inertia(preserved_atoms),
+                "RotationalConstants": cls._calculate_rotational_constants(inertia),
+                "MomentOfInertia": cls._calculate_moment_of_inertia(inertia),
                 "ElectronCount": {
                     'total': total_electrons,
                     'valence': total_valence,
@@ -4168,25 +4479,12 @@ class MoleculeCalculatorV2:
         Returns:
             Dict with polarizability in A^3 and method
         """
-        # Atomic polarizabilities (A^3) - Tkatchenko-Scheffler reference values
-        ATOMIC_POLARIZABILITIES = {
-            'H': 0.67, 'He': 0.21,
-            'Li': 24.3, 'Be': 5.60, 'B': 3.03, 'C': 1.76, 'N': 1.10, 'O': 0.80,
-            'F': 0.56, 'Ne': 0.39,
-            'Na': 24.1, 'Mg': 10.6, 'Al': 6.80, 'Si': 5.38, 'P': 3.63, 'S': 2.90,
-            'Cl': 2.18, 'Ar': 1.64,
-            'K': 43.4, 'Ca': 22.8, 'Fe': 8.40, 'Cu': 6.10, 'Zn': 5.75,
-            'Br': 3.05, 'Kr': 2.48,
-            'Ag': 7.20, 'I': 5.35, 'Xe': 4.04,
-            'Au': 5.80, 'Hg': 5.70,
-        }
-
         total_polarizability = 0
         atom_contributions = []
 
         for atom, count in zip(atom_data_list, counts):
             symbol = atom.get('symbol', '?')
-            alpha_atom = ATOMIC_POLARIZABILITIES.get(symbol, 2.0)  # Default 2.0 A^3
+            alpha_atom = cls.ATOMIC_POLARIZABILITIES.get(symbol, 2.0)  # Default 2.0 A^3
 
             contribution = alpha_atom * count
             total_polarizability += contribution
@@ -4414,10 +4712,15 @@ class MoleculeCalculatorV2:
 
     @classmethod
     def _calculate_atom_positions(cls, atom_data_list: List[Dict], counts: List[int],
-                                   geometry_result: Dict, bonds: List[Dict]) -> Dict:
+                                   geometry_result: Dict, bonds: List[Dict],
+                                   bond_graph: Optional[List[Dict]] = None) -> Dict:
         """
         Calculate 3D atom positions in the molecule based on geometry.
+        With an explicit bond graph the whole graph is embedded instead.
         """
+        if bond_graph:
+            return cls._embed_atom_positions(atom_data_list, counts, bond_graph)
+
         total_atoms = sum(counts)
         positions = []
         geometry = geometry_result.get('geometry', 'Linear')
@@ -4486,6 +4789,34 @@ class MoleculeCalculatorV2:
             'geometry_type': geometry
         }
 
+    @classmethod
+    def _embed_atom_positions(cls, atom_data_list: List[Dict], counts: List[int],
+                              bond_graph: List[Dict]) -> Dict:
+        """
+        Embed an explicit bond graph in 3D (spanning-tree VSEPR placement plus
+        neighbor-list relaxation), centered on the center of mass.
+        """
+        from utils.structure_embedding import embed_structure
+
+        composition = []
+        masses = []
+        for atom, count in zip(atom_data_list, counts):
+            composition.extend({'element': atom.get('symbol', '?')} for _ in range(count))
+            masses.extend([atom.get('atomic_mass', 1)] * count)
+
+        coordinates = embed_structure(composition, bond_graph)
+        total_mass = sum(masses) or 1
+        center = [sum(m * p[axis] for m, p in zip(masses, coordinates)) / total_mass for axis in range(3)]
+        positions = [[round(p[axis] - center[axis], 4) for axis in range(3)] for p in coordinates]
+
+        return {
+            'positions': positions,
+            'coordinate_system': 'cartesian',
+            'units': 'angstrom',
+            'method': 'graph_embedding',
+            'geometry_type': 'Embedded'
+        }
+
     @classmethod
     def _calculate_bond_data(cls, atom_data_list: List[Dict], counts: List[int],
                               bonds: List[Dict], geometry_result: Dict) -> Dict:
@@ -4597,68 +4928,36 @@ class MoleculeCalculatorV2:
 
     @classmethod
     def _calculate_vibrational_modes(cls, atom_data_list: List[Dict], counts: List[int],
-                                      bonds: List[Dict], molecular_mass: float) -> Dict:
+                                      atom_positions: Dict, bond_graph: Optional[List[Dict]] = None) -> Dict:
         """
-        Calculate vibrational modes for the molecule.
+        Calculate harmonic vibrational modes of the generated 3D structure
+        (valence force field normal-mode analysis, see utils.normal_modes).
         """
-        total_atoms = sum(counts)
+        from utils.normal_modes import normal_modes
+        from utils.structure_embedding import valence_bond_graph
 
-        # Degrees of freedom
+        total_atoms = sum(counts)
         if total_atoms == 1:
             return {'modes': [], 'total_modes': 0, 'note': 'Monoatomic - no vibrations'}
 
-        # Linear vs nonlinear
-        is_linear = len(set(atom.get('symbol') for atom in atom_data_list)) <= 2 and total_atoms <= 3
-
-        if is_linear:
-            vibrational_dof = 3 * total_atoms - 5
-        else:
-            vibrational_dof = 3 * total_atoms - 6
-
-        vibrational_dof = max(0, vibrational_dof)
-
-        # Estimate vibrational frequencies
-        # Based on reduced mass and force constant approximations
-        modes = []
-        for i in range(vibrational_dof):
-            if i < len(bonds):
-                bond = bonds[i]
-                # Stretching mode frequency ~ sqrt(k/mu)
-                # Use reduced mass approximation
-                bond_length = bond.get('Length_pm', 150)
-                # Shorter bonds = higher frequency
-                frequency = 3000 - bond_length * 10  # cm^-1, rough estimate
-
-                modes.append({
-                    'index': i,
-                    'type': 'stretch',
-                    'frequency_cm-1': round(max(400, frequency), 0),
-                    'ir_active': True,
-                    'raman_active': True,
-                    'description': f"Bond stretch {bond.get('From', '?')}-{bond.get('To', '?')}"
-                })
-            else:
-                # Bending mode (lower frequency)
-                modes.append({
-                    'index': i,
-                    'type': 'bend',
-                    'frequency_cm-1': round(500 + (i - len(bonds)) * 100, 0),
-                    'ir_active': True,
-                    'raman_active': True,
-                    'description': f"Bending mode {i - len(bonds) + 1}"
-                })
-
-        return {
-            'modes': modes,
-            'total_modes': vibrational_dof,
-            'is_linear': is_linear,
-            'degrees_of_freedom': {
-                'total': 3 * total_atoms,
-                'translational': 3,
-                'rotational': 2 if is_linear else 3,
-                'vibrational': vibrational_dof
-            }
-        }
+        elements = [atom.get('symbol', '?') for atom, count in zip(atom_data_list, counts) for _ in range(count)]
+        positions = atom_positions.get('positions', [])
+        bonds = bond_graph
+        if not bonds:
+            # The VSEPR template only places the central atom and its neighbors,
+            # so embed a valence bond graph over every atom instead
+            bonds = valence_bond_graph(elements)
+            positions = cls._embed_atom_positions(atom_data_list, counts, bonds)['positions']
+
+        vibrational_dof = max(0, 3 * total_atoms - (5 if total_atoms == 2 else 6))
+        if len(positions) != total_atoms:
+            return {'modes': [], 'total_modes': vibrational_dof, 'method': 'degrees_of_freedom',
+                    'note': 'No 3D structure for every atom - mode count only'}
+        modes = normal_modes(elements, positions, bonds)
+        if modes is None:
+            return {'modes': [], 'total_modes': vibrational_dof, 'method': 'degrees_of_freedom',
+                    'note': 'Too many atoms for the pure-Python normal-mode solver - mode count only'}
+        return modes
 
     @classmethod
     def _determine_symmetry(cls, geometry_result: Dict) -> Dict:
@@ -4677,57 +4976,63 @@ class MoleculeCalculatorV2:
 
         return symmetry_map.get(geometry, {'point_group': 'C1', 'symmetry_elements': ['E']})
 
+    # Principal moments closer than this (relative) are taken as equal
+    ROTOR_MOMENT_TOLERANCE = 0.01
+
     @classmethod
-    def _calculate_rotational_constants(cls, atom_positions: Dict, molecular_mass: float) -> Dict:
-        """Calculate rotational constants for the molecule."""
-        # Simplified calculation based on geometry
-        positions = atom_positions.get('positions', [])
+    def _inertia_descriptors(cls, preserved_atoms: List[Dict]) -> Optional[Dict]:
+        """compute_descriptors() of the preserved atoms with their input masses (None without atoms)."""
+        if not preserved_atoms:
+            return None
+        from utils.molecular_descriptors import PackedMolecules, compute_descriptors
+        packed = PackedMolecules()
+        packed.add('', [atom.get('element', '?') for atom in preserved_atoms],
+                   [tuple((list(atom.get('position_angstrom') or []) + [0.0, 0.0, 0.0])[:3])
+                    for atom in preserved_atoms],
+                   masses=[atom.get('atomic_mass') or 1.0 for atom in preserved_atoms])
+        return compute_descriptors(packed)[0]
 
-        if len(positions) < 2:
+    @classmethod
+    def _calculate_rotational_constants(cls, descriptors: Optional[Dict]) -> Dict:
+        """Rotational constants A >= B >= C and rotor type from the principal moments of inertia."""
+        if descriptors is None or descriptors['atom_count'] < 2:
             return {'A': 0, 'B': 0, 'C': 0, 'note': 'Insufficient atoms'}
 
-        # Estimate moment of inertia from average distance
-        avg_dist = 0
-        count = 0
-        for i, pos1 in enumerate(positions):
-            for j, pos2 in enumerate(positions):
-                if i < j:
-                    dist = math.sqrt(sum((a - b) ** 2 for a, b in zip(pos1, pos2)))
-                    avg_dist += dist
-                    count += 1
-
-        avg_dist = avg_dist / max(1, count)
-
-        # Rotational constant B = h / (8 * pi^2 * I * c)
-        # Simplified estimate in cm^-1
-        B = 505379.0 / (molecular_mass * avg_dist ** 2) if avg_dist > 0 else 0
+        small, middle, large = descriptors['principal_moments']
+        A, B, C = descriptors['rotational_constants_cm-1']
+        tolerance = cls.ROTOR_MOMENT_TOLERANCE * large
+        if small <= tolerance:
+            # A is infinite (reported as 0, as in compute_descriptors)
+            rotor_type = 'linear'
+        elif large - small <= tolerance:
+            rotor_type = 'spherical top'
+        elif middle - small <= tolerance:
+            rotor_type = 'oblate symmetric'
+        elif large - middle <= tolerance:
+            rotor_type = 'prolate symmetric'
+        else:
+            rotor_type = 'asymmetric'
 
         return {
-            'A_cm-1': round(B * 1.2, 4),  # Approximation
+            'A_cm-1': round(A, 4),
             'B_cm-1': round(B, 4),
-            'C_cm-1': round(B * 0.8, 4),  # Approximation
-            'rotor_type': 'prolate symmetric' if len(positions) > 2 else 'linear'
+            'C_cm-1': round(C, 4),
+            'rotor_type': rotor_type
         }
 
     @classmethod
-    def _calculate_moment_of_inertia(cls, preserved_atoms: List[Dict]) -> Dict:
-        """Calculate moment of inertia tensor."""
-        if not preserved_atoms:
+    def _calculate_moment_of_inertia(cls, descriptors: Optional[Dict]) -> Dict:
+        """Inertia tensor diagonal about the centre of mass, and the principal moments."""
+        if descriptors is None:
             return {'Ixx': 0, 'Iyy': 0, 'Izz': 0}
 
-        Ixx = Iyy = Izz = 0
-        for atom in preserved_atoms:
-            pos = atom.get('position_angstrom', [0, 0, 0])
-            mass = atom.get('atomic_mass', 1)
-            x, y, z = pos[0] if len(pos) > 0 else 0, pos[1] if len(pos) > 1 else 0, pos[2] if len(pos) > 2 else 0
-            Ixx += mass * (y ** 2 + z ** 2)
-            Iyy += mass * (x ** 2 + z ** 2)
-            Izz += mass * (x ** 2 + y ** 2)
-
+        tensor = descriptors['inertia_tensor']
         return {
-            'Ixx_amu_angstrom2': round(Ixx, 4),
-            'Iyy_amu_angstrom2': round(Iyy, 4),
-            'Izz_amu_angstrom2': round(Izz, 4),
+            'Ixx_amu_angstrom2': round(tensor[0][0], 4),
+            'Iyy_amu_angstrom2': round(tensor[1][1], 4),
+            'Izz_amu_angstrom2': round(tensor[2][2], 4),
+            'principal_moments_amu_angstrom2': [round(m, 4) for m in descriptors['principal_moments']],
+            'center_of_mass_angstrom': [round(c, 4) for c in descriptors['center_of_mass']],
             'units': 'amu * angstrom^2'
         }
 
@@ -0,0 +1,293 @@
+"""
+Profiler
+Toggleable timing scopes for paint phases, layouts, calculators and data loads.
+
+Scopes are recorded into fixed-size ring buffers: one of raw events (exported
+as Chrome trace-event JSON for chrome://tracing or Perfetto) and one of
+per-frame totals (used for the FPS / costliest-scopes overlay). When the
+profiler is disabled, scope() returns a shared no-op context manager and
+profiled() wrappers fall straight through to the wrapped function, so the
+instrumentation left in hot paths costs one attribute check.
+
+Enable at startup with PERIODICS_PROFILE=1, or at runtime via
+get_profiler().set_enabled(True).
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+
+PROFILE_ENV = 'PERIODICS_PROFILE'
+
+# Ring buffer sizes
+DEFAULT_EVENT_CAPACITY = 20000
+DEFAULT_FRAME_CAPACITY = 120
+
+
+class _NullScope:
+    """Context manager that does nothing (returned while disabled)"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    """Times one named region and reports it to the profiler on exit"""
+    __slots__ = ('profiler', 'name', 'category', 'start')
+
+    def __init__(self, profiler: 'Profiler', name: str, category: str):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, self.start, time.perf_counter_ns() - self.start, self.category)
+        return False
+
+
+class Profiler:
+    """Ring-buffer scope timer with frame statistics and Chrome trace export"""
+
+    def __init__(self, enabled: bool = False, event_capacity: int = DEFAULT_EVENT_CAPACITY,
+                 frame_capacity: int = DEFAULT_FRAME_CAPACITY):
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled: Start recording immediately
+            event_capacity: Raw events kept for trace export (oldest dropped first)
+            frame_capacity: Frames kept for FPS and per-frame scope costs
+        """
+        self.enabled = enabled
+        self.overlay_visible = False
+        self._origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        # (name, category, start_ns, duration_ns, thread_id)
+        self._events: Deque[Tuple[str, str, int, int, int]] = deque(maxlen=event_capacity)
+        # (frame start_ns, frame duration_ns, {scope name: ns within the frame})
+        self._frames: Deque[Tuple[int, int, Dict[str, int]]] = deque(maxlen=frame_capacity)
+        # Scope totals since the last reset: name -> [count, total_ns, max_ns]
+        self._totals: Dict[str, List[int]] = {}
+        self._frame_start: Optional[int] = None
+        self._frame_scopes: Dict[str, int] = {}
+
+    # ==================== Control ====================
+
+    def set_enabled(self, enabled: bool):
+        """Start or stop recording (recorded data is kept)"""
+        self.enabled = enabled
+        if not enabled:
+            self._frame_start = None
+            self._frame_scopes = {}
+
+    def set_overlay_visible(self, visible: bool):
+        """Show or hide the on-screen overlay (enables recording when shown)"""
+        self.overlay_visible = visible
+        if visible:
+            self.set_enabled(True)
+
+    def reset(self):
+        """Discard all recorded events, frames and totals"""
+        with self._lock:
+            self._events.clear()
+            self._frames.clear()
+            self._totals.clear()
+            self._frame_start = None
+            self._frame_scopes = {}
+
+    # ==================== Recording ====================
+
+    def scope(self, name: str, category: str = 'app'):
+        """
+        Context manager timing a named region.
+
+        Args:
+            name: Scope name (e.g. 'paint.elements')
+            category: Trace category (e.g. 'paint', 'layout', 'calc', 'data')
+        """
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name, category)
+
+    def record(self, name: str, start_ns: int, duration_ns: int, category: str = 'app'):
+        """Record a completed scope measured by the caller"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._events.append((name, category, start_ns, duration_ns, threading.get_ident()))
+            totals = self._totals.get(name)
+            if totals is None:
+                self._totals[name] = [1, duration_ns, duration_ns]
+            else:
+                totals[0] += 1
+                totals[1] += duration_ns
+                if duration_ns > totals[2]:
+                    totals[2] = duration_ns
+            if self._frame_start is not None:
+                self._frame_scopes[name] = self._frame_scopes.get(name, 0) + duration_ns
+
+    def begin_frame(self):
+        """Mark the start of a paint frame"""
+        if not self.enabled:
+            return
+        self._frame_start = time.perf_counter_ns()
+        self._frame_scopes = {}
+
+    def end_frame(self, name: str = 'frame'):
+        """
+        Mark the end of the current paint frame.
+
+        Args:
+            name: Scope name recorded for the whole frame (e.g. 'UnifiedTable.paint')
+        """
+        if not self.enabled or self._frame_start is None:
+            return
+        start = self._frame_start
+        duration = time.perf_counter_ns() - start
+        self._frame_start = None
+        self.record(name, start, duration, 'frame')
+        with self._lock:
+            self._frame_scopes.pop(name, None)
+            self._frames.append((start, duration, self._frame_scopes))
+        self._frame_scopes = {}
+
+    # ==================== Statistics ====================
+
+    def fps(self) -> float:
+        """Frames per second over the frame ring buffer (from frame start times)"""
+        with self._lock:
+            if len(self._frames) < 2:
+                return 0.0
+            span = self._frames[-1][0] - self._frames[0][0]
+            count = len(self._frames) - 1
+        return count * 1e9 / span if span > 0 else 0.0
+
+    def frame_time_ms(self) -> float:
+        """Mean paint time per frame in milliseconds over the frame ring buffer"""
+        with self._lock:
+            if not self._frames:
+                return 0.0
+            return sum(f[1] for f in self._frames) / len(self._frames) / 1e6
+
+    def top_scopes(self, n: int = 8) -> List[Tuple[str, float]]:
+        """
+        Costliest scopes per frame over the frame ring buffer.
+
+        Args:
+            n: Number of scopes to return
+
+        Returns:
+            (name, mean milliseconds per frame), most expensive first
+        """
+        with self._lock:
+            frames = list(self._frames)
+        if not frames:
+            return []
+        totals: Dict[str, int] = {}
+        for _, _, scopes in frames:
+            for name, ns in scopes.items():
+                totals[name] = totals.get(name, 0) + ns
+        ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:n]
+        return [(name, ns / len(frames) / 1e6) for name, ns in ranked]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-scope count, total, mean and max (milliseconds) since the last reset"""
+        with self._lock:
+            totals = {name: list(values) for name, values in self._totals.items()}
+        return {
+            name: {
+                'count': count,
+                'total_ms': total / 1e6,
+                'mean_ms': total / count / 1e6,
+                'max_ms': peak / 1e6,
+            }
+            for name, (count, total, peak) in totals.items()
+        }
+
+    # ==================== Export ====================
+
+    def to_chrome_trace(self) -> Dict:
+        """Recorded events as a Chrome trace-event document (complete 'X' events)"""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self._events)
+        trace_events = [
+            {
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': (start - self._origin_ns) / 1000.0,
+                'dur': duration / 1000.0,
+                'pid': pid,
+                'tid': tid,
+            }
+            for name, category, start, duration, tid in events
+        ]
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path: str) -> int:
+        """
+        Write recorded events as Chrome trace-event JSON.
+
+        Args:
+            path: Output file (open in chrome://tracing or ui.perfetto.dev)
+
+        Returns:
+            Number of events written
+        """
+        trace = self.to_chrome_trace()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f)
+        return len(trace['traceEvents'])
+
+
+def profiled(name: str, category: str = 'app') -> Callable:
+    """
+    Decorator timing every call of a function as a profiler scope.
+
+    Args:
+        name: Scope name
+        category: Trace category
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = get_profiler()
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.record(name, start, time.perf_counter_ns() - start, category)
+        return wrapper
+    return decorator
+
+
+# Global profiler instance
+_profiler: Optional[Profiler] = None
+
+
+def get_profiler() -> Profiler:
+    """Get the global profiler (enabled at creation if PERIODICS_PROFILE is set)"""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler(enabled=os.environ.get(PROFILE_ENV, '') not in ('', '0'))
+    return _profiler
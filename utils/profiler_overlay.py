@@ -0,0 +1,61 @@
+"""
+Profiler Overlay
+On-screen FPS and costliest-scope panel drawn by the unified tables.
+"""
+
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QColor, QFont, QPen
+
+from utils.profiler import get_profiler
+
+
+OVERLAY_WIDTH = 300
+OVERLAY_MARGIN = 10
+OVERLAY_LINE_HEIGHT = 16
+OVERLAY_TOP_N = 8
+
+
+def draw_profiler_overlay(painter, widget_width, top_n=OVERLAY_TOP_N):
+    """
+    Draw the profiler overlay in the top-right corner of a widget.
+
+    Does nothing unless the overlay is visible. Drawn in widget (screen)
+    coordinates regardless of the painter's current zoom/pan transform.
+
+    Args:
+        painter: Active QPainter on the widget
+        widget_width: Widget width in pixels
+        top_n: Number of scopes to list
+    """
+    profiler = get_profiler()
+    if not profiler.overlay_visible:
+        return
+
+    scopes = profiler.top_scopes(top_n)
+    height = OVERLAY_LINE_HEIGHT * (len(scopes) + 2) + 12
+    rect = QRectF(widget_width - OVERLAY_WIDTH - OVERLAY_MARGIN, OVERLAY_MARGIN, OVERLAY_WIDTH, height)
+
+    painter.save()
+    painter.resetTransform()
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(0, 0, 0, 180))
+    painter.drawRoundedRect(rect, 6, 6)
+
+    painter.setFont(QFont("Consolas", 9, QFont.Weight.Bold))
+    painter.setPen(QPen(QColor(120, 255, 120)))
+    x = rect.left() + 8
+    y = rect.top() + 6
+    header = f"{profiler.fps():5.1f} FPS   paint {profiler.frame_time_ms():6.2f} ms"
+    painter.drawText(QRectF(x, y, OVERLAY_WIDTH - 16, OVERLAY_LINE_HEIGHT),
+                     Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, header)
+
+    painter.setFont(QFont("Consolas", 8))
+    painter.setPen(QPen(QColor(220, 220, 220)))
+    y += OVERLAY_LINE_HEIGHT * 1.5
+    for name, ms in scopes:
+        row = QRectF(x, y, OVERLAY_WIDTH - 16, OVERLAY_LINE_HEIGHT)
+        painter.drawText(row, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, name)
+        painter.drawText(row, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, f"{ms:7.2f} ms")
+        y += OVERLAY_LINE_HEIGHT
+
+    painter.restore()
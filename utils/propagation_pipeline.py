@@ -0,0 +1,434 @@
+"""
+Propagation Pipeline
+Memoized, incremental quarks -> hadrons -> atoms -> molecules / alloys chain.
+
+The pipeline runs the utils.simulation_schema propagate_* functions over the
+active data files as a DAG of nodes, one node per item and stage:
+
+    quarks + subatomic JSON -> hadrons
+    elements JSON + hadrons (Proton, Neutron) -> atoms
+    molecules JSON + atoms -> molecules
+    alloys JSON + elements JSON -> alloys
+
+Each node's key is the content hash of its stage version and the output
+hashes of the nodes it reads, and its result is memoized under that key in a
+result cache (see utils.result_cache).  A run re-reads only the JSON files
+whose (mtime, size) changed and recomputes only the nodes whose inputs
+changed; when a recomputed node produces the same output as before (e.g. a
+hadron whose mass comes from the experimental table), nothing downstream of
+it is touched.
+
+Nodes of one stage are independent, so a stage with enough pending nodes is
+computed in a process pool.
+
+Usage:
+    pipeline = get_propagation_pipeline()
+    report = pipeline.run()
+    iron = pipeline.get('atoms', '026_Fe')
+"""
+
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from data.data_manager import DataCategory, DataChangeEvent, DataManager, get_data_manager
+from data.data_watcher import FileSignature
+from utils.result_cache import ResultCache, content_hash, get_result_cache, make_key
+
+
+# Bump a stage's version when its propagate function changes results
+STAGE_VERSIONS = {
+    'hadrons': 1,
+    'atoms': 1,
+    'molecules': 1,
+    'alloys': 1,
+}
+
+# Stage -> the stages and source categories its nodes read, in run order
+STAGE_DAG: Dict[str, Tuple[Union[str, DataCategory], ...]] = {
+    'hadrons': (DataCategory.SUBATOMIC, DataCategory.QUARKS),
+    'atoms': (DataCategory.ELEMENTS, 'hadrons'),
+    'molecules': (DataCategory.MOLECULES, 'atoms'),
+    'alloys': (DataCategory.ALLOYS, DataCategory.ELEMENTS),
+}
+
+SOURCE_CATEGORIES = (
+    DataCategory.QUARKS,
+    DataCategory.SUBATOMIC,
+    DataCategory.ELEMENTS,
+    DataCategory.MOLECULES,
+    DataCategory.ALLOYS,
+)
+
+# Pending nodes in a stage before a process pool is worth its start-up cost
+PARALLEL_THRESHOLD = 256
+MEV_PER_AMU = 931.494
+
+# (stage or source category, item name)
+NodeId = Tuple[Union[str, DataCategory], str]
+
+
+# ==================== Stage Functions ====================
+# Module level so worker processes can unpickle them
+
+def _hadron_properties(payload: Tuple[List[Dict], Optional[float]]) -> Dict:
+    from utils.simulation_schema import propagate_quark_to_hadron
+    quarks, spin_hint = payload
+    return propagate_quark_to_hadron(quarks, spin_hint).to_dict()
+
+
+def _atom_properties(payload: Tuple[int, int, Dict, Dict, str, str]) -> Dict:
+    from utils.simulation_schema import propagate_hadrons_to_atom
+    z, n, proton_data, neutron_data, name, symbol = payload
+    result = propagate_hadrons_to_atom(z, n, z, proton_data, neutron_data).to_dict()
+    result['name'] = name
+    result['symbol'] = symbol
+    return result
+
+
+def _molecule_properties(payload: Tuple[List[Dict], List[Dict], str]) -> Dict:
+    from utils.simulation_schema import propagate_atoms_to_molecule
+    atoms, bonds, name = payload
+    result = propagate_atoms_to_molecule(atoms, bonds).to_dict()
+    result['name'] = name
+    return result
+
+
+def _alloy_properties(payload: Tuple[List[Dict], List[float], str, str]) -> Dict:
+    from utils.simulation_schema import propagate_elements_to_alloy
+    elements, fractions, lattice_type, name = payload
+    result = propagate_elements_to_alloy(elements, fractions, lattice_type).to_dict()
+    result['name'] = name
+    return result
+
+
+STAGE_FUNCTIONS: Dict[str, Callable[[Any], Dict]] = {
+    'hadrons': _hadron_properties,
+    'atoms': _atom_properties,
+    'molecules': _molecule_properties,
+    'alloys': _alloy_properties,
+}
+
+
+def _quark_flavour(constituent: str) -> Tuple[str, bool]:
+    """('Up Quark', True) for 'Anti-Up Quark' / 'Antiup Quark', else (name, False)"""
+    lowered = constituent.lower()
+    if not lowered.startswith('anti'):
+        return constituent, False
+    base = constituent[4:].lstrip('- ')
+    return base[:1].upper() + base[1:], True
+
+
+class PropagationPipeline:
+    """Incremental, memoized quark-to-alloy propagation over the active data files"""
+
+    def __init__(self, manager: Optional[DataManager] = None, workers: Optional[int] = None,
+                 parallel_threshold: int = PARALLEL_THRESHOLD):
+        """
+        Initialize the pipeline. Nothing is computed until run().
+
+        Args:
+            manager: DataManager whose active files feed the sources (global if None)
+            workers: Worker processes for large stages (default: CPU count; 1 never forks)
+            parallel_threshold: Pending nodes in a stage before the process pool is used
+        """
+        self.manager = manager or get_data_manager()
+        self.workers = workers
+        self.parallel_threshold = parallel_threshold
+        self._file_signatures: Dict[NodeId, FileSignature] = {}
+        self._keys: Dict[NodeId, str] = {}
+        self._hashes: Dict[NodeId, str] = {}
+        self._outputs: Dict[NodeId, Dict] = {}
+
+    # ==================== Public API ====================
+
+    def run(self) -> Dict[str, Dict[str, Dict]]:
+        """
+        Bring every node up to date with the active data files.
+
+        Returns:
+            Report of what the run did:
+            {'sources': {category: {'changed': [...], 'unchanged': count}},
+             'stages': {stage: {'computed': [...], 'cached': [...], 'unchanged': count}}}
+            where 'cached' nodes had changed inputs whose result was already memoized.
+        """
+        report = {'sources': {}, 'stages': {}}
+        for category in SOURCE_CATEGORIES:
+            report['sources'][category.value] = self._refresh_source(category)
+
+        planners = {
+            'hadrons': self._plan_hadrons,
+            'atoms': self._plan_atoms,
+            'molecules': self._plan_molecules,
+            'alloys': self._plan_alloys,
+        }
+        for stage in STAGE_DAG:
+            report['stages'][stage] = self._run_stage(stage, planners[stage]())
+        return report
+
+    def get(self, stage: str, name: str) -> Optional[Dict]:
+        """
+        Latest result of one node.
+
+        Args:
+            stage: 'hadrons', 'atoms', 'molecules' or 'alloys'
+            name: Data file stem (e.g. 'Proton', '026_Fe', 'Water')
+
+        Returns:
+            A copy of the result, or None if the node does not exist
+        """
+        result = self._outputs.get((stage, name))
+        return copy.deepcopy(result) if result is not None else None
+
+    def results(self, stage: str) -> Dict[str, Dict]:
+        """Copies of every result of a stage, by item name"""
+        return {name: copy.deepcopy(result) for (layer, name), result in self._outputs.items()
+                if layer == stage}
+
+    def invalidate(self, event: DataChangeEvent):
+        """
+        Force the files named in a change event to be re-read on the next run.
+
+        run() already notices edits by file signature; this also catches edits
+        that keep the same mtime and size. Suitable as a DataManager item
+        change callback (see watch()).
+        """
+        if event.full:
+            stale = [node for node in self._file_signatures if node[0] == event.category]
+        else:
+            stale = [(event.category, name) for name in event.names]
+        for node in stale:
+            self._file_signatures.pop(node, None)
+
+    def watch(self):
+        """Register invalidate() for item changes in every source category"""
+        for category in SOURCE_CATEGORIES:
+            self.manager.register_item_change_callback(category, self.invalidate)
+
+    def cache(self, stage: str) -> ResultCache:
+        """The result cache memoizing a stage"""
+        return get_result_cache(f"pipeline_{stage}")
+
+    # ==================== Sources ====================
+
+    def _refresh_source(self, category: DataCategory) -> Dict:
+        """Re-read the files of a category whose signature changed"""
+        changed = []
+        unchanged = 0
+        present = set()
+        for filepath in sorted(self.manager.get_active_path(category).glob("*.json")):
+            node = (category, filepath.stem)
+            try:
+                stat = filepath.stat()
+            except OSError:
+                continue
+            present.add(node)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if self._file_signatures.get(node) == signature:
+                unchanged += 1
+                continue
+            data = self.manager.get_item(category, filepath.stem)
+            if data is None:
+                continue
+            self._file_signatures[node] = signature
+            digest = content_hash(data)
+            # Formatting or comment edits leave the parsed data, and everything downstream, alone
+            if self._hashes.get(node) == digest:
+                unchanged += 1
+                continue
+            self._hashes[node] = digest
+            self._outputs[node] = data
+            changed.append(filepath.stem)
+
+        for node in [n for n in self._hashes if n[0] == category and n not in present]:
+            self._forget(node)
+            changed.append(node[1])
+        return {'changed': sorted(changed), 'unchanged': unchanged}
+
+    def _source_items(self, category: DataCategory) -> List[Tuple[str, Dict]]:
+        """(name, data) for every loaded file of a category"""
+        return sorted((name, data) for (layer, name), data in self._outputs.items() if layer == category)
+
+    # ==================== Planning ====================
+    # A planner returns (name, inputs, build_payload) per node. build_payload is
+    # only called for nodes whose inputs changed.
+
+    def _plan_hadrons(self) -> List[Tuple[str, List[NodeId], Callable[[], Any]]]:
+        quarks_by_name = {data.get('Name'): name for name, data in self._source_items(DataCategory.QUARKS)
+                          if 'Quark' in data.get('Classification', [])}
+        plan = []
+        for name, data in self._source_items(DataCategory.SUBATOMIC):
+            constituents = []
+            for entry in data.get('Composition', []):
+                flavour, anti = _quark_flavour(entry.get('Constituent', ''))
+                quark = quarks_by_name.get(flavour)
+                if quark is None:
+                    break
+                is_anti = anti or bool(entry.get('IsAnti'))
+                constituents.extend([(quark, is_anti)] * int(entry.get('Count', 1)))
+            else:
+                if constituents:
+                    inputs = [(DataCategory.SUBATOMIC, name)]
+                    inputs += sorted({(DataCategory.QUARKS, quark) for quark, _ in constituents})
+                    plan.append((name, inputs, self._hadron_payload(data, constituents)))
+                continue
+            print(f"Warning: Skipping hadron {name}: unknown constituent {entry.get('Constituent')}")
+        return plan
+
+    def _hadron_payload(self, data: Dict, constituents: List[Tuple[str, bool]]) -> Callable[[], Any]:
+        def build():
+            from utils.physics_calculator_v2 import SubatomicCalculatorV2
+            quarks = []
+            for quark, anti in constituents:
+                quark_data = self._outputs[(DataCategory.QUARKS, quark)]
+                quarks.append(SubatomicCalculatorV2.make_antiquark(quark_data) if anti else quark_data)
+            return quarks, data.get('Spin_hbar')
+        return build
+
+    def _plan_atoms(self) -> List[Tuple[str, List[NodeId], Callable[[], Any]]]:
+        nucleons = [('hadrons', 'Proton'), ('hadrons', 'Neutron')]
+        if any(node not in self._outputs for node in nucleons):
+            print("Warning: Proton and Neutron hadrons are required for the atom stage")
+            return []
+        plan = []
+        for name, data in self._source_items(DataCategory.ELEMENTS):
+            if data.get('atomic_number'):
+                plan.append((name, [(DataCategory.ELEMENTS, name)] + nucleons, self._atom_payload(data)))
+        return plan
+
+    def _atom_payload(self, data: Dict) -> Callable[[], Any]:
+        def build():
+            z = data['atomic_number']
+            # Same neutron count as the element tables and the atom cache warm-up
+            n = max(0, round(data.get('atomic_mass', 2 * z)) - z)
+            proton, neutron = (self._outputs[('hadrons', name)] for name in ('Proton', 'Neutron'))
+            return (z, n, {'Mass_amu': proton['mass_MeV'] / MEV_PER_AMU},
+                    {'Mass_amu': neutron['mass_MeV'] / MEV_PER_AMU},
+                    data.get('name', ''), data.get('symbol', ''))
+        return build
+
+    def _atoms_by_symbol(self) -> Dict[str, str]:
+        return {data.get('symbol'): name for name, data in self._source_items(DataCategory.ELEMENTS)
+                if ('atoms', name) in self._outputs}
+
+    def _plan_molecules(self) -> List[Tuple[str, List[NodeId], Callable[[], Any]]]:
+        atoms = self._atoms_by_symbol()
+        plan = []
+        for name, data in self._source_items(DataCategory.MOLECULES):
+            symbols = [entry.get('Element') for entry in data.get('Composition', [])]
+            missing = [s for s in symbols if s not in atoms]
+            if missing:
+                print(f"Warning: Skipping molecule {name}: no atom for {', '.join(missing)}")
+                continue
+            inputs = [(DataCategory.MOLECULES, name)] + sorted({('atoms', atoms[s]) for s in symbols})
+            plan.append((name, inputs, self._molecule_payload(data, atoms)))
+        return plan
+
+    def _molecule_payload(self, data: Dict, atoms: Dict[str, str]) -> Callable[[], Any]:
+        def build():
+            expanded = []
+            for entry in data.get('Composition', []):
+                atom = self._outputs[('atoms', atoms[entry['Element']])]
+                expanded.extend([{
+                    'symbol': entry['Element'],
+                    'atomic_mass': atom['properties']['atomic_mass_amu'],
+                    'atomic_number': atom['atomic_number'],
+                }] * int(entry.get('Count', 1)))
+            return expanded, data.get('Bonds3D', []), data.get('Name', '')
+        return build
+
+    def _plan_alloys(self) -> List[Tuple[str, List[NodeId], Callable[[], Any]]]:
+        elements = {data.get('symbol'): name for name, data in self._source_items(DataCategory.ELEMENTS)}
+        plan = []
+        for name, data in self._source_items(DataCategory.ALLOYS):
+            symbols = [entry.get('Element') for entry in data.get('Components', [])]
+            missing = [s for s in symbols if s not in elements]
+            if missing or not symbols:
+                print(f"Warning: Skipping alloy {name}: no element data for {', '.join(missing) or 'components'}")
+                continue
+            inputs = [(DataCategory.ALLOYS, name)] + sorted({(DataCategory.ELEMENTS, elements[s]) for s in symbols})
+            plan.append((name, inputs, self._alloy_payload(data, elements)))
+        return plan
+
+    def _alloy_payload(self, data: Dict, elements: Dict[str, str]) -> Callable[[], Any]:
+        def build():
+            components = data.get('Components', [])
+            # Nominal composition: the middle of each specified range, normalized
+            midpoints = [(c.get('MinPercent', 0) + c.get('MaxPercent', 0)) / 2 for c in components]
+            total = sum(midpoints) or 1.0
+            element_data = []
+            for component in components:
+                element = self._outputs[(DataCategory.ELEMENTS, elements[component['Element']])]
+                element_data.append({key: element[key] for key in ('symbol', 'density', 'melting_point')
+                                     if element.get(key) is not None})
+            lattice = data.get('LatticeProperties', {}).get('PrimaryStructure', 'FCC')
+            return element_data, [m / total for m in midpoints], lattice, data.get('Name', '')
+        return build
+
+    # ==================== Execution ====================
+
+    def _run_stage(self, stage: str, plan: List[Tuple[str, List[NodeId], Callable[[], Any]]]) -> Dict:
+        """Recompute the nodes of one stage whose inputs changed"""
+        cache = self.cache(stage)
+        version = STAGE_VERSIONS[stage]
+        computed, cached = [], []
+        unchanged = 0
+        pending = []
+        planned = set()
+        for name, inputs, build_payload in plan:
+            node = (stage, name)
+            planned.add(node)
+            key = make_key(stage, version, [(str(layer), item, self._hashes[(layer, item)])
+                                            for layer, item in inputs])
+            if self._keys.get(node) == key:
+                unchanged += 1
+                continue
+            result = cache.get(key)
+            if result is not None:
+                self._store(node, key, result)
+                cached.append(name)
+            else:
+                pending.append((node, key, build_payload()))
+
+        results = self._execute(stage, [payload for _, _, payload in pending])
+        for (node, key, _), result in zip(pending, results):
+            cache.put(key, result)
+            self._store(node, key, result)
+            computed.append(node[1])
+
+        for node in [n for n in self._keys if n[0] == stage and n not in planned]:
+            self._forget(node)
+        return {'computed': sorted(computed), 'cached': sorted(cached), 'unchanged': unchanged}
+
+    def _execute(self, stage: str, payloads: List[Any]) -> List[Dict]:
+        """Compute the pending nodes of a stage, in a process pool when there are many"""
+        function = STAGE_FUNCTIONS[stage]
+        workers = self.workers or os.cpu_count() or 1
+        if workers == 1 or len(payloads) < max(2, self.parallel_threshold):
+            return [function(payload) for payload in payloads]
+        workers = min(workers, len(payloads))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(function, payloads, chunksize=max(1, len(payloads) // (workers * 4))))
+
+    def _store(self, node: NodeId, key: str, result: Dict):
+        self._keys[node] = key
+        self._hashes[node] = content_hash(result)
+        self._outputs[node] = result
+
+    def _forget(self, node: NodeId):
+        for table in (self._file_signatures, self._keys, self._hashes, self._outputs):
+            table.pop(node, None)
+
+
+# Global pipeline over the active data
+_pipeline: Optional[PropagationPipeline] = None
+
+
+def get_propagation_pipeline() -> PropagationPipeline:
+    """Get the global propagation pipeline (watching the global data manager)"""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = PropagationPipeline()
+        _pipeline.watch()
+    return _pipeline
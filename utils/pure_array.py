@@ -2,12 +2,15 @@
 Pure Python array and vector utilities.
 
 Replaces numpy operations for SDF rendering with zero external dependencies.
-Provides basic math wrappers, a 3D vector class, and nucleon position generation
-for nuclear visualization in the Periodics application.
+Provides basic math wrappers, a 3D vector class, a structure-of-arrays vector
+batch (Vec3Array) for whole-point-cloud transforms, a symmetric eigensolver
+(numpy eigh when available) and nucleon position generation for nuclear
+visualization in the Periodics application.
 """
 import math
 import random
-from typing import List, Tuple, Optional
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 # =============================================================================
 # Constants
@@ -428,44 +431,8 @@ def generate_nucleon_positions(
         >>> positions[0]  # (x, y, z, is_proton)
         (0.123, -0.456, 0.789, True)
     """
-    if seed is not None:
-        random_seed(seed)
-
-    total_nucleons = protons + neutrons
-    if total_nucleons == 0:
-        return []
-
-    positions: List[Tuple[float, float, float, bool]] = []
-
-    # Create a shuffled list of nucleon types for uniform mixing
-    nucleon_types = [True] * protons + [False] * neutrons
-    random.shuffle(nucleon_types)
-
-    for is_proton in nucleon_types:
-        # Generate uniform distribution within sphere
-        # Using rejection sampling would be inefficient, so we use
-        # proper spherical coordinate transformation
-
-        # Radius: r = R * cbrt(uniform(0,1)) for uniform volume distribution
-        u = random_uniform(0, 1)
-        r = nuclear_radius * (u ** (1.0 / 3.0))
-
-        # Polar angle theta: cos(theta) uniformly distributed in [-1, 1]
-        cos_theta = random_uniform(-1, 1)
-        theta = acos(cos_theta)
-
-        # Azimuthal angle phi: uniformly distributed in [0, 2*pi)
-        phi = random_uniform(0, 2 * pi)
-
-        # Convert to Cartesian coordinates
-        sin_theta = sin(theta)
-        x = r * sin_theta * cos(phi)
-        y = r * sin_theta * sin(phi)
-        z = r * cos_theta
-
-        positions.append((x, y, z, is_proton))
-
-    return positions
+    points, nucleon_types = generate_nucleon_array(protons, neutrons, nuclear_radius, seed, use_numpy=False)
+    return [(x, y, z, is_proton) for (x, y, z), is_proton in zip(points.to_tuples(), nucleon_types)]
 
 
 def generate_shell_positions(
@@ -613,6 +580,78 @@ def distance(p1: Tuple[float, float, float], p2: Tuple[float, float, float]) ->
     return sqrt(dx * dx + dy * dy + dz * dz)
 
 
+def vector_sub(a: Tuple[float, float, float], b: Tuple[float, float, float]) -> Tuple[float, float, float]:
+    """
+    Difference of two 3D tuples.
+
+    Args:
+        a: First vector (x, y, z).
+        b: Vector subtracted from a.
+
+    Returns:
+        a - b as a tuple.
+    """
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+
+def vector_scale(a: Tuple[float, float, float], s: float) -> Tuple[float, float, float]:
+    """
+    Multiply a 3D tuple by a scalar.
+
+    Args:
+        a: Vector (x, y, z).
+        s: Scale factor.
+
+    Returns:
+        a * s as a tuple.
+    """
+    return (a[0] * s, a[1] * s, a[2] * s)
+
+
+def vector_dot(a: Tuple[float, float, float], b: Tuple[float, float, float]) -> float:
+    """
+    Dot product of two 3D tuples.
+
+    Args:
+        a: First vector (x, y, z).
+        b: Second vector (x, y, z).
+
+    Returns:
+        Scalar dot product.
+    """
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def vector_cross(a: Tuple[float, float, float], b: Tuple[float, float, float]) -> Tuple[float, float, float]:
+    """
+    Cross product of two 3D tuples.
+
+    Args:
+        a: First vector (x, y, z).
+        b: Second vector (x, y, z).
+
+    Returns:
+        a x b as a tuple.
+    """
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def vector_normalize(a: Tuple[float, float, float]) -> Tuple[float, float, float]:
+    """
+    Unit vector in the direction of a 3D tuple.
+
+    Args:
+        a: Vector (x, y, z).
+
+    Returns:
+        a / |a|, or the zero vector if a has (near) zero length.
+    """
+    length = sqrt(a[0] * a[0] + a[1] * a[1] + a[2] * a[2])
+    if length < 1e-12:
+        return (0.0, 0.0, 0.0)
+    return (a[0] / length, a[1] / length, a[2] / length)
+
+
 # =============================================================================
 # 3D Rotation Matrix Functions
 # =============================================================================
@@ -806,6 +845,628 @@ def apply_rotation_matrix(M: List[List[float]], vec: 'Vec3') -> 'Vec3':
     )
 
 
+# =============================================================================
+# Vec3Array (Structure-of-Arrays Vectors)
+# =============================================================================
+
+# Vec3Array storage backend; numpy is only used when enabled and installed
+_ARRAY_USE_NUMPY = True
+_numpy_module = None
+
+
+def _load_numpy():
+    """Import numpy once, returning None when it is not installed."""
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy
+            _numpy_module = numpy
+        except ImportError:
+            _numpy_module = False
+    return _numpy_module or None
+
+
+def set_array_backend(use_numpy: bool) -> None:
+    """
+    Choose the storage used by newly created Vec3Array instances.
+
+    Args:
+        use_numpy: True to back arrays with numpy (when installed),
+                   False for array('d') buffers.
+    """
+    global _ARRAY_USE_NUMPY
+    _ARRAY_USE_NUMPY = use_numpy
+
+
+def get_array_backend() -> str:
+    """
+    Return the storage backend used for new Vec3Array instances.
+
+    Returns:
+        "numpy" if arrays are backed by numpy, "pure_python" otherwise.
+    """
+    return "numpy" if _ARRAY_USE_NUMPY and _load_numpy() is not None else "pure_python"
+
+
+def array_numpy():
+    """
+    Return the numpy module when the array backend is numpy.
+
+    Returns:
+        numpy, or None for the pure Python backend.
+    """
+    return _load_numpy() if _ARRAY_USE_NUMPY else None
+
+
+class Vec3Array:
+    """
+    Structure-of-arrays collection of 3D vectors.
+
+    The x, y and z components live in three contiguous float buffers
+    (array('d'), or numpy float64 arrays when the numpy backend is active),
+    so a whole point cloud can be translated, scaled or rotated in one call
+    without creating a Vec3 per point.
+
+    Methods ending in an underscore modify the array in place and return it;
+    the others return a new Vec3Array. Operands may be another Vec3Array of
+    the same length (element-wise), a Vec3, or an (x, y, z) tuple (applied to
+    every point).
+
+    Attributes:
+        x: Buffer of X components.
+        y: Buffer of Y components.
+        z: Buffer of Z components.
+    """
+    __slots__ = ('x', 'y', 'z', '_np')
+
+    def __init__(self, x=(), y=(), z=(), use_numpy: Optional[bool] = None):
+        """
+        Initialize from component sequences (copied into new buffers).
+
+        Args:
+            x: X components.
+            y: Y components.
+            z: Z components.
+            use_numpy: Force numpy (True) or array('d') (False) storage;
+                       None follows the module backend.
+
+        Raises:
+            ValueError: If the component sequences differ in length.
+        """
+        if use_numpy is None:
+            use_numpy = _ARRAY_USE_NUMPY
+        np = _load_numpy() if use_numpy else None
+        if np is not None:
+            self.x = np.array(x, dtype=np.float64)
+            self.y = np.array(y, dtype=np.float64)
+            self.z = np.array(z, dtype=np.float64)
+        else:
+            self.x = array('d', x)
+            self.y = array('d', y)
+            self.z = array('d', z)
+        self._np = np
+        if not len(self.x) == len(self.y) == len(self.z):
+            raise ValueError("Vec3Array components must have the same length")
+
+    # -------------------------------------------------------------------------
+    # Construction and conversion
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def zeros(cls, count: int, use_numpy: Optional[bool] = None) -> 'Vec3Array':
+        """Create an array of count zero vectors."""
+        zero = [0.0] * count
+        return cls(zero, zero, zero, use_numpy)
+
+    @classmethod
+    def from_points(cls, points: Iterable[Sequence[float]],
+                    use_numpy: Optional[bool] = None) -> 'Vec3Array':
+        """
+        Create from (x, y, z, ...) tuples; extra fields such as is_proton are ignored.
+
+        Args:
+            points: Iterable of sequences with at least three components.
+            use_numpy: Storage override (see __init__).
+
+        Returns:
+            New Vec3Array.
+        """
+        xs, ys, zs = array('d'), array('d'), array('d')
+        for point in points:
+            xs.append(point[0])
+            ys.append(point[1])
+            zs.append(point[2])
+        return cls(xs, ys, zs, use_numpy)
+
+    @classmethod
+    def from_vec3s(cls, vectors: Iterable[Vec3], use_numpy: Optional[bool] = None) -> 'Vec3Array':
+        """Create from an iterable of Vec3 instances."""
+        return cls.from_points(((v.x, v.y, v.z) for v in vectors), use_numpy)
+
+    def _new(self, x, y, z) -> 'Vec3Array':
+        """Wrap freshly computed buffers of the same storage type without copying."""
+        result = Vec3Array.__new__(Vec3Array)
+        result.x, result.y, result.z, result._np = x, y, z, self._np
+        return result
+
+    def copy(self) -> 'Vec3Array':
+        """Return an independent copy."""
+        if self._np is not None:
+            return self._new(self.x.copy(), self.y.copy(), self.z.copy())
+        return self._new(array('d', self.x), array('d', self.y), array('d', self.z))
+
+    @property
+    def uses_numpy(self) -> bool:
+        """True if the buffers are numpy arrays."""
+        return self._np is not None
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __getitem__(self, index: int) -> Vec3:
+        """Return point index as a Vec3 (a copy, not a view)."""
+        return Vec3(float(self.x[index]), float(self.y[index]), float(self.z[index]))
+
+    def __setitem__(self, index: int, value) -> None:
+        """Set point index from a Vec3 or (x, y, z) tuple."""
+        if isinstance(value, Vec3):
+            value = (value.x, value.y, value.z)
+        self.x[index], self.y[index], self.z[index] = value[0], value[1], value[2]
+
+    def __repr__(self) -> str:
+        return f"Vec3Array(len={len(self)}, backend={'numpy' if self._np is not None else 'pure_python'})"
+
+    def to_tuples(self) -> List[Tuple[float, float, float]]:
+        """Return the points as a list of (x, y, z) tuples."""
+        return list(zip(self.x.tolist(), self.y.tolist(), self.z.tolist()))
+
+    def to_vec3s(self) -> List[Vec3]:
+        """Return the points as a list of Vec3 instances."""
+        return [Vec3(x, y, z) for x, y, z in self.to_tuples()]
+
+    def _operand(self, other):
+        """
+        Split an operand into components.
+
+        Returns:
+            (ox, oy, oz, per_point) where per_point is True when the
+            components are buffers matching this array's length.
+        """
+        if isinstance(other, Vec3Array):
+            if len(other) != len(self):
+                raise ValueError(f"Vec3Array length mismatch: {len(self)} != {len(other)}")
+            return other.x, other.y, other.z, True
+        if isinstance(other, Vec3):
+            return other.x, other.y, other.z, False
+        return other[0], other[1], other[2], False
+
+    # -------------------------------------------------------------------------
+    # Arithmetic
+    # -------------------------------------------------------------------------
+
+    def _axpy_(self, other, factor: float) -> 'Vec3Array':
+        """In place: self += factor * other."""
+        ox, oy, oz, per_point = self._operand(other)
+        if self._np is not None:
+            if per_point and not isinstance(ox, self._np.ndarray):
+                ox, oy, oz = self._np.asarray(ox), self._np.asarray(oy), self._np.asarray(oz)
+            self.x += factor * ox
+            self.y += factor * oy
+            self.z += factor * oz
+            return self
+        for buffer, offset in ((self.x, ox), (self.y, oy), (self.z, oz)):
+            if per_point:
+                for i in range(len(buffer)):
+                    buffer[i] += factor * offset[i]
+            else:
+                offset = factor * offset
+                for i in range(len(buffer)):
+                    buffer[i] += offset
+        return self
+
+    def add_(self, other) -> 'Vec3Array':
+        """Add a vector (or per-point vectors) in place."""
+        return self._axpy_(other, 1.0)
+
+    def sub_(self, other) -> 'Vec3Array':
+        """Subtract a vector (or per-point vectors) in place."""
+        return self._axpy_(other, -1.0)
+
+    def add(self, other) -> 'Vec3Array':
+        """Return self + other."""
+        return self.copy()._axpy_(other, 1.0)
+
+    def sub(self, other) -> 'Vec3Array':
+        """Return self - other."""
+        return self.copy()._axpy_(other, -1.0)
+
+    def scale_(self, factor) -> 'Vec3Array':
+        """
+        Scale in place.
+
+        Args:
+            factor: A scalar, or a sequence with one factor per point.
+        """
+        if self._np is not None:
+            if not isinstance(factor, (int, float)):
+                factor = self._np.asarray(factor, dtype=self._np.float64)
+            self.x *= factor
+            self.y *= factor
+            self.z *= factor
+            return self
+        per_point = not isinstance(factor, (int, float))
+        for buffer in (self.x, self.y, self.z):
+            if per_point:
+                for i in range(len(buffer)):
+                    buffer[i] *= factor[i]
+            else:
+                for i in range(len(buffer)):
+                    buffer[i] *= factor
+        return self
+
+    def scale(self, factor) -> 'Vec3Array':
+        """Return a scaled copy (scalar or per-point factors)."""
+        return self.copy().scale_(factor)
+
+    def __add__(self, other) -> 'Vec3Array':
+        return self.add(other)
+
+    def __sub__(self, other) -> 'Vec3Array':
+        return self.sub(other)
+
+    def __mul__(self, factor) -> 'Vec3Array':
+        return self.scale(factor)
+
+    def __rmul__(self, factor) -> 'Vec3Array':
+        return self.scale(factor)
+
+    def __iadd__(self, other) -> 'Vec3Array':
+        return self.add_(other)
+
+    def __isub__(self, other) -> 'Vec3Array':
+        return self.sub_(other)
+
+    def __imul__(self, factor) -> 'Vec3Array':
+        return self.scale_(factor)
+
+    # -------------------------------------------------------------------------
+    # Products and norms
+    # -------------------------------------------------------------------------
+
+    def dot(self, other):
+        """
+        Per-point dot product.
+
+        Args:
+            other: Vec3Array of the same length, Vec3, or (x, y, z) tuple.
+
+        Returns:
+            Buffer (array('d') or numpy array) with one dot product per point.
+        """
+        ox, oy, oz, per_point = self._operand(other)
+        if self._np is not None:
+            return self.x * ox + self.y * oy + self.z * oz
+        xs, ys, zs = self.x, self.y, self.z
+        if per_point:
+            return array('d', (xs[i] * ox[i] + ys[i] * oy[i] + zs[i] * oz[i] for i in range(len(xs))))
+        return array('d', (xs[i] * ox + ys[i] * oy + zs[i] * oz for i in range(len(xs))))
+
+    def cross_(self, other) -> 'Vec3Array':
+        """Replace each point with its cross product with other, in place."""
+        ox, oy, oz, per_point = self._operand(other)
+        xs, ys, zs = self.x, self.y, self.z
+        if self._np is not None:
+            cx = ys * oz - zs * oy
+            cy = zs * ox - xs * oz
+            cz = xs * oy - ys * ox
+            xs[:], ys[:], zs[:] = cx, cy, cz
+            return self
+        for i in range(len(xs)):
+            x, y, z = xs[i], ys[i], zs[i]
+            if per_point:
+                bx, by, bz = ox[i], oy[i], oz[i]
+            else:
+                bx, by, bz = ox, oy, oz
+            xs[i] = y * bz - z * by
+            ys[i] = z * bx - x * bz
+            zs[i] = x * by - y * bx
+        return self
+
+    def cross(self, other) -> 'Vec3Array':
+        """Return the per-point cross product self x other."""
+        return self.copy().cross_(other)
+
+    def lengths(self):
+        """Per-point Euclidean lengths as a buffer."""
+        if self._np is not None:
+            return self._np.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+        xs, ys, zs = self.x, self.y, self.z
+        return array('d', (math.sqrt(xs[i] * xs[i] + ys[i] * ys[i] + zs[i] * zs[i]) for i in range(len(xs))))
+
+    def normalize_(self) -> 'Vec3Array':
+        """Scale every point to unit length in place; zero vectors stay zero."""
+        lengths = self.lengths()
+        if self._np is not None:
+            safe = self._np.where(lengths == 0, 1.0, lengths)
+            self.x /= safe
+            self.y /= safe
+            self.z /= safe
+            return self
+        xs, ys, zs = self.x, self.y, self.z
+        for i in range(len(xs)):
+            length = lengths[i]
+            if length != 0:
+                xs[i] /= length
+                ys[i] /= length
+                zs[i] /= length
+        return self
+
+    def normalized(self) -> 'Vec3Array':
+        """Return a copy with every point scaled to unit length."""
+        return self.copy().normalize_()
+
+    # -------------------------------------------------------------------------
+    # Rotation
+    # -------------------------------------------------------------------------
+
+    def rotate_(self, M: List[List[float]]) -> 'Vec3Array':
+        """
+        Apply a 3x3 matrix to every point in place.
+
+        Args:
+            M: 3x3 matrix as list of lists (e.g. from rotation_matrix_euler).
+
+        Returns:
+            This array, rotated.
+        """
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = M
+        xs, ys, zs = self.x, self.y, self.z
+        if self._np is not None:
+            rx = m00 * xs + m01 * ys + m02 * zs
+            ry = m10 * xs + m11 * ys + m12 * zs
+            rz = m20 * xs + m21 * ys + m22 * zs
+            xs[:], ys[:], zs[:] = rx, ry, rz
+            return self
+        for i in range(len(xs)):
+            x, y, z = xs[i], ys[i], zs[i]
+            xs[i] = m00 * x + m01 * y + m02 * z
+            ys[i] = m10 * x + m11 * y + m12 * z
+            zs[i] = m20 * x + m21 * y + m22 * z
+        return self
+
+    def rotate(self, M: List[List[float]]) -> 'Vec3Array':
+        """Return a copy with a 3x3 matrix applied to every point."""
+        return self.copy().rotate_(M)
+
+    def rotate_x_(self, angle: float) -> 'Vec3Array':
+        """Rotate every point around the X axis in place."""
+        return self.rotate_(rotation_matrix_x(angle))
+
+    def rotate_y_(self, angle: float) -> 'Vec3Array':
+        """Rotate every point around the Y axis in place."""
+        return self.rotate_(rotation_matrix_y(angle))
+
+    def rotate_z_(self, angle: float) -> 'Vec3Array':
+        """Rotate every point around the Z axis in place."""
+        return self.rotate_(rotation_matrix_z(angle))
+
+
+def generate_nucleon_array(
+    protons: int,
+    neutrons: int,
+    nuclear_radius: float,
+    seed: Optional[int] = None,
+    use_numpy: Optional[bool] = None
+) -> Tuple[Vec3Array, List[bool]]:
+    """
+    Generate nucleon positions as a Vec3Array for batch transforms.
+
+    Produces the same positions as generate_nucleon_positions for the same
+    seed, split into a Vec3Array and a parallel list of nucleon types.
+
+    Args:
+        protons: Number of protons (atomic number Z).
+        neutrons: Number of neutrons (N = A - Z).
+        nuclear_radius: Radius of the nucleus in arbitrary units.
+        seed: Optional random seed for reproducibility.
+        use_numpy: Storage override (see Vec3Array).
+
+    Returns:
+        Tuple of (positions, is_proton) where is_proton[i] is True for protons.
+    """
+    if seed is not None:
+        random_seed(seed)
+
+    xs, ys, zs = array('d'), array('d'), array('d')
+    total_nucleons = protons + neutrons
+    if total_nucleons == 0:
+        return Vec3Array(use_numpy=use_numpy), []
+
+    # Create a shuffled list of nucleon types for uniform mixing
+    nucleon_types = [True] * protons + [False] * neutrons
+    random.shuffle(nucleon_types)
+
+    for _ in nucleon_types:
+        # Radius: r = R * cbrt(uniform(0,1)) for uniform volume distribution
+        u = random_uniform(0, 1)
+        r = nuclear_radius * (u ** (1.0 / 3.0))
+
+        # Polar angle theta: cos(theta) uniformly distributed in [-1, 1]
+        cos_theta = random_uniform(-1, 1)
+        theta = acos(cos_theta)
+
+        # Azimuthal angle phi: uniformly distributed in [0, 2*pi)
+        phi = random_uniform(0, 2 * pi)
+
+        # Convert to Cartesian coordinates
+        sin_theta = sin(theta)
+        xs.append(r * sin_theta * cos(phi))
+        ys.append(r * sin_theta * sin(phi))
+        zs.append(r * cos_theta)
+
+    return Vec3Array(xs, ys, zs, use_numpy), nucleon_types
+
+
+# =============================================================================
+# Symmetric Eigensolver
+# =============================================================================
+
+def symmetric_eigen(matrix: List[List[float]]) -> Tuple[List[float], List[List[float]]]:
+    """
+    Eigen-decomposition of a symmetric matrix: Householder reduction to
+    tridiagonal form, then implicit QL iterations (EISPACK tred2/tql2).
+
+    Returns:
+        (eigenvalues ascending, eigenvectors as rows in the same order)
+    """
+    n = len(matrix)
+    if n == 0:
+        return [], []
+    v = [row[:] for row in matrix]
+    d = v[n - 1][:]
+    e = [0.0] * n
+
+    # Householder reduction
+    for i in range(n - 1, 0, -1):
+        scale = sum(abs(d[k]) for k in range(i))
+        h = 0.0
+        if scale == 0.0:
+            e[i] = d[i - 1]
+            for j in range(i):
+                d[j] = v[i - 1][j]
+                v[i][j] = 0.0
+                v[j][i] = 0.0
+        else:
+            for k in range(i):
+                d[k] /= scale
+                h += d[k] * d[k]
+            f = d[i - 1]
+            g = math.sqrt(h)
+            if f > 0:
+                g = -g
+            e[i] = scale * g
+            h -= f * g
+            d[i - 1] = f - g
+            for j in range(i):
+                e[j] = 0.0
+            for j in range(i):
+                f = d[j]
+                v[j][i] = f
+                g = e[j] + v[j][j] * f
+                for k in range(j + 1, i):
+                    g += v[k][j] * d[k]
+                    e[k] += v[k][j] * f
+                e[j] = g
+            f = 0.0
+            for j in range(i):
+                e[j] /= h
+                f += e[j] * d[j]
+            hh = f / (h + h)
+            for j in range(i):
+                e[j] -= hh * d[j]
+            for j in range(i):
+                f, g = d[j], e[j]
+                for k in range(j, i):
+                    v[k][j] -= f * e[k] + g * d[k]
+                d[j] = v[i - 1][j]
+                v[i][j] = 0.0
+        d[i] = h
+
+    # Accumulate the transformations
+    for i in range(n - 1):
+        v[n - 1][i] = v[i][i]
+        v[i][i] = 1.0
+        h = d[i + 1]
+        if h != 0.0:
+            for k in range(i + 1):
+                d[k] = v[k][i + 1] / h
+            for j in range(i + 1):
+                g = sum(v[k][i + 1] * v[k][j] for k in range(i + 1))
+                for k in range(i + 1):
+                    v[k][j] -= g * d[k]
+        for k in range(i + 1):
+            v[k][i + 1] = 0.0
+    for j in range(n):
+        d[j] = v[n - 1][j]
+        v[n - 1][j] = 0.0
+    v[n - 1][n - 1] = 1.0
+
+    # Implicit QL on the tridiagonal matrix; rotations act on rows of w = v^T
+    w = [list(column) for column in zip(*v)]
+    for i in range(1, n):
+        e[i - 1] = e[i]
+    e[n - 1] = 0.0
+    f = 0.0
+    largest = 0.0
+    eps = 2.0 ** -52
+    for l in range(n):
+        largest = max(largest, abs(d[l]) + abs(e[l]))
+        m = l
+        while m < n - 1 and abs(e[m]) > eps * largest:
+            m += 1
+        if m > l:
+            while True:
+                g = d[l]
+                p = (d[l + 1] - g) / (2.0 * e[l])
+                r = math.copysign(math.hypot(p, 1.0), p)
+                d[l] = e[l] / (p + r)
+                d[l + 1] = e[l] * (p + r)
+                dl1 = d[l + 1]
+                h = g - d[l]
+                for i in range(l + 2, n):
+                    d[i] -= h
+                f += h
+                p = d[m]
+                c = c2 = c3 = 1.0
+                el1 = e[l + 1]
+                s = s2 = 0.0
+                for i in range(m - 1, l - 1, -1):
+                    c3, c2, s2 = c2, c, s
+                    g = c * e[i]
+                    h = c * p
+                    r = math.hypot(p, e[i])
+                    e[i + 1] = s * r
+                    s, c = e[i] / r, p / r
+                    p = c * d[i] - s * g
+                    d[i + 1] = h + s * (c * g + s * d[i])
+                    wi, wj = w[i], w[i + 1]
+                    w[i + 1] = [s * a + c * b for a, b in zip(wi, wj)]
+                    w[i] = [c * a - s * b for a, b in zip(wi, wj)]
+                p = -s * s2 * c3 * el1 * e[l] / dl1
+                e[l] = s * p
+                d[l] = c * p
+                if abs(e[l]) <= eps * largest:
+                    break
+        d[l] += f
+        e[l] = 0.0
+
+    order = sorted(range(n), key=lambda i: d[i])
+    return [d[i] for i in order], [w[i] for i in order]
+
+
+def symmetric_eigen_batch(matrices: List[List[List[float]]]) -> List[Tuple[List[float], List[List[float]]]]:
+    """
+    Eigenpairs of many symmetric matrices: one stacked numpy eigh per matrix
+    size when the array backend is numpy, else symmetric_eigen() on each.
+
+    Returns:
+        (eigenvalues ascending, eigenvectors as rows) per matrix, in input order
+    """
+    np = array_numpy()
+    if np is None:
+        return [symmetric_eigen(m) for m in matrices]
+    results: List[Optional[Tuple[List[float], List[List[float]]]]] = [None] * len(matrices)
+    by_size: Dict[int, List[int]] = {}
+    for n, matrix in enumerate(matrices):
+        by_size.setdefault(len(matrix), []).append(n)
+    for members in by_size.values():
+        values, vectors = np.linalg.eigh(np.array([matrices[n] for n in members], dtype=np.float64))
+        for n, vals, vecs in zip(members, values.tolist(), vectors):
+            # eigh returns eigenvectors as columns
+            results[n] = (vals, vecs.T.tolist())
+    return results
+
+
 # =============================================================================
 # Module Self-Test
 # =============================================================================
@@ -5,15 +5,20 @@ Replaces scipy.special for orbital calculations with zero external dependencies.
 This module provides implementations of:
 - factorial(n): Factorial function with caching
 - double_factorial(n): Double factorial n!!
+- factorial_float(n), log_factorial(n), factorial_ratio(a, b): Table-driven
+  float factorials and log-space ratios for normalization constants
 - genlaguerre(n, alpha): Generalized Laguerre polynomials L_n^alpha(x)
 - lpmv(m, l, x): Associated Legendre polynomials P_l^m(x)
 
+genlaguerre and lpmv also accept a sequence of points and evaluate them
+together in one sweep of the recurrence.
+
 All implementations use only the Python standard library (math module).
 Accuracy target: < 1e-10 relative error compared to scipy.special.
 """
 import math
 from functools import lru_cache
-from typing import Callable, Union
+from typing import Callable, List, Sequence, Union
 
 
 # =============================================================================
@@ -23,11 +28,11 @@ from typing import Callable, Union
 @lru_cache(maxsize=200)
 def factorial(n: int) -> int:
     """
-    Compute factorial n! with caching for repeated calls.
+    Compute the exact integer factorial n!, cached for repeated calls.
 
-    Uses iterative approach for performance and avoids recursion limits.
-    Results are cached using LRU cache for efficiency in orbital calculations
-    where the same factorials are computed repeatedly.
+    Floating-point code (normalization constants) should use
+    factorial_float, log_factorial or factorial_ratio instead, which read
+    precomputed tables and avoid big-integer arithmetic.
 
     Parameters
     ----------
@@ -46,9 +51,8 @@ def factorial(n: int) -> int:
 
     Notes
     -----
-    - Exact for n < 170 (before float overflow occurs)
-    - For n >= 171, Python's arbitrary precision integers still work,
-      but conversion to float will overflow
+    - Exact for all n (Python arbitrary precision integers)
+    - For n >= 171, conversion to float overflows; use log_factorial
 
     Examples
     --------
@@ -66,14 +70,7 @@ def factorial(n: int) -> int:
     if n < 0:
         raise ValueError(f"Factorial is not defined for negative integers: {n}")
 
-    if n <= 1:
-        return 1
-
-    # Iterative computation for better performance
-    result = 1
-    for i in range(2, n + 1):
-        result *= i
-    return result
+    return math.factorial(n)
 
 
 @lru_cache(maxsize=200)
@@ -139,10 +136,138 @@ def double_factorial(n: int) -> int:
     return result
 
 
+# Largest n whose factorial is a finite double (171! overflows)
+FACTORIAL_TABLE_MAX = 170
+
+# Precomputed n! as floats and log(n!) for 0 <= n <= FACTORIAL_TABLE_MAX
+_FACTORIAL_TABLE = tuple(float(math.factorial(k)) for k in range(FACTORIAL_TABLE_MAX + 1))
+_LOG_FACTORIAL_TABLE = tuple(math.log(math.factorial(k)) for k in range(FACTORIAL_TABLE_MAX + 1))
+
+# Beyond the table, ratios spanning at most this many terms are multiplied out directly
+_SHORT_RATIO_TERMS = 32
+
+
+def factorial_float(n: int) -> float:
+    """
+    Return n! as a float from the precomputed table.
+
+    Parameters
+    ----------
+    n : int
+        Non-negative integer.
+
+    Returns
+    -------
+    float
+        n! (math.inf for n > FACTORIAL_TABLE_MAX, where the value overflows)
+
+    Raises
+    ------
+    ValueError
+        If n < 0
+    """
+    n = int(n)
+    if n < 0:
+        raise ValueError(f"Factorial is not defined for negative integers: {n}")
+    if n <= FACTORIAL_TABLE_MAX:
+        return _FACTORIAL_TABLE[n]
+    return math.inf
+
+
+def log_factorial(n: int) -> float:
+    """
+    Natural logarithm of n!.
+
+    Table lookup for n <= FACTORIAL_TABLE_MAX, log-gamma beyond, so it
+    never overflows.
+
+    Parameters
+    ----------
+    n : int
+        Non-negative integer.
+
+    Returns
+    -------
+    float
+        log(n!)
+
+    Raises
+    ------
+    ValueError
+        If n < 0
+
+    Examples
+    --------
+    >>> log_factorial(0)
+    0.0
+    >>> round(math.exp(log_factorial(5)), 10)
+    120.0
+    """
+    n = int(n)
+    if n < 0:
+        raise ValueError(f"Factorial is not defined for negative integers: {n}")
+    if n <= FACTORIAL_TABLE_MAX:
+        return _LOG_FACTORIAL_TABLE[n]
+    return math.lgamma(n + 1)
+
+
+def factorial_ratio(a: int, b: int) -> float:
+    """
+    Compute a! / b! as a float without big-integer arithmetic.
+
+    Uses the float table when both factorials are finite and log-space
+    differences otherwise, so ratios such as (l-m)!/(l+m)! stay finite
+    for large arguments.
+
+    Parameters
+    ----------
+    a : int
+        Non-negative integer (numerator).
+    b : int
+        Non-negative integer (denominator).
+
+    Returns
+    -------
+    float
+        a! / b!
+
+    Examples
+    --------
+    >>> factorial_ratio(5, 3)
+    20.0
+    >>> factorial_ratio(1, 3)
+    0.16666666666666666
+    """
+    a = int(a)
+    b = int(b)
+    if a < 0 or b < 0:
+        raise ValueError(f"Factorial is not defined for negative integers: {min(a, b)}")
+    if a <= FACTORIAL_TABLE_MAX and b <= FACTORIAL_TABLE_MAX:
+        return _FACTORIAL_TABLE[a] / _FACTORIAL_TABLE[b]
+    if abs(a - b) <= _SHORT_RATIO_TERMS:
+        # Few terms: a direct float product is exact to rounding
+        ratio = 1.0
+        for k in range(min(a, b) + 1, max(a, b) + 1):
+            ratio *= k
+        return ratio if a >= b else 1.0 / ratio
+    return math.exp(log_factorial(a) - log_factorial(b))
+
+
 # =============================================================================
 # Generalized Laguerre Polynomials
 # =============================================================================
 
+def _is_sequence(x) -> bool:
+    """True if x is a sequence of evaluation points rather than a single number."""
+    if isinstance(x, (int, float)):
+        return False
+    try:
+        len(x)
+    except TypeError:
+        return False
+    return True
+
+
 class GeneralizedLaguerre:
     """
     Generalized Laguerre polynomial L_n^alpha(x).
@@ -177,11 +302,16 @@ class GeneralizedLaguerre:
 
     This three-term recurrence is numerically stable for moderate n.
 
+    Calling with a sequence of points evaluates all of them in a single
+    sweep of the recurrence.
+
     Examples
     --------
     >>> L = GeneralizedLaguerre(2, 0.5)
     >>> L(1.0)  # Evaluate L_2^0.5 at x=1
     0.125
+    >>> L([0.0, 1.0])
+    [1.875, -0.125]
     """
 
     def __init__(self, n: int, alpha: float):
@@ -203,20 +333,23 @@ class GeneralizedLaguerre:
         self.n = n
         self.alpha = float(alpha)
 
-    def __call__(self, x: Union[float, int]) -> float:
+    def __call__(self, x: Union[float, int, Sequence[float]]) -> Union[float, List[float]]:
         """
         Evaluate L_n^alpha(x) using the recurrence relation.
 
         Parameters
         ----------
-        x : float or int
-            Point at which to evaluate the polynomial
+        x : float, int or sequence of floats
+            Point (or points) at which to evaluate the polynomial
 
         Returns
         -------
-        float
-            Value of L_n^alpha(x)
+        float or list of float
+            Value of L_n^alpha(x), or one value per point for a sequence
         """
+        if _is_sequence(x):
+            return self._sweep([float(v) for v in x])
+
         x = float(x)
         n = self.n
         alpha = self.alpha
@@ -241,6 +374,27 @@ class GeneralizedLaguerre:
 
         return L_prev1
 
+    def _sweep(self, xs: List[float]) -> List[float]:
+        """
+        Run the recurrence once over all points and return L_n^alpha at each.
+        """
+        n = self.n
+        alpha = self.alpha
+
+        L_prev2 = [1.0] * len(xs)                   # L_0
+        if n == 0:
+            return L_prev2
+        L_prev1 = [1.0 + alpha - x for x in xs]     # L_1
+
+        for k in range(1, n):
+            a = 2*k + 1 + alpha
+            b = k + alpha
+            L_next = [((a - x) * p1 - b * p2) / (k + 1) for x, p1, p2 in zip(xs, L_prev1, L_prev2)]
+            L_prev2 = L_prev1
+            L_prev1 = L_next
+
+        return L_prev1
+
     def __repr__(self) -> str:
         return f"GeneralizedLaguerre(n={self.n}, alpha={self.alpha})"
 
@@ -346,13 +500,14 @@ def lpmv(m: int, l: int, x: float) -> float:
         For |m| > l, returns 0.
     l : int
         Degree of the polynomial (l >= 0)
-    x : float
-        Point of evaluation, typically in [-1, 1] for real results
+    x : float or sequence of floats
+        Point of evaluation, typically in [-1, 1] for real results.
+        A sequence is evaluated in a single recurrence sweep.
 
     Returns
     -------
-    float
-        Value of P_l^m(x)
+    float or list of float
+        Value of P_l^m(x), or one value per point for a sequence
 
     Notes
     -----
@@ -389,12 +544,15 @@ def lpmv(m: int, l: int, x: float) -> float:
         m = int(m)
     if not isinstance(l, (int,)) or isinstance(l, bool):
         l = int(l)
-    x = float(x)
 
     # Validate l
     if l < 0:
         raise ValueError(f"Degree l must be non-negative: {l}")
 
+    if _is_sequence(x):
+        return _lpmv_many(m, l, [float(v) for v in x])
+    x = float(x)
+
     # Handle |m| > l case
     if abs(m) > l:
         return 0.0
@@ -410,11 +568,8 @@ def lpmv(m: int, l: int, x: float) -> float:
 
         P_l_m_pos = lpmv(m_pos, l, x)
 
-        # Calculate ratio (l-m_pos)! / (l+m_pos)!
-        # This equals 1 / [(l-m_pos+1) * (l-m_pos+2) * ... * (l+m_pos)]
-        ratio = 1.0
-        for k in range(l - m_pos + 1, l + m_pos + 1):
-            ratio /= k
+        # Calculate ratio (l-m_pos)! / (l+m_pos)! from the factorial table
+        ratio = factorial_ratio(l - m_pos, l + m_pos)
 
         sign = (-1) ** m_pos
         return sign * ratio * P_l_m_pos
@@ -486,6 +641,53 @@ def lpmv(m: int, l: int, x: float) -> float:
     return P_prev1
 
 
+def _lpmv_many(m: int, l: int, xs: List[float]) -> List[float]:
+    """
+    Evaluate P_l^m at many points in one upward recurrence sweep in l.
+
+    Uses the same recurrences as lpmv, so values match it exactly.
+    """
+    m_abs = abs(m)
+    if m_abs > l:
+        return [0.0] * len(xs)
+
+    values = _assoc_legendre_sweep(m_abs, l, xs)
+    if m < 0:
+        # P_l^{-m} = (-1)^m * (l-m)!/(l+m)! * P_l^m
+        scale = (-1) ** m_abs * factorial_ratio(l - m_abs, l + m_abs)
+        values = [scale * v for v in values]
+    return values
+
+
+def _assoc_legendre_sweep(m: int, l: int, xs: List[float]) -> List[float]:
+    """
+    Upward recurrence from P_m^m to P_l^m for fixed m >= 0 over many points.
+    """
+    P_mm = []
+    for x in xs:
+        sqrt_factor = math.sqrt(abs(1.0 - x * x))
+        value = 1.0  # P_0^0
+        for k in range(1, m + 1):
+            value *= -(2*k - 1) * sqrt_factor
+        P_mm.append(value)
+
+    if l == m:
+        return P_mm
+
+    P_prev2 = P_mm
+    P_prev1 = [x * (2*m + 1) * p for x, p in zip(xs, P_mm)]   # P_{m+1}^m
+
+    for k in range(m + 1, l):
+        a = 2*k + 1
+        b = k + m
+        c = k - m + 1
+        P_next = [(a * x * p1 - b * p2) / c for x, p1, p2 in zip(xs, P_prev1, P_prev2)]
+        P_prev2 = P_prev1
+        P_prev1 = P_next
+
+    return P_prev1
+
+
 # =============================================================================
 # Additional Utility Functions for Orbital Calculations
 # =============================================================================
@@ -515,11 +717,7 @@ def spherical_harmonic_prefactor(l: int, m: int) -> float:
     m_abs = abs(m)
 
     # (l - |m|)! / (l + |m|)!
-    # More stable: compute as product
-    ratio = 1.0
-    for k in range(l - m_abs + 1, l + m_abs + 1):
-        ratio *= k
-    ratio = 1.0 / ratio
+    ratio = factorial_ratio(l - m_abs, l + m_abs)
 
     return math.sqrt((2*l + 1) / (4 * math.pi) * ratio)
 
@@ -736,7 +934,7 @@ def gamma_half_integer(n: int) -> float:
         k = n // 2
         if k == 0:
             raise ValueError("Gamma function has pole at 0")
-        return float(factorial(k - 1))
+        return factorial_float(k - 1)
     else:
         # n/2 is half-integer: n = 2k+1, so n/2 = k + 1/2
         # Γ(k + 1/2) = (2k-1)!! / 2^k * sqrt(π)
@@ -786,7 +984,7 @@ def laguerre_explicit(n: int, alpha: float, x: float) -> float:
         for j in range(n - k):
             binom *= (n + alpha - j) / (j + 1)
 
-        term = ((-1)**k) * binom * (x**k) / factorial(k)
+        term = ((-1)**k) * binom * (x**k) / factorial_float(k)
         result += term
 
     return result
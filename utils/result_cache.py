@@ -0,0 +1,392 @@
+"""
+Result Cache
+Content-addressed cache for deterministic calculator results.
+
+Keys are SHA-256 hashes of the canonical JSON of every input that affects a
+result (particle JSON objects, counts, calculator version), so editing a
+particle's JSON or bumping a calculator version never serves a stale entry.
+Results live in an in-memory LRU tier and, optionally, an on-disk tier of one
+JSON file per key under the cache directory (see utils.cache_paths).
+
+Entries are stored serialized (pickle in memory, JSON on disk) and decoded
+on every hit, so callers always get a private copy they are free to modify.
+Unpickling is two to three times cheaper than decoding JSON, which matters
+for results that are only slightly more expensive to compute than to copy.
+
+The disk tier is off by default; enable it per cache with set_disk_enabled()
+or for every cache with PERIODICS_RESULT_CACHE_DISK=1.
+
+Usage:
+    python -m utils.result_cache warm-atoms [-j WORKERS]
+    python -m utils.result_cache warm-hadrons [-j WORKERS] [--max-quarks N]
+    python -m utils.result_cache stats
+    python -m utils.result_cache clear
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.cache_paths import get_cache_dir, get_cache_path
+
+
+DISK_CACHE_ENV = 'PERIODICS_RESULT_CACHE_DISK'
+RESULTS_DIR = 'results'
+DEFAULT_MAX_ENTRIES = 512
+HASH_MEMO_SIZE = 256
+
+
+def content_hash(data: Any) -> str:
+    """
+    Hash JSON-compatible data independently of dict key order.
+
+    Args:
+        data: Any JSON-serializable value
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding
+    """
+    text = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+# id(data) -> (deep snapshot of data, content hash)
+_hash_memo: Dict[int, Tuple[Any, str]] = {}
+
+
+def memo_content_hash(data: Any) -> str:
+    """
+    content_hash() for objects passed in repeatedly, such as particle JSON.
+
+    The hash is remembered by object identity together with a deep snapshot.
+    The snapshot is compared to the object on every call, which is far cheaper
+    than re-encoding it, so in-place edits are still picked up.
+
+    Args:
+        data: Any JSON-serializable value
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding
+    """
+    entry = _hash_memo.get(id(data))
+    if entry is not None and entry[0] == data:
+        return entry[1]
+    digest = content_hash(data)
+    if len(_hash_memo) >= HASH_MEMO_SIZE:
+        _hash_memo.clear()
+    _hash_memo[id(data)] = (copy.deepcopy(data), digest)
+    return digest
+
+
+def make_key(*parts: Any) -> str:
+    """Combine key parts (hashes, counts, versions) into one cache key"""
+    return content_hash(list(parts))
+
+
+class ResultCache:
+    """In-memory LRU cache of JSON results with an optional on-disk tier"""
+
+    def __init__(self, namespace: str, max_entries: int = DEFAULT_MAX_ENTRIES, disk: bool = False):
+        """
+        Initialize the cache.
+
+        Args:
+            namespace: Name of the cache (also its disk subdirectory)
+            max_entries: Entries kept in memory before the least recently used is dropped
+            disk: Read and write the on-disk tier
+        """
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.disk_enabled = disk
+        self._entries: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    # ==================== Configuration ====================
+
+    def set_disk_enabled(self, enabled: bool):
+        """Turn the on-disk tier on or off"""
+        self.disk_enabled = enabled
+
+    def set_max_entries(self, max_entries: int):
+        """Resize the memory tier, evicting the oldest entries if needed"""
+        with self._lock:
+            self.max_entries = max_entries
+            self._evict()
+
+    def disk_dir(self, create: bool = False) -> str:
+        """Directory of this cache's on-disk tier"""
+        path = os.path.join(get_cache_dir(create=create), RESULTS_DIR, self.namespace)
+        if create:
+            os.makedirs(path, exist_ok=True)
+        return path
+
+    # ==================== Lookup ====================
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a result.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            A fresh copy of the cached result, or None on a miss
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if data is not None:
+            return pickle.loads(data)
+
+        text = self._read_disk(key) if self.disk_enabled else None
+        if text is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        result = json.loads(text)
+        with self._lock:
+            self.disk_hits += 1
+            self._store(key, pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+        return result
+
+    def put(self, key: str, result: Dict):
+        """
+        Store a result in memory (and on disk when the disk tier is enabled).
+
+        Args:
+            key: Cache key from make_key()
+            result: JSON-serializable result
+        """
+        data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._store(key, data)
+        if self.disk_enabled:
+            self._write_disk(key, json.dumps(result))
+
+    def get_or_compute(self, key: str, compute: Callable[[], Dict]) -> Dict:
+        """
+        Return the cached result for key, computing and storing it on a miss.
+
+        Args:
+            key: Cache key from make_key()
+            compute: Zero-argument function producing the result
+
+        Returns:
+            A copy of the result that the caller may modify
+        """
+        result = self.get(key)
+        if result is None:
+            result = compute()
+            # put() stores a serialized copy, so the caller's object is never shared
+            self.put(key, result)
+        return result
+
+    def clear(self, disk: bool = False):
+        """
+        Drop all in-memory entries and reset the statistics.
+
+        Args:
+            disk: Also delete the on-disk tier
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+        if disk:
+            shutil.rmtree(self.disk_dir(), ignore_errors=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count and hit/miss counters"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    # ==================== Internals ====================
+
+    def _store(self, key: str, data: bytes):
+        """Insert into the memory tier (caller holds the lock)"""
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self):
+        while len(self._entries) > max(0, self.max_entries):
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str, create_dir: bool = False) -> str:
+        # Two-character fan-out keeps directories small
+        filename = os.path.join(RESULTS_DIR, self.namespace, key[:2], f"{key}.json")
+        return get_cache_path(filename, create_dir=create_dir)
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError as e:
+            print(f"Warning: Could not read cached result {path}: {e}")
+            return None
+
+    def _write_disk(self, key: str, text: str):
+        path = self._disk_path(key, create_dir=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            # Atomic, so concurrent processes never read a partial file
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Warning: Could not write cached result {path}: {e}")
+
+
+# Global caches by namespace
+_caches: Dict[str, ResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_result_cache(namespace: str) -> ResultCache:
+    """Get the global cache for a namespace (e.g. 'atoms'), creating it on first use"""
+    with _caches_lock:
+        cache = _caches.get(namespace)
+        if cache is None:
+            disk = os.environ.get(DISK_CACHE_ENV, '') not in ('', '0')
+            cache = ResultCache(namespace, disk=disk)
+            _caches[namespace] = cache
+        return cache
+
+
+# ==================== Warm-up ====================
+
+def _ground_state_inputs() -> Tuple[Dict, Dict, Dict, List[Tuple[int, int, str, str]]]:
+    """Proton, neutron and electron JSON plus (Z, N, name, symbol) for every element"""
+    from data.data_manager import get_data_manager, DataCategory
+    manager = get_data_manager()
+    proton = manager.get_item(DataCategory.SUBATOMIC, 'Proton')
+    neutron = manager.get_item(DataCategory.SUBATOMIC, 'Neutron')
+    electron = manager.get_item(DataCategory.QUARKS, 'Electron')
+    if not proton or not neutron or not electron:
+        raise RuntimeError("Proton, Neutron and Electron data are required to warm the atom cache")
+
+    nuclei = []
+    for element in sorted(manager.get_all_items(DataCategory.ELEMENTS), key=lambda e: e.get('atomic_number', 0)):
+        z = element.get('atomic_number')
+        if not z:
+            continue
+        n = max(0, round(element.get('atomic_mass', 2 * z)) - z)
+        nuclei.append((z, n, element.get('name', ''), element.get('symbol', '')))
+    return proton, neutron, electron, nuclei
+
+
+def _compute_atom(args: Tuple) -> Tuple[str, Dict]:
+    """Compute one atom uncached (runs in a worker process)"""
+    from utils.physics_calculator_v2 import AtomCalculatorV2
+    proton, neutron, electron, z, n, name, symbol = args
+    key = AtomCalculatorV2.atom_cache_key(proton, neutron, electron, z, n, z, name, symbol)
+    result = AtomCalculatorV2.create_atom_from_particles(
+        proton, neutron, electron, z, n, z, name, symbol, use_cache=False)
+    return key, result
+
+
+def warm_ground_state_atoms(workers: Optional[int] = None, disk: bool = True) -> int:
+    """
+    Compute every neutral ground-state atom (Z = 1..118) in parallel and cache it.
+
+    Neutron counts follow the rounded standard atomic mass, matching what the
+    element tables and accuracy audit request.
+
+    Args:
+        workers: Worker processes (default: CPU count; 1 computes in-process)
+        disk: Also write the results to the on-disk tier
+
+    Returns:
+        Number of atoms cached
+    """
+    proton, neutron, electron, nuclei = _ground_state_inputs()
+    jobs = [(proton, neutron, electron, z, n, name, symbol) for z, n, name, symbol in nuclei]
+    cache = get_result_cache('atoms')
+    if disk:
+        cache.set_disk_enabled(True)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = [_compute_atom(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_compute_atom, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+    for key, result in results:
+        cache.put(key, result)
+    return len(results)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Manage the Periodics calculator result cache")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    warm = subparsers.add_parser('warm-atoms', help="Compute and cache all 118 ground-state atoms")
+    warm.add_argument('-j', '--workers', type=int, help="Worker processes (default: CPU count)")
+    warm.add_argument('--no-disk', action='store_true', help="Do not write the on-disk tier")
+    hadrons = subparsers.add_parser('warm-hadrons', help="Compute and cache every meson and baryon")
+    hadrons.add_argument('-j', '--workers', type=int, help="Worker processes (default: CPU count)")
+    hadrons.add_argument('--max-quarks', type=int, default=3, help="Largest quark count (default: %(default)s)")
+    hadrons.add_argument('--no-disk', action='store_true', help="Do not write the on-disk tier")
+    subparsers.add_parser('stats', help="Show on-disk entry counts per cache")
+    clear = subparsers.add_parser('clear', help="Delete the on-disk tier")
+    clear.add_argument('namespace', nargs='?', help="Cache to clear (default: all)")
+    args = parser.parse_args(argv)
+
+    results_dir = os.path.join(get_cache_dir(), RESULTS_DIR)
+    if args.command == 'warm-atoms':
+        start = time.perf_counter()
+        count = warm_ground_state_atoms(args.workers, disk=not args.no_disk)
+        print(f"Cached {count} atoms in {time.perf_counter() - start:.2f}s")
+    elif args.command == 'warm-hadrons':
+        from utils.physics_calculator_v2 import SubatomicCalculatorV2
+        get_result_cache('hadrons').set_disk_enabled(not args.no_disk)
+        start = time.perf_counter()
+        count = len(SubatomicCalculatorV2.enumerate_all_hadrons(args.max_quarks, workers=args.workers))
+        print(f"Cached {count} hadrons in {time.perf_counter() - start:.2f}s")
+    elif args.command == 'stats':
+        namespaces = sorted(os.listdir(results_dir)) if os.path.isdir(results_dir) else []
+        for namespace in namespaces:
+            count = sum(len(files) for _, _, files in os.walk(os.path.join(results_dir, namespace)))
+            print(f"  {namespace:<16} {count} entries")
+        if not namespaces:
+            print(f"No cached results in {results_dir}")
+    elif args.command == 'clear':
+        target = os.path.join(results_dir, args.namespace) if args.namespace else results_dir
+        shutil.rmtree(target, ignore_errors=True)
+        print(f"Cleared {target}")
+    return 0
+
+
+if __name__ == '__main__':
+    # Run from the importable module so the calculators share its cache registry
+    from utils.result_cache import main as module_main
+    sys.exit(module_main())
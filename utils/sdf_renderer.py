@@ -20,6 +20,8 @@ import math
 from PySide6.QtGui import QImage, QColor, QPainter, QBrush, QRadialGradient
 from PySide6.QtCore import Qt, QPointF
 
+from utils.backend_dispatch import get_dispatcher
+
 # Backend selection
 USE_NUMPY = True
 
@@ -194,8 +196,14 @@ class SDFRenderer:
         # Place nucleons in a roughly spherical arrangement
         nucleon_radius = max(2, nuclear_radius / max(1, (A ** (1/3))) * 0.8)
 
-        # Select backend-specific implementation
+        # Select backend-specific implementation (numpy only pays off for larger nuclei)
         if _NUMPY_AVAILABLE and USE_NUMPY:
+            use_numpy = get_dispatcher().use_library('nucleons', A)
+        else:
+            use_numpy = False
+            get_dispatcher().record('nucleons', library=False)
+
+        if use_numpy:
             nucleon_data = cls._generate_nucleons_numpy(
                 protons, neutrons, nuclear_radius, rotation_x, rotation_y
             )
@@ -249,45 +257,25 @@ class SDFRenderer:
             List of tuples (dx2, dy2, dz3, is_proton) for each nucleon
         """
         import numpy as np
+        from utils.pure_array import Vec3Array
 
         A = protons + neutrons
 
         # Random but deterministic positions for nucleons
         np.random.seed(protons * 1000 + neutrons)  # Consistent for same isotope
 
-        # Pre-calculate rotation
-        cos_rx, sin_rx = np.cos(rotation_x), np.sin(rotation_x)
-        cos_ry, sin_ry = np.cos(rotation_y), np.sin(rotation_y)
-
-        nucleon_data = []
-
-        for i in range(protons + neutrons):
-            is_proton = i < protons
-
-            # Spherical placement with some randomness
-            if A == 1:
-                dx, dy, dz = 0, 0, 0
-            else:
-                phi = np.random.uniform(0, 2 * np.pi)
-                cos_theta = np.random.uniform(-1, 1)
-                sin_theta = np.sqrt(1 - cos_theta**2)
-                r = nuclear_radius * 0.7 * np.random.uniform(0.3, 1.0)
-
-                dx = r * sin_theta * np.cos(phi)
-                dy = r * sin_theta * np.sin(phi)
-                dz = r * cos_theta
-
-            # Apply 3D rotation - rotate around X axis
-            dy2 = dy * cos_rx - dz * sin_rx
-            dz2 = dy * sin_rx + dz * cos_rx
-
-            # Rotate around Y axis
-            dx2 = dx * cos_ry + dz2 * sin_ry
-            dz3 = -dx * sin_ry + dz2 * cos_ry
-
-            nucleon_data.append((dx2, dy2, dz3, is_proton))
+        # Spherical placement with some randomness, sampled for all nucleons at once
+        if A == 1:
+            positions = Vec3Array.zeros(1, use_numpy=True)
+        else:
+            phi = np.random.uniform(0, 2 * np.pi, A)
+            cos_theta = np.random.uniform(-1, 1, A)
+            sin_theta = np.sqrt(1 - cos_theta**2)
+            r = nuclear_radius * 0.7 * np.random.uniform(0.3, 1.0, A)
+            positions = Vec3Array(r * sin_theta * np.cos(phi), r * sin_theta * np.sin(phi),
+                                  r * cos_theta, use_numpy=True)
 
-        return nucleon_data
+        return cls._rotate_nucleons(positions, protons, rotation_x, rotation_y)
 
     @classmethod
     def _generate_nucleons_pure(cls, protons, neutrons, nuclear_radius, rotation_x, rotation_y):
@@ -303,9 +291,10 @@ class SDFRenderer:
         Returns:
             List of tuples (dx2, dy2, dz3, is_proton) for each nucleon
         """
+        from array import array
         from utils.pure_array import (
             pi, sqrt, cos, sin,
-            random_seed, random_uniform
+            random_seed, random_uniform, Vec3Array
         )
 
         A = protons + neutrons
@@ -313,15 +302,9 @@ class SDFRenderer:
         # Random but deterministic positions for nucleons
         random_seed(protons * 1000 + neutrons)  # Consistent for same isotope
 
-        # Pre-calculate rotation
-        cos_rx, sin_rx = cos(rotation_x), sin(rotation_x)
-        cos_ry, sin_ry = cos(rotation_y), sin(rotation_y)
-
-        nucleon_data = []
+        xs, ys, zs = array('d'), array('d'), array('d')
 
         for i in range(protons + neutrons):
-            is_proton = i < protons
-
             # Spherical placement with some randomness
             if A == 1:
                 dx, dy, dz = 0, 0, 0
@@ -335,17 +318,31 @@ class SDFRenderer:
                 dy = r * sin_theta * sin(phi)
                 dz = r * cos_theta
 
-            # Apply 3D rotation - rotate around X axis
-            dy2 = dy * cos_rx - dz * sin_rx
-            dz2 = dy * sin_rx + dz * cos_rx
+            xs.append(dx)
+            ys.append(dy)
+            zs.append(dz)
+
+        positions = Vec3Array(xs, ys, zs, use_numpy=False)
+        return cls._rotate_nucleons(positions, protons, rotation_x, rotation_y)
+
+    @staticmethod
+    def _rotate_nucleons(positions, protons, rotation_x, rotation_y):
+        """
+        Rotate all nucleons in one batch (around X, then Y) and tag their types.
 
-            # Rotate around Y axis
-            dx2 = dx * cos_ry + dz2 * sin_ry
-            dz3 = -dx * sin_ry + dz2 * cos_ry
+        Args:
+            positions: Vec3Array of unrotated nucleon positions (modified in place)
+            protons: Number of protons; the first `protons` entries are protons
+            rotation_x, rotation_y: 3D rotation angles
 
-            nucleon_data.append((dx2, dy2, dz3, is_proton))
+        Returns:
+            List of tuples (dx2, dy2, dz3, is_proton) for each nucleon
+        """
+        from utils.pure_array import rotation_matrix_x, rotation_matrix_y, matrix_multiply_3x3
 
-        return nucleon_data
+        positions.rotate_(matrix_multiply_3x3(rotation_matrix_y(rotation_y), rotation_matrix_x(rotation_x)))
+        return [(dx2, dy2, dz3, i < protons)
+                for i, (dx2, dy2, dz3) in enumerate(positions.to_tuples())]
 
     @classmethod
     def _draw_nucleus_legend(cls, painter, cx, cy, protons, neutrons,
@@ -430,7 +427,7 @@ class SDFRenderer:
     def _draw_s_orbital(cls, painter, cx, cy, n, shell_radius,
                        cos_rx, cos_ry, opacity, Z, animation_offset):
         """Draw s-orbital (spherically symmetric) with SDF-like gradient"""
-        from utils.orbital_clouds import get_orbital_probability
+        from utils.orbital_clouds import get_orbital_probability_many
 
         # Sample resolution - fewer samples for performance
         resolution = 35
@@ -438,14 +435,16 @@ class SDFRenderer:
 
         painter.setPen(Qt.PenStyle.NoPen)
 
+        # Sample probability at every radius in one batched evaluation
+        radii = [(i + 1) / resolution * max_extent for i in range(resolution)]
+        r_bohr_values = [r / (shell_radius / n) if shell_radius > 0 else r for r in radii]
+        probabilities = get_orbital_probability_many(n, 0, 0, r_bohr_values, [0.0] * resolution, Z)
+
         for i in range(resolution - 1, -1, -1):  # Draw from outer to inner
             t = (i + 1) / resolution
-            r = t * max_extent
+            r = radii[i]
 
-            # Sample probability at this radius
-            r_bohr = r / (shell_radius / n) if shell_radius > 0 else r
-            prob = get_orbital_probability(n, 0, 0, r_bohr, 0, 0, Z)
-            prob = min(1.0, prob * 8.0)  # Amplify for visibility
+            prob = min(1.0, probabilities[i] * 8.0)  # Amplify for visibility
 
             # Apply animation
             prob_animated = prob * (1.0 + animation_offset * math.sin(t * math.pi * 2))
@@ -560,7 +559,7 @@ class SDFRenderer:
     def _draw_angular_orbital(cls, painter, cx, cy, n, l, m, shell_radius,
                              cos_rx, sin_rx, cos_ry, sin_ry, opacity, Z):
         """Draw orbitals with angular dependence (d, f) using sampled SDF blobs"""
-        from utils.orbital_clouds import get_orbital_probability
+        from utils.orbital_clouds import get_orbital_probability_many
 
         # Sample grid for angular orbitals
         grid_size = 25  # Balance between quality and performance
@@ -571,6 +570,11 @@ class SDFRenderer:
         # Pre-compute blob size
         blob_size = max_extent / grid_size * 1.5
 
+        # Collect grid points inside the disc, then sample them in one batch
+        # (|psi|^2 does not depend on phi, so only r and theta are needed)
+        grid_points = []
+        r_bohr_values = []
+        theta_values = []
         for i in range(grid_size):
             for j in range(grid_size):
                 # Normalized coordinates in [-1, 1]
@@ -585,48 +589,49 @@ class SDFRenderer:
                 r = r_norm * max_extent
 
                 # Convert to spherical coordinates
-                theta = math.acos(ny / r_norm) if r_norm > 0 else 0
-                phi = math.atan2(nx, 0.1)  # Simplified for 2D projection
+                grid_points.append((nx, ny))
+                theta_values.append(math.acos(ny / r_norm) if r_norm > 0 else 0)
+                r_bohr_values.append(r / (shell_radius / n) if shell_radius > 0 else r)
 
-                # Sample probability
-                r_bohr = r / (shell_radius / n) if shell_radius > 0 else r
-                prob = get_orbital_probability(n, l, m, r_bohr, theta, phi, Z)
-                prob = min(1.0, prob * 20)  # Amplify for visibility
+        probabilities = get_orbital_probability_many(n, l, m, r_bohr_values, theta_values, Z)
 
-                # Early termination for low probability
-                if prob < 0.03:
-                    continue
+        for (nx, ny), prob in zip(grid_points, probabilities):
+            prob = min(1.0, prob * 20)  # Amplify for visibility
+
+            # Early termination for low probability
+            if prob < 0.03:
+                continue
 
-                # 3D position
-                x_3d = nx * max_extent
-                y_3d = ny * max_extent
-                z_3d = 0  # Flat slice
+            # 3D position
+            x_3d = nx * max_extent
+            y_3d = ny * max_extent
+            z_3d = 0  # Flat slice
 
-                # Apply rotation
-                y_rot = y_3d * cos_rx - z_3d * sin_rx
-                z_rot = y_3d * sin_rx + z_3d * cos_rx
+            # Apply rotation
+            y_rot = y_3d * cos_rx - z_3d * sin_rx
+            z_rot = y_3d * sin_rx + z_3d * cos_rx
 
-                x_rot = x_3d * cos_ry + z_rot * sin_ry
+            x_rot = x_3d * cos_ry + z_rot * sin_ry
 
-                # Position on screen
-                px = cx + x_rot
-                py = cy + y_rot
+            # Position on screen
+            px = cx + x_rot
+            py = cy + y_rot
 
-                # Draw small SDF blob at this position
-                gradient = QRadialGradient(px, py, blob_size)
+            # Draw small SDF blob at this position
+            gradient = QRadialGradient(px, py, blob_size)
 
-                cloud_color = QColor(100, 180, 255)
-                cloud_color.setAlpha(int(100 * prob * opacity))
-                gradient.setColorAt(0.0, cloud_color)
+            cloud_color = QColor(100, 180, 255)
+            cloud_color.setAlpha(int(100 * prob * opacity))
+            gradient.setColorAt(0.0, cloud_color)
 
-                cloud_color.setAlpha(int(30 * prob * opacity))
-                gradient.setColorAt(0.7, cloud_color)
+            cloud_color.setAlpha(int(30 * prob * opacity))
+            gradient.setColorAt(0.7, cloud_color)
 
-                cloud_color.setAlpha(0)
-                gradient.setColorAt(1.0, cloud_color)
+            cloud_color.setAlpha(0)
+            gradient.setColorAt(1.0, cloud_color)
 
-                painter.setBrush(QBrush(gradient))
-                painter.drawEllipse(QPointF(px, py), blob_size, blob_size)
+            painter.setBrush(QBrush(gradient))
+            painter.drawEllipse(QPointF(px, py), blob_size, blob_size)
 
     @classmethod
     def draw_electron_sdf(cls, painter, x, y, radius, is_selected=False, glow_factor=1.0):
@@ -660,3 +665,17 @@ class SDFRenderer:
     def clear_cache(cls):
         """Clear the orbital probability cache"""
         cls._orbital_cache.clear()
+
+
+def _register_dispatch():
+    """Register the numpy/pure Python nucleon generators with the dispatcher for calibration."""
+    get_dispatcher().register(
+        'nucleons',
+        lambda A: SDFRenderer._generate_nucleons_pure(A // 2, A - A // 2, 30.0, 0.3, 0.5),
+        lambda A: SDFRenderer._generate_nucleons_numpy(A // 2, A - A // 2, 30.0, 0.3, 0.5),
+        make_input=lambda size: size,
+    )
+
+
+if _NUMPY_AVAILABLE:
+    _register_dispatch()
@@ -768,12 +768,20 @@ def propagate_quark_to_hadron(quarks: List[Dict], spin_hint: float = None) -> Ha
         quarks: List of quark dictionaries with properties
         spin_hint: Optional spin value to select excited states (e.g., 1.5 for Delta baryons)
                   When provided, selects the hadron state with matching spin if available
+
+    Quarks are taken in canonical order (quarks before antiquarks, by flavour),
+    the same order SubatomicCalculatorV2 uses for its result cache, so the
+    quark content string is independent of input order (e.g. always "uud").
     """
+    from utils.physics_calculator_v2 import SubatomicCalculatorV2
+
     hadron = HadronSimulationData()
 
     if not quarks:
         return hadron
 
+    quarks = SubatomicCalculatorV2.canonical_quark_order(quarks)
+
     # Determine hadron type
     num_quarks = len(quarks)
     if num_quarks == 3:
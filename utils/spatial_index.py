@@ -0,0 +1,141 @@
+"""
+Spatial Index
+Uniform-grid index of card rectangles in layout (world) coordinates.
+
+The unified tables rebuild one index per layout pass and query it with the
+visible world rectangle on every paint, so paint cost scales with the cards
+on screen rather than the catalog size. Query results keep insertion order,
+which is the tables' draw order, so overlapping cards stack exactly as they
+do without culling.
+"""
+
+import math
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+DEFAULT_CELL_SIZE = 256.0
+
+
+class SpatialIndex:
+    """Bucket grid mapping cells to the rectangles that overlap them"""
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        """
+        Initialize an empty index.
+
+        Args:
+            cell_size: Grid cell edge in layout units (about twice the card size works well)
+        """
+        self.cell_size = max(1.0, float(cell_size))
+        self._items: List[Any] = []
+        self._rects: List[Tuple[float, float, float, float]] = []
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        # Occupied cell range, used to clamp queries larger than the content
+        self._cell_bounds: Optional[Tuple[int, int, int, int]] = None
+
+    @classmethod
+    def build(cls, items: Iterable[Any], rect_of: Callable[[Any], Tuple[float, float, float, float]],
+              cell_size: float = DEFAULT_CELL_SIZE) -> 'SpatialIndex':
+        """
+        Build an index from items.
+
+        Args:
+            items: Items in draw order
+            rect_of: Function returning an item's (x, y, width, height)
+            cell_size: Grid cell edge in layout units
+
+        Returns:
+            Populated index
+        """
+        index = cls(cell_size)
+        for item in items:
+            x, y, width, height = rect_of(item)
+            index.insert(item, x, y, width, height)
+        return index
+
+    def insert(self, item: Any, x: float, y: float, width: float, height: float):
+        """Add an item covering the rectangle (x, y, width, height)"""
+        order = len(self._items)
+        self._items.append(item)
+        self._rects.append((x, y, x + width, y + height))
+
+        x0, y0, x1, y1 = self._cell_range(x, y, x + width, y + height)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self._cells.setdefault((cx, cy), []).append(order)
+
+        if self._cell_bounds is None:
+            self._cell_bounds = (x0, y0, x1, y1)
+        else:
+            bx0, by0, bx1, by1 = self._cell_bounds
+            self._cell_bounds = (min(bx0, x0), min(by0, y0), max(bx1, x1), max(by1, y1))
+
+    def query(self, left: float, top: float, right: float, bottom: float) -> List[Any]:
+        """
+        Items whose rectangles intersect a query rectangle.
+
+        Args:
+            left, top, right, bottom: Query rectangle in layout units
+
+        Returns:
+            Intersecting items in insertion (draw) order
+        """
+        if self._cell_bounds is None or right < left or bottom < top:
+            return []
+        x0, y0, x1, y1 = self._cell_range(left, top, right, bottom)
+        bx0, by0, bx1, by1 = self._cell_bounds
+        x0, y0, x1, y1 = max(x0, bx0), max(y0, by0), min(x1, bx1), min(y1, by1)
+
+        candidates = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket:
+                    candidates.update(bucket)
+
+        rects = self._rects
+        hits = [i for i in candidates
+                if rects[i][0] <= right and rects[i][2] >= left and rects[i][1] <= bottom and rects[i][3] >= top]
+        hits.sort()
+        return [self._items[i] for i in hits]
+
+    def item_at(self, x: float, y: float) -> Optional[Any]:
+        """First item (in insertion order) whose rectangle contains a point, or None"""
+        bucket = self._cells.get((math.floor(x / self.cell_size), math.floor(y / self.cell_size)))
+        if not bucket:
+            return None
+        for i in bucket:
+            left, top, right, bottom = self._rects[i]
+            if left <= x <= right and top <= y <= bottom:
+                return self._items[i]
+        return None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _cell_range(self, left: float, top: float, right: float, bottom: float) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return (math.floor(left / size), math.floor(top / size),
+                math.floor(right / size), math.floor(bottom / size))
+
+
+def visible_world_rect(width: float, height: float, pan_x: float, pan_y: float, zoom: float,
+                       scroll_y: float = 0.0, margin: float = 0.0) -> Tuple[float, float, float, float]:
+    """
+    The widget area in layout coordinates for a translate(pan_x, pan_y - scroll_y)
+    then scale(zoom) painter transform.
+
+    Args:
+        width, height: Widget size in pixels
+        pan_x, pan_y: Pan offset in pixels
+        zoom: Zoom factor
+        scroll_y: Vertical scroll offset in pixels
+        margin: Extra layout units added on every side (for glows and outlines)
+
+    Returns:
+        (left, top, right, bottom) in layout units
+    """
+    zoom = zoom or 1.0
+    left = -pan_x / zoom
+    top = (scroll_y - pan_y) / zoom
+    return (left - margin, top - margin, left + width / zoom + margin, top + height / zoom + margin)
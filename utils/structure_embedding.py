@@ -0,0 +1,485 @@
+"""
+Structure Embedding
+3D coordinates for arbitrary bonded graphs, from small molecules to polymers
+and proteins with thousands of atoms.
+
+Atoms are first placed along a breadth-first spanning tree of each connected
+component. Every atom takes the VSEPR directions of its steric number from
+MolecularGeometryCalculator, rotated so that one direction points back at its
+parent and twisted so the chain continues anti (zigzag) to the grandparent.
+Ring-closure bonds are then pulled shut by a force-field relaxation with bond
+springs, 1-3 angle springs and soft non-bonded repulsion. Repulsion partners
+come from a Verlet neighbor list built with a cell list, so each relaxation
+step costs O(N) rather than O(N^2).
+
+Pure Python implementation with no external dependencies.
+"""
+
+import math
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from utils.molecular_geometry import MolecularGeometryCalculator
+from utils.pure_array import (
+    matrix_multiply_3x3,
+    matrix_vector_multiply_3x3,
+    rotation_matrix_axis_angle,
+    vector_cross,
+    vector_dot,
+    vector_normalize,
+    vector_sub,
+)
+
+
+# Non-bonded atoms closer than this (Angstroms) repel each other
+REPULSION_CUTOFF = 2.6
+# Extra neighbor-list radius; the list is rebuilt once an atom moves skin / 2
+NEIGHBOR_SKIN = 1.0
+
+BOND_STIFFNESS = 1.0
+ANGLE_STIFFNESS = 0.5
+REPULSION_STIFFNESS = 0.2
+
+STEP_SIZE = 0.1
+MAX_DISPLACEMENT = 0.2  # Angstroms per atom per step
+FORCE_TOLERANCE = 1e-3
+DEFAULT_ITERATIONS = 200
+
+# Gap between separate connected components (Angstroms)
+COMPONENT_SPACING = 3.0
+
+# Embedded molecule records kept for the 3D views
+MAX_CACHED_EMBEDDINGS = 32
+
+BOND_MULTIPLICITY = {'single': 1, 'double': 2, 'triple': 3, 'aromatic': 1.5, 'resonance': 1.5}
+
+Vector = Tuple[float, float, float]
+
+
+# ==================== Neighbor Search ====================
+
+def neighbor_pairs(positions: Sequence[Vector], cutoff: float) -> List[Tuple[int, int]]:
+    """
+    All pairs of points closer than cutoff, found with a cell list.
+
+    Points are binned into cubic cells of edge `cutoff`, so only the 27 cells
+    around each point are searched and the cost grows linearly with the number
+    of points at constant density.
+
+    Args:
+        positions: (x, y, z) per point
+        cutoff: Distance below which a pair is reported
+
+    Returns:
+        List of (i, j) index pairs with i < j
+    """
+    if cutoff <= 0:
+        return []
+
+    cells: Dict[Tuple[int, int, int], List[int]] = {}
+    keys = []
+    for i, (x, y, z) in enumerate(positions):
+        key = (math.floor(x / cutoff), math.floor(y / cutoff), math.floor(z / cutoff))
+        keys.append(key)
+        cells.setdefault(key, []).append(i)
+
+    cutoff_sq = cutoff * cutoff
+    pairs = []
+    offsets = [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)]
+    for i, (cx, cy, cz) in enumerate(keys):
+        x, y, z = positions[i]
+        for dx, dy, dz in offsets:
+            for j in cells.get((cx + dx, cy + dy, cz + dz), ()):
+                if j <= i:
+                    continue
+                px, py, pz = positions[j]
+                if (px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2 < cutoff_sq:
+                    pairs.append((i, j))
+    return pairs
+
+
+# ==================== Vector Helpers ====================
+
+def _perpendicular(v: Vector, axis: Vector) -> Vector:
+    """Component of v perpendicular to the unit vector axis"""
+    d = vector_dot(v, axis)
+    return (v[0] - d * axis[0], v[1] - d * axis[1], v[2] - d * axis[2])
+
+
+def _align_matrix(source: Vector, target: Vector) -> List[List[float]]:
+    """Rotation taking unit vector source onto unit vector target"""
+    axis = vector_cross(source, target)
+    cos_angle = max(-1.0, min(1.0, vector_dot(source, target)))
+    if vector_dot(axis, axis) < 1e-18:
+        if cos_angle > 0:
+            return [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+        # Antiparallel: half turn about any axis perpendicular to source
+        helper = (1.0, 0.0, 0.0) if abs(source[0]) < 0.9 else (0.0, 1.0, 0.0)
+        axis = vector_cross(source, helper)
+    return rotation_matrix_axis_angle(axis, math.acos(cos_angle))
+
+
+def _sphere_directions(count: int) -> List[Vector]:
+    """Evenly spread unit vectors (Fibonacci sphere) for high coordination"""
+    golden = math.pi * (3.0 - math.sqrt(5.0))
+    directions = []
+    for i in range(count):
+        y = 1.0 - 2.0 * (i + 0.5) / count
+        r = math.sqrt(max(0.0, 1.0 - y * y))
+        directions.append((r * math.cos(golden * i), y, r * math.sin(golden * i)))
+    return directions
+
+
+# ==================== Spanning-Tree Placement ====================
+
+def _vsepr_directions(calculator: MolecularGeometryCalculator, element: str,
+                      degree: int, bonding_electrons: float) -> List[Vector]:
+    """Unit bond directions of an atom with `degree` neighbors"""
+    if degree == 0:
+        return []
+    lone_pairs = calculator.calculate_lone_pairs(element, int(round(bonding_electrons)))
+    geometry_name, bond_angle = calculator.determine_geometry(degree, lone_pairs)
+    if geometry_name == 'Unknown' and degree > 4:
+        return _sphere_directions(degree)
+    directions = [vector_normalize(p) for p in calculator.generate_positions(geometry_name, [1.0] * degree, bond_angle)]
+    if len(directions) != degree or any(d == (0.0, 0.0, 0.0) for d in directions):
+        return _sphere_directions(degree)
+    return directions
+
+
+def _place_tree(composition: Sequence[Dict], neighbors: List[List[Tuple[int, str]]],
+                calculator: MolecularGeometryCalculator) -> Tuple[List[Vector], Dict[int, List[Tuple[int, Vector]]]]:
+    """
+    Place every atom along a breadth-first spanning tree of each component.
+
+    Returns:
+        (positions, directions): directions maps each atom to (neighbor, unit
+        bond direction) for all of its neighbors, including ring closures,
+        used as the 1-3 angle targets of the relaxation
+    """
+    count = len(composition)
+    positions: List[Optional[Vector]] = [None] * count
+    parent: List[int] = [-1] * count
+    directions: Dict[int, List[Tuple[int, Vector]]] = {}
+    offset_x = 0.0
+
+    # Components are rooted at their most connected atom
+    order = sorted(range(count), key=lambda i: (-len(neighbors[i]), i))
+    for root in order:
+        if positions[root] is not None:
+            continue
+        positions[root] = (0.0, 0.0, 0.0)
+        component = [root]
+        queue = deque([root])
+        while queue:
+            atom = queue.popleft()
+            pos = positions[atom]
+            element = composition[atom]['element']
+            bonding_electrons = sum(BOND_MULTIPLICITY.get(t, 1) for _, t in neighbors[atom])
+            template = _vsepr_directions(calculator, element, len(neighbors[atom]), bonding_electrons)
+
+            # Parent first so that template direction 0 points back at it
+            ordered = sorted(neighbors[atom], key=lambda nb: nb[0] != parent[atom])
+            rotation = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+            up = parent[atom]
+            if up >= 0:
+                to_parent = vector_normalize(vector_sub(positions[up], pos))
+                rotation = _align_matrix(template[0], to_parent)
+                # Twist about the parent bond so the first child runs anti to the grandparent
+                grand = parent[up]
+                if grand >= 0 and len(template) > 1:
+                    beyond = _perpendicular(vector_sub(positions[grand], positions[up]), to_parent)
+                    child = _perpendicular(matrix_vector_multiply_3x3(rotation, template[1]), to_parent)
+                    if vector_dot(beyond, beyond) > 1e-12 and vector_dot(child, child) > 1e-12:
+                        wanted = (-beyond[0], -beyond[1], -beyond[2])
+                        twist = math.atan2(vector_dot(to_parent, vector_cross(child, wanted)),
+                                           vector_dot(child, wanted))
+                        rotation = matrix_multiply_3x3(rotation_matrix_axis_angle(to_parent, twist), rotation)
+
+            directions[atom] = []
+            for (other, bond_type), template_dir in zip(ordered, template):
+                direction = tuple(matrix_vector_multiply_3x3(rotation, template_dir))
+                directions[atom].append((other, direction))
+                if positions[other] is not None:
+                    continue
+                length = calculator.get_bond_length(element, composition[other]['element'], bond_type)
+                positions[other] = (pos[0] + direction[0] * length,
+                                    pos[1] + direction[1] * length,
+                                    pos[2] + direction[2] * length)
+                parent[other] = atom
+                component.append(other)
+                queue.append(other)
+
+        # Line components up along x so they do not overlap
+        min_x = min(positions[i][0] for i in component)
+        shift = offset_x - min_x
+        for i in component:
+            x, y, z = positions[i]
+            positions[i] = (x + shift, y, z)
+        offset_x = max(positions[i][0] for i in component) + COMPONENT_SPACING
+
+    return positions, directions
+
+
+# ==================== Relaxation ====================
+
+def relax_positions(positions: Sequence[Vector], springs: Sequence[Tuple[int, int, float, float]],
+                    iterations: int = DEFAULT_ITERATIONS,
+                    cutoff: float = REPULSION_CUTOFF) -> List[Vector]:
+    """
+    Relax positions by gradient descent on spring and repulsion energies.
+
+    Args:
+        positions: Starting (x, y, z) per atom
+        springs: (i, j, rest length, stiffness); spring pairs do not repel
+        iterations: Maximum number of steps
+        cutoff: Non-bonded repulsion range
+
+    Returns:
+        Relaxed positions
+    """
+    count = len(positions)
+    xs = [p[0] for p in positions]
+    ys = [p[1] for p in positions]
+    zs = [p[2] for p in positions]
+    excluded: Set[Tuple[int, int]] = {(min(i, j), max(i, j)) for i, j, _, _ in springs}
+
+    list_radius = cutoff + NEIGHBOR_SKIN
+    pairs: List[Tuple[int, int]] = []
+    anchor: Optional[Tuple[List[float], List[float], List[float]]] = None
+
+    for _ in range(iterations):
+        # Rebuild the Verlet list once any atom has moved half the skin
+        if anchor is None or _max_displacement(anchor, xs, ys, zs) > NEIGHBOR_SKIN / 2:
+            pairs = [pair for pair in neighbor_pairs(list(zip(xs, ys, zs)), list_radius)
+                     if pair not in excluded]
+            anchor = (xs[:], ys[:], zs[:])
+
+        fx = [0.0] * count
+        fy = [0.0] * count
+        fz = [0.0] * count
+
+        for i, j, rest, stiffness in springs:
+            _spring_force(xs, ys, zs, fx, fy, fz, i, j, rest, stiffness, False)
+        for i, j in pairs:
+            _spring_force(xs, ys, zs, fx, fy, fz, i, j, cutoff, REPULSION_STIFFNESS, True)
+
+        largest = 0.0
+        for i in range(count):
+            dx, dy, dz = fx[i] * STEP_SIZE, fy[i] * STEP_SIZE, fz[i] * STEP_SIZE
+            step = math.sqrt(dx * dx + dy * dy + dz * dz)
+            largest = max(largest, step)
+            if step > MAX_DISPLACEMENT:
+                scale = MAX_DISPLACEMENT / step
+                dx, dy, dz = dx * scale, dy * scale, dz * scale
+            xs[i] += dx
+            ys[i] += dy
+            zs[i] += dz
+        if largest < FORCE_TOLERANCE * STEP_SIZE:
+            break
+
+    return list(zip(xs, ys, zs))
+
+
+def _spring_force(xs, ys, zs, fx, fy, fz, i, j, rest, stiffness, repulsive_only):
+    """Accumulate the force of the energy stiffness * (d - rest)^2 between i and j"""
+    dx = xs[j] - xs[i]
+    dy = ys[j] - ys[i]
+    dz = zs[j] - zs[i]
+    distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+    if repulsive_only and distance >= rest:
+        return
+    if distance < 1e-9:
+        # Coincident atoms: push apart along a fixed axis
+        dx, dy, dz, distance = 1e-3, 0.0, 0.0, 1e-3
+    magnitude = 2.0 * stiffness * (distance - rest) / distance
+    fx[i] += magnitude * dx
+    fy[i] += magnitude * dy
+    fz[i] += magnitude * dz
+    fx[j] -= magnitude * dx
+    fy[j] -= magnitude * dy
+    fz[j] -= magnitude * dz
+
+
+def _max_displacement(anchor, xs, ys, zs) -> float:
+    ax, ay, az = anchor
+    return math.sqrt(max((x - x0) ** 2 + (y - y0) ** 2 + (z - z0) ** 2
+                         for x, y, z, x0, y0, z0 in zip(xs, ys, zs, ax, ay, az)))
+
+
+# ==================== Public API ====================
+
+def embed_structure(composition: Sequence[Dict], bonds: Sequence[Dict],
+                    calculator: Optional[MolecularGeometryCalculator] = None,
+                    iterations: int = DEFAULT_ITERATIONS) -> List[Vector]:
+    """
+    Generate 3D coordinates for an arbitrary bonded graph.
+
+    Args:
+        composition: List of atom dictionaries with 'element' key
+        bonds: List of bond dictionaries with 'from', 'to', 'type' keys
+               (indices into composition)
+        calculator: Geometry calculator providing VSEPR templates and bond lengths
+        iterations: Maximum relaxation steps (0 keeps the spanning-tree placement)
+
+    Returns:
+        (x, y, z) in Angstroms per composition entry, centered on the centroid
+    """
+    if not composition:
+        return []
+    calculator = calculator or MolecularGeometryCalculator()
+
+    count = len(composition)
+    neighbors: List[List[Tuple[int, str]]] = [[] for _ in composition]
+    seen = set()
+    for bond in bonds:
+        i, j = bond['from'], bond['to']
+        key = (min(i, j), max(i, j))
+        # Skip self-bonds, duplicates and bonds to atoms that do not exist
+        if i == j or key in seen or key[0] < 0 or key[1] >= count:
+            continue
+        seen.add(key)
+        bond_type = bond.get('type', 'single').lower()
+        neighbors[i].append((j, bond_type))
+        neighbors[j].append((i, bond_type))
+
+    positions, directions = _place_tree(composition, neighbors, calculator)
+
+    springs = []
+    lengths: Dict[Tuple[int, int], float] = {}
+    for i, atom_neighbors in enumerate(neighbors):
+        for j, bond_type in atom_neighbors:
+            if i < j:
+                length = calculator.get_bond_length(composition[i]['element'], composition[j]['element'], bond_type)
+                lengths[(i, j)] = length
+                springs.append((i, j, length, BOND_STIFFNESS))
+
+    # 1-3 springs hold each bond angle at its VSEPR template value
+    angle_pairs = set()
+    for center, bond_dirs in directions.items():
+        for a in range(len(bond_dirs)):
+            i, dir_i = bond_dirs[a]
+            for b in range(a + 1, len(bond_dirs)):
+                j, dir_j = bond_dirs[b]
+                key = (min(i, j), max(i, j))
+                if key in angle_pairs or key in lengths:
+                    continue
+                angle_pairs.add(key)
+                r_i = lengths[(min(center, i), max(center, i))]
+                r_j = lengths[(min(center, j), max(center, j))]
+                rest = math.sqrt(max(0.0, r_i * r_i + r_j * r_j - 2.0 * r_i * r_j * vector_dot(dir_i, dir_j)))
+                springs.append((i, j, rest, ANGLE_STIFFNESS))
+
+    if iterations > 0 and springs:
+        positions = relax_positions(positions, springs, iterations)
+
+    count = len(positions)
+    cx = sum(p[0] for p in positions) / count
+    cy = sum(p[1] for p in positions) / count
+    cz = sum(p[2] for p in positions) / count
+    return [(x - cx, y - cy, z - cz) for x, y, z in positions]
+
+
+def expand_composition(composition: Sequence[Dict]) -> List[Dict]:
+    """
+    Expand a molecule's Composition ([{'Element', 'Count'}]) to one entry per atom.
+
+    Returns:
+        List of {'element': symbol} in composition order
+    """
+    return [{'element': entry.get('Element', '?')}
+            for entry in composition for _ in range(entry.get('Count', 1))]
+
+
+def valence_bond_graph(elements: Sequence[str],
+                       calculator: Optional[MolecularGeometryCalculator] = None) -> List[Dict]:
+    """
+    Plausible connected bond graph for a bare formula, from typical valences.
+
+    Atoms that can form more than one bond make a backbone, each joining the
+    placed atom with the most free valence. Single-valent atoms (H, halogens,
+    alkali metals) fill the remaining valences, spilling onto hypervalent
+    atoms (e.g. SF6) once the octets are full. Leftover valence between
+    bonded backbone atoms becomes double and triple bonds (O=C=O, N#N).
+
+    Args:
+        elements: Element symbol per atom
+        calculator: Geometry calculator providing valence electron counts
+
+    Returns:
+        List of {'from', 'to', 'type'} bonds over the element indices
+    """
+    calculator = calculator or MolecularGeometryCalculator()
+    valences = [calculator.get_valence_electrons(e) for e in elements]
+    capacity = [max(1, v if v <= 4 else 8 - v) for v in valences]
+    extra = [max(0, v - c) for v, c in zip(valences, capacity)]
+    remaining = list(capacity)
+    orders: Dict[Tuple[int, int], int] = {}
+
+    def add_bond(i: int, j: int):
+        key = (min(i, j), max(i, j))
+        orders[key] = orders.get(key, 0) + 1
+        remaining[i] -= 1
+        remaining[j] -= 1
+
+    backbone = sorted((i for i, c in enumerate(capacity) if c > 1), key=lambda i: (-capacity[i], i))
+    terminals = [i for i, c in enumerate(capacity) if c == 1]
+    if not backbone:
+        # H2, HCl, NaCl: a chain of single-valent atoms
+        for i, j in zip(terminals, terminals[1:]):
+            add_bond(i, j)
+    else:
+        for index, atom in enumerate(backbone[1:], 1):
+            parent = max(backbone[:index], key=lambda p: (remaining[p], p))
+            add_bond(parent, atom)
+        for atom in terminals:
+            parent = max(backbone, key=lambda p: (remaining[p] > 0,
+                                                  remaining[p] if remaining[p] > 0 else remaining[p] + extra[p],
+                                                  -p))
+            add_bond(parent, atom)
+        for i, j in list(orders):
+            while orders[(i, j)] < 3 and remaining[i] > 0 and remaining[j] > 0:
+                add_bond(i, j)
+
+    bond_types = {1: 'single', 2: 'double', 3: 'triple'}
+    return [{'from': i, 'to': j, 'type': bond_types[order]} for (i, j), order in sorted(orders.items())]
+
+
+def molecule_atoms_3d(molecule: Dict) -> List[Dict]:
+    """
+    Atom coordinates of a molecule record for the 3D views.
+
+    Uses the stored Atoms3D when present; otherwise embeds the Bonds3D graph
+    over the expanded Composition (atom indices follow composition order).
+    Embeddings are cached by the record's composition and bond graph.
+
+    Returns:
+        List of {'element', 'x', 'y', 'z', 'index'} dictionaries (empty when
+        the record has neither coordinates nor a bond graph)
+    """
+    atoms_3d = molecule.get('Atoms3D')
+    if atoms_3d:
+        return atoms_3d
+    bonds = molecule.get('Bonds3D')
+    if not bonds:
+        return []
+    composition = expand_composition(molecule.get('Composition', []))
+    if not composition or any(max(b['from'], b['to']) >= len(composition) for b in bonds):
+        return []
+
+    key = (tuple(atom['element'] for atom in composition),
+           tuple((b['from'], b['to'], b.get('type', 'single')) for b in bonds))
+    atoms = _embedding_cache.get(key)
+    if atoms is None:
+        positions = embed_structure(composition, bonds)
+        atoms = [{'element': atom['element'], 'x': round(x, 4), 'y': round(y, 4), 'z': round(z, 4), 'index': i}
+                 for i, (atom, (x, y, z)) in enumerate(zip(composition, positions))]
+        _embedding_cache[key] = atoms
+        while len(_embedding_cache) > MAX_CACHED_EMBEDDINGS:
+            _embedding_cache.popitem(last=False)
+    else:
+        _embedding_cache.move_to_end(key)
+    return atoms
+
+
+_embedding_cache: 'OrderedDict[Tuple, List[Dict]]' = OrderedDict()